@@ -19,7 +19,6 @@ Incident Management System JSON API endpoints.
 """
 
 from collections.abc import (
-    AsyncIterable,
     Awaitable,
     Callable,
     Iterable,
@@ -28,11 +27,8 @@ from collections.abc import (
 from datetime import UTC
 from datetime import datetime as DateTime
 from enum import Enum
-from functools import partial
-from io import BytesIO
 from json import JSONDecodeError
 from typing import Any, ClassVar, Literal, NotRequired, TypedDict, cast
-from uuid import uuid4
 
 from attrs import frozen
 from hyperlink import URL
@@ -40,21 +36,24 @@ from klein import KleinRenderable
 from klein._app import KleinSynchronousRenderable
 from multipart import (  # type: ignore[import-untyped]
     MultipartError,
-    MultipartParser,
+    MultipartSegment,
+    PushMultipartParser,
     parse_options_header,
 )
-from puremagic import PureError
-from puremagic import from_stream as puremagic_from_stream
-from puremagic import from_string as puremagic_from_string
 from twisted.internet.defer import Deferred
 from twisted.internet.error import ConnectionDone
-from twisted.internet.threads import deferToThread
 from twisted.logger import Logger
 from twisted.python.failure import Failure
 from twisted.web import http
 from twisted.web.iweb import IRequest
-from twisted.web.static import Data, File
 
+from ims.attachments import (
+    AttachmentResource,
+    AttachmentTooLargeError,
+    AttachmentUpload,
+    NoSuchAttachmentError,
+    PreviewSize,
+)
 from ims.auth import Authorization, NotAuthorizedError
 from ims.config import Configuration, URLs
 from ims.directory import DirectoryError, IMSUser
@@ -85,7 +84,7 @@ from ims.model.jsons import (
     jsonObjectFromModelObject,
     modelObjectFromJSONObject,
 )
-from ims.store import NoSuchFieldReportError, NoSuchIncidentError
+from ims.store import IMSDataStore, NoSuchFieldReportError, NoSuchIncidentError
 
 from ._eventsource import DataStoreEventSourceLogObserver
 from ._klein import (
@@ -97,6 +96,7 @@ from ._klein import (
     noContentResponse,
     notFoundResponse,
     queryValue,
+    sessionLastWrite,
     textResponse,
 )
 from ._static import buildJSONArray, jsonBytes, writeJSONStream
@@ -115,6 +115,76 @@ def _urlToTextForBag(url: URL) -> str:
     return url.to_text().replace("<", "{").replace(">", "}")
 
 
+def _listViewFields(
+    request: IRequest, jsonKeys: type[Enum], entriesKey: Enum
+) -> frozenset[str] | None:
+    """
+    Determine which JSON keys to include in each object of a list response,
+    from the ``fields`` and ``view`` query parameters of the given request.
+
+    ``fields`` is a comma-separated list of JSON keys.
+    ``view=summary`` selects all keys except for the report entries key.
+
+    @return: The keys to include, or :obj:`None` if all keys are requested.
+
+    @raise ValueError: If the query is invalid.
+        The exception arguments are the query parameter name and value.
+    """
+    allKeys = frozenset(key.value for key in jsonKeys)
+
+    fieldsText = queryValue(request, "fields")
+    if fieldsText is not None:
+        fields = frozenset(
+            name.strip() for name in fieldsText.split(",") if name.strip()
+        )
+        if not fields or not fields <= allKeys:
+            raise ValueError("fields", fieldsText)
+        return fields
+
+    view = queryValue(request, "view", "full")
+    if view == "summary":
+        return allKeys - {entriesKey.value}
+    if view == "full":
+        return None
+
+    raise ValueError("view", view)
+
+
+def _readingStore(store: IMSDataStore, request: IRequest) -> IMSDataStore:
+    """
+    Look up a view of the given store for reads for the given request, which
+    see the data last written in the request's session, and the data written
+    at the time given by the ``write_time`` query parameter, if any (eg. a
+    write which the client was notified of via the event source).
+
+    @raise ValueError: If the query is invalid.
+        The exception arguments are the query parameter name and value.
+    """
+    writeTimes = [sessionLastWrite(request)]
+
+    writeTimeText = queryValue(request, "write_time")
+    if writeTimeText is not None:
+        try:
+            writeTimes.append(float(writeTimeText))
+        except ValueError:
+            raise ValueError("write_time", writeTimeText) from None
+
+    return store.readingAfter(
+        max((t for t in writeTimes if t is not None), default=None)
+    )
+
+
+def _jsonListItem(modelObject: Any, fields: frozenset[str] | None) -> bytes:
+    """
+    Serialize a model object in a list response, including only the given
+    JSON keys.
+    """
+    json = cast("Mapping[str, Any]", jsonObjectFromModelObject(modelObject))
+    if fields is not None:
+        json = {key: value for key, value in json.items() if key in fields}
+    return jsonTextFromObject(json).encode("utf-8")
+
+
 class FetchAuthEventAccess(TypedDict):
     readIncidents: bool
     writeIncidents: bool
@@ -159,6 +229,8 @@ class APIApplication:
                 "event": _urlToTextForBag(URLs.event),
                 "incidents": _urlToTextForBag(URLs.incidents),
                 "incident": _urlToTextForBag(URLs.incidentNumber),
+                "incident_search": _urlToTextForBag(URLs.incidentSearch),
+                "incident_bulk_edit": _urlToTextForBag(URLs.incidentBulkEdit),
                 "field_reports": _urlToTextForBag(URLs.fieldReports),
                 "field_report": _urlToTextForBag(URLs.fieldReport),
                 "event_source": _urlToTextForBag(URLs.eventSource),
@@ -166,6 +238,13 @@ class APIApplication:
         }
     ).encode("utf-8")
 
+    # Maybe move this to config
+    # Arbitrary limit of 10 MB per file
+    attachmentSizeLimit: ClassVar[int] = 10 * 1024 * 1024
+
+    # Amount of an attachment upload request body to read at a time
+    attachmentChunkSize: ClassVar[int] = 64 * 1024
+
     config: Configuration
     storeObserver: DataStoreEventSourceLogObserver
 
@@ -382,11 +461,11 @@ class APIApplication:
         """
         Events endpoint.
         """
-        self.config.authProvider.authenticateRequest(request)
+        authProvider = self.config.authProvider
+        authProvider.authenticateRequest(request)
 
-        authorizationsForUser = partial(
-            self.config.authProvider.authorizationsForUser,
-            getattr(request, "user", None),
+        authorizationsByEvent = await authProvider.authorizationsForUserInEvents(
+            getattr(request, "user", None)
         )
 
         relevantAuthorizations = (
@@ -396,7 +475,8 @@ class APIApplication:
         jsonEvents = [
             jsonObjectFromModelObject(event)
             for event in await self.config.store.events()
-            if relevantAuthorizations & await authorizationsForUser(event.id)
+            if relevantAuthorizations
+            & authorizationsByEvent.get(event.id, Authorization.none)
         ]
 
         data = jsonTextFromObject(jsonEvents).encode("utf-8")
@@ -441,7 +521,9 @@ class APIApplication:
         return noContentResponse(request)
 
     @router.route(_unprefix(URLs.incidents), methods=("HEAD", "GET"))
-    async def listIncidentsResource(self, request: IRequest, event_id: str) -> None:
+    async def listIncidentsResource(
+        self, request: IRequest, event_id: str
+    ) -> KleinSynchronousRenderable:
         """
         Incident list endpoint.
         """
@@ -451,14 +533,85 @@ class APIApplication:
 
         excludeSystemEntries = queryValue(request, "exclude_system_entries") == "true"
 
+        try:
+            fields = _listViewFields(
+                request, IncidentJSONKey, IncidentJSONKey.reportEntries
+            )
+        except ValueError as e:
+            return invalidQueryResponse(request, *e.args)
+
+        excludeReportEntries = (
+            fields is not None and IncidentJSONKey.reportEntries.value not in fields
+        )
+
+        # Clients refreshing several incidents at once may ask for just those
+        numbersText = queryValue(request, "numbers")
+        numbers: frozenset[int] | None = None
+        if numbersText is not None:
+            try:
+                numbers = frozenset(
+                    int(number) for number in numbersText.split(",") if number
+                )
+            except ValueError:
+                return invalidQueryResponse(request, "numbers", numbersText)
+
+        try:
+            store = _readingStore(self.config.store, request)
+        except ValueError as e:
+            return invalidQueryResponse(request, *e.args)
+
         stream = buildJSONArray(
-            jsonTextFromObject(jsonObjectFromModelObject(incident)).encode("utf-8")
-            for incident in await self.config.store.incidents(
-                event_id, excludeSystemEntries=excludeSystemEntries
+            _jsonListItem(incident, fields)
+            for incident in await store.incidents(
+                event_id,
+                excludeSystemEntries=excludeSystemEntries,
+                excludeReportEntries=excludeReportEntries,
+                numbers=numbers,
             )
         )
 
         writeJSONStream(request, stream, None)
+        return None
+
+    @router.route(_unprefix(URLs.incidentSearch), methods=("HEAD", "GET"))
+    async def searchIncidentsResource(
+        self, request: IRequest, event_id: str
+    ) -> KleinSynchronousRenderable:
+        """
+        Incident full-text search endpoint.
+        """
+        await self.config.authProvider.authorizeRequest(
+            request, event_id, Authorization.readIncidents
+        )
+
+        text = queryValue(request, "q")
+        if text is None:
+            return invalidQueryResponse(request, "q")
+
+        limitText = queryValue(request, "limit", "100")
+        assert limitText is not None
+        try:
+            limit = int(limitText)
+        except ValueError:
+            return invalidQueryResponse(request, "limit", limitText)
+        if limit < 1:
+            return invalidQueryResponse(request, "limit", limitText)
+
+        results = await self.config.store.searchIncidents(event_id, text, limit=limit)
+
+        stream = buildJSONArray(
+            jsonTextFromObject(
+                {
+                    "number": result.number,
+                    "rank": result.rank,
+                    "snippets": list(result.snippets),
+                }
+            ).encode("utf-8")
+            for result in results
+        )
+
+        writeJSONStream(request, stream, None)
+        return None
 
     @router.route(_unprefix(URLs.incidents), methods=("POST",))
     async def newIncidentResource(
@@ -756,6 +909,95 @@ class APIApplication:
 
         return noContentResponse(request)
 
+    @router.route(_unprefix(URLs.incidentBulkEdit), methods=("POST",))
+    async def editIncidentsResource(
+        self, request: IRequest, event_id: str
+    ) -> KleinSynchronousRenderable:
+        """
+        Bulk incident edit endpoint.
+
+        Applies the same edits to several incidents at once, eg. to close out
+        the incidents from a shift.
+        """
+        await self.config.authProvider.authorizeRequest(
+            request, event_id, Authorization.writeIncidents
+        )
+
+        user: IMSUser = request.user  # type: ignore[attr-defined]
+        author = user.shortNames[0]
+
+        #
+        # Get the edits requested by the client
+        #
+        try:
+            edits = objectFromJSONBytesIO(request.content)
+        except JSONDecodeError as e:
+            return invalidJSONResponse(request, e)
+
+        if not isinstance(edits, dict):
+            return badRequestResponse(request, "JSON edits must be a dictionary")
+
+        numbers = edits.get("numbers")
+        if not isinstance(numbers, list) or not all(
+            type(number) is int for number in numbers
+        ):
+            return badRequestResponse(
+                request, "Incident numbers must be a list of integers"
+            )
+
+        unsupported = edits.keys() - {
+            "numbers",
+            IncidentJSONKey.priority.value,
+            IncidentJSONKey.state.value,
+            IncidentJSONKey.reportEntries.value,
+        }
+        if unsupported:
+            return badRequestResponse(
+                request, f"Unsupported bulk edits: {', '.join(sorted(unsupported))}"
+            )
+
+        priority: IncidentPriority | None = None
+        state: IncidentState | None = None
+        try:
+            if IncidentJSONKey.priority.value in edits:
+                priority = modelObjectFromJSONObject(
+                    edits[IncidentJSONKey.priority.value], IncidentPriority
+                )
+            if IncidentJSONKey.state.value in edits:
+                state = modelObjectFromJSONObject(
+                    edits[IncidentJSONKey.state.value], IncidentState
+                )
+        except JSONCodecError as e:
+            return badRequestResponse(request, str(e))
+
+        now = DateTime.now(UTC)
+
+        entries = tuple(
+            ReportEntry(
+                id=-1,  # will be assigned a valid ID on write to DB
+                author=author,
+                text=jsonEntry[ReportEntryJSONKey.text.value],
+                created=now,
+                automatic=False,
+                stricken=False,
+            )
+            for jsonEntry in edits.get(IncidentJSONKey.reportEntries.value, ())
+        )
+
+        try:
+            await self.config.store.editIncidents(
+                event_id,
+                numbers,
+                author,
+                priority=priority,
+                state=state,
+                reportEntries=entries,
+            )
+        except NoSuchIncidentError as e:
+            return badRequestResponse(request, str(e))
+
+        return noContentResponse(request)
+
     @router.route(_unprefix(URLs.incidentAttachments), methods=("POST",))
     async def attachFileToIncident(
         self,
@@ -772,68 +1014,58 @@ class APIApplication:
             request, eventId, Authorization.writeIncidents
         )
 
-        _, options = parse_options_header(request.getHeader("Content-Type"))
-        p = MultipartParser(
-            request.content,
-            options.get("boundary", ""),
-            # Allow no more than one file
-            part_limit=1,
-            # Maybe move this to config
-            # Arbitrary limit of 10 MB per file
-            partsize_limit=10 * 1024 * 1024,
-        )
+        attachmentStore = self.config.attachmentStore
+        if attachmentStore is None:
+            self._log.info("no attachmentsStoreType configured")
+            return badRequestResponse(request, "Attachments upload is not enabled")
 
+        # The body is parsed and stored as it is read, so that the attached
+        # file is never held in memory in full.
+        _, options = parse_options_header(request.getHeader("Content-Type"))
+        upload: AttachmentUpload | None = None
         try:
-            parts = p.parts()
+            with PushMultipartParser(
+                options.get("boundary", ""),
+                # Allow no more than one file
+                max_segment_count=1,
+                max_segment_size=self.attachmentSizeLimit,
+            ) as parser:
+                while not parser.closed:
+                    chunk = request.content.read(self.attachmentChunkSize)
+                    for result in parser.parse(chunk):
+                        if isinstance(result, MultipartSegment):
+                            upload = AttachmentUpload(
+                                store=attachmentStore,
+                                filename=result.filename,
+                                sizeLimit=self.attachmentSizeLimit,
+                            )
+                        elif result:
+                            assert upload is not None
+                            await upload.write(result)
         except MultipartError as me:
+            if upload is not None:
+                await upload.abort()
             self._log.error("error decoding attachment: {me}", me=me)
             request.setResponseCode(me.http_status)
             return textResponse(request, str(me))
-        if len(parts) == 0:
+        except AttachmentTooLargeError as e:
+            self._log.error("error storing attachment: {e}", e=e)
+            request.setResponseCode(http.REQUEST_ENTITY_TOO_LARGE)
+            return textResponse(request, e.message)
+        except BaseException:
+            if upload is not None:
+                await upload.abort()
+            raise
+
+        if upload is None:
             # No files provided in request. Nothing to do
             return noContentResponse(request)
-        if len(parts) > 1:
-            return badRequestResponse(request, "Only one file is allowed per request")
-        part = parts[0]
-
-        try:
-            extension = puremagic_from_string(part.raw, filename=part.filename)
-        except PureError:
-            self._log.info(f"failed to determine filetype for {part.filename}")
-            extension = ""
-        else:
-            self._log.info(f"detected file extension {extension} for {part.filename}")
 
-        newFilename = (
-            f"event_{eventId}_incident_{incidentNumber:05}_{uuid4()}{extension}"
-        )
-        # Safety check, since this could make for bad behavior
-        assert "/" not in newFilename
+        attachment = await upload.finish()
 
-        match self.config.attachmentsStoreType:
-            case "Local":
-                localDestDir = self.config.localAttachmentsRoot
-                if not localDestDir:
-                    return badRequestResponse(
-                        request, "Attachments upload is not enabled"
-                    )
-                localDestDir.mkdir(parents=True, exist_ok=True)
-                dest = localDestDir / newFilename
-                part.save_as(dest)
-            case "S3":
-                if not self.config.botoClient:
-                    return badRequestResponse(
-                        request, "Attachments upload is not enabled"
-                    )
-                await deferToThread(
-                    self.config.botoClient.upload_fileobj,
-                    Fileobj=part.file,
-                    Bucket=self.config.s3Bucket,
-                    Key=self.config.s3BucketSubPath + "/" + newFilename,
-                )
-            case _:
-                self._log.info("no attachmentsStoreType configured")
-                return badRequestResponse(request, "Attachments upload is not enabled")
+        attachmentPreviewer = self.config.attachmentPreviewer
+        if attachmentPreviewer is not None:
+            attachmentPreviewer.prepare(attachment.name, attachment.contentType)
 
         user: IMSUser = request.user  # type: ignore[attr-defined]
         author = user.shortNames[0]
@@ -841,11 +1073,11 @@ class APIApplication:
         entry = ReportEntry(
             id=-1,
             author=author,
-            text=f"{author} uploaded a file: {part.filename}",
+            text=f"{author} uploaded a file: {upload.filename}",
             created=DateTime.now(UTC),
             automatic=False,
             stricken=False,
-            attachedFile=newFilename,
+            attachedFile=attachment.name,
         )
 
         await self.config.store.addReportEntriesToIncident(
@@ -853,6 +1085,37 @@ class APIApplication:
         )
         return noContentResponse(request)
 
+    @router.route(_unprefix(URLs.incidentAttachments), methods=("HEAD", "GET"))
+    async def listIncidentAttachments(
+        self,
+        request: IRequest,
+        event_id: str,
+        incident_number: str,
+    ) -> KleinSynchronousRenderable:
+        eventId = event_id
+        del event_id
+
+        await self.config.authProvider.authorizeRequest(
+            request, eventId, Authorization.readIncidents
+        )
+
+        try:
+            incidentNumber = int(incident_number)
+        except ValueError:
+            return notFoundResponse(request)
+        del incident_number
+
+        # The report entry IDs are the attachment numbers
+        reportEntries = await self.config.store.incidentAttachments(
+            eventId, incidentNumber
+        )
+
+        data = jsonTextFromObject(
+            [jsonObjectFromModelObject(entry) for entry in reportEntries]
+        ).encode("utf-8")
+
+        return jsonBytes(request, data)
+
     @router.route(_unprefix(URLs.incidentAttachmentNumber), methods=("HEAD", "GET"))
     async def retrieveIncidentAttachment(
         self,
@@ -872,61 +1135,37 @@ class APIApplication:
             request, eventId, Authorization.readIncidents
         )
 
-        incident = await self.config.store.incidentWithNumber(eventId, incidentNumber)
-
-        attachedFile: str | None = None
-        for reportEntry in incident.reportEntries:
-            if reportEntry.id == attachmentNumber:
-                attachedFile = reportEntry.attachedFile
-                break
-
+        attachedFile = await self.config.store.incidentAttachedFile(
+            eventId, incidentNumber, attachmentNumber
+        )
         if not attachedFile:
             raise NotAuthorizedError("Not authorized for file")
 
-        match self.config.attachmentsStoreType:
-            case "Local":
-                if not self.config.localAttachmentsRoot:
-                    return badRequestResponse(
-                        request, "Attachments download is not enabled"
-                    )
-                self._log.info(
-                    "reading file {f}",
-                    f=str(self.config.localAttachmentsRoot / attachedFile),
-                )
-                return File(str(self.config.localAttachmentsRoot / attachedFile))
-            case "S3":
-                with BytesIO() as buffer:
-                    if not self.config.botoClient:
-                        return badRequestResponse(
-                            request, "Attachments download is not enabled"
-                        )
-                    key = self.config.s3BucketSubPath + "/" + attachedFile
-                    self._log.info(
-                        "fetching s3://{bucket}/{key}",
-                        bucket=self.config.s3Bucket,
-                        key=key,
-                    )
-                    await deferToThread(
-                        self.config.botoClient.download_fileobj,
-                        Bucket=self.config.s3Bucket,
-                        Key=key,
-                        Fileobj=buffer,
-                    )
-                    buffer.seek(0)
-                    contentType = ""
-                    try:
-                        contentType = puremagic_from_stream(
-                            buffer, mime=True, filename=attachedFile
-                        )
-                    except PureError:
-                        self._log.info(
-                            f"failed to determine MIME type for {attachedFile}"
-                        )
-                    buffer.seek(0)
-                    return Data(buffer.read(), contentType)
-            case _:
-                self._log.info("no attachmentsStoreType configured")
-                return badRequestResponse(request, "Attachments upload is not enabled")
+        attachmentStore = self.config.attachmentStore
+        attachmentPreviewer = self.config.attachmentPreviewer
+        if attachmentStore is None or attachmentPreviewer is None:
+            self._log.info("no attachmentsStoreType configured")
+            return badRequestResponse(request, "Attachments download is not enabled")
+
+        previewSizeName = queryValue(request, "preview")
+        if previewSizeName is None:
+            return AttachmentResource(store=attachmentStore, name=attachedFile)
+
+        try:
+            previewSize = PreviewSize[previewSizeName]
+        except KeyError:
+            return invalidQueryResponse(request, "preview", previewSizeName)
+
+        try:
+            preview = await attachmentPreviewer.preview(attachedFile, previewSize)
+        except NoSuchAttachmentError:
+            return notFoundResponse(request)
+
+        if preview is None:
+            # Not an image
+            return notFoundResponse(request)
+
+        return AttachmentResource(store=attachmentPreviewer.previewStore, name=preview)
 
     @router.route(_unprefix(URLs.incident_reportEntry), methods=("POST",))
     async def editIncidentReportEntryResource(
@@ -993,22 +1232,36 @@ class APIApplication:
         incidentNumberText = queryValue(request, "incident")
         excludeSystemEntries = queryValue(request, "exclude_system_entries") == "true"
 
-        store = self.config.store
+        try:
+            fields = _listViewFields(
+                request, FieldReportJSONKey, FieldReportJSONKey.reportEntries
+            )
+        except ValueError as e:
+            return invalidQueryResponse(request, *e.args)
+
+        excludeReportEntries = (
+            fields is not None and FieldReportJSONKey.reportEntries.value not in fields
+        )
+
+        try:
+            store = _readingStore(self.config.store, request)
+        except ValueError as e:
+            return invalidQueryResponse(request, *e.args)
 
         fieldReports: Iterable[FieldReport]
         if limitedAccess:
             user: IMSUser = request.user  # type: ignore[attr-defined]
-            fieldReports = (
-                fieldReport
-                for fieldReport in await store.fieldReports(
-                    event_id, excludeSystemEntries=excludeSystemEntries
-                )
-                if user.shortNames[0]
-                in (entry.author for entry in fieldReport.reportEntries)
+            fieldReports = await store.fieldReports(
+                event_id,
+                excludeSystemEntries=excludeSystemEntries,
+                excludeReportEntries=excludeReportEntries,
+                author=user.shortNames[0],
             )
         elif incidentNumberText is None:
             fieldReports = await store.fieldReports(
-                event_id, excludeSystemEntries=excludeSystemEntries
+                event_id,
+                excludeSystemEntries=excludeSystemEntries,
+                excludeReportEntries=excludeReportEntries,
             )
         else:
             try:
@@ -1021,8 +1274,7 @@ class APIApplication:
             )
 
         stream = buildJSONArray(
-            jsonTextFromObject(jsonObjectFromModelObject(fieldReport)).encode("utf-8")
-            for fieldReport in fieldReports
+            _jsonListItem(fieldReport, fields) for fieldReport in fieldReports
         )
 
         writeJSONStream(request, stream, None)
@@ -1150,6 +1402,10 @@ class APIApplication:
             return notFoundResponse(request)
         del field_report_number
 
+        await self.config.authProvider.authorizeRequestForFieldReportNumber(
+            request, event_id, fieldReportNumber
+        )
+
         try:
             fieldReport = await self.config.store.fieldReportWithNumber(
                 event_id, fieldReportNumber
@@ -1157,10 +1413,6 @@ class APIApplication:
         except NoSuchFieldReportError:
             return notFoundResponse(request)
 
-        await self.config.authProvider.authorizeRequestForFieldReport(
-            request, fieldReport
-        )
-
         text = jsonTextFromObject(jsonObjectFromModelObject(fieldReport))
 
         return jsonBytes(request, text.encode("utf-8"))
@@ -1302,11 +1554,8 @@ class APIApplication:
         del field_report_number
         del report_entry_id
 
-        fieldReport = await self.config.store.fieldReportWithNumber(
-            eventId, fieldReportNumber
-        )
-        await self.config.authProvider.authorizeRequestForFieldReport(
-            request, fieldReport
+        await self.config.authProvider.authorizeRequestForFieldReportNumber(
+            request, eventId, fieldReportNumber
         )
 
         store = self.config.store
@@ -1346,7 +1595,10 @@ class APIApplication:
             request, None, Authorization.imsAdmin
         )
 
-        store = self.config.store
+        try:
+            store = _readingStore(self.config.store, request)
+        except ValueError as e:
+            return invalidQueryResponse(request, *e.args)
 
         acl = {}
         for event in await store.events():
@@ -1407,31 +1659,27 @@ class APIApplication:
         """
         Street list endpoint.
         """
-        store = self.config.store
+        authProvider = self.config.authProvider
+        authProvider.authenticateRequest(request)
 
         oneEventId = queryValue(request, "event_id")
 
-        async def authorizedEvents() -> AsyncIterable[Event]:
-            for event in await store.events():
-                if oneEventId and event.id != oneEventId:
-                    continue
-                try:
-                    await self.config.authProvider.authorizeRequest(
-                        request,
-                        event.id,
-                        Authorization.readIncidents | Authorization.imsAdmin,
-                    )
-                except NotAuthorizedError:
-                    pass
-                else:
-                    yield event
+        authorizationsByEvent = await authProvider.authorizationsForUserInEvents(
+            getattr(request, "user", None)
+        )
+        requiredAuthorizations = Authorization.readIncidents | Authorization.imsAdmin
 
         return jsonBytes(
             request,
             jsonTextFromObject(
                 {
-                    event.id: await store.concentricStreets(event.id)
-                    async for event in authorizedEvents()
+                    eventID: streets
+                    for eventID, streets in (
+                        await self.config.store.concentricStreetsByEvent()
+                    ).items()
+                    if (not oneEventId or eventID == oneEventId)
+                    and requiredAuthorizations
+                    & authorizationsByEvent.get(eventID, Authorization.none)
                 }
             ).encode("utf-8"),
         )
@@ -1457,11 +1705,7 @@ class APIApplication:
             return invalidJSONResponse(request, e)
 
         for eventID, streets in edits.items():
-            existing = await store.concentricStreets(eventID)
-
-            for streetID, streetName in streets.items():
-                if streetID not in existing:
-                    await store.createConcentricStreet(eventID, streetID, streetName)
+            await store.createConcentricStreets(eventID, streets)
 
         return noContentResponse(request)
 
@@ -115,7 +115,13 @@ class DataStoreEventSourceLogObserver:
             # Not a data store event
             return None
 
-        if eventClass is Incident:
+        if eventClass is Incident and "incidentNumbers" in loggerEvent:
+            # Several incidents were updated together
+            message = {
+                "event_id": loggerEvent.get("eventID", ""),
+                "incident_numbers": list(loggerEvent["incidentNumbers"]),
+            }
+        elif eventClass is Incident:
             incident = loggerEvent.get("incident", None)
 
             if incident is None:
@@ -161,6 +167,11 @@ class DataStoreEventSourceLogObserver:
             # It's some EventClass for which we don't notify the EventSource,
             # so there's nothing to do.
             return None
+
+        # Store events are logged once the data is written, so clients can
+        # ask for reads which see it (see IMSDataStore.readingAfter)
+        message["write_time"] = loggerEvent.get("log_time")
+
         self._counter[0] += 1
         return Event(
             eventID=self._counter[0],
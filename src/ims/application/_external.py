@@ -24,13 +24,14 @@ Incident Management System cached external resources.
 import os
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import Any, ClassVar
+from typing import ClassVar
 from zipfile import BadZipfile
 
-from attrs import frozen
+from attrs import field, frozen, mutable
 from hyperlink import URL
 from klein import KleinRenderable
 from twisted.internet import defer, protocol
+from twisted.internet.defer import Deferred
 from twisted.logger import Logger
 from twisted.python.compat import nativeString
 from twisted.python.failure import Failure
@@ -42,9 +43,10 @@ from twisted.web.client import URI, PartialDownloadError
 from twisted.web.iweb import IRequest
 
 from ims.config import Configuration, URLs
-from ims.ext.klein import ContentType, HeaderName, static
+from ims.element import StaticAsset, StaticAssetResource
+from ims.ext.klein import ContentType
 
-from ._klein import Router, internalErrorResponse, notFoundResponse
+from ._klein import Router, notFoundResponse
 
 
 __all__ = ("ExternalApplication",)
@@ -659,137 +661,253 @@ def _unprefix(url: URL) -> URL:
     return url.replace(path=url.path[len(prefix) :])
 
 
+def _relativePath(path: tuple[str, ...], base: URL) -> tuple[str, ...]:
+    """
+    Remove the path of the given base URL (which ends with an empty segment)
+    from the start of the given path.
+    Returns an empty path if the path is not under the base URL.
+    """
+    prefix = base.path[:-1]
+    if len(path) <= len(prefix) or path[: len(prefix)] != prefix:
+        return ()
+    return path[len(prefix) :]
+
+
+def _contentType(name: str) -> str:
+    if name.endswith(".js"):
+        return ContentType.javascript.value
+    if name.endswith(".css"):
+        return ContentType.css.value
+    if name.endswith(".map"):
+        return ContentType.json.value
+    return ContentType.text.value
+
+
 @frozen(kw_only=True, eq=False)
 class ExternalApplication:
     """
     Application with endpoints for cached external resources.
+
+    Resources are loaded into memory once, either when first requested or
+    ahead of time by :meth:`prewarm`, and are then served from memory with
+    their content digest as the ETag and (where worthwhile) gzip compression.
     """
 
     _log: ClassVar[Logger] = Logger()
     router: ClassVar[Router] = Router()
 
+    # Directory containing copies of external resources, which are used
+    # rather than downloading them
+    vendoredResourcesRoot: ClassVar[Path] = (
+        Path(__file__).parent.parent / "element" / "static"
+    )
+
+    # The URLs of external resources aren't versioned, so clients can't
+    # cache them indefinitely.
+    cacheControl: ClassVar[str] = f"max-age={20 * 60}, private"
+
+    # External resources used by IMS pages
+    prewarmURLs: ClassVar[tuple[URL, ...]] = (
+        URLs.jqueryJS,
+        URLs.bootstrapCSS,
+        URLs.bootstrapJS,
+        URLs.dataTablesJS,
+        URLs.dataTablesBootstrapCSS,
+        URLs.dataTablesBootstrapJS,
+        URLs.dataTablesResponsiveCSS,
+        URLs.dataTablesResponsiveJS,
+    )
+
+    @mutable(kw_only=True, eq=False)
+    class _State:
+        """
+        Internal mutable state for :class:`ExternalApplication`.
+        """
+
+        # Loaded resources, by URL path
+        assets: dict[tuple[str, ...], StaticAsset] = field(factory=dict)
+
+        # Deferreds waiting on in-progress loads, by URL path
+        loads: dict[tuple[str, ...], list[Deferred[StaticAsset | None]]] = field(
+            factory=dict
+        )
+
     config: Configuration
 
+    _state: _State = field(factory=_State, init=False, repr=False)
+
     @router.route(_unprefix(URLs.bootstrapBase), methods=("HEAD", "GET"), branch=True)
-    @static
     async def bootstrapResource(self, request: IRequest) -> KleinRenderable:
         """
         Endpoint for Bootstrap.
         """
-        requestURL = URL.fromText(request.uri.decode("ascii"))
-
-        # Remove URL prefix
-        names = requestURL.path[len(URLs.bootstrapBase.path) - 1 :]
-
-        if "js" in names:
-            contentType = ContentType.javascript.value
-        elif "css" in names:
-            contentType = ContentType.css.value
-        else:
-            contentType = ContentType.text.value
-
-        request.setHeader(HeaderName.contentType.value, contentType)
-        return await self.cachedZippedResource(
-            request,
-            self.config.externalDeps.bootstrapSourceURL,
-            self.config.externalDeps.bootstrapVersion,
-            self.config.externalDeps.bootstrapVersion,
-            *names,
-        )
+        return await self.assetResource(request)
 
     @router.route(_unprefix(URLs.jqueryJS), methods=("HEAD", "GET"))
-    @static
     async def jqueryJSResource(self, request: IRequest) -> KleinRenderable:
         """
         Endpoint for jQuery.
         """
-        request.setHeader(HeaderName.contentType.value, ContentType.javascript.value)
-        return await self.cachedResource(
-            request,
-            self.config.externalDeps.jqueryJSSourceURL,
-            f"{self.config.externalDeps.jqueryVersion}.min.js",
-        )
+        return await self.assetResource(request)
 
     @router.route(_unprefix(URLs.jqueryMap), methods=("HEAD", "GET"))
-    @static
     async def jqueryMapResource(self, request: IRequest) -> KleinRenderable:
         """
         Endpoint for the jQuery map file.
         """
-        request.setHeader(HeaderName.contentType.value, ContentType.json.value)
-        return await self.cachedResource(
-            request,
-            self.config.externalDeps.jqueryMapSourceURL,
-            f"{self.config.externalDeps.jqueryVersion}.min.map",
-        )
+        return await self.assetResource(request)
 
     @router.route(_unprefix(URLs.dataTablesBase), methods=("HEAD", "GET"), branch=True)
-    @static
     async def dataTablesResource(self, request: IRequest) -> KleinRenderable:
         """
         Endpoint for DataTables.
         """
-        requestURL = URL.fromText(request.uri.decode("ascii"))
+        return await self.assetResource(request)
 
-        # Remove URL prefix
-        names = requestURL.path[len(URLs.dataTablesBase.path) - 1 :]
+    async def assetResource(self, request: IRequest) -> KleinRenderable:
+        """
+        Respond with the external resource at the requested URL.
+        """
+        path = URL.fromText(request.uri.decode("ascii")).path
 
-        if names[-1].endswith(".css"):
-            contentType = ContentType.css.value
-        elif names[-1].endswith(".js"):
-            contentType = ContentType.javascript.value
-        else:
+        asset = await self.asset(path)
+        if asset is None:
             return notFoundResponse(request)
 
-        request.setHeader(HeaderName.contentType.value, contentType)
-
-        return self.cachedZippedResourceFromPath(
-            request,
-            (
-                Path(__file__).parent.parent
-                / "element"
-                / "static"
-                / f"DataTables-{self.config.externalDeps.dataTablesVersionNumber}.zip"
-            ),
-            self.config.externalDeps.dataTablesVersion,
-            *names,
+        return StaticAssetResource(asset=asset, cacheControl=self.cacheControl)
+
+    async def prewarm(self) -> None:
+        """
+        Load the external resources used by IMS pages, so that no request has
+        to wait for them to be downloaded.
+        """
+        for url in self.prewarmURLs:
+            try:
+                asset = await self.asset(url.path)
+            except Exception:  # noqa: BLE001
+                self._log.failure("Unable to load external resource {url}", url=url)
+                continue
+
+            if asset is None:
+                self._log.error("Unable to load external resource {url}", url=url)
+
+        self._log.info(
+            "Loaded {count} external resources", count=len(self._state.assets)
         )
 
+    async def asset(self, path: tuple[str, ...]) -> StaticAsset | None:
+        """
+        Look up the external resource at the given URL path, loading it if
+        necessary.
+        Returns :obj:`None` if there is no such resource.
+        """
+        state = self._state
+
+        asset = state.assets.get(path)
+        if asset is not None:
+            return asset
+
+        waiters = state.loads.get(path)
+        if waiters is not None:
+            waiter: Deferred[StaticAsset | None] = Deferred()
+            waiters.append(waiter)
+            return await waiter
+
+        waiters = state.loads[path] = []
+        try:
+            content = await self.content(path)
+        except Exception as e:
+            del state.loads[path]
+            for waiter in waiters:
+                waiter.errback(e)
+            raise
+
+        del state.loads[path]
+
+        if content is None:
+            asset = None
+        else:
+            name = path[-1]
+            asset = StaticAsset.fromContent(name, _contentType(name), content)
+            state.assets[path] = asset
+
+        for waiter in waiters:
+            waiter.callback(asset)
+
+        return asset
+
+    async def content(self, path: tuple[str, ...]) -> bytes | None:
+        """
+        Read the content of the external resource at the given URL path.
+        Returns :obj:`None` if there is no such resource.
+        """
+        deps = self.config.externalDeps
+
+        if path == URLs.jqueryJS.path:
+            return await self.cachedResource(
+                deps.jqueryJSSourceURL, f"{deps.jqueryVersion}.min.js"
+            )
+
+        if path == URLs.jqueryMap.path:
+            return await self.cachedResource(
+                deps.jqueryMapSourceURL, f"{deps.jqueryVersion}.min.map"
+            )
+
+        names = _relativePath(path, URLs.bootstrapBase)
+        if names:
+            archivePath = await self.cacheFromURL(
+                deps.bootstrapSourceURL, f"{deps.bootstrapVersion}.zip"
+            )
+            return self.zippedResource(archivePath, deps.bootstrapVersion, *names)
+
+        names = _relativePath(path, URLs.dataTablesBase)
+        if names and names[-1].endswith((".css", ".js")):
+            return self.zippedResource(
+                self.vendoredResourcesRoot / f"{deps.dataTablesVersion}.zip",
+                deps.dataTablesVersion,
+                *names,
+            )
+
+        return None
+
     async def cacheFromURL(self, url: URL, name: str) -> Path:
         """
         Download a resource and cache it.
+        Vendored copies of resources are used rather than downloading them.
         """
         cacheDir = self.config.cachedResourcesRoot
 
         destination = cacheDir / name
 
-        if not destination.exists():
-            with NamedTemporaryFile(
-                dir=str(cacheDir), delete=False, suffix=".tmp"
-            ) as tmp:
-                path = Path(tmp.name)
+        if destination.exists():
+            return destination
+
+        vendored = self.vendoredResourcesRoot / name
+        if vendored.exists():
+            return vendored
+
+        with NamedTemporaryFile(dir=str(cacheDir), delete=False, suffix=".tmp") as tmp:
+            path = Path(tmp.name)
+            try:
+                await downloadPage(url.asText().encode("utf-8"), tmp)
+            except Exception as e:  # noqa: BLE001
+                self._log.critical(
+                    "Download failed for {url}: {error}", url=url, error=e
+                )
                 try:
-                    await downloadPage(url.asText().encode("utf-8"), tmp)
-                except Exception as e:  # noqa: BLE001
+                    path.unlink()
+                except OSError as e:
                     self._log.critical(
-                        "Download failed for {url}: {error}", url=url, error=e
+                        "Failed to remove temporary file {path}: {error}",
+                        path=path,
+                        error=e,
                     )
-                    try:
-                        path.unlink()
-                    except OSError as e:
-                        self._log.critical(
-                            "Failed to remove temporary file {path}: {error}",
-                            path=path,
-                            error=e,
-                        )
-                else:
-                    path.rename(destination)
+            else:
+                path.rename(destination)
 
         return destination
 
-    async def cachedResource(
-        self, request: IRequest, url: URL, name: str
-    ) -> KleinRenderable:
+    async def cachedResource(self, url: URL, name: str) -> bytes | None:
         """
         Retrieve a cached resource.
         """
@@ -799,32 +917,11 @@ class ExternalApplication:
             return path.read_bytes()
         except OSError as e:
             self._log.error("Unable to open file {path}: {error}", path=path, error=e)
-            return notFoundResponse(request)
+            return None
 
-    async def cachedZippedResource(
-        self,
-        request: IRequest,
-        url: URL,
-        archiveName: str,
-        name: str,
-        *names: Any,
-    ) -> KleinRenderable:
-        """
-        Retrieve a cached resource from a zip file.
-        """
-
-        archivePath = await self.cacheFromURL(url, f"{archiveName}.zip")
-        return self.cachedZippedResourceFromPath(request, archivePath, name, *names)
-
-    def cachedZippedResourceFromPath(
-        self,
-        request: IRequest,
-        archivePath: Path,
-        name: str,
-        *names: Any,
-    ) -> KleinRenderable:
+    def zippedResource(self, archivePath: Path, name: str, *names: str) -> bytes | None:
         """
-        Retrieve a cached resource from a zip file.
+        Retrieve a resource from a zip file.
         """
         try:
             filePath = ZipArchive(str(archivePath))
@@ -842,14 +939,14 @@ class ExternalApplication:
                     path=archivePath,
                     error=e,
                 )
-            return internalErrorResponse(request)
+            return None
         except OSError as e:
             self._log.critical(
                 "Unable to open zip archive {path}: {error}",
                 path=archivePath,
                 error=e,
             )
-            return notFoundResponse(request)
+            return None
 
         filePath = filePath.child(name)
         for _name in names:
@@ -863,4 +960,4 @@ class ExternalApplication:
                 filePath=filePath,
                 archive=archivePath,
             )
-            return notFoundResponse(request)
+            return None
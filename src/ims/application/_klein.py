@@ -20,6 +20,7 @@ Incident Management System Klein application.
 
 from collections.abc import Callable, Iterable, Sequence
 from functools import wraps
+from time import time
 from typing import Any, TypeVar, cast
 
 from hyperlink import URL
@@ -48,6 +49,7 @@ __all__ = (
     "Router",
     "queryValue",
     "queryValues",
+    "sessionLastWrite",
 )
 
 
@@ -354,6 +356,40 @@ def queryValues(
     return (a.decode("utf-8") for a in values)
 
 
+#
+# Sessions
+#
+
+
+def sessionLastWrite(request: IRequest) -> float | None:
+    """
+    Look up when the session attached to the given request last wrote data.
+
+    @param request: The request to look into.
+
+    @return: The time (as returned by :func:`time.time`) at which the last
+        request in the session to write data finished, or :obj:`None` if no
+        request in the session has written data.
+    """
+    # Use the session established by authentication, if any; don't create one
+    # just for this.
+    session = getattr(request, "session", None)
+    return cast("float | None", getattr(session, "lastWrite", None))
+
+
+def _noteWrite(request: IRequest) -> None:
+    """
+    Note that the given request may write data, so that the session's reads
+    can see it.
+    """
+    session = request.getSession()
+
+    def finished(result: object) -> None:  # noqa: ARG001
+        session.lastWrite = time()
+
+    request.notifyFinish().addBoth(finished)  # type: ignore[attr-defined]
+
+
 #
 # Router
 #
@@ -395,6 +431,9 @@ class Router(Klein):
                 # don't require authentication.
                 app.config.authProvider.checkAuthentication(request)
 
+                if request.method not in (b"GET", b"HEAD"):
+                    _noteWrite(request)
+
                 return f(app, request, *args, **kwargs)
 
             return wrapper  # type: ignore[return-value]
@@ -18,19 +18,23 @@
 Incident Management System web service.
 """
 
+from functools import cache
 from typing import TYPE_CHECKING, ClassVar, cast
 
 from attrs import Factory, field, frozen
 from klein import KleinRenderable
 from twisted.logger import globalLogPublisher
-from twisted.python.filepath import FilePath
 from twisted.web.iweb import IRequest
-from twisted.web.static import File
 
-import ims.element
 from ims.config import Configuration, URLs
+from ims.element import (
+    StaticAsset,
+    StaticAssetResource,
+    StaticAssetsResource,
+    staticAssets,
+)
 from ims.ext.json_ext import jsonTextFromObject
-from ims.ext.klein import ContentType, HeaderName, static
+from ims.ext.klein import ContentType
 
 from ._api import APIApplication
 from ._auth import AuthApplication
@@ -47,7 +51,23 @@ if TYPE_CHECKING:
 __all__ = ("MainApplication",)
 
 
-resourcesDirectory = FilePath(ims.element.__file__).parent().child("static")
+@cache
+def urlsJavaScript() -> StaticAsset:
+    """
+    JavaScript variables for service URLs.
+
+    URLs don't change while the server is running, so this is computed once.
+    """
+    assets = staticAssets()
+    urls = {
+        k: assets.url(getattr(URLs, k)).asText()
+        for k in URLs.__dict__
+        if not k.startswith("_")
+    }
+    text = "\n".join(f"var url_{k} = {jsonTextFromObject(v)};" for k, v in urls.items())
+    return StaticAsset.fromContent(
+        "urls.js", ContentType.javascript.value, text.encode("utf-8")
+    )
 
 
 def apiApplicationFactory(parent: "MainApplication") -> APIApplication:
@@ -105,6 +125,10 @@ class MainApplication:
     def __attrs_post_init__(self) -> None:
         globalLogPublisher.addObserver(self.storeObserver)
 
+        # Build the static resource manifest now, rather than on the first
+        # request.
+        urlsJavaScript()
+
     def __del__(self) -> None:
         globalLogPublisher.removeObserver(self.storeObserver)
 
@@ -129,32 +153,22 @@ class MainApplication:
         return redirect(request, URLs.app)
 
     @router.route(URLs.static, branch=True)
-    @static
     def staticEndpoint(self, request: IRequest) -> KleinRenderable:
         """
         Return endpoint for static resources collection.
         """
-        return File(resourcesDirectory.path)
+        return StaticAssetsResource(assets=staticAssets())
 
     #
     # URLs
     #
 
     @router.route(URLs.urlsJS, methods=("HEAD", "GET"))
-    @static
     def urlsEndpoint(self, request: IRequest) -> KleinRenderable:
         """
         JavaScript variables for service URLs.
         """
-        urls = {
-            k: getattr(URLs, k).asText() for k in URLs.__dict__ if not k.startswith("_")
-        }
-
-        request.setHeader(HeaderName.contentType.value, ContentType.javascript.value)
-
-        return "\n".join(
-            (f"var url_{k} = {jsonTextFromObject(v)};" for k, v in urls.items())
-        )
+        return StaticAssetResource(asset=urlsJavaScript())
 
     #
     # Child application endpoints
@@ -0,0 +1,180 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+"""
+Tests for :mod:`ranger-ims-server.application._external`
+"""
+
+from pathlib import Path
+from typing import Any
+
+from twisted.internet.defer import Deferred, ensureDeferred, fail, succeed
+
+from ims.config import Configuration, URLs
+from ims.ext.trial import TestCase
+
+from .. import _external
+from .._external import ExternalApplication  # type: ignore[attr-defined]
+
+
+__all__ = ()
+
+
+class ExternalApplicationTests(TestCase):
+    """
+    Tests for :class:`ExternalApplication`
+    """
+
+    def setUp(self) -> None:
+        cachedResourcesRoot = Path(self.mktemp())
+        cachedResourcesRoot.mkdir()
+        vendoredResourcesRoot = Path(self.mktemp())
+        vendoredResourcesRoot.mkdir()
+
+        self.patch(ExternalApplication, "vendoredResourcesRoot", vendoredResourcesRoot)
+
+        self.app = ExternalApplication(
+            config=Configuration.fromConfigFile(None).replace(
+                cachedResourcesRoot=cachedResourcesRoot
+            )
+        )
+
+        # Paths for which content was read, and the corresponding Deferreds
+        self.contentReads: list[tuple[tuple[str, ...], Deferred[bytes | None]]] = []
+
+    def patchContent(self) -> None:
+        """
+        Replace :meth:`ExternalApplication.content` with a fake which records
+        reads and completes them when told to.
+        """
+
+        def content(
+            app: ExternalApplication,  # noqa: ARG001
+            path: tuple[str, ...],
+        ) -> Deferred[bytes | None]:
+            d: Deferred[bytes | None] = Deferred()
+            self.contentReads.append((path, d))
+            return d
+
+        self.patch(ExternalApplication, "content", content)
+
+    def test_asset_concurrent(self) -> None:
+        """
+        Concurrent requests for a resource which isn't loaded yet share a
+        single load, and later requests use the loaded resource.
+        """
+        self.patchContent()
+        path = URLs.jqueryJS.path
+
+        results = [ensureDeferred(self.app.asset(path)) for _ in range(3)]
+
+        self.assertEqual(len(self.contentReads), 1)
+        for result in results:
+            self.assertNoResult(result)
+
+        self.contentReads[0][1].callback(b"jQuery")
+
+        assets = [self.successResultOf(result) for result in results]
+        self.assertEqual(assets[0].content, b"jQuery")
+        for asset in assets:
+            self.assertIs(asset, assets[0])
+
+        self.assertIs(
+            self.successResultOf(ensureDeferred(self.app.asset(path))), assets[0]
+        )
+        self.assertEqual(len(self.contentReads), 1)
+
+    def test_asset_failed(self) -> None:
+        """
+        A failure to load a resource is reported to all of the requests
+        waiting for it, and a later request tries again.
+        """
+        self.patchContent()
+        path = URLs.jqueryJS.path
+
+        results = [ensureDeferred(self.app.asset(path)) for _ in range(3)]
+        self.contentReads[0][1].errback(OSError("Disk on fire"))
+
+        for result in results:
+            self.failureResultOf(result, OSError)
+
+        ensureDeferred(self.app.asset(path))
+        self.assertEqual(len(self.contentReads), 2)
+
+    def test_asset_vendored(self) -> None:
+        """
+        Vendored copies of resources are used rather than downloading them.
+        """
+        deps = self.app.config.externalDeps
+        vendoredPath = (
+            ExternalApplication.vendoredResourcesRoot / f"{deps.jqueryVersion}.min.js"
+        )
+        vendoredPath.write_bytes(b"vendored jQuery")
+
+        def downloadPage(*args: Any, **kwargs: Any) -> Deferred[None]:  # noqa: ARG001
+            self.fail("Resource downloaded")
+
+        self.patch(_external, "downloadPage", downloadPage)
+
+        asset = self.successResultOf(ensureDeferred(self.app.asset(URLs.jqueryJS.path)))
+        assert asset is not None
+        self.assertEqual(asset.content, b"vendored jQuery")
+
+    def test_asset_downloaded(self) -> None:
+        """
+        Resources which aren't vendored are downloaded into the cached
+        resources directory, once.
+        """
+        downloads: list[bytes] = []
+
+        def downloadPage(url: bytes, file: Any) -> Deferred[None]:
+            downloads.append(url)
+            file.write(b"downloaded jQuery")
+            return succeed(None)
+
+        self.patch(_external, "downloadPage", downloadPage)
+
+        for _ in range(2):
+            content = self.successResultOf(
+                ensureDeferred(self.app.content(URLs.jqueryJS.path))
+            )
+            self.assertEqual(content, b"downloaded jQuery")
+
+        self.assertEqual(len(downloads), 1)
+
+    def test_prewarm(self) -> None:
+        """
+        :meth:`ExternalApplication.prewarm` loads the resources used by IMS
+        pages, continuing past those which can't be loaded.
+        """
+        failedURL = ExternalApplication.prewarmURLs[0]
+
+        def content(
+            app: ExternalApplication,  # noqa: ARG001
+            path: tuple[str, ...],
+        ) -> Deferred[bytes | None]:
+            if path == failedURL.path:
+                return fail(OSError("Disk on fire"))
+            return succeed("/".join(path).encode("utf-8"))
+
+        self.patch(ExternalApplication, "content", content)
+
+        self.successResultOf(ensureDeferred(self.app.prewarm()))
+        self.assertEqual(len(self.flushLoggedErrors(OSError)), 1)
+
+        for url in ExternalApplication.prewarmURLs[1:]:
+            self.assertIn(url.path, self.app._state.assets)
+        self.assertNotIn(failedURL.path, self.app._state.assets)
@@ -0,0 +1,58 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+
+"""
+Incident Management System attachment storage.
+"""
+
+from ._abc import (
+    AttachmentMetadata,
+    AttachmentReader,
+    AttachmentStore,
+    AttachmentWriter,
+)
+from ._cache import AttachmentCacheStatistics, CachingAttachmentStore
+from ._exceptions import (
+    AttachmentStorageError,
+    AttachmentTooLargeError,
+    NoSuchAttachmentError,
+)
+from ._local import LocalAttachmentStore
+from ._preview import AttachmentPreviewer, PreviewSize
+from ._resource import AttachmentResource
+from ._s3 import S3AttachmentStore
+from ._upload import AttachmentUpload, StoredAttachment
+
+
+__all__ = (
+    "AttachmentCacheStatistics",
+    "AttachmentMetadata",
+    "AttachmentPreviewer",
+    "AttachmentReader",
+    "AttachmentResource",
+    "AttachmentStorageError",
+    "AttachmentStore",
+    "AttachmentTooLargeError",
+    "AttachmentUpload",
+    "AttachmentWriter",
+    "CachingAttachmentStore",
+    "LocalAttachmentStore",
+    "NoSuchAttachmentError",
+    "PreviewSize",
+    "S3AttachmentStore",
+    "StoredAttachment",
+)
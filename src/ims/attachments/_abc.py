@@ -0,0 +1,125 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+
+"""
+Incident Management System attachment storage abstract base classes.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime as DateTime
+
+from attrs import frozen
+
+
+__all__ = ()
+
+
+@frozen(kw_only=True)
+class AttachmentMetadata:
+    """
+    Attachment metadata.
+    """
+
+    size: int
+    contentType: str
+
+    # Entity tag, as used in HTTP (quotes included)
+    etag: str
+
+    lastModified: DateTime
+
+
+class AttachmentReader(ABC):
+    """
+    Reader for the content of a stored attachment.
+    """
+
+    @abstractmethod
+    async def read(self, size: int) -> bytes:
+        """
+        Read up to the given number of bytes from the attachment.
+        Returns empty bytes at the end of the attachment.
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """
+        Stop reading the attachment.
+        """
+
+
+class AttachmentWriter(ABC):
+    """
+    Writer for the content of an attachment being stored.
+
+    The attachment is not visible in the store until :meth:`commit` is
+    called, at which point its name (which is derived from its content) is
+    known.
+    """
+
+    @abstractmethod
+    async def write(self, data: bytes) -> None:
+        """
+        Write data to the attachment.
+        """
+
+    @abstractmethod
+    async def commit(self, name: str) -> None:
+        """
+        Finish writing the attachment and make it available in the store with
+        the given name.
+
+        Attachment names are derived from their content, so if there is
+        already an attachment with the given name, it is kept and the
+        content written is discarded.
+        """
+
+    @abstractmethod
+    async def abort(self) -> None:
+        """
+        Discard the attachment.
+        """
+
+
+class AttachmentStore(ABC):
+    """
+    Incident Management System attachment store abstract base class.
+    """
+
+    @abstractmethod
+    async def metadata(self, name: str) -> AttachmentMetadata:
+        """
+        Look up the metadata for the attachment with the given name.
+        Raises :exc:`NoSuchAttachmentError` if there is no such attachment.
+        """
+
+    @abstractmethod
+    async def reader(
+        self, name: str, start: int = 0, end: int | None = None
+    ) -> AttachmentReader:
+        """
+        Start reading the attachment with the given name, from the byte at
+        ``start`` through the byte at ``end`` (inclusive), or through the end
+        of the attachment if ``end`` is :obj:`None`.
+        Raises :exc:`NoSuchAttachmentError` if there is no such attachment.
+        """
+
+    @abstractmethod
+    async def writer(self, contentType: str) -> AttachmentWriter:
+        """
+        Start storing an attachment with the given content type.
+        """
@@ -0,0 +1,454 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+"""
+Incident Management System attachment cache.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import ClassVar
+
+from attrs import Factory, field, frozen, mutable
+from twisted.internet.defer import Deferred
+from twisted.logger import Logger
+
+from ._abc import (
+    AttachmentMetadata,
+    AttachmentReader,
+    AttachmentStore,
+    AttachmentWriter,
+)
+from ._exceptions import AttachmentStorageError, NoSuchAttachmentError
+from ._local import LocalAttachmentStore
+
+
+__all__ = ()
+
+
+@mutable(kw_only=True)
+class AttachmentCacheStatistics:
+    """
+    Attachment cache statistics.
+    """
+
+    # Reads served from the cache
+    hits: int = 0
+
+    # Reads which fetched the attachment from the backing store
+    misses: int = 0
+
+    # Reads which waited for another read's fetch of the same attachment
+    sharedMisses: int = 0
+
+    # Reads of attachments too large to cache
+    bypasses: int = 0
+
+    # Attachments removed from the cache to make room for others
+    evictions: int = 0
+
+    # Bytes fetched from the backing store
+    bytesFetched: int = 0
+
+
+@mutable(kw_only=True)
+class _CacheEntry:
+    size: int
+
+    # Metadata from the backing store, if known
+    metadata: AttachmentMetadata | None
+
+
+@mutable(kw_only=True)
+class CachingAttachmentWriter(AttachmentWriter):
+    """
+    Writer for an attachment in a caching attachment store.
+
+    Content is written to the backing store and to the cache, unless it
+    turns out to be too large to cache.
+    """
+
+    _log: ClassVar[Logger] = Logger()
+
+    store: "CachingAttachmentStore"
+    writer: AttachmentWriter
+    cacheWriter: AttachmentWriter | None
+
+    _size: int = field(default=0, init=False)
+
+    async def _abortCache(self) -> None:
+        cacheWriter, self.cacheWriter = self.cacheWriter, None
+        if cacheWriter is not None:
+            await cacheWriter.abort()
+
+    async def write(self, data: bytes) -> None:
+        """
+        See :meth:`AttachmentWriter.write`.
+        """
+        self._size += len(data)
+
+        if self.cacheWriter is not None:
+            if self._size > self.store.maxEntrySize:
+                await self._abortCache()
+            else:
+                try:
+                    await self.cacheWriter.write(data)
+                except AttachmentStorageError as e:
+                    self._log.error("Unable to cache attachment: {error}", error=e)
+                    await self._abortCache()
+
+        try:
+            await self.writer.write(data)
+        except AttachmentStorageError:
+            await self._abortCache()
+            raise
+
+    async def commit(self, name: str) -> None:
+        """
+        See :meth:`AttachmentWriter.commit`.
+        """
+        try:
+            await self.writer.commit(name)
+        except AttachmentStorageError:
+            await self._abortCache()
+            raise
+
+        cacheWriter, self.cacheWriter = self.cacheWriter, None
+        if cacheWriter is not None:
+            try:
+                await cacheWriter.commit(name)
+            except AttachmentStorageError as e:
+                self._log.error(
+                    "Unable to cache attachment {name}: {error}",
+                    name=name,
+                    error=e,
+                )
+            else:
+                self.store.added(name, self._size)
+
+    async def abort(self) -> None:
+        """
+        See :meth:`AttachmentWriter.abort`.
+        """
+        await self._abortCache()
+        await self.writer.abort()
+
+
+@frozen(kw_only=True)
+class CachingAttachmentStore(AttachmentStore):
+    """
+    Attachment store which keeps recently used attachments from a (slower)
+    backing store in a local directory.
+
+    The cache is bounded in size, evicting the least recently used
+    attachments first.
+    Attachments are cached when they are stored and when they are read.
+    Concurrent reads of an attachment which is not yet cached share a single
+    fetch from the backing store.
+
+    Attachments are never modified once stored, so cached attachments are
+    never stale.
+    """
+
+    _log: ClassVar[Logger] = Logger()
+
+    # Amount of content to copy from the backing store at a time
+    chunkSize: ClassVar[int] = 64 * 1024
+
+    # Maximum number of uncached attachments to remember metadata for
+    metadataCacheSize: ClassVar[int] = 1024
+
+    @mutable(kw_only=True, eq=False)
+    class _State:
+        """
+        Internal mutable state for :class:`CachingAttachmentStore`.
+        """
+
+        # Cached attachments, least recently used first
+        entries: OrderedDict[str, _CacheEntry] = field(factory=OrderedDict)
+        size: int = 0
+
+        # Metadata from the backing store for attachments which aren't cached,
+        # least recently used first, so that fetching them into the cache
+        # doesn't look it up again
+        metadata: OrderedDict[str, AttachmentMetadata] = field(factory=OrderedDict)
+
+        # Deferreds waiting on in-progress fetches, by attachment name
+        fetches: dict[str, list[Deferred[_CacheEntry | None]]] = field(factory=dict)
+
+        statistics: AttachmentCacheStatistics = field(factory=AttachmentCacheStatistics)
+
+    store: AttachmentStore
+    root: Path
+
+    # Maximum total size of cached attachments, in bytes
+    maxSize: int
+
+    # Maximum size of a cached attachment, in bytes; larger attachments are
+    # read directly from the backing store.
+    maxEntrySize: int = Factory(lambda self: self.maxSize // 4, takes_self=True)
+
+    _cache: LocalAttachmentStore = field(init=False)
+    _state: _State = field(factory=_State, init=False, repr=False)
+
+    @_cache.default
+    def _newCache(self) -> LocalAttachmentStore:
+        return LocalAttachmentStore(root=self.root)
+
+    def __attrs_post_init__(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        # Index attachments cached by a previous process, oldest first.
+        # Attachment names never start with ".", so any such files are left
+        # over from incomplete writes.
+        paths: list[tuple[float, Path, int]] = []
+        for path in self.root.iterdir():
+            stat = path.stat()
+            if path.name.startswith("."):
+                path.unlink()
+            else:
+                paths.append((stat.st_mtime, path, stat.st_size))
+
+        for _, path, size in sorted(paths):
+            self.added(path.name, size)
+
+    @property
+    def statistics(self) -> AttachmentCacheStatistics:
+        """
+        Cache statistics.
+        """
+        return self._state.statistics
+
+    @property
+    def size(self) -> int:
+        """
+        Total size of cached attachments, in bytes.
+        """
+        return self._state.size
+
+    def logStatistics(self) -> None:
+        """
+        Log cache statistics.
+        """
+        statistics = self._state.statistics
+        reads = statistics.hits + statistics.misses + statistics.sharedMisses
+        self._log.info(
+            "Attachment cache: {hitRate:.0%} of {reads} reads cached, "
+            "{size}/{maxSize} bytes used; {statistics}",
+            hitRate=statistics.hits / reads if reads else 0.0,
+            reads=reads,
+            size=self._state.size,
+            maxSize=self.maxSize,
+            statistics=statistics,
+        )
+
+    def path(self, name: str) -> Path:
+        """
+        Look up the path of the cached copy of the attachment with the given
+        name.
+        """
+        return self._cache.path(name)
+
+    def cached(self, name: str) -> bool:
+        """
+        Determine whether the attachment with the given name is cached.
+        """
+        return name in self._state.entries
+
+    def added(self, name: str, size: int) -> None:
+        """
+        Record that an attachment of the given size has been written to the
+        cache directory.
+        """
+        # The backing store's metadata (eg. its ETag) is looked up when first
+        # needed.
+        self._add(name, _CacheEntry(size=size, metadata=None))
+
+    def _add(self, name: str, entry: _CacheEntry) -> None:
+        state = self._state
+
+        previous = state.entries.pop(name, None)
+        if previous is not None:
+            state.size -= previous.size
+
+        state.entries[name] = entry
+        state.size += entry.size
+
+        while state.size > self.maxSize and len(state.entries) > 1:
+            evictName, evictEntry = state.entries.popitem(last=False)
+            state.size -= evictEntry.size
+            state.statistics.evictions += 1
+            self._log.debug("Evicting cached attachment {name}", name=evictName)
+            try:
+                self._cache.path(evictName).unlink(missing_ok=True)
+            except OSError as e:
+                self._log.error(
+                    "Unable to remove cached attachment {name}: {error}",
+                    name=evictName,
+                    error=e,
+                )
+
+    def _remove(self, name: str) -> None:
+        entry = self._state.entries.pop(name, None)
+        if entry is not None:
+            self._state.size -= entry.size
+
+    async def _uncachedMetadata(self, name: str) -> AttachmentMetadata:
+        """
+        Look up the metadata for an attachment which isn't cached from the
+        backing store, remembering it for when the attachment is fetched.
+        """
+        state = self._state
+
+        metadata = state.metadata.get(name)
+        if metadata is not None:
+            state.metadata.move_to_end(name)
+            return metadata
+
+        metadata = await self.store.metadata(name)
+
+        state.metadata[name] = metadata
+        while len(state.metadata) > self.metadataCacheSize:
+            state.metadata.popitem(last=False)
+
+        return metadata
+
+    async def _fetch(self, name: str) -> _CacheEntry | None:
+        """
+        Copy an attachment from the backing store into the cache.
+        Returns :obj:`None` if the attachment is too large to cache.
+        """
+        statistics = self._state.statistics
+
+        metadata = await self._uncachedMetadata(name)
+        if metadata.size > self.maxEntrySize:
+            statistics.bypasses += 1
+            return None
+
+        statistics.misses += 1
+
+        writer = await self._cache.writer(metadata.contentType)
+        try:
+            reader = await self.store.reader(name)
+            try:
+                while data := await reader.read(self.chunkSize):
+                    await writer.write(data)
+                    statistics.bytesFetched += len(data)
+            finally:
+                await reader.close()
+        except BaseException:
+            await writer.abort()
+            raise
+
+        await writer.commit(name)
+
+        entry = _CacheEntry(size=metadata.size, metadata=metadata)
+        self._add(name, entry)
+        self._state.metadata.pop(name, None)
+
+        self._log.debug(
+            "Cached attachment {name}: {statistics}",
+            name=name,
+            statistics=statistics,
+        )
+
+        return entry
+
+    async def _cachedEntry(self, name: str) -> _CacheEntry | None:
+        """
+        Look up the cache entry for an attachment, fetching it from the
+        backing store if necessary.
+        Returns :obj:`None` if the attachment is too large to cache.
+        """
+        state = self._state
+
+        entry = state.entries.get(name)
+        if entry is not None:
+            state.entries.move_to_end(name)
+            state.statistics.hits += 1
+            return entry
+
+        waiters = state.fetches.get(name)
+        if waiters is not None:
+            state.statistics.sharedMisses += 1
+            waiter: Deferred[_CacheEntry | None] = Deferred()
+            waiters.append(waiter)
+            return await waiter
+
+        waiters = state.fetches[name] = []
+        try:
+            entry = await self._fetch(name)
+        except Exception as e:
+            del state.fetches[name]
+            for waiter in waiters:
+                waiter.errback(e)
+            raise
+        else:
+            del state.fetches[name]
+            for waiter in waiters:
+                waiter.callback(entry)
+            return entry
+
+    async def metadata(self, name: str) -> AttachmentMetadata:
+        """
+        See :meth:`AttachmentStore.metadata`.
+        """
+        entry = self._state.entries.get(name)
+        if entry is None:
+            return await self._uncachedMetadata(name)
+
+        if entry.metadata is None:
+            entry.metadata = await self.store.metadata(name)
+
+        return entry.metadata
+
+    async def reader(
+        self, name: str, start: int = 0, end: int | None = None
+    ) -> AttachmentReader:
+        """
+        See :meth:`AttachmentStore.reader`.
+        """
+        entry = await self._cachedEntry(name)
+
+        if entry is not None:
+            try:
+                return await self._cache.reader(name, start=start, end=end)
+            except NoSuchAttachmentError:
+                self._log.error(
+                    "Cached attachment {name} is missing from {root}",
+                    name=name,
+                    root=self.root,
+                )
+                self._remove(name)
+
+        return await self.store.reader(name, start=start, end=end)
+
+    async def writer(self, contentType: str) -> AttachmentWriter:
+        """
+        See :meth:`AttachmentStore.writer`.
+        """
+        writer = await self.store.writer(contentType)
+
+        cacheWriter: AttachmentWriter | None
+        try:
+            cacheWriter = await self._cache.writer(contentType)
+        except AttachmentStorageError as e:
+            self._log.error("Unable to cache attachment: {error}", error=e)
+            cacheWriter = None
+
+        return CachingAttachmentWriter(
+            store=self, writer=writer, cacheWriter=cacheWriter
+        )
@@ -0,0 +1,211 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+
+"""
+Incident Management System local file system attachment store.
+"""
+
+from datetime import UTC
+from datetime import datetime as DateTime
+from os import fdopen
+from pathlib import Path
+from tempfile import mkstemp
+from typing import BinaryIO, ClassVar
+
+from attrs import field, frozen, mutable
+from twisted.logger import Logger
+
+from ._abc import (
+    AttachmentMetadata,
+    AttachmentReader,
+    AttachmentStore,
+    AttachmentWriter,
+)
+from ._exceptions import AttachmentStorageError, NoSuchAttachmentError
+from ._upload import contentTypeForName
+
+
+__all__ = ()
+
+
+@mutable(kw_only=True)
+class LocalAttachmentReader(AttachmentReader):
+    """
+    Reader for an attachment in a local attachment store.
+    """
+
+    _file: BinaryIO
+
+    # Number of bytes left to read, or None to read to the end of the file
+    _remaining: int | None
+
+    async def read(self, size: int) -> bytes:
+        """
+        See :meth:`AttachmentReader.read`.
+        """
+        if self._remaining is not None:
+            size = min(size, self._remaining)
+            if size <= 0:
+                return b""
+
+        data = self._file.read(size)
+
+        if self._remaining is not None:
+            self._remaining -= len(data)
+
+        return data
+
+    async def close(self) -> None:
+        """
+        See :meth:`AttachmentReader.close`.
+        """
+        self._file.close()
+
+
+@mutable(kw_only=True)
+class LocalAttachmentWriter(AttachmentWriter):
+    """
+    Writer for an attachment in a local attachment store.
+
+    Content is written to a temporary file in the attachments directory,
+    which is renamed into place when the attachment is committed.
+    """
+
+    _log: ClassVar[Logger] = Logger()
+
+    store: "LocalAttachmentStore"
+    _temporaryPath: Path
+    _file: BinaryIO
+
+    async def write(self, data: bytes) -> None:
+        """
+        See :meth:`AttachmentWriter.write`.
+        """
+        try:
+            self._file.write(data)
+        except OSError as e:
+            self._log.critical(
+                "Unable to write attachment {path}: {error}",
+                path=self._temporaryPath,
+                error=e,
+            )
+            raise AttachmentStorageError(str(e)) from e
+
+    async def commit(self, name: str) -> None:
+        """
+        See :meth:`AttachmentWriter.commit`.
+        """
+        path = self.store.path(name)
+
+        try:
+            self._file.close()
+            if path.exists():
+                self._log.info("Attachment {path} is already stored", path=path)
+                self._temporaryPath.unlink()
+            else:
+                self._temporaryPath.replace(path)
+        except OSError as e:
+            self._log.critical(
+                "Unable to store attachment {path}: {error}",
+                path=path,
+                error=e,
+            )
+            self._temporaryPath.unlink(missing_ok=True)
+            raise AttachmentStorageError(str(e)) from e
+
+    async def abort(self) -> None:
+        """
+        See :meth:`AttachmentWriter.abort`.
+        """
+        self._file.close()
+        self._temporaryPath.unlink(missing_ok=True)
+
+
+@frozen(kw_only=True)
+class LocalAttachmentStore(AttachmentStore):
+    """
+    Attachment store which keeps attachments in a local directory.
+    """
+
+    root: Path = field(converter=Path)
+
+    def path(self, name: str) -> Path:
+        """
+        Look up the path for the attachment with the given name.
+        """
+        # Safety check, since this could make for bad behavior
+        if "/" in name or name.startswith("."):
+            raise AttachmentStorageError(f"Invalid attachment name: {name!r}")
+
+        return self.root / name
+
+    async def metadata(self, name: str) -> AttachmentMetadata:
+        """
+        See :meth:`AttachmentStore.metadata`.
+        """
+        path = self.path(name)
+
+        try:
+            stat = path.stat()
+        except FileNotFoundError as e:
+            raise NoSuchAttachmentError(f"No such attachment: {name}") from e
+        except OSError as e:
+            raise AttachmentStorageError(str(e)) from e
+
+        return AttachmentMetadata(
+            size=stat.st_size,
+            # The file extension was chosen for the detected content type
+            # when the attachment was stored
+            contentType=contentTypeForName(name),
+            etag=f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+            lastModified=DateTime.fromtimestamp(stat.st_mtime, tz=UTC),
+        )
+
+    async def reader(
+        self, name: str, start: int = 0, end: int | None = None
+    ) -> AttachmentReader:
+        """
+        See :meth:`AttachmentStore.reader`.
+        """
+        path = self.path(name)
+
+        try:
+            file = path.open("rb")
+        except FileNotFoundError as e:
+            raise NoSuchAttachmentError(f"No such attachment: {name}") from e
+        except OSError as e:
+            raise AttachmentStorageError(str(e)) from e
+
+        file.seek(start)
+
+        return LocalAttachmentReader(
+            file=file, remaining=None if end is None else end - start + 1
+        )
+
+    async def writer(self, contentType: str) -> AttachmentWriter:
+        """
+        See :meth:`AttachmentStore.writer`.
+        """
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd, temporaryName = mkstemp(dir=self.root, prefix=".upload-")
+        except OSError as e:
+            raise AttachmentStorageError(str(e)) from e
+
+        return LocalAttachmentWriter(
+            store=self, temporaryPath=Path(temporaryName), file=fdopen(fd, "wb")
+        )
@@ -0,0 +1,310 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+"""
+Incident Management System attachment previews.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable
+from enum import Enum
+from io import BytesIO
+from typing import TYPE_CHECKING, ClassVar
+
+from attrs import field, frozen, mutable
+from twisted.internet.defer import Deferred, ensureDeferred
+from twisted.internet.threads import deferToThread
+from twisted.logger import Logger
+from twisted.python.failure import Failure
+
+from ._abc import AttachmentStore
+from ._exceptions import AttachmentStorageError
+from ._local import LocalAttachmentStore
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+__all__ = ()
+
+
+class PreviewSize(Enum):
+    """
+    Attachment preview sizes, as the maximum width and height in pixels.
+    """
+
+    small = 320
+    large = 1280
+
+
+previewContentType = "image/jpeg"
+
+
+def renderPreview(content: bytes, size: int) -> bytes | None:
+    """
+    Render a JPEG preview of an image, scaled down to fit within a square of
+    the given size.
+    Returns :obj:`None` if the content is not an image that can be read.
+
+    This is CPU-bound, and should be called in a worker thread.
+    """
+    # Pillow is only needed (and its image plugins only loaded) once a
+    # preview is actually rendered.
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    try:
+        with Image.open(BytesIO(content)) as image:
+            # Have the decoder scale down as it goes (for JPEG, at least),
+            # which is much faster than decoding the full image.
+            image.draft("RGB", (size, size))
+
+            # Phone cameras record orientation separately from the pixels
+            preview = ImageOps.exif_transpose(image)
+            preview.thumbnail((size, size))
+
+            if preview.mode != "RGB":
+                preview = preview.convert("RGB")
+
+            output = BytesIO()
+            preview.save(output, format="JPEG", quality=80, optimize=True)
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError):
+        return None
+
+    return output.getvalue()
+
+
+def previewName(name: str, size: PreviewSize) -> str:
+    """
+    Compute the name of a preview of the attachment with the given name.
+    """
+    return f"{name}.preview-{size.name}.jpg"
+
+
+@frozen(kw_only=True)
+class AttachmentPreviewer:
+    """
+    Generates and keeps scaled-down previews of image attachments.
+
+    Previews are rendered in a worker thread, and kept in a separate local
+    attachment store, so each is rendered once.
+    Concurrent requests for a preview which doesn't exist yet share a single
+    rendering.
+
+    The preview store is bounded in size, removing the least recently used
+    previews first; a removed preview is rendered again when next needed.
+    """
+
+    _log: ClassVar[Logger] = Logger()
+
+    # Amount of content to read from the store at a time
+    chunkSize: ClassVar[int] = 64 * 1024
+
+    @mutable(kw_only=True, eq=False)
+    class _State:
+        """
+        Internal mutable state for :class:`AttachmentPreviewer`.
+        """
+
+        # Sizes of stored previews, by name, least recently used first
+        previews: OrderedDict[str, int] = field(factory=OrderedDict)
+        size: int = 0
+
+        # Names of attachments known to have no preview
+        unpreviewable: set[str] = field(factory=set)
+
+        # Deferreds waiting on in-progress renderings, by preview name
+        renderings: dict[str, list[Deferred[str | None]]] = field(factory=dict)
+
+    # Store containing the attachments
+    store: AttachmentStore
+
+    # Store in which to keep previews
+    previewStore: LocalAttachmentStore
+
+    # Largest attachment to render a preview of, in bytes
+    maxSize: int = 32 * 1024 * 1024
+
+    # Maximum total size of stored previews, in bytes
+    maxStoreSize: int = 256 * 1024 * 1024
+
+    render: Callable[[bytes, int], bytes | None] = renderPreview
+
+    _state: _State = field(factory=_State, init=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        root = self.previewStore.root
+        root.mkdir(parents=True, exist_ok=True)
+
+        # Index previews stored by a previous process, oldest first.
+        # Preview names never start with ".", so any such files are left over
+        # from incomplete writes.
+        paths: list[tuple[float, Path, int]] = []
+        for path in root.iterdir():
+            stat = path.stat()
+            if path.name.startswith("."):
+                path.unlink()
+            else:
+                paths.append((stat.st_mtime, path, stat.st_size))
+
+        for _, path, size in sorted(paths):
+            self._added(path.name, size)
+
+    @property
+    def size(self) -> int:
+        """
+        Total size of stored previews, in bytes.
+        """
+        return self._state.size
+
+    def _added(self, preview: str, size: int) -> None:
+        """
+        Record that a preview of the given size has been stored, removing the
+        least recently used previews if the store is too large.
+        """
+        state = self._state
+
+        previous = state.previews.pop(preview, None)
+        if previous is not None:
+            state.size -= previous
+
+        state.previews[preview] = size
+        state.size += size
+
+        while state.size > self.maxStoreSize and len(state.previews) > 1:
+            removeName, removeSize = state.previews.popitem(last=False)
+            state.size -= removeSize
+            self._log.debug("Removing preview {name}", name=removeName)
+            try:
+                self.previewStore.path(removeName).unlink(missing_ok=True)
+            except OSError as e:
+                self._log.error(
+                    "Unable to remove preview {name}: {error}",
+                    name=removeName,
+                    error=e,
+                )
+
+    async def _content(self, name: str) -> bytes | None:
+        """
+        Read the content of an image attachment.
+        Returns :obj:`None` if the attachment is not an image, or is too large
+        to render a preview of.
+        """
+        metadata = await self.store.metadata(name)
+        if not metadata.contentType.startswith("image/"):
+            return None
+        if metadata.size > self.maxSize:
+            self._log.info(
+                "Attachment {name} is too large to preview ({size} bytes)",
+                name=name,
+                size=metadata.size,
+            )
+            return None
+
+        reader = await self.store.reader(name)
+        try:
+            chunks = []
+            while data := await reader.read(self.chunkSize):
+                chunks.append(data)
+        finally:
+            await reader.close()
+
+        return b"".join(chunks)
+
+    async def _render(self, name: str, size: PreviewSize) -> str | None:
+        preview = previewName(name, size)
+
+        content = await self._content(name)
+        if content is None:
+            return None
+
+        rendered = await deferToThread(self.render, content, size.value)
+        if rendered is None:
+            self._log.info("Unable to render preview of {name}", name=name)
+            return None
+
+        writer = await self.previewStore.writer(previewContentType)
+        try:
+            await writer.write(rendered)
+        except AttachmentStorageError:
+            await writer.abort()
+            raise
+        await writer.commit(preview)
+        self._added(preview, len(rendered))
+
+        self._log.info(
+            "Rendered {size} preview of {name}: {before} -> {after} bytes",
+            size=size.name,
+            name=name,
+            before=len(content),
+            after=len(rendered),
+        )
+
+        return preview
+
+    async def preview(self, name: str, size: PreviewSize) -> str | None:
+        """
+        Look up the name of a preview of the attachment with the given name
+        in :attr:`previewStore`, rendering the preview if necessary.
+        Returns :obj:`None` if the attachment can't be previewed.
+        Raises :exc:`NoSuchAttachmentError` if there is no such attachment.
+        """
+        state = self._state
+        preview = previewName(name, size)
+
+        if preview in state.previews:
+            state.previews.move_to_end(preview)
+            return preview
+        if name in state.unpreviewable:
+            return None
+
+        waiters = state.renderings.get(preview)
+        if waiters is not None:
+            waiter: Deferred[str | None] = Deferred()
+            waiters.append(waiter)
+            return await waiter
+
+        waiters = state.renderings[preview] = []
+        try:
+            result = await self._render(name, size)
+        except Exception as e:
+            del state.renderings[preview]
+            for waiter in waiters:
+                waiter.errback(e)
+            raise
+
+        del state.renderings[preview]
+
+        if result is None:
+            state.unpreviewable.add(name)
+
+        for waiter in waiters:
+            waiter.callback(result)
+
+        return result
+
+    def prepare(self, name: str, contentType: str) -> None:
+        """
+        Start rendering a small preview of a newly stored attachment in the
+        background, so that it is ready when the attachment is first shown.
+        """
+        if not contentType.startswith("image/"):
+            return
+
+        def failed(failure: Failure) -> None:
+            self._log.failure("Unable to render preview of {name}", failure, name=name)
+
+        ensureDeferred(self.preview(name, PreviewSize.small)).addErrback(failed)
@@ -0,0 +1,357 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+"""
+Incident Management System attachment download resource.
+"""
+
+from typing import Any, ClassVar, cast
+
+from attrs import evolve, field, frozen, mutable
+from twisted.internet.defer import Deferred, ensureDeferred
+from twisted.internet.interfaces import IPushProducer
+from twisted.logger import Logger
+from twisted.python.failure import Failure
+from twisted.web import http
+from twisted.web.iweb import IRequest
+from twisted.web.resource import IResource, NoResource
+from twisted.web.server import NOT_DONE_YET, Request
+from zope.interface import implementer
+
+from ims.ext.klein import HeaderName, requestHeader
+
+from ._abc import AttachmentMetadata, AttachmentReader, AttachmentStore
+from ._exceptions import AttachmentStorageError, NoSuchAttachmentError
+from ._upload import digestFromName
+
+
+__all__ = ()
+
+
+def _weakETag(etag: str) -> str:
+    return etag.strip().removeprefix("W/")
+
+
+def _lastModified(metadata: AttachmentMetadata) -> int:
+    """
+    Last modified time of an attachment, in whole seconds since the epoch, as
+    used in HTTP dates.
+    """
+    return int(metadata.lastModified.timestamp())
+
+
+def _httpDate(text: str) -> int | None:
+    try:
+        return cast("int", http.stringToDatetime(text.encode("latin-1")))
+    except ValueError:
+        return None
+
+
+def _etagMatches(ifNoneMatch: str, etag: str) -> bool:
+    # If-None-Match uses the weak comparison function
+    etag = _weakETag(etag)
+    return any(
+        tag.strip() == "*" or _weakETag(tag) == etag for tag in ifNoneMatch.split(",")
+    )
+
+
+def _notModified(request: IRequest, metadata: AttachmentMetadata) -> bool:
+    """
+    Determine whether a conditional request's cached copy is current.
+    """
+    ifNoneMatch = requestHeader(request, HeaderName.ifNoneMatch)
+    if ifNoneMatch is not None:
+        # If-None-Match takes precedence over If-Modified-Since
+        return _etagMatches(ifNoneMatch, metadata.etag)
+
+    ifModifiedSince = requestHeader(request, HeaderName.ifModifiedSince)
+    if ifModifiedSince is not None:
+        since = _httpDate(ifModifiedSince)
+        return since is not None and _lastModified(metadata) <= since
+
+    return False
+
+
+def _requestedRange(request: IRequest, metadata: AttachmentMetadata) -> str | None:
+    """
+    Look up the byte range requested, if any.
+    The range is ignored if an If-Range condition doesn't match.
+    """
+    rangeHeader = requestHeader(request, HeaderName.range)
+    if rangeHeader is None:
+        return None
+
+    ifRange = requestHeader(request, HeaderName.ifRange)
+    if ifRange is not None:
+        ifRange = ifRange.strip()
+        if ifRange.startswith(('"', "W/")):
+            # If-Range requires the strong comparison function
+            if ifRange.startswith("W/") or ifRange != metadata.etag:
+                return None
+        elif _httpDate(ifRange) != _lastModified(metadata):
+            return None
+
+    return rangeHeader
+
+
+def parseByteRange(value: str, size: int) -> tuple[int, int] | None:
+    """
+    Parse the value of a Range header requesting a single byte range of a
+    resource with the given size.
+
+    Returns the first and last (inclusive) byte positions requested, or
+    :obj:`None` if the value isn't a single byte range, in which case the
+    header should be ignored.
+    Raises :exc:`ValueError` if the range is not satisfiable.
+    """
+    unit, _, ranges = value.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        # We don't support other units or multipart/byteranges responses
+        return None
+
+    first, dash, last = ranges.strip().partition("-")
+    if not dash:
+        return None
+
+    if not first:
+        # Suffix range: the last N bytes
+        if not last.isdigit():
+            return None
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError(f"Unsatisfiable range: {value}")
+        return max(size - length, 0), size - 1
+
+    if not first.isdigit() or not (last == "" or last.isdigit()):
+        return None
+
+    start = int(first)
+    end = size - 1 if last == "" else min(int(last), size - 1)
+
+    if end < start:
+        if last != "" and int(last) < start:
+            # Invalid rather than unsatisfiable
+            return None
+        raise ValueError(f"Unsatisfiable range: {value}")
+
+    return start, end
+
+
+@implementer(IPushProducer)
+@mutable(kw_only=True)
+class _AttachmentProducer:
+    """
+    Producer which streams an attachment's content to a request.
+    """
+
+    reader: AttachmentReader
+    request: Request
+    chunkSize: int
+
+    _paused: Deferred[None] | None = field(default=None, init=False)
+    stopped: bool = field(default=False, init=False)
+
+    def pauseProducing(self) -> None:
+        if self._paused is None:
+            self._paused = Deferred()
+
+    def resumeProducing(self) -> None:
+        paused, self._paused = self._paused, None
+        if paused is not None:
+            paused.callback(None)
+
+    def stopProducing(self) -> None:
+        self.stopped = True
+        self.resumeProducing()
+
+    async def produce(self, length: int) -> None:
+        """
+        Write the given number of bytes from the reader to the request.
+        """
+        remaining = length
+        try:
+            while remaining > 0:
+                if self._paused is not None:
+                    await self._paused
+                    continue
+
+                data = await self.reader.read(min(self.chunkSize, remaining))
+                if self.stopped:
+                    break
+                if not data:
+                    raise AttachmentStorageError(
+                        f"Attachment ended {remaining} bytes early"
+                    )
+
+                remaining -= len(data)
+                self.request.write(data)
+        finally:
+            await self.reader.close()
+
+
+@implementer(IResource)
+@frozen(kw_only=True)
+class AttachmentResource:
+    """
+    Resource which serves an attachment from an attachment store.
+
+    Content is streamed from the store as the client reads it, rather than
+    held in memory.
+    Conditional requests (If-None-Match, If-Modified-Since) and single byte
+    range requests (Range, If-Range) are supported.
+
+    Attachments named for the digest of their content never change, so the
+    digest is used as their ETag and clients may cache them indefinitely.
+    """
+
+    _log: ClassVar[Logger] = Logger()
+
+    # Amount of content to read from the store at a time
+    chunkSize: ClassVar[int] = 64 * 1024
+
+    # Cache-Control for attachments named for their content
+    immutableCacheControl: ClassVar[str] = (
+        f"private, max-age={365 * 24 * 60 * 60}, immutable"
+    )
+
+    isLeaf: ClassVar[bool] = True
+
+    store: AttachmentStore
+    name: str
+
+    def getChildWithDefault(self, name: bytes, request: IRequest) -> IResource:
+        """
+        See :meth:`IResource.getChildWithDefault`.
+        Attachment resources have no children.
+        """
+        return NoResource()
+
+    def putChild(self, path: bytes, child: IResource) -> None:
+        """
+        See :meth:`IResource.putChild`.
+        Attachment resources have no children, so this does nothing.
+        """
+
+    def render(self, request: IRequest) -> Any:
+        """
+        See :meth:`IResource.render`.
+        """
+        # Klein renders resources with a twisted.web.server.Request
+        serverRequest = cast("Request", request)
+        d = ensureDeferred(self._render(serverRequest))
+        d.addErrback(self._renderFailed, serverRequest)
+        return NOT_DONE_YET
+
+    def _renderFailed(self, failure: Failure, request: Request) -> None:
+        self._log.failure("Unable to serve attachment {name}", failure, name=self.name)
+        if request.startedWriting:
+            # Too late to send an error response, and the client must not
+            # mistake what it has received for the full content.
+            request.loseConnection()
+        else:
+            request.setResponseCode(http.INTERNAL_SERVER_ERROR)
+            request.setHeader(HeaderName.contentLength.value, b"0")
+            request.finish()
+
+    async def _render(self, request: Request) -> None:
+        digest = digestFromName(self.name)
+        if digest is not None:
+            etag = f'"sha256-{digest}"'
+            request.setHeader(HeaderName.etag.value, etag)
+            request.setHeader(HeaderName.cacheControl.value, self.immutableCacheControl)
+
+            # No need to consult the store if the client has the content
+            ifNoneMatch = requestHeader(request, HeaderName.ifNoneMatch)
+            if ifNoneMatch is not None and _etagMatches(ifNoneMatch, etag):
+                request.setResponseCode(http.NOT_MODIFIED)
+                request.finish()
+                return
+
+        try:
+            metadata = await self.store.metadata(self.name)
+        except NoSuchAttachmentError:
+            request.setResponseCode(http.NOT_FOUND)
+            request.setHeader(HeaderName.contentLength.value, b"0")
+            request.finish()
+            return
+
+        if digest is not None:
+            metadata = evolve(metadata, etag=etag)
+
+        request.setHeader(HeaderName.etag.value, metadata.etag)
+        request.setHeader(
+            HeaderName.lastModified.value,
+            http.datetimeToString(_lastModified(metadata)),
+        )
+        request.setHeader(HeaderName.acceptRanges.value, b"bytes")
+
+        if _notModified(request, metadata):
+            request.setResponseCode(http.NOT_MODIFIED)
+            request.finish()
+            return
+
+        request.setHeader(HeaderName.contentType.value, metadata.contentType)
+
+        start, end = 0, metadata.size - 1
+
+        rangeHeader = _requestedRange(request, metadata)
+        if rangeHeader is not None:
+            try:
+                byteRange = parseByteRange(rangeHeader, metadata.size)
+            except ValueError:
+                request.setResponseCode(http.REQUESTED_RANGE_NOT_SATISFIABLE)
+                request.setHeader(
+                    HeaderName.contentRange.value, f"bytes */{metadata.size}"
+                )
+                request.setHeader(HeaderName.contentLength.value, b"0")
+                request.finish()
+                return
+
+            if byteRange is not None:
+                start, end = byteRange
+                request.setResponseCode(http.PARTIAL_CONTENT)
+                request.setHeader(
+                    HeaderName.contentRange.value,
+                    f"bytes {start}-{end}/{metadata.size}",
+                )
+
+        length = end - start + 1
+        request.setHeader(HeaderName.contentLength.value, str(length))
+
+        if request.method == b"HEAD" or length == 0:
+            request.finish()
+            return
+
+        reader = await self.store.reader(
+            self.name, start=start, end=None if end == metadata.size - 1 else end
+        )
+        producer = _AttachmentProducer(
+            reader=reader, request=request, chunkSize=self.chunkSize
+        )
+
+        def connectionLost(_: Failure) -> None:
+            producer.stopProducing()
+
+        request.notifyFinish().addErrback(connectionLost)
+
+        request.registerProducer(producer, True)
+        try:
+            await producer.produce(length)
+        finally:
+            request.unregisterProducer()
+
+        if not producer.stopped:
+            request.finish()
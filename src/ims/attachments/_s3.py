@@ -0,0 +1,337 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+
+"""
+Incident Management System S3 attachment store.
+"""
+
+from collections.abc import Callable
+from datetime import UTC
+from tempfile import SpooledTemporaryFile
+from typing import Any, ClassVar
+from uuid import uuid4
+
+from attrs import field, frozen, mutable
+from botocore.client import BaseClient  # type: ignore[import-untyped]
+from botocore.exceptions import (  # type: ignore[import-untyped]
+    BotoCoreError,
+    ClientError,
+)
+from twisted.internet.threads import deferToThread
+from twisted.logger import Logger
+
+from ._abc import (
+    AttachmentMetadata,
+    AttachmentReader,
+    AttachmentStore,
+    AttachmentWriter,
+)
+from ._exceptions import AttachmentStorageError, NoSuchAttachmentError
+from ._upload import contentTypeForName, defaultContentType
+
+
+__all__ = ()
+
+
+# Error codes in S3 responses indicating that an object does not exist
+_notFoundCodes = frozenset(("404", "NoSuchKey", "NotFound"))
+
+
+@mutable(kw_only=True)
+class S3AttachmentReader(AttachmentReader):
+    """
+    Reader for an attachment in an S3 attachment store.
+    """
+
+    # Streaming body of a get_object response
+    body: Any
+
+    async def read(self, size: int) -> bytes:
+        """
+        See :meth:`AttachmentReader.read`.
+        """
+        try:
+            data: bytes = await deferToThread(self.body.read, size)
+        except BotoCoreError as e:
+            raise AttachmentStorageError(str(e)) from e
+        return data
+
+    async def close(self) -> None:
+        """
+        See :meth:`AttachmentReader.close`.
+        """
+        self.body.close()
+
+
+@mutable(kw_only=True)
+class S3AttachmentWriter(AttachmentWriter):
+    """
+    Writer for an attachment in an S3 attachment store.
+
+    Content is spooled (to memory, then to a temporary file) until a part's
+    worth has been written, then uploaded as a part of a multipart upload.
+    Attachments smaller than a part are uploaded in a single request when
+    committed.
+
+    As the attachment's name isn't known until it is committed, multipart
+    uploads are made to a temporary key, then copied (within S3) to the
+    attachment's key.
+    """
+
+    _log: ClassVar[Logger] = Logger()
+
+    # Amount of buffered content to hold in memory before spooling to disk
+    spoolSize: ClassVar[int] = 256 * 1024
+
+    store: "S3AttachmentStore"
+    contentType: str
+
+    _temporaryKey: str = field(init=False)
+    _buffer: SpooledTemporaryFile[bytes] = field(init=False)
+    _uploadID: str | None = field(default=None, init=False)
+    _parts: list[dict[str, Any]] = field(factory=list, init=False)
+
+    @_temporaryKey.default
+    def _newTemporaryKey(self) -> str:
+        return f"{self.store.subPath}/.upload-{uuid4().hex}"
+
+    @_buffer.default
+    def _newBuffer(self) -> SpooledTemporaryFile[bytes]:
+        return SpooledTemporaryFile(max_size=self.spoolSize)
+
+    async def _call(self, method: Callable[..., Any], **kwargs: Any) -> Any:
+        return await self.store.call(method, self._temporaryKey, **kwargs)
+
+    async def _uploadPart(self) -> None:
+        client = self.store.client
+
+        if self._uploadID is None:
+            response = await self._call(
+                client.create_multipart_upload, ContentType=self.contentType
+            )
+            self._uploadID = response["UploadId"]
+
+        partNumber = len(self._parts) + 1
+
+        self._buffer.seek(0)
+        response = await self._call(
+            client.upload_part,
+            UploadId=self._uploadID,
+            PartNumber=partNumber,
+            Body=self._buffer,
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": partNumber})
+
+        self._buffer.seek(0)
+        self._buffer.truncate()
+
+    async def _completeUpload(self, key: str) -> None:
+        client = self.store.client
+
+        if self._buffer.tell() > 0:
+            await self._uploadPart()
+
+        await self._call(
+            client.complete_multipart_upload,
+            UploadId=self._uploadID,
+            MultipartUpload={"Parts": self._parts},
+        )
+        self._uploadID = None
+
+        try:
+            if await self.store.objectExists(key):
+                self._log.info("Attachment {key} is already stored", key=key)
+            else:
+                await self.store.call(
+                    client.copy_object,
+                    key,
+                    CopySource={"Bucket": self.store.bucket, "Key": self._temporaryKey},
+                    ContentType=self.contentType,
+                    MetadataDirective="REPLACE",
+                )
+        finally:
+            try:
+                await self._call(client.delete_object)
+            except AttachmentStorageError as e:
+                self._log.error(
+                    "Unable to delete temporary attachment {key}: {error}",
+                    key=self._temporaryKey,
+                    error=e,
+                )
+
+    async def write(self, data: bytes) -> None:
+        """
+        See :meth:`AttachmentWriter.write`.
+        """
+        self._buffer.write(data)
+
+        if self._buffer.tell() >= self.store.partSize:
+            try:
+                await self._uploadPart()
+            except AttachmentStorageError:
+                await self.abort()
+                raise
+
+    async def commit(self, name: str) -> None:
+        """
+        See :meth:`AttachmentWriter.commit`.
+        """
+        client = self.store.client
+        key = self.store.key(name)
+
+        try:
+            if self._uploadID is not None:
+                await self._completeUpload(key)
+            elif await self.store.objectExists(key):
+                self._log.info("Attachment {key} is already stored", key=key)
+            else:
+                self._buffer.seek(0)
+                await self.store.call(
+                    client.put_object,
+                    key,
+                    Body=self._buffer,
+                    ContentType=self.contentType,
+                )
+        except AttachmentStorageError:
+            await self.abort()
+            raise
+
+        self._buffer.close()
+
+    async def abort(self) -> None:
+        """
+        See :meth:`AttachmentWriter.abort`.
+        """
+        self._buffer.close()
+
+        uploadID = self._uploadID
+        if uploadID is not None:
+            self._uploadID = None
+            try:
+                await self._call(
+                    self.store.client.abort_multipart_upload, UploadId=uploadID
+                )
+            except AttachmentStorageError as e:
+                self._log.error(
+                    "Unable to abort upload of attachment {key}: {error}",
+                    key=self._temporaryKey,
+                    error=e,
+                )
+
+
+@frozen(kw_only=True)
+class S3AttachmentStore(AttachmentStore):
+    """
+    Attachment store which keeps attachments in an S3 bucket.
+    """
+
+    _log: ClassVar[Logger] = Logger()
+
+    client: BaseClient
+    bucket: str
+    subPath: str
+
+    # Size of each part of a multipart upload.
+    # S3 requires that all but the last part be at least 5 MiB.
+    partSize: int = 5 * 1024 * 1024
+
+    def key(self, name: str) -> str:
+        """
+        Look up the key for the attachment with the given name.
+        """
+        # Safety check, since this could make for bad behavior
+        if "/" in name:
+            raise AttachmentStorageError(f"Invalid attachment name: {name!r}")
+
+        return f"{self.subPath}/{name}"
+
+    async def call(self, method: Callable[..., Any], key: str, **kwargs: Any) -> Any:
+        """
+        Call the given S3 client method for the object with the given key in
+        a worker thread.
+        """
+        try:
+            return await deferToThread(method, Bucket=self.bucket, Key=key, **kwargs)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in _notFoundCodes:
+                raise NoSuchAttachmentError(
+                    f"No such attachment: s3://{self.bucket}/{key}"
+                ) from e
+            self._log.critical(
+                "S3 request for attachment s3://{bucket}/{key} failed: {error}",
+                bucket=self.bucket,
+                key=key,
+                error=e,
+            )
+            raise AttachmentStorageError(str(e)) from e
+        except BotoCoreError as e:
+            self._log.critical(
+                "S3 request for attachment s3://{bucket}/{key} failed: {error}",
+                bucket=self.bucket,
+                key=key,
+                error=e,
+            )
+            raise AttachmentStorageError(str(e)) from e
+
+    async def objectExists(self, key: str) -> bool:
+        """
+        Determine whether there is an object with the given key.
+        """
+        try:
+            await self.call(self.client.head_object, key)
+        except NoSuchAttachmentError:
+            return False
+        return True
+
+    async def metadata(self, name: str) -> AttachmentMetadata:
+        """
+        See :meth:`AttachmentStore.metadata`.
+        """
+        response = await self.call(self.client.head_object, self.key(name))
+
+        # Objects stored before the content type was recorded on upload get
+        # S3's default content type; fall back to the attachment name's.
+        contentType = response.get("ContentType")
+        if contentType in (None, "binary/octet-stream", defaultContentType):
+            contentType = contentTypeForName(name)
+
+        return AttachmentMetadata(
+            size=response["ContentLength"],
+            contentType=contentType,
+            etag=response["ETag"],
+            lastModified=response["LastModified"].astimezone(UTC),
+        )
+
+    async def reader(
+        self, name: str, start: int = 0, end: int | None = None
+    ) -> AttachmentReader:
+        """
+        See :meth:`AttachmentStore.reader`.
+        """
+        kwargs: dict[str, Any] = {}
+        if start != 0 or end is not None:
+            kwargs["Range"] = f"bytes={start}-{'' if end is None else end}"
+
+        response = await self.call(self.client.get_object, self.key(name), **kwargs)
+
+        return S3AttachmentReader(body=response["Body"])
+
+    async def writer(self, contentType: str) -> AttachmentWriter:
+        """
+        See :meth:`AttachmentStore.writer`.
+        """
+        return S3AttachmentWriter(store=self, contentType=contentType)
@@ -0,0 +1,217 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+
+"""
+Incident Management System attachment uploads.
+"""
+
+from hashlib import sha256
+from mimetypes import guess_type
+from re import compile as regexCompile
+from typing import Any, ClassVar
+
+from attrs import field, frozen, mutable
+from puremagic import PureError
+from puremagic import from_string as puremagic_from_string
+from twisted.logger import Logger
+
+from ._abc import AttachmentStore, AttachmentWriter
+from ._exceptions import AttachmentStorageError, AttachmentTooLargeError
+
+
+__all__ = ()
+
+
+defaultContentType = "application/octet-stream"
+
+
+def contentAddressedName(digest: str, extension: str) -> str:
+    """
+    Compute the name of an attachment from the SHA-256 digest of its content
+    and the file extension for its content type.
+    """
+    return f"sha256-{digest}{extension}"
+
+
+_contentAddressedNamePattern = regexCompile(r"sha256-(?P<digest>[0-9a-f]{64})(\.\w+)?")
+
+
+def digestFromName(name: str) -> str | None:
+    """
+    Look up the SHA-256 digest of an attachment's content from its name.
+    Returns :obj:`None` for attachments stored before attachments were named
+    for their content.
+    """
+    match = _contentAddressedNamePattern.fullmatch(name)
+    if match is None:
+        return None
+    return match.group("digest")
+
+
+def contentTypeForName(name: str) -> str:
+    """
+    Determine the content type for an attachment from its name.
+    """
+    contentType, _ = guess_type(name, strict=False)
+    return contentType or defaultContentType
+
+
+@frozen(kw_only=True)
+class StoredAttachment:
+    """
+    An attachment which has been stored.
+    """
+
+    name: str
+    contentType: str
+    size: int
+
+    # SHA-256 digest of the content, as a hexadecimal string
+    digest: str
+
+
+@mutable(kw_only=True)
+class AttachmentUpload:
+    """
+    Streams the content of an uploaded attachment into an attachment store.
+
+    Attachments are named for the digest of their content, so the same
+    content uploaded more than once is stored once.
+
+    The type of the content is detected from its first bytes, which are
+    held until :attr:`sniffSize` bytes have been written.
+    After that, content is hashed and handed to the store as it is written,
+    and the size limit is enforced as it goes, so that the attachment is
+    never held in memory in full.
+    """
+
+    _log: ClassVar[Logger] = Logger()
+
+    sniffSize: ClassVar[int] = 64 * 1024
+
+    store: AttachmentStore
+
+    # File name provided by the client, used as a hint when detecting the
+    # content type
+    filename: str | None
+
+    sizeLimit: int | None = None
+
+    _head: bytearray = field(factory=bytearray, init=False)
+    _hash: Any = field(factory=sha256, init=False)
+    _size: int = field(default=0, init=False)
+    _writer: AttachmentWriter | None = field(default=None, init=False)
+    _extension: str = field(default="", init=False)
+    _contentType: str = field(default="", init=False)
+
+    def _sniff(self, head: bytes) -> tuple[str, str]:
+        """
+        Determine the file extension and MIME type of the given content.
+        """
+        if not head:
+            return "", defaultContentType
+
+        try:
+            extension = puremagic_from_string(head, filename=self.filename)
+            contentType = puremagic_from_string(head, mime=True, filename=self.filename)
+        except PureError:
+            self._log.info(
+                "failed to determine filetype for {filename}", filename=self.filename
+            )
+            return "", defaultContentType
+
+        self._log.info(
+            "detected file extension {extension} for {filename}",
+            extension=extension,
+            filename=self.filename,
+        )
+        return extension, contentType or defaultContentType
+
+    async def _open(self) -> AttachmentWriter:
+        head = bytes(self._head)
+        self._head.clear()
+
+        self._extension, self._contentType = self._sniff(head)
+
+        writer = await self.store.writer(self._contentType)
+        self._writer = writer
+
+        if head:
+            try:
+                await writer.write(head)
+            except AttachmentStorageError:
+                await self.abort()
+                raise
+
+        return writer
+
+    async def write(self, data: bytes) -> None:
+        """
+        Write data to the attachment.
+        """
+        self._size += len(data)
+
+        if self.sizeLimit is not None and self._size > self.sizeLimit:
+            await self.abort()
+            raise AttachmentTooLargeError(
+                f"Attachment exceeds size limit of {self.sizeLimit} bytes"
+            )
+
+        self._hash.update(data)
+
+        writer = self._writer
+        if writer is None:
+            self._head += data
+            if len(self._head) >= self.sniffSize:
+                await self._open()
+        else:
+            try:
+                await writer.write(data)
+            except AttachmentStorageError:
+                await self.abort()
+                raise
+
+    async def finish(self) -> StoredAttachment:
+        """
+        Finish writing the attachment and store it.
+        """
+        writer = self._writer
+        if writer is None:
+            writer = await self._open()
+
+        digest = self._hash.hexdigest()
+        name = contentAddressedName(digest, self._extension)
+
+        await writer.commit(name)
+
+        return StoredAttachment(
+            name=name,
+            contentType=self._contentType,
+            size=self._size,
+            digest=digest,
+        )
+
+    async def abort(self) -> None:
+        """
+        Discard the attachment.
+        """
+        self._head.clear()
+
+        writer = self._writer
+        if writer is not None:
+            self._writer = None
+            await writer.abort()
@@ -0,0 +1,210 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+
+"""
+Fake S3 client for testing.
+"""
+
+from datetime import UTC
+from datetime import datetime as DateTime
+from hashlib import md5
+from io import BytesIO
+from typing import Any, BinaryIO
+
+from attrs import field, mutable
+from botocore.exceptions import ClientError  # type: ignore[import-untyped]
+
+
+__all__ = ()
+
+
+@mutable(kw_only=True)
+class FakeS3Object:
+    """
+    An object stored in a :class:`FakeS3Client`.
+    """
+
+    body: bytes
+    contentType: str
+    lastModified: DateTime = field(
+        factory=lambda: DateTime(2025, 8, 30, 12, 0, tzinfo=UTC)
+    )
+
+    @property
+    def etag(self) -> str:
+        return f'"{md5(self.body, usedforsecurity=False).hexdigest()}"'
+
+
+@mutable(kw_only=True)
+class FakeS3Body:
+    """
+    Streaming body of a :class:`FakeS3Client` get_object response.
+    """
+
+    data: BytesIO
+    closed: bool = False
+
+    def read(self, size: int) -> bytes:
+        assert not self.closed
+        return self.data.read(size)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@mutable(kw_only=True)
+class FakeS3Client:
+    """
+    In-memory stand-in for a boto3 S3 client, implementing only the methods
+    used by the attachment store.
+    """
+
+    objects: dict[tuple[str, str], FakeS3Object] = field(factory=dict)
+
+    # Multipart uploads in progress, by upload ID
+    uploads: dict[str, dict[int, bytes]] = field(factory=dict)
+    uploadContentTypes: dict[str, str] = field(factory=dict)
+
+    # Method names which should fail when called
+    failures: set[str] = field(factory=set)
+
+    calls: list[str] = field(factory=list)
+
+    # Bodies returned by get_object
+    bodies: list[FakeS3Body] = field(factory=list)
+
+    def _call(self, name: str) -> None:
+        self.calls.append(name)
+        if name in self.failures:
+            raise ClientError(
+                {"Error": {"Code": "InternalError", "Message": "Oops"}}, name
+            )
+
+    def _object(self, name: str, bucket: str, key: str) -> FakeS3Object:
+        try:
+            return self.objects[(bucket, key)]
+        except KeyError:
+            raise ClientError(
+                {"Error": {"Code": "NoSuchKey", "Message": "Nope"}}, name
+            ) from None
+
+    def head_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+        self._call("head_object")
+        obj = self._object("head_object", Bucket, Key)
+        return {
+            "ContentLength": len(obj.body),
+            "ContentType": obj.contentType,
+            "ETag": obj.etag,
+            "LastModified": obj.lastModified,
+        }
+
+    def get_object(
+        self, *, Bucket: str, Key: str, Range: str | None = None
+    ) -> dict[str, Any]:
+        self._call("get_object")
+        obj = self._object("get_object", Bucket, Key)
+        body = obj.body
+        if Range is not None:
+            assert Range.startswith("bytes="), Range
+            first, last = Range.removeprefix("bytes=").split("-")
+            body = body[int(first) : int(last) + 1 if last else None]
+        fakeBody = FakeS3Body(data=BytesIO(body))
+        self.bodies.append(fakeBody)
+        return {"Body": fakeBody, "ContentLength": len(body)}
+
+    def put_object(
+        self, *, Bucket: str, Key: str, Body: BinaryIO, ContentType: str
+    ) -> dict[str, Any]:
+        self._call("put_object")
+        self.objects[(Bucket, Key)] = FakeS3Object(
+            body=Body.read(), contentType=ContentType
+        )
+        return {}
+
+    def create_multipart_upload(
+        self, *, Bucket: str, Key: str, ContentType: str
+    ) -> dict[str, Any]:
+        self._call("create_multipart_upload")
+        uploadID = f"upload-{len(self.calls)}"
+        self.uploads[uploadID] = {}
+        self.uploadContentTypes[uploadID] = ContentType
+        return {"Bucket": Bucket, "Key": Key, "UploadId": uploadID}
+
+    def upload_part(
+        self,
+        *,
+        Bucket: str,
+        Key: str,
+        UploadId: str,
+        PartNumber: int,
+        Body: BinaryIO,
+    ) -> dict[str, Any]:
+        self._call("upload_part")
+        self.uploads[UploadId][PartNumber] = Body.read()
+        return {"ETag": f'"{UploadId}-{PartNumber}"'}
+
+    def complete_multipart_upload(
+        self,
+        *,
+        Bucket: str,
+        Key: str,
+        UploadId: str,
+        MultipartUpload: dict[str, Any],
+    ) -> dict[str, Any]:
+        self._call("complete_multipart_upload")
+        parts = self.uploads.pop(UploadId)
+        partNumbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        assert partNumbers == sorted(parts), (partNumbers, sorted(parts))
+        self.objects[(Bucket, Key)] = FakeS3Object(
+            body=b"".join(parts[number] for number in partNumbers),
+            contentType=self.uploadContentTypes.pop(UploadId),
+        )
+        return {}
+
+    def copy_object(
+        self,
+        *,
+        Bucket: str,
+        Key: str,
+        CopySource: dict[str, str],
+        ContentType: str,
+        MetadataDirective: str,
+    ) -> dict[str, Any]:
+        self._call("copy_object")
+        assert MetadataDirective == "REPLACE"
+        source = self._object("copy_object", CopySource["Bucket"], CopySource["Key"])
+        self.objects[(Bucket, Key)] = FakeS3Object(
+            body=source.body, contentType=ContentType
+        )
+        return {}
+
+    def delete_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+        self._call("delete_object")
+        self.objects.pop((Bucket, Key), None)
+        return {}
+
+    def abort_multipart_upload(
+        self,
+        *,
+        Bucket: str,
+        Key: str,
+        UploadId: str,
+    ) -> dict[str, Any]:
+        self._call("abort_multipart_upload")
+        del self.uploads[UploadId]
+        del self.uploadContentTypes[UploadId]
+        return {}
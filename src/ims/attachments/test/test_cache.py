@@ -0,0 +1,298 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+"""
+Tests for :mod:`ranger-ims-server.attachments._cache`
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+from unittest.mock import patch
+
+from twisted.internet.defer import ensureDeferred, gatherResults
+from twisted.logger import LogEvent, Logger, formatEvent
+
+from ims.ext.trial import AsynchronousTestCase, asyncAsDeferred
+
+from .._abc import AttachmentStore
+from .._cache import CachingAttachmentStore
+from .._exceptions import NoSuchAttachmentError
+from .._s3 import S3AttachmentStore
+from .s3 import FakeS3Client, FakeS3Object
+
+
+if TYPE_CHECKING:
+    from twisted.logger import ILogObserver
+
+
+__all__ = ()
+
+
+async def readAll(store: AttachmentStore, name: str) -> bytes:
+    reader = await store.reader(name)
+    chunks = []
+    while data := await reader.read(1024):
+        chunks.append(data)
+    await reader.close()
+    return b"".join(chunks)
+
+
+class CachingAttachmentStoreTests(AsynchronousTestCase):
+    """
+    Tests for :class:`CachingAttachmentStore`
+    """
+
+    def store(
+        self,
+        client: FakeS3Client,
+        maxSize: int = 100,
+        maxEntrySize: int = 25,
+        root: Path | None = None,
+    ) -> CachingAttachmentStore:
+        return CachingAttachmentStore(
+            store=S3AttachmentStore(client=client, bucket="bucket", subPath="a"),
+            root=Path(self.mktemp()) if root is None else root,
+            maxSize=maxSize,
+            maxEntrySize=maxEntrySize,
+        )
+
+    def client(self, **objects: bytes) -> FakeS3Client:
+        client = FakeS3Client()
+        for name, body in objects.items():
+            client.objects["bucket", f"a/{name}"] = FakeS3Object(
+                body=body, contentType="text/plain"
+            )
+        return client
+
+    @asyncAsDeferred
+    async def test_reader_miss(self) -> None:
+        """
+        Reading an attachment which isn't cached fetches it from the backing
+        store into the cache.
+        """
+        client = self.client(x=b"Hello, World!")
+        store = self.store(client)
+
+        self.assertEqual(await readAll(store, "x"), b"Hello, World!")
+
+        self.assertTrue(store.cached("x"))
+        self.assertEqual(store.path("x").read_bytes(), b"Hello, World!")
+        self.assertEqual(store.statistics.misses, 1)
+        self.assertEqual(store.statistics.hits, 0)
+        self.assertEqual(store.statistics.bytesFetched, 13)
+
+    @asyncAsDeferred
+    async def test_reader_miss_metadata(self) -> None:
+        """
+        Reading an attachment which isn't cached, after looking up its
+        metadata, looks up the metadata from the backing store only once.
+        """
+        client = self.client(x=b"Hello, World!")
+        store = self.store(client)
+
+        metadata = await store.metadata("x")
+        self.assertEqual(await readAll(store, "x"), b"Hello, World!")
+
+        self.assertEqual(client.calls, ["head_object", "get_object"])
+        self.assertEqual(await store.metadata("x"), metadata)
+        self.assertEqual(client.calls, ["head_object", "get_object"])
+
+    @asyncAsDeferred
+    async def test_reader_hit(self) -> None:
+        """
+        Reading a cached attachment doesn't use the backing store.
+        """
+        client = self.client(x=b"Hello, World!")
+        store = self.store(client)
+
+        await readAll(store, "x")
+        calls = list(client.calls)
+
+        self.assertEqual(await readAll(store, "x"), b"Hello, World!")
+
+        self.assertEqual(client.calls, calls)
+        self.assertEqual(store.statistics.misses, 1)
+        self.assertEqual(store.statistics.hits, 1)
+
+    @asyncAsDeferred
+    async def test_reader_range(self) -> None:
+        """
+        Ranges of cached attachments are read from the cache.
+        """
+        client = self.client(x=b"Hello, World!")
+        store = self.store(client)
+
+        reader = await store.reader("x", start=7, end=11)
+        self.assertEqual(await reader.read(100), b"World")
+        await reader.close()
+
+        self.assertTrue(store.cached("x"))
+
+    @asyncAsDeferred
+    async def test_reader_concurrent(self) -> None:
+        """
+        Concurrent reads of an attachment which isn't cached share a single
+        fetch from the backing store.
+        """
+        client = self.client(x=b"Hello, World!")
+        store = self.store(client)
+
+        results = await gatherResults(
+            [ensureDeferred(readAll(store, "x")) for _ in range(3)]
+        )
+
+        self.assertEqual(results, [b"Hello, World!"] * 3)
+        self.assertEqual(client.calls.count("get_object"), 1)
+        self.assertEqual(store.statistics.misses, 1)
+        self.assertEqual(store.statistics.sharedMisses, 2)
+
+    @asyncAsDeferred
+    async def test_reader_concurrent_missing(self) -> None:
+        """
+        Concurrent reads of a missing attachment all fail.
+        """
+        store = self.store(self.client())
+
+        for d in [ensureDeferred(store.reader("x")) for _ in range(2)]:
+            try:
+                await d
+            except NoSuchAttachmentError:
+                pass
+            else:
+                self.fail("NoSuchAttachmentError not raised")
+
+        self.assertFalse(store.cached("x"))
+
+    @asyncAsDeferred
+    async def test_reader_large(self) -> None:
+        """
+        Attachments too large to cache are read from the backing store.
+        """
+        client = self.client(x=b"Hello, World!")
+        store = self.store(client, maxEntrySize=10)
+
+        self.assertEqual(await readAll(store, "x"), b"Hello, World!")
+
+        self.assertFalse(store.cached("x"))
+        self.assertEqual(store.statistics.bypasses, 1)
+
+    @asyncAsDeferred
+    async def test_evict(self) -> None:
+        """
+        The least recently used attachments are evicted to keep the cache
+        within its maximum size.
+        """
+        client = self.client(x=b"x" * 20, y=b"y" * 20, z=b"z" * 20)
+        store = self.store(client, maxSize=50)
+
+        await readAll(store, "x")
+        await readAll(store, "y")
+        await readAll(store, "x")
+        await readAll(store, "z")
+
+        self.assertTrue(store.cached("x"))
+        self.assertFalse(store.cached("y"))
+        self.assertTrue(store.cached("z"))
+        self.assertFalse(store.path("y").exists())
+        self.assertEqual(store.size, 40)
+        self.assertEqual(store.statistics.evictions, 1)
+
+    @asyncAsDeferred
+    async def test_logStatistics(self) -> None:
+        """
+        :meth:`CachingAttachmentStore.logStatistics` logs the proportion of
+        reads served from the cache and the cache's size.
+        """
+        client = self.client(x=b"Hello, World!")
+        store = self.store(client)
+
+        for _ in range(4):
+            await readAll(store, "x")
+
+        events: list[LogEvent] = []
+        with patch.object(
+            CachingAttachmentStore,
+            "_log",
+            Logger(observer=cast("ILogObserver", events.append)),
+        ):
+            store.logStatistics()
+
+        self.assertEqual(len(events), 1)
+        self.assertStartsWith(
+            formatEvent(events[0]),
+            "Attachment cache: 75% of 4 reads cached, 13/100 bytes used; ",
+        )
+
+    @asyncAsDeferred
+    async def test_writer(self) -> None:
+        """
+        Stored attachments are written to the backing store and the cache.
+        """
+        client = self.client()
+        store = self.store(client)
+
+        writer = await store.writer("text/plain")
+        await writer.write(b"Hello, ")
+        await writer.write(b"World!")
+        await writer.commit("x")
+
+        self.assertEqual(client.objects["bucket", "a/x"].body, b"Hello, World!")
+        self.assertTrue(store.cached("x"))
+
+        self.assertEqual(await readAll(store, "x"), b"Hello, World!")
+        self.assertEqual(store.statistics.hits, 1)
+        self.assertNotIn("get_object", client.calls)
+
+        # Metadata comes from the backing store
+        metadata = await store.metadata("x")
+        self.assertEqual(metadata.etag, client.objects["bucket", "a/x"].etag)
+
+    @asyncAsDeferred
+    async def test_writer_large(self) -> None:
+        """
+        Stored attachments too large to cache are written only to the backing
+        store.
+        """
+        client = self.client()
+        store = self.store(client, maxEntrySize=10)
+
+        writer = await store.writer("text/plain")
+        await writer.write(b"Hello, ")
+        await writer.write(b"World!")
+        await writer.commit("x")
+
+        self.assertEqual(client.objects["bucket", "a/x"].body, b"Hello, World!")
+        self.assertFalse(store.cached("x"))
+        self.assertEqual(list(store.root.iterdir()), [])
+
+    @asyncAsDeferred
+    async def test_restart(self) -> None:
+        """
+        Attachments cached by a previous store are used.
+        """
+        client = self.client(x=b"Hello, World!")
+        root = Path(self.mktemp())
+
+        await readAll(self.store(client, root=root), "x")
+        (root / ".upload-leftover").write_bytes(b"...")
+
+        store = self.store(client, root=root)
+
+        self.assertTrue(store.cached("x"))
+        self.assertEqual(store.size, 13)
+        self.assertFalse((root / ".upload-leftover").exists())
+        self.assertEqual(await readAll(store, "x"), b"Hello, World!")
+        self.assertEqual(store.statistics.hits, 1)
@@ -0,0 +1,147 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+
+"""
+Tests for :mod:`ranger-ims-server.attachments._local`
+"""
+
+from pathlib import Path
+
+from ims.ext.trial import TestCase
+
+from .._exceptions import AttachmentStorageError, NoSuchAttachmentError
+from .._local import LocalAttachmentStore
+
+
+__all__ = ()
+
+
+class LocalAttachmentStoreTests(TestCase):
+    """
+    Tests for :class:`LocalAttachmentStore`
+    """
+
+    def store(self) -> LocalAttachmentStore:
+        return LocalAttachmentStore(root=Path(self.mktemp()))
+
+    def test_commit(self) -> None:
+        """
+        Committed attachments are stored in the attachments directory, and no
+        temporary files are left behind.
+        """
+        store = self.store()
+
+        writer = self.successResultOf(store.writer("text/plain"))
+        self.successResultOf(writer.write(b"Hello, "))
+        self.successResultOf(writer.write(b"World!"))
+
+        self.assertFalse(store.path("a.txt").exists())
+
+        self.successResultOf(writer.commit("a.txt"))
+
+        self.assertEqual(store.path("a.txt").read_bytes(), b"Hello, World!")
+        self.assertEqual([p.name for p in store.root.iterdir()], ["a.txt"])
+
+    def test_commit_existing(self) -> None:
+        """
+        Attachments with the name of an existing attachment are not stored
+        again.
+        """
+        store = self.store()
+
+        for _ in range(2):
+            writer = self.successResultOf(store.writer("text/plain"))
+            self.successResultOf(writer.write(b"Hello, World!"))
+            self.successResultOf(writer.commit("a.txt"))
+
+        self.assertEqual(store.path("a.txt").read_bytes(), b"Hello, World!")
+        self.assertEqual([p.name for p in store.root.iterdir()], ["a.txt"])
+
+    def test_abort(self) -> None:
+        """
+        Aborted attachments leave nothing behind.
+        """
+        store = self.store()
+
+        writer = self.successResultOf(store.writer("text/plain"))
+        self.successResultOf(writer.write(b"Hello, World!"))
+        self.successResultOf(writer.abort())
+
+        self.assertEqual(list(store.root.iterdir()), [])
+
+    def test_path_invalid(self) -> None:
+        """
+        :meth:`LocalAttachmentStore.path` rejects names which could refer to
+        files outside of the attachments directory.
+        """
+        store = self.store()
+
+        for name in ("../a.txt", "a/b.txt", ".a.txt"):
+            self.assertRaises(AttachmentStorageError, store.path, name)
+
+    def test_metadata(self) -> None:
+        """
+        :meth:`LocalAttachmentStore.metadata` returns the attachment's size
+        and the content type implied by its name.
+        """
+        store = self.store()
+        store.root.mkdir()
+        store.path("a.png").write_bytes(b"Hello, World!")
+
+        metadata = self.successResultOf(store.metadata("a.png"))
+
+        self.assertEqual(metadata.size, 13)
+        self.assertEqual(metadata.contentType, "image/png")
+        self.assertTrue(metadata.etag.startswith('"'))
+        self.assertTrue(metadata.etag.endswith('"'))
+
+    def test_metadata_missing(self) -> None:
+        """
+        :meth:`LocalAttachmentStore.metadata` raises
+        :exc:`NoSuchAttachmentError` for missing attachments.
+        """
+        store = self.store()
+
+        self.failureResultOf(store.metadata("a.txt"), NoSuchAttachmentError)
+
+    def test_reader(self) -> None:
+        """
+        :meth:`LocalAttachmentStore.reader` reads the attachment's content.
+        """
+        store = self.store()
+        store.root.mkdir()
+        store.path("a.txt").write_bytes(b"Hello, World!")
+
+        reader = self.successResultOf(store.reader("a.txt"))
+        chunks = [self.successResultOf(reader.read(5)) for _ in range(4)]
+        self.successResultOf(reader.close())
+
+        self.assertEqual(chunks, [b"Hello", b", Wor", b"ld!", b""])
+
+    def test_reader_range(self) -> None:
+        """
+        :meth:`LocalAttachmentStore.reader` reads only the given range.
+        """
+        store = self.store()
+        store.root.mkdir()
+        store.path("a.txt").write_bytes(b"Hello, World!")
+
+        reader = self.successResultOf(store.reader("a.txt", start=7, end=11))
+        chunks = [self.successResultOf(reader.read(3)) for _ in range(3)]
+        self.successResultOf(reader.close())
+
+        self.assertEqual(chunks, [b"Wor", b"ld", b""])
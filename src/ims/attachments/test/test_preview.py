@@ -0,0 +1,229 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+"""
+Tests for :mod:`ranger-ims-server.attachments._preview`
+"""
+
+from io import BytesIO
+from pathlib import Path
+
+from twisted.internet.defer import ensureDeferred, gatherResults
+
+from ims.ext.trial import AsynchronousTestCase, TestCase, asyncAsDeferred
+
+from .._exceptions import NoSuchAttachmentError
+from .._local import LocalAttachmentStore
+from .._preview import AttachmentPreviewer, PreviewSize, previewName, renderPreview
+
+
+__all__ = ()
+
+
+def imageContent(width: int, height: int, format: str = "PNG") -> bytes:
+    from PIL import Image
+
+    # JPEG has no alpha channel
+    mode = "RGB" if format == "JPEG" else "RGBA"
+
+    output = BytesIO()
+    Image.new(mode, (width, height), (255, 0, 0, 128)).save(output, format=format)
+    return output.getvalue()
+
+
+class RenderPreviewTests(TestCase):
+    """
+    Tests for :func:`renderPreview`
+    """
+
+    def test_renderPreview(self) -> None:
+        """
+        :func:`renderPreview` renders a JPEG image which fits within the given
+        size, retaining the aspect ratio.
+        """
+        from PIL import Image
+
+        preview = renderPreview(imageContent(2000, 1000), 320)
+        assert preview is not None
+
+        with Image.open(BytesIO(preview)) as image:
+            self.assertEqual(image.format, "JPEG")
+            self.assertEqual(image.size, (320, 160))
+
+    def test_renderPreview_small(self) -> None:
+        """
+        :func:`renderPreview` doesn't scale up images smaller than the given
+        size.
+        """
+        from PIL import Image
+
+        preview = renderPreview(imageContent(100, 50, "JPEG"), 320)
+        assert preview is not None
+
+        with Image.open(BytesIO(preview)) as image:
+            self.assertEqual(image.size, (100, 50))
+
+    def test_renderPreview_notImage(self) -> None:
+        """
+        :func:`renderPreview` returns :obj:`None` for content which is not an
+        image.
+        """
+        self.assertIsNone(renderPreview(b"Hello, World!", 320))
+
+
+class AttachmentPreviewerTests(AsynchronousTestCase):
+    """
+    Tests for :class:`AttachmentPreviewer`
+    """
+
+    def setUp(self) -> None:
+        self.rendered: list[tuple[bytes, int]] = []
+
+    def render(self, content: bytes, size: int) -> bytes | None:
+        self.rendered.append((content, size))
+        if content == b"not an image":
+            return None
+        return b"preview of " + content
+
+    def previewer(
+        self, maxStoreSize: int = 1024, **attachments: bytes
+    ) -> AttachmentPreviewer:
+        store = LocalAttachmentStore(root=Path(self.mktemp()))
+        store.root.mkdir()
+        for name, content in attachments.items():
+            store.path(name.replace("_", ".")).write_bytes(content)
+
+        return AttachmentPreviewer(
+            store=store,
+            previewStore=LocalAttachmentStore(root=Path(self.mktemp())),
+            maxStoreSize=maxStoreSize,
+            render=self.render,
+        )
+
+    def previewContent(self, previewer: AttachmentPreviewer, name: str) -> bytes:
+        return previewer.previewStore.path(name).read_bytes()
+
+    @asyncAsDeferred
+    async def test_preview(self) -> None:
+        """
+        :meth:`AttachmentPreviewer.preview` renders a preview of an image
+        into the preview store, once.
+        """
+        previewer = self.previewer(a_png=b"image")
+
+        for _ in range(2):
+            preview = await previewer.preview("a.png", PreviewSize.small)
+
+            self.assertEqual(preview, previewName("a.png", PreviewSize.small))
+            assert preview is not None
+            self.assertEqual(
+                self.previewContent(previewer, preview), b"preview of image"
+            )
+
+        self.assertEqual(self.rendered, [(b"image", PreviewSize.small.value)])
+
+    @asyncAsDeferred
+    async def test_preview_stored(self) -> None:
+        """
+        :meth:`AttachmentPreviewer.preview` uses previews rendered by a
+        previous previewer.
+        """
+        previewer = self.previewer(a_png=b"image")
+        await previewer.preview("a.png", PreviewSize.small)
+
+        previewer = AttachmentPreviewer(
+            store=previewer.store,
+            previewStore=previewer.previewStore,
+            render=self.render,
+        )
+        preview = await previewer.preview("a.png", PreviewSize.small)
+
+        self.assertIsNotNone(preview)
+        self.assertEqual(len(self.rendered), 1)
+
+    @asyncAsDeferred
+    async def test_preview_bounded(self) -> None:
+        """
+        :meth:`AttachmentPreviewer.preview` removes the least recently used
+        previews when the preview store is too large, and renders them again
+        when they are next needed.
+        """
+        # Each preview is 16 bytes
+        previewer = self.previewer(
+            maxStoreSize=40, a_png=b"image", b_png=b"image", c_png=b"image"
+        )
+
+        for name in ("a.png", "b.png", "a.png", "c.png"):
+            await previewer.preview(name, PreviewSize.small)
+
+        self.assertEqual(previewer.size, 32)
+        self.assertFalse(
+            previewer.previewStore.path(
+                previewName("b.png", PreviewSize.small)
+            ).exists()
+        )
+        self.assertEqual(len(self.rendered), 3)
+
+        await previewer.preview("b.png", PreviewSize.small)
+        self.assertEqual(len(self.rendered), 4)
+        self.assertEqual(previewer.size, 32)
+
+    @asyncAsDeferred
+    async def test_preview_concurrent(self) -> None:
+        """
+        Concurrent requests for the same preview share a single rendering.
+        """
+        previewer = self.previewer(a_png=b"image")
+
+        previews = await gatherResults(
+            [
+                ensureDeferred(previewer.preview("a.png", PreviewSize.small))
+                for _ in range(3)
+            ]
+        )
+
+        self.assertEqual(len(set(previews)), 1)
+        self.assertEqual(len(self.rendered), 1)
+
+    @asyncAsDeferred
+    async def test_preview_notImage(self) -> None:
+        """
+        :meth:`AttachmentPreviewer.preview` returns :obj:`None` for
+        attachments which are not images.
+        """
+        previewer = self.previewer(a_txt=b"text", b_png=b"not an image")
+
+        self.assertIsNone(await previewer.preview("a.txt", PreviewSize.small))
+        self.assertIsNone(await previewer.preview("b.png", PreviewSize.small))
+        self.assertIsNone(await previewer.preview("b.png", PreviewSize.small))
+
+        # The text attachment wasn't read; the other was only rendered once
+        self.assertEqual(self.rendered, [(b"not an image", PreviewSize.small.value)])
+
+    @asyncAsDeferred
+    async def test_preview_missing(self) -> None:
+        """
+        :meth:`AttachmentPreviewer.preview` raises
+        :exc:`NoSuchAttachmentError` for missing attachments.
+        """
+        previewer = self.previewer()
+
+        try:
+            await previewer.preview("a.png", PreviewSize.small)
+        except NoSuchAttachmentError:
+            pass
+        else:
+            self.fail("NoSuchAttachmentError not raised")
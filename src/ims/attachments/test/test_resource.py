@@ -0,0 +1,294 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+"""
+Tests for :mod:`ranger-ims-server.attachments._resource`
+"""
+
+from hashlib import sha256
+from pathlib import Path
+
+from twisted.web import http
+from twisted.web.resource import IResource
+from twisted.web.server import Request
+from twisted.web.test.requesthelper import DummyChannel
+
+from ims.ext.trial import TestCase
+
+from .._local import LocalAttachmentStore
+from .._resource import AttachmentResource, parseByteRange
+
+
+__all__ = ()
+
+
+content = b"Hello, World!"
+
+
+class ParseByteRangeTests(TestCase):
+    """
+    Tests for :func:`parseByteRange`
+    """
+
+    def test_ranges(self) -> None:
+        """
+        Single byte ranges are parsed.
+        """
+        for value, expected in (
+            ("bytes=0-4", (0, 4)),
+            ("bytes=7-", (7, 12)),
+            ("bytes=7-100", (7, 12)),
+            ("bytes=-6", (7, 12)),
+            ("bytes=-100", (0, 12)),
+        ):
+            self.assertEqual(parseByteRange(value, 13), expected, value)
+
+    def test_ignored(self) -> None:
+        """
+        Ranges which can't be served as a single byte range are ignored.
+        """
+        for value in ("items=0-4", "bytes=0-1,4-5", "bytes=4-1", "bytes=x-", "bytes"):
+            self.assertIsNone(parseByteRange(value, 13), value)
+
+    def test_unsatisfiable(self) -> None:
+        """
+        Ranges beyond the end of the resource are not satisfiable.
+        """
+        for value, size in (("bytes=13-", 13), ("bytes=20-30", 13), ("bytes=-0", 13)):
+            self.assertRaises(ValueError, parseByteRange, value, size)
+
+
+class AttachmentResourceTests(TestCase):
+    """
+    Tests for :class:`AttachmentResource`
+    """
+
+    def resource(self, name: str = "a.txt") -> AttachmentResource:
+        store = LocalAttachmentStore(root=Path(self.mktemp()))
+        store.root.mkdir()
+        store.path(name).write_bytes(content)
+        return AttachmentResource(store=store, name=name)
+
+    def render(
+        self,
+        resource: IResource,
+        headers: dict[str, str] | None = None,
+        method: bytes = b"GET",
+    ) -> tuple[Request, bytes]:
+        """
+        Render the given resource and return the request and response body.
+        """
+        channel = DummyChannel()
+        request = Request(channel, False)
+        request.method = method
+        request.clientproto = b"HTTP/1.1"
+        for name, value in (headers or {}).items():
+            request.requestHeaders.setRawHeaders(name, [value])
+
+        finished = request.notifyFinish()
+        request.render(resource)
+        self.successResultOf(finished)
+
+        written = channel.transport.written.getvalue()
+        _, _, body = written.partition(b"\r\n\r\n")
+        return request, body
+
+    def header(self, request: Request, name: str) -> str | None:
+        values = request.responseHeaders.getRawHeaders(name)
+        if values is None:
+            return None
+        self.assertEqual(len(values), 1)
+        return values[0]
+
+    def test_get(self) -> None:
+        """
+        GET responds with the attachment's content and metadata.
+        """
+        request, body = self.render(self.resource())
+
+        self.assertResponseCode(request, http.OK)
+        self.assertEqual(body, content)
+        self.assertEqual(self.header(request, "Content-Type"), "text/plain")
+        self.assertEqual(self.header(request, "Content-Length"), "13")
+        self.assertEqual(self.header(request, "Accept-Ranges"), "bytes")
+        self.assertIsNotNone(self.header(request, "ETag"))
+        self.assertIsNotNone(self.header(request, "Last-Modified"))
+
+    def test_get_chunked(self) -> None:
+        """
+        Content larger than a chunk is streamed a chunk at a time.
+        """
+        self.patch(AttachmentResource, "chunkSize", 4)
+
+        request, body = self.render(self.resource())
+
+        self.assertResponseCode(request, http.OK)
+        self.assertEqual(body, content)
+
+    def test_head(self) -> None:
+        """
+        HEAD responds with the attachment's metadata and no content.
+        """
+        request, body = self.render(self.resource(), method=b"HEAD")
+
+        self.assertResponseCode(request, http.OK)
+        self.assertEqual(body, b"")
+        self.assertEqual(self.header(request, "Content-Length"), "13")
+
+    def test_missing(self) -> None:
+        """
+        Missing attachments are not found.
+        """
+        resource = self.resource()
+        resource = AttachmentResource(store=resource.store, name="b.txt")
+
+        request, _ = self.render(resource)
+
+        self.assertResponseCode(request, http.NOT_FOUND)
+
+    def test_child(self) -> None:
+        """
+        Attachment resources have no children.
+        """
+        resource = self.resource()
+        resource.putChild(b"x", resource)
+
+        request, _ = self.render(
+            resource.getChildWithDefault(b"x", Request(DummyChannel(), False))
+        )
+
+        self.assertResponseCode(request, http.NOT_FOUND)
+
+    def test_range(self) -> None:
+        """
+        A byte range request responds with partial content.
+        """
+        request, body = self.render(self.resource(), {"Range": "bytes=7-11"})
+
+        self.assertResponseCode(request, http.PARTIAL_CONTENT)
+        self.assertEqual(body, b"World")
+        self.assertEqual(self.header(request, "Content-Range"), "bytes 7-11/13")
+        self.assertEqual(self.header(request, "Content-Length"), "5")
+
+    def test_range_suffix(self) -> None:
+        """
+        A suffix byte range request responds with the end of the content.
+        """
+        request, body = self.render(self.resource(), {"Range": "bytes=-6"})
+
+        self.assertResponseCode(request, http.PARTIAL_CONTENT)
+        self.assertEqual(body, b"World!")
+        self.assertEqual(self.header(request, "Content-Range"), "bytes 7-12/13")
+
+    def test_range_unsatisfiable(self) -> None:
+        """
+        An unsatisfiable byte range request is rejected.
+        """
+        request, body = self.render(self.resource(), {"Range": "bytes=20-"})
+
+        self.assertResponseCode(request, http.REQUESTED_RANGE_NOT_SATISFIABLE)
+        self.assertEqual(body, b"")
+        self.assertEqual(self.header(request, "Content-Range"), "bytes */13")
+
+    def test_range_ifRange(self) -> None:
+        """
+        A byte range request with a non-matching If-Range condition responds
+        with the full content.
+        """
+        resource = self.resource()
+        request, _ = self.render(resource, method=b"HEAD")
+        etag = self.header(request, "ETag")
+        assert etag is not None
+
+        request, body = self.render(resource, {"Range": "bytes=7-11", "If-Range": etag})
+        self.assertResponseCode(request, http.PARTIAL_CONTENT)
+        self.assertEqual(body, b"World")
+
+        request, body = self.render(
+            resource, {"Range": "bytes=7-11", "If-Range": '"other"'}
+        )
+        self.assertResponseCode(request, http.OK)
+        self.assertEqual(body, content)
+
+    def test_ifNoneMatch(self) -> None:
+        """
+        A request with a matching If-None-Match condition is not modified.
+        """
+        resource = self.resource()
+        request, _ = self.render(resource, method=b"HEAD")
+        etag = self.header(request, "ETag")
+        assert etag is not None
+
+        request, body = self.render(resource, {"If-None-Match": f'"other", {etag}'})
+        self.assertResponseCode(request, http.NOT_MODIFIED)
+        self.assertEqual(body, b"")
+
+        request, body = self.render(resource, {"If-None-Match": '"other"'})
+        self.assertResponseCode(request, http.OK)
+        self.assertEqual(body, content)
+
+    def test_ifModifiedSince(self) -> None:
+        """
+        A request with an If-Modified-Since condition at or after the last
+        modified time is not modified.
+        """
+        resource = self.resource()
+        request, _ = self.render(resource, method=b"HEAD")
+        lastModified = self.header(request, "Last-Modified")
+        assert lastModified is not None
+
+        request, body = self.render(resource, {"If-Modified-Since": lastModified})
+        self.assertResponseCode(request, http.NOT_MODIFIED)
+        self.assertEqual(body, b"")
+
+        request, body = self.render(
+            resource, {"If-Modified-Since": "Sat, 01 Jan 2000 00:00:00 GMT"}
+        )
+        self.assertResponseCode(request, http.OK)
+        self.assertEqual(body, content)
+
+    def test_contentAddressed(self) -> None:
+        """
+        Attachments named for their content use the content digest as a
+        strong ETag and may be cached indefinitely.
+        """
+        digest = sha256(content).hexdigest()
+        resource = self.resource(f"sha256-{digest}.txt")
+
+        request, body = self.render(resource)
+
+        self.assertResponseCode(request, http.OK)
+        self.assertEqual(body, content)
+        self.assertEqual(self.header(request, "ETag"), f'"sha256-{digest}"')
+        self.assertEqual(
+            self.header(request, "Cache-Control"),
+            AttachmentResource.immutableCacheControl,
+        )
+
+    def test_contentAddressed_ifNoneMatch(self) -> None:
+        """
+        A request for an attachment named for its content with a matching
+        If-None-Match condition is not modified, without consulting the
+        store.
+        """
+        digest = sha256(content).hexdigest()
+        resource = self.resource()
+        resource = AttachmentResource(store=resource.store, name=f"sha256-{digest}.txt")
+
+        request, body = self.render(resource, {"If-None-Match": f'"sha256-{digest}"'})
+
+        self.assertResponseCode(request, http.NOT_MODIFIED)
+        self.assertEqual(body, b"")
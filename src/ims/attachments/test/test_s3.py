@@ -0,0 +1,239 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+
+"""
+Tests for :mod:`ranger-ims-server.attachments._s3`
+"""
+
+from ims.ext.trial import AsynchronousTestCase, asyncAsDeferred
+
+from .._exceptions import AttachmentStorageError, NoSuchAttachmentError
+from .._s3 import S3AttachmentStore
+from .s3 import FakeS3Client, FakeS3Object
+
+
+__all__ = ()
+
+
+class S3AttachmentStoreTests(AsynchronousTestCase):
+    """
+    Tests for :class:`S3AttachmentStore`
+    """
+
+    def store(self, client: FakeS3Client) -> S3AttachmentStore:
+        return S3AttachmentStore(
+            client=client, bucket="bucket", subPath="attachments", partSize=4
+        )
+
+    @asyncAsDeferred
+    async def test_commit_small(self) -> None:
+        """
+        Attachments smaller than a part are uploaded in a single request.
+        """
+        client = FakeS3Client()
+        store = self.store(client)
+
+        writer = await store.writer("text/plain")
+        await writer.write(b"Hi!")
+        await writer.commit("a.txt")
+
+        self.assertEqual(client.calls, ["head_object", "put_object"])
+        stored = client.objects["bucket", "attachments/a.txt"]
+        self.assertEqual(stored.body, b"Hi!")
+        self.assertEqual(stored.contentType, "text/plain")
+
+    @asyncAsDeferred
+    async def test_commit_multipart(self) -> None:
+        """
+        Attachments larger than a part are uploaded a part at a time.
+        """
+        client = FakeS3Client()
+        store = self.store(client)
+
+        writer = await store.writer("text/plain")
+        for data in (b"Hello", b", ", b"World", b"!"):
+            await writer.write(data)
+        await writer.commit("a.txt")
+
+        self.assertEqual(
+            client.calls,
+            [
+                "create_multipart_upload",
+                "upload_part",
+                "upload_part",
+                "upload_part",
+                "complete_multipart_upload",
+                "head_object",
+                "copy_object",
+                "delete_object",
+            ],
+        )
+        self.assertEqual(list(client.objects), [("bucket", "attachments/a.txt")])
+        stored = client.objects["bucket", "attachments/a.txt"]
+        self.assertEqual(stored.body, b"Hello, World!")
+        self.assertEqual(stored.contentType, "text/plain")
+        self.assertEqual(client.uploads, {})
+
+    @asyncAsDeferred
+    async def test_commit_existing(self) -> None:
+        """
+        Attachments with the name of an existing attachment are not stored
+        again.
+        """
+        client = FakeS3Client()
+        stored = FakeS3Object(body=b"Hello, World!", contentType="text/plain")
+        client.objects["bucket", "attachments/a.txt"] = stored
+        store = self.store(client)
+
+        writer = await store.writer("text/plain")
+        await writer.write(b"Hi!")
+        await writer.commit("a.txt")
+
+        self.assertEqual(client.calls, ["head_object"])
+
+        writer = await store.writer("text/plain")
+        for data in (b"Hello", b", ", b"World", b"!"):
+            await writer.write(data)
+        await writer.commit("a.txt")
+
+        self.assertNotIn("copy_object", client.calls)
+        self.assertEqual(client.calls[-1], "delete_object")
+        self.assertEqual(list(client.objects), [("bucket", "attachments/a.txt")])
+        self.assertIs(client.objects["bucket", "attachments/a.txt"], stored)
+
+    @asyncAsDeferred
+    async def test_abort(self) -> None:
+        """
+        Aborting an attachment aborts its multipart upload.
+        """
+        client = FakeS3Client()
+        store = self.store(client)
+
+        writer = await store.writer("text/plain")
+        await writer.write(b"Hello, World!")
+        await writer.abort()
+
+        self.assertEqual(client.calls[-1], "abort_multipart_upload")
+        self.assertEqual(client.objects, {})
+        self.assertEqual(client.uploads, {})
+
+    @asyncAsDeferred
+    async def test_write_error(self) -> None:
+        """
+        An error uploading a part raises :exc:`AttachmentStorageError` and
+        aborts the multipart upload.
+        """
+        client = FakeS3Client(failures={"upload_part"})
+        store = self.store(client)
+
+        writer = await store.writer("text/plain")
+        try:
+            await writer.write(b"Hello, World!")
+        except AttachmentStorageError:
+            pass
+        else:
+            self.fail("AttachmentStorageError not raised")
+
+        self.assertEqual(client.calls[-1], "abort_multipart_upload")
+        self.assertEqual(client.uploads, {})
+
+    @asyncAsDeferred
+    async def test_metadata(self) -> None:
+        """
+        :meth:`S3AttachmentStore.metadata` returns the stored object's
+        metadata, including the content type it was stored with.
+        """
+        client = FakeS3Client()
+        stored = FakeS3Object(body=b"Hello, World!", contentType="text/plain")
+        client.objects["bucket", "attachments/a"] = stored
+        store = self.store(client)
+
+        metadata = await store.metadata("a")
+
+        self.assertEqual(metadata.size, 13)
+        self.assertEqual(metadata.contentType, "text/plain")
+        self.assertEqual(metadata.etag, stored.etag)
+        self.assertEqual(metadata.lastModified, stored.lastModified)
+
+    @asyncAsDeferred
+    async def test_metadata_defaultContentType(self) -> None:
+        """
+        :meth:`S3AttachmentStore.metadata` falls back to the content type
+        implied by the attachment name for objects stored without one.
+        """
+        client = FakeS3Client()
+        client.objects["bucket", "attachments/a.png"] = FakeS3Object(
+            body=b"...", contentType="binary/octet-stream"
+        )
+        store = self.store(client)
+
+        metadata = await store.metadata("a.png")
+
+        self.assertEqual(metadata.contentType, "image/png")
+
+    @asyncAsDeferred
+    async def test_metadata_missing(self) -> None:
+        """
+        :meth:`S3AttachmentStore.metadata` raises
+        :exc:`NoSuchAttachmentError` for missing attachments.
+        """
+        store = self.store(FakeS3Client())
+
+        try:
+            await store.metadata("a.txt")
+        except NoSuchAttachmentError:
+            pass
+        else:
+            self.fail("NoSuchAttachmentError not raised")
+
+    @asyncAsDeferred
+    async def test_reader(self) -> None:
+        """
+        :meth:`S3AttachmentStore.reader` streams the object's content and
+        closes the response body when closed.
+        """
+        client = FakeS3Client()
+        client.objects["bucket", "attachments/a.txt"] = FakeS3Object(
+            body=b"Hello, World!", contentType="text/plain"
+        )
+        store = self.store(client)
+
+        reader = await store.reader("a.txt")
+        chunks = [await reader.read(5) for _ in range(4)]
+        await reader.close()
+
+        self.assertEqual(chunks, [b"Hello", b", Wor", b"ld!", b""])
+        self.assertTrue(client.bodies[0].closed)
+
+    @asyncAsDeferred
+    async def test_reader_range(self) -> None:
+        """
+        :meth:`S3AttachmentStore.reader` requests only the given range.
+        """
+        client = FakeS3Client()
+        client.objects["bucket", "attachments/a.txt"] = FakeS3Object(
+            body=b"Hello, World!", contentType="text/plain"
+        )
+        store = self.store(client)
+
+        reader = await store.reader("a.txt", start=7, end=11)
+        self.assertEqual(await reader.read(100), b"World")
+        await reader.close()
+
+        reader = await store.reader("a.txt", start=7)
+        self.assertEqual(await reader.read(100), b"World!")
+        await reader.close()
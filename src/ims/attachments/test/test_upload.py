@@ -0,0 +1,147 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+
+"""
+Tests for :mod:`ranger-ims-server.attachments._upload`
+"""
+
+from hashlib import sha256
+from pathlib import Path
+
+from ims.ext.trial import TestCase
+
+from .._exceptions import AttachmentTooLargeError
+from .._local import LocalAttachmentStore
+from .._upload import AttachmentUpload, contentAddressedName, digestFromName
+
+
+__all__ = ()
+
+
+pngData = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR" + bytes(range(256)) * 1024
+
+
+class AttachmentUploadTests(TestCase):
+    """
+    Tests for :class:`AttachmentUpload`
+    """
+
+    def upload(self, sizeLimit: int | None = None) -> AttachmentUpload:
+        return AttachmentUpload(
+            store=LocalAttachmentStore(root=Path(self.mktemp())),
+            filename="photo",
+            sizeLimit=sizeLimit,
+        )
+
+    def test_finish(self) -> None:
+        """
+        :meth:`AttachmentUpload.finish` stores the content written, named
+        for its detected type, and describes it.
+        """
+        upload = self.upload()
+        store = upload.store
+        assert isinstance(store, LocalAttachmentStore)
+
+        for start in range(0, len(pngData), 1000):
+            self.successResultOf(upload.write(pngData[start : start + 1000]))
+        attachment = self.successResultOf(upload.finish())
+
+        self.assertEqual(attachment.name, f"sha256-{sha256(pngData).hexdigest()}.png")
+        self.assertEqual(attachment.contentType, "image/png")
+        self.assertEqual(attachment.size, len(pngData))
+        self.assertEqual(attachment.digest, sha256(pngData).hexdigest())
+        self.assertEqual(store.path(attachment.name).read_bytes(), pngData)
+
+    def test_finish_small(self) -> None:
+        """
+        :meth:`AttachmentUpload.finish` stores content smaller than
+        :attr:`AttachmentUpload.sniffSize`.
+        """
+        upload = self.upload()
+        store = upload.store
+        assert isinstance(store, LocalAttachmentStore)
+
+        self.successResultOf(upload.write(b"Hello, World!"))
+        attachment = self.successResultOf(upload.finish())
+
+        self.assertEqual(
+            attachment.name, f"sha256-{sha256(b'Hello, World!').hexdigest()}"
+        )
+        self.assertEqual(attachment.contentType, "application/octet-stream")
+        self.assertEqual(store.path(attachment.name).read_bytes(), b"Hello, World!")
+
+    def test_finish_empty(self) -> None:
+        """
+        :meth:`AttachmentUpload.finish` stores empty content.
+        """
+        upload = self.upload()
+        attachment = self.successResultOf(upload.finish())
+
+        self.assertEqual(attachment.size, 0)
+        self.assertEqual(attachment.digest, sha256(b"").hexdigest())
+
+    def test_write_tooLarge(self) -> None:
+        """
+        :meth:`AttachmentUpload.write` raises :exc:`AttachmentTooLargeError`
+        when the size limit is exceeded, and discards the attachment.
+        """
+        upload = self.upload(sizeLimit=len(pngData) - 1)
+        store = upload.store
+        assert isinstance(store, LocalAttachmentStore)
+
+        # Write enough for the attachment to be opened in the store first
+        size = AttachmentUpload.sniffSize + 1
+        self.successResultOf(upload.write(pngData[:size]))
+        self.assertEqual(len(list(store.root.iterdir())), 1)
+
+        f = self.failureResultOf(upload.write(pngData[size:]))
+        f.trap(AttachmentTooLargeError)
+
+        self.assertEqual(list(store.root.iterdir()), [])
+
+    def test_finish_duplicate(self) -> None:
+        """
+        The same content uploaded more than once is stored once.
+        """
+        store = LocalAttachmentStore(root=Path(self.mktemp()))
+        names = []
+
+        for filename in ("a", "b"):
+            upload = AttachmentUpload(store=store, filename=filename)
+            self.successResultOf(upload.write(pngData))
+            names.append(self.successResultOf(upload.finish()).name)
+
+        self.assertEqual(names[0], names[1])
+        self.assertEqual([p.name for p in store.root.iterdir()], [names[0]])
+
+
+class DigestFromNameTests(TestCase):
+    """
+    Tests for :func:`digestFromName`
+    """
+
+    def test_digestFromName(self) -> None:
+        """
+        :func:`digestFromName` returns the digest from the names of
+        attachments named for their content.
+        """
+        digest = sha256(pngData).hexdigest()
+
+        self.assertEqual(digestFromName(contentAddressedName(digest, ".png")), digest)
+        self.assertEqual(digestFromName(contentAddressedName(digest, "")), digest)
+        self.assertIsNone(digestFromName("event_1_incident_00001_x.png"))
+        self.assertIsNone(digestFromName(f"sha256-{digest[:-1]}.png"))
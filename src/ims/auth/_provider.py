@@ -18,23 +18,27 @@
 Incident Management System web application authentication provider.
 """
 
+from collections import OrderedDict
 from collections.abc import Iterable, Mapping
 from datetime import UTC
 from datetime import datetime as DateTime
 from datetime import timedelta as TimeDelta
 from enum import Flag, auto
+from hashlib import sha256
 from time import time
 from typing import Any, ClassVar, cast
+from weakref import ReferenceType, ref
 
-from attrs import asdict, field, frozen
+from attrs import asdict, field, frozen, mutable
 from attrs.validators import instance_of
 from cattrs.preconf.json import make_converter as makeJSONConverter
 from jwcrypto.common import JWException
 from jwcrypto.jwk import JWK
 from jwcrypto.jws import InvalidJWSSignature
 from jwcrypto.jwt import JWT
-from twisted.logger import Logger
+from twisted.logger import ILogObserver, Logger, globalLogPublisher
 from twisted.web.iweb import IRequest
+from zope.interface import implementer
 
 from ims.directory import (
     DirectoryUser,
@@ -45,7 +49,7 @@ from ims.directory import (
     IMSUserID,
 )
 from ims.ext.klein import HeaderName
-from ims.model import AccessEntry, AccessValidity, FieldReport
+from ims.model import AccessEntry, AccessValidity, Event, EventAccess
 from ims.store import IMSDataStore
 
 from ._exceptions import (
@@ -223,6 +227,49 @@ class JSONWebToken:
         return cast("str", self._jwt.serialize())
 
 
+@frozen(kw_only=True)
+class _MemoizedAuthorizations:
+    """
+    Authorizations computed for a user in an event.
+    """
+
+    user: IMSUser | None
+    authorizations: Authorization
+
+    # Revision of event access at the time the authorizations were computed
+    revision: int
+
+    # Time after which the authorizations must be computed again
+    expires: float
+
+
+@implementer(ILogObserver)
+@frozen(kw_only=True)
+class _EventAccessObserver:
+    """
+    Observer for changes to event access in an auth provider's data store.
+    """
+
+    _provider: "ReferenceType[AuthProvider]"
+
+    def __call__(self, event: Mapping[str, Any]) -> None:
+        """
+        See L{ILogObserver.__call__}.
+        """
+        provider = self._provider()
+
+        if provider is None:
+            globalLogPublisher.removeObserver(self)
+            return
+
+        if (
+            event.get("storeWriteClass") is Event
+            and "mode" in event
+            and event.get("log_source") is provider.store
+        ):
+            provider.eventAccessChanged()
+
+
 @frozen(kw_only=True)
 class AuthProvider:
     """
@@ -232,6 +279,25 @@ class AuthProvider:
     _log: ClassVar[Logger] = Logger()
     _jwtIssuer: ClassVar[str] = "ranger-ims-server"
 
+    @mutable(kw_only=True, eq=False)
+    class _State:
+        """
+        Internal mutable state for :class:`AuthProvider`.
+        """
+
+        # Claims and users for verified bearer tokens, by token digest, least
+        # recently used first
+        verifiedTokens: OrderedDict[bytes, tuple[JSONWebTokenClaims, IMSUser]] = field(
+            factory=OrderedDict
+        )
+
+        # Incremented whenever event access changes
+        eventAccessRevision: int = 0
+
+        # When event access last changed, so that reads of event access can
+        # see the change
+        eventAccessChangedTime: float | None = None
+
     store: IMSDataStore
     directory: IMSDirectory
 
@@ -240,6 +306,17 @@ class AuthProvider:
     adminUsers: frozenset[str] = frozenset()
     masterKey: str = ""
 
+    # Maximum number of verified bearer tokens to remember
+    tokenCacheSize: int = 1024
+
+    # Time in seconds for which a session's authorizations are remembered
+    authorizationsTTL: float = 30.0
+
+    _state: _State = field(factory=_State, init=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        globalLogPublisher.addObserver(_EventAccessObserver(provider=ref(self)))
+
     async def verifyPassword(self, user: IMSUser, password: str) -> bool:
         """
         Verify a password for the given user.
@@ -289,6 +366,24 @@ class AuthProvider:
         if tokenText is authorization:  # Prefix doesn't match
             return None
 
+        # Clients send the same token with every request until it expires, so
+        # remember the tokens we have verified.
+        # Tokens are signed with our key, which doesn't change, so a token
+        # which was verified remains valid until it expires.
+        verifiedTokens = self._state.verifiedTokens
+        digest = sha256(tokenText.encode("utf-8")).digest()
+
+        verified = verifiedTokens.get(digest)
+        if verified is not None:
+            claims, user = verified
+            try:
+                claims.validateExpiration()
+            except InvalidCredentialsError:
+                del verifiedTokens[digest]
+                raise
+            verifiedTokens.move_to_end(digest)
+            return user
+
         try:
             jwt = JSONWebToken.fromText(tokenText, key=self._jsonWebKey)
         except InvalidJWSSignature as e:
@@ -300,7 +395,7 @@ class AuthProvider:
 
         self._log.debug("Valid JWT token for subject {subject}", subject=claims.sub)
 
-        return DirectoryUser(
+        user = DirectoryUser(
             uid=IMSUserID(claims.sub),
             shortNames=(claims.preferred_username,),
             onsite=claims.ranger_on_site,
@@ -308,6 +403,12 @@ class AuthProvider:
             teams=tuple(IMSTeamID(tid) for tid in claims.ranger_teams.split(",")),
         )
 
+        verifiedTokens[digest] = (claims, user)
+        while len(verifiedTokens) > self.tokenCacheSize:
+            verifiedTokens.popitem(last=False)
+
+        return user
+
     def _enhanceSessionCookie(self, request: IRequest) -> None:
         """
         Set some additional features on the Twisted Session cookie.
@@ -413,11 +514,9 @@ class AuthProvider:
 
         return False
 
-    async def authorizationsForUser(
-        self, user: IMSUser | None, eventID: str | None
-    ) -> Authorization:
+    def _adminAuthorizations(self, user: IMSUser | None) -> Authorization:
         """
-        Look up the authorizations that a user has for a given event.
+        Determine the authorizations that a user has regardless of event.
         """
         authorizations = Authorization.none
 
@@ -426,23 +525,58 @@ class AuthProvider:
                 if shortName in self.adminUsers:
                     authorizations |= Authorization.imsAdmin
 
-        if eventID is not None:
-            if self._matchACL(user, tuple(await self.store.writers(eventID))):
-                authorizations |= Authorization.writeIncidents
+        return authorizations
+
+    def _eventAuthorizations(
+        self, user: IMSUser | None, eventAccess: EventAccess
+    ) -> Authorization:
+        """
+        Determine the authorizations that a user has for an event with the
+        given access.
+        """
+        authorizations = Authorization.none
+
+        if self._matchACL(user, eventAccess.writers):
+            authorizations |= Authorization.writeIncidents
+            authorizations |= Authorization.readIncidents
+            authorizations |= Authorization.writeFieldReports
+            authorizations |= Authorization.readPersonnel
+
+        else:
+            if self._matchACL(user, eventAccess.readers):
                 authorizations |= Authorization.readIncidents
-                authorizations |= Authorization.writeFieldReports
                 authorizations |= Authorization.readPersonnel
 
-            else:
-                if self._matchACL(user, tuple(await self.store.readers(eventID))):
-                    authorizations |= Authorization.readIncidents
-                    authorizations |= Authorization.readPersonnel
+            if self._matchACL(user, eventAccess.reporters):
+                authorizations |= Authorization.writeFieldReports
 
-                if self._matchACL(
-                    user,
-                    tuple(await self.store.reporters(eventID)),
-                ):
-                    authorizations |= Authorization.writeFieldReports
+        return authorizations
+
+    def _store(self) -> IMSDataStore:
+        """
+        Look up a view of the data store which sees the latest change to event
+        access.
+        """
+        return self.store.readingAfter(self._state.eventAccessChangedTime)
+
+    async def authorizationsForUser(
+        self, user: IMSUser | None, eventID: str | None
+    ) -> Authorization:
+        """
+        Look up the authorizations that a user has for a given event.
+        """
+        authorizations = self._adminAuthorizations(user)
+
+        if eventID is not None:
+            store = self._store()
+            authorizations |= self._eventAuthorizations(
+                user,
+                EventAccess(
+                    readers=await store.readers(eventID),
+                    writers=await store.writers(eventID),
+                    reporters=await store.reporters(eventID),
+                ),
+            )
 
         self._log.debug(
             "Authz for {user} in event {event}: {authorizations}",
@@ -453,6 +587,86 @@ class AuthProvider:
 
         return authorizations
 
+    async def authorizationsForUserInEvents(
+        self, user: IMSUser | None
+    ) -> Mapping[str, Authorization]:
+        """
+        Look up the authorizations that a user has for every event.
+        Returns a mapping from event ID to authorizations.
+
+        This looks up access for all events at once, which is much cheaper than
+        calling :meth:`authorizationsForUser` for each event.
+        """
+        adminAuthorizations = self._adminAuthorizations(user)
+
+        return {
+            eventID: adminAuthorizations | self._eventAuthorizations(user, eventAccess)
+            for eventID, eventAccess in (await self._store().eventAccesses()).items()
+        }
+
+    def eventAccessChanged(self) -> None:
+        """
+        Note that access to an event has changed, so that any remembered
+        authorizations are computed again.
+        """
+        self._state.eventAccessRevision += 1
+        self._state.eventAccessChangedTime = time()
+
+    async def _authorizationsForRequest(
+        self, request: IRequest, eventID: str | None
+    ) -> Authorization:
+        """
+        Look up the authorizations that the user attached to a request has for
+        a given event.
+
+        Authorizations are remembered for the rest of the request, and for
+        :attr:`authorizationsTTL` seconds in the request's session, unless
+        event access changes.
+        """
+        user: IMSUser | None = request.user  # type: ignore[attr-defined]
+        revision = self._state.eventAccessRevision
+        now = time()
+
+        requestMemos: dict[str | None, _MemoizedAuthorizations] | None = getattr(
+            request, "authorizationsByEvent", None
+        )
+        if requestMemos is None:
+            requestMemos = {}
+            request.authorizationsByEvent = (  # type: ignore[attr-defined]
+                requestMemos
+            )
+
+        memo = requestMemos.get(eventID)
+        if memo is not None and memo.user == user and memo.revision == revision:
+            return memo.authorizations
+
+        # Use the session established by authentication, if any; don't create
+        # one just for this.
+        session = getattr(request, "session", None)
+        sessionMemos: dict[str | None, _MemoizedAuthorizations] = {}
+        if session is not None:
+            sessionMemos = getattr(session, "authorizationsByEvent", sessionMemos)
+            session.authorizationsByEvent = sessionMemos
+
+        memo = sessionMemos.get(eventID)
+        if (
+            memo is None
+            or memo.user != user
+            or memo.revision != revision
+            or memo.expires <= now
+        ):
+            memo = _MemoizedAuthorizations(
+                user=user,
+                authorizations=await self.authorizationsForUser(user, eventID),
+                revision=revision,
+                expires=now + self.authorizationsTTL,
+            )
+            sessionMemos[eventID] = memo
+
+        requestMemos[eventID] = memo
+
+        return memo.authorizations
+
     async def authorizeRequest(
         self,
         request: IRequest,
@@ -465,10 +679,7 @@ class AuthProvider:
         """
         self.authenticateRequest(request)
 
-        userAuthorizations = await self.authorizationsForUser(
-            request.user,  # type: ignore[attr-defined]
-            eventID,
-        )
+        userAuthorizations = await self._authorizationsForRequest(request, eventID)
         request.authorizations = (  # type: ignore[attr-defined]
             userAuthorizations
         )
@@ -484,42 +695,38 @@ class AuthProvider:
             )
             raise NotAuthorizedError("User not authorized")
 
-    async def authorizeRequestForFieldReport(
-        self, request: IRequest, fieldReport: FieldReport
+    async def authorizeRequestForFieldReportNumber(
+        self, request: IRequest, eventID: str, fieldReportNumber: int
     ) -> None:
         """
         Determine whether the user attached to a request has the required
         authorizations to access the field report with the given number.
+
+        Users with readIncidents may access any field report.
+        Authors of the field report may access it so long as they have
+        writeFieldReports; authorship is looked up in the store, and only if
+        the user lacks readIncidents.
         """
-        # An author of the field report should be allowed to read and write
-        # to it, provided they have writeFieldReports on the event.
-        userIsAuthor = False
-        user: IMSUser = request.user  # type: ignore[attr-defined]
-        if user is not None and fieldReport.reportEntries:
-            rangerHandle = user.shortNames[0]
-            for reportEntry in fieldReport.reportEntries:
-                if reportEntry.author == rangerHandle:
-                    userIsAuthor = True
-                    break
-
-        # If the user is an author, they're authorized so long as they have
+        try:
+            await self.authorizeRequest(request, eventID, Authorization.readIncidents)
+        except NotAuthorizedError:
+            pass
+        else:
+            return
+
+        # An author of the field report is authorized so long as they have
         # writeFieldReports.
-        if userIsAuthor:
-            try:
-                await self.authorizeRequest(
-                    request,
-                    fieldReport.eventID,
-                    Authorization.writeFieldReports,
-                )
-            except NotAuthorizedError:
-                # No writeFieldReports, so we'll fall back to checking if
-                # they have readIncidents permission below
-                pass
-            else:
-                # writeFieldReports authorization succeeded
-                return
-
-        # Authorize the user if they have readIncidents permission
-        await self.authorizeRequest(
-            request, fieldReport.eventID, Authorization.readIncidents
-        )
+        await self.authorizeRequest(request, eventID, Authorization.writeFieldReports)
+
+        user: IMSUser = request.user  # type: ignore[attr-defined]
+        if not await self.store.fieldReportHasAuthor(
+            eventID, fieldReportNumber, user.shortNames[0]
+        ):
+            self._log.debug(
+                "Authorization failed for {request.user}. "
+                "Not an author of field report #{fieldReportNumber}. "
+                "URI: {request.uri}",
+                request=request,
+                fieldReportNumber=fieldReportNumber,
+            )
+            raise NotAuthorizedError("User not authorized")
@@ -0,0 +1,129 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+"""
+Benchmark for bearer token verification in :class:`ims.auth._provider.AuthProvider`.
+
+Run with::
+
+    python -m ims.auth.test.benchmark_provider
+
+Requests are spread over a number of users' tokens with a Zipf distribution,
+as the web client sends the same token with every request, and a few users
+make most of the requests.
+A fraction of requests bring a token which hasn't been seen before.
+"""
+
+from argparse import ArgumentParser
+from datetime import timedelta as TimeDelta
+from pathlib import Path
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from ims.directory import IMSGroupID, IMSTeamID, IMSUserID
+from ims.directory.file import FileDirectory
+from ims.store.sqlite import DataStore as SQLiteDataStore
+
+from .._provider import AuthProvider, JSONWebKey
+from .test_provider import TestUser
+
+
+__all__ = ()
+
+
+def requestMix(
+    random: Random, users: int, requests: int, fresh: float
+) -> list[int | None]:
+    """
+    Choose the user making each request, with a Zipf distribution.
+    :obj:`None` stands for a request with a token which hasn't been seen
+    before.
+    """
+    weights = [1 / rank for rank in range(1, users + 1)]
+    choices = random.choices(range(users), weights, k=requests)
+    return [None if random.random() < fresh else user for user in choices]
+
+
+def benchmark(
+    provider: AuthProvider, users: int, requests: int, fresh: float, seed: int
+) -> float:
+    """
+    Verify bearer tokens for a mix of requests.
+    Returns the mean time per request, in seconds.
+    """
+
+    def authorization(name: str) -> str:
+        user = TestUser(
+            uid=IMSUserID(name),
+            shortNames=(name,),
+            onsite=True,
+            groups=(IMSGroupID("Rangers"),),
+            teams=(IMSTeamID("Council"),),
+            plainTextPassword=None,
+        )
+        token = provider._tokenForUser(user, TimeDelta(hours=1))
+        return f"Bearer {token.asText()}"
+
+    random = Random(seed)  # noqa: S311
+    userAuthorizations = [authorization(f"user{user}") for user in range(users)]
+    mix = [
+        authorization(f"fresh{index}") if user is None else userAuthorizations[user]
+        for index, user in enumerate(requestMix(random, users, requests, fresh))
+    ]
+
+    start = perf_counter()
+    for requestAuthorization in mix:
+        provider._userFromBearerAuthorization(requestAuthorization)
+    return (perf_counter() - start) / requests
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Benchmark bearer token verification")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--fresh", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    directoryPath = (
+        Path(__file__).parent.parent.parent
+        / "directory"
+        / "file"
+        / "test"
+        / "directory.yaml"
+    )
+
+    with TemporaryDirectory() as temp:
+        for name, tokenCacheSize in (("no cache", 0), ("with cache", 1024)):
+            provider = AuthProvider(
+                store=SQLiteDataStore(dbPath=Path(temp) / f"{tokenCacheSize}.sqlite"),
+                directory=FileDirectory(path=directoryPath),
+                jsonWebKey=JSONWebKey.generate(),
+                tokenCacheSize=tokenCacheSize,
+            )
+            perRequest = benchmark(
+                provider,
+                arguments.users,
+                arguments.requests,
+                arguments.fresh,
+                arguments.seed,
+            )
+            print(f"{name}: {perRequest * 1_000_000:.1f} µs per request")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
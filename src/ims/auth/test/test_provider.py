@@ -18,12 +18,14 @@
 Tests for L{ims.auth._provider}.
 """
 
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 from datetime import UTC
 from datetime import datetime as DateTime
 from datetime import timedelta as TimeDelta
 from pathlib import Path
 from string import ascii_letters, digits
+from time import time
+from types import SimpleNamespace
 from typing import Any, AnyStr
 from unittest.mock import patch
 
@@ -512,6 +514,94 @@ class AuthProviderTests(TestCase):
         self.assertEqual(userFromToken.groups, user.groups)
         self.assertEqual(userFromToken.hashedPassword, None)
 
+    def tokenUser(self, name: str) -> TestUser:
+        return TestUser(
+            uid=IMSUserID(name),
+            shortNames=(name,),
+            onsite=True,
+            groups=(),
+            teams=(),
+            plainTextPassword=None,
+        )
+
+    def test_userFromBearerAuthorization_cached(self) -> None:
+        """
+        AuthProvider._userFromBearerAuthorization remembers verified tokens,
+        and doesn't verify them again.
+        """
+        provider = AuthProvider(
+            store=self.store(),
+            directory=self.directory(),
+            jsonWebKey=JSONWebKey.generate(),
+        )
+        user = self.tokenUser("Bucket")
+        token = provider._tokenForUser(user, TimeDelta(hours=1))
+        authorization = f"Bearer {token.asText()}"
+
+        userFromToken = provider._userFromBearerAuthorization(authorization)
+
+        with patch.object(JSONWebToken, "fromText", oops):
+            self.assertIs(
+                provider._userFromBearerAuthorization(authorization), userFromToken
+            )
+
+    def test_userFromBearerAuthorization_cachedExpired(self) -> None:
+        """
+        AuthProvider._userFromBearerAuthorization rejects remembered tokens
+        once they expire.
+        """
+        provider = AuthProvider(
+            store=self.store(),
+            directory=self.directory(),
+            jsonWebKey=JSONWebKey.generate(),
+        )
+        user = self.tokenUser("Bucket")
+        token = provider._tokenForUser(user, TimeDelta(hours=1))
+        authorization = f"Bearer {token.asText()}"
+
+        provider._userFromBearerAuthorization(authorization)
+
+        later = token.claims.exp + 1
+        with patch("ims.auth._provider.time", lambda: later):
+            self.assertRaises(
+                InvalidCredentialsError,
+                provider._userFromBearerAuthorization,
+                authorization,
+            )
+
+        self.assertEqual(len(provider._state.verifiedTokens), 0)
+
+    def test_userFromBearerAuthorization_cacheSize(self) -> None:
+        """
+        AuthProvider._userFromBearerAuthorization remembers no more than
+        AuthProvider.tokenCacheSize tokens, forgetting the least recently used
+        first.
+        """
+        provider = AuthProvider(
+            store=self.store(),
+            directory=self.directory(),
+            jsonWebKey=JSONWebKey.generate(),
+            tokenCacheSize=2,
+        )
+        authorizations = [
+            "Bearer "
+            + provider._tokenForUser(self.tokenUser(name), TimeDelta(hours=1)).asText()
+            for name in ("a", "b", "c")
+        ]
+
+        for authorization in (*authorizations[:2], authorizations[0]):
+            provider._userFromBearerAuthorization(authorization)
+        provider._userFromBearerAuthorization(authorizations[2])
+
+        with patch.object(JSONWebToken, "fromText", oops):
+            for authorization in (authorizations[0], authorizations[2]):
+                provider._userFromBearerAuthorization(authorization)
+            self.assertRaises(
+                AssertionError,
+                provider._userFromBearerAuthorization,
+                authorizations[1],
+            )
+
     def test_authenticateRequest(self) -> None:
         raise NotImplementedError()
 
@@ -897,8 +987,210 @@ class AuthProviderTests(TestCase):
         )
         self.assertEqual(request.authorizations, Authorization.none)
 
-    def test_authorizeReqForFieldReport(self) -> None:
-        # Set up DB and AuthProvider with a single user
+    def authorizationsProvider(self) -> tuple[AuthProvider, list[str]]:
+        """
+        Create a provider with a store containing an event which the user
+        "Slumber" can read, recording the events for which the store looks up
+        readers.
+        """
+        store = self.store()
+        self.successResultOf(store.upgradeSchema())
+        self.successResultOf(store.createEvent(Event(id="2024")))
+        self.successResultOf(
+            store.setReaders(
+                "2024",
+                (
+                    AccessEntry(
+                        expression="person:Slumber", validity=AccessValidity.always
+                    ),
+                ),
+            )
+        )
+        provider = AuthProvider(
+            store=store,
+            directory=self.directory(),
+            jsonWebKey=JSONWebKey.generate(),
+        )
+
+        lookups: list[str] = []
+        readers = SQLiteDataStore.readers
+
+        def recordingReaders(
+            store: SQLiteDataStore, eventID: str
+        ) -> Coroutine[Any, Any, Iterable[AccessEntry]]:
+            lookups.append(eventID)
+            return readers(store, eventID)
+
+        self.patch(SQLiteDataStore, "readers", recordingReaders)
+
+        return provider, lookups
+
+    def authorizationsRequest(self, session: object | None = None) -> "MockReq":
+        request = MockReq(self.tokenUser("Slumber"), {})
+        # As if a session were looked up during authentication
+        request._insecureSession = session  # type: ignore[assignment]
+        return request
+
+    def test_authorizeRequest_memoizedForRequest(self) -> None:
+        """
+        AuthProvider.authorizeRequest looks up a user's authorizations for an
+        event once per request.
+        """
+        provider, lookups = self.authorizationsProvider()
+
+        for request in (self.authorizationsRequest(), self.authorizationsRequest()):
+            for requiredAuthorizations in (
+                Authorization.readIncidents,
+                Authorization.readPersonnel,
+            ):
+                self.successResultOf(
+                    provider.authorizeRequest(request, "2024", requiredAuthorizations)
+                )
+
+        self.assertEqual(lookups, ["2024", "2024"])
+
+    def test_authorizeRequest_memoizedForSession(self) -> None:
+        """
+        AuthProvider.authorizeRequest remembers a user's authorizations for an
+        event in the request's session, until AuthProvider.authorizationsTTL
+        passes.
+        """
+        provider, lookups = self.authorizationsProvider()
+        session = SimpleNamespace()
+
+        self.successResultOf(
+            provider.authorizeRequest(
+                self.authorizationsRequest(session), "2024", Authorization.readIncidents
+            )
+        )
+        self.successResultOf(
+            provider.authorizeRequest(
+                self.authorizationsRequest(session), "2024", Authorization.readIncidents
+            )
+        )
+        self.assertEqual(lookups, ["2024"])
+
+        later = time() + provider.authorizationsTTL + 1
+        with patch("ims.auth._provider.time", lambda: later):
+            self.successResultOf(
+                provider.authorizeRequest(
+                    self.authorizationsRequest(session),
+                    "2024",
+                    Authorization.readIncidents,
+                )
+            )
+        self.assertEqual(lookups, ["2024", "2024"])
+
+    def test_authorizeRequest_eventAccessChanged(self) -> None:
+        """
+        AuthProvider.authorizeRequest looks up a user's authorizations again
+        after event access changes in the store.
+        """
+        provider, lookups = self.authorizationsProvider()
+        session = SimpleNamespace()
+        request = self.authorizationsRequest(session)
+
+        self.successResultOf(
+            provider.authorizeRequest(request, "2024", Authorization.readIncidents)
+        )
+
+        self.successResultOf(provider.store.setReaders("2024", ()))
+
+        self.failureResultOf(
+            provider.authorizeRequest(request, "2024", Authorization.readIncidents),
+            NotAuthorizedError,
+        )
+        self.failureResultOf(
+            provider.authorizeRequest(
+                self.authorizationsRequest(session), "2024", Authorization.readIncidents
+            ),
+            NotAuthorizedError,
+        )
+        self.assertEqual(lookups, ["2024", "2024"])
+
+    def test_authorizationsForUser_eventAccessChanged(self) -> None:
+        """
+        AuthProvider.authorizationsForUser reads event access as of the last
+        change to event access, so that reads from a replica don't miss it.
+        """
+        provider, _ = self.authorizationsProvider()
+        writeTimes: list[float | None] = []
+        readingAfter = SQLiteDataStore.readingAfter
+
+        def recordingReadingAfter(
+            store: SQLiteDataStore, writeTime: float | None
+        ) -> IMSDataStore:
+            writeTimes.append(writeTime)
+            return readingAfter(store, writeTime)
+
+        self.patch(SQLiteDataStore, "readingAfter", recordingReadingAfter)
+        user = self.tokenUser("Slumber")
+
+        self.successResultOf(provider.authorizationsForUser(user, "2024"))
+        before = time()
+        self.successResultOf(provider.store.setReaders("2024", ()))
+        self.successResultOf(provider.authorizationsForUser(user, "2024"))
+
+        self.assertIsNone(writeTimes[0])
+        writeTime = writeTimes[1]
+        assert writeTime is not None
+        self.assertGreaterEqual(writeTime, before)
+
+    def test_authorizationsForUserInEvents(self) -> None:
+        """
+        AuthProvider.authorizationsForUserInEvents looks up a user's
+        authorizations in all events at once, with the same results as
+        AuthProvider.authorizationsForUser.
+        """
+        store = self.store()
+        self.successResultOf(store.upgradeSchema())
+        provider = AuthProvider(
+            store=store,
+            directory=self.directory(),
+            jsonWebKey=JSONWebKey.generate(),
+            adminUsers=frozenset(("Admin",)),
+        )
+
+        def entry(expression: str) -> tuple[AccessEntry, ...]:
+            return (AccessEntry(expression=expression, validity=AccessValidity.always),)
+
+        for eventID in ("Read", "Write", "Report", "None"):
+            self.successResultOf(store.createEvent(Event(id=eventID)))
+        self.successResultOf(store.setReaders("Read", entry("person:Slumber")))
+        self.successResultOf(store.setWriters("Write", entry("position:Dispatch")))
+        self.successResultOf(store.setReporters("Report", entry("*")))
+
+        for user in (
+            self.tokenUser("Slumber"),
+            evolve(self.tokenUser("Admin"), groups=(IMSGroupID("Dispatch"),)),
+            None,
+        ):
+            authorizations = self.successResultOf(
+                provider.authorizationsForUserInEvents(user)
+            )
+            self.assertEqual(
+                authorizations,
+                {
+                    eventID: self.successResultOf(
+                        provider.authorizationsForUser(user, eventID)
+                    )
+                    for eventID in ("Read", "Write", "Report", "None")
+                },
+            )
+
+        self.assertEqual(
+            self.successResultOf(
+                provider.authorizationsForUserInEvents(self.tokenUser("Slumber"))
+            ),
+            {
+                "Read": Authorization.readIncidents | Authorization.readPersonnel,
+                "Write": Authorization.none,
+                "Report": Authorization.writeFieldReports,
+                "None": Authorization.none,
+            },
+        )
+
+    def test_authorizeReqForFieldReportNumber(self) -> None:
         store = self.store()
         provider = AuthProvider(
             store=store,
@@ -923,54 +1215,50 @@ class AuthProviderTests(TestCase):
             {HeaderName.authorization.value: f"Bearer {token}"},
         )
 
-        # This FieldReport includes an entry by the user in session
-        reportByUser = FieldReport(
-            eventID=event,
-            number=0,
-            created=DateTime.now(tz=UTC),
-            summary=None,
-            incidentNumber=0,
-            reportEntries=(
-                ReportEntry(
-                    id=0,
-                    created=DateTime.now(tz=UTC),
-                    author="SomeoneElse",
-                    automatic=False,
-                    text="abc",
-                    stricken=False,
-                ),
-                ReportEntry(
-                    id=1,
-                    created=DateTime.now(tz=UTC),
-                    author="Slumber",
-                    automatic=False,
-                    text="abcde",
-                    stricken=False,
-                ),
-            ),
-        )
-        # This report doesn't include an entry by the user in session
-        reportNotByUser = FieldReport(
-            eventID=event,
-            number=1,
-            created=DateTime.now(tz=UTC),
-            summary=None,
-            incidentNumber=1,
-            reportEntries=(),
-        )
+        # Field report 1 includes an entry by the user in session; field
+        # report 2 doesn't
+        for author in ("Slumber", "SomeoneElse"):
+            number = self.successResultOf(
+                store.createFieldReport(
+                    FieldReport(
+                        eventID=event,
+                        number=0,
+                        created=DateTime.now(tz=UTC),
+                        summary=None,
+                        incidentNumber=None,
+                        reportEntries=(),
+                    ),
+                    author,
+                )
+            ).number
+            self.successResultOf(
+                store.addReportEntriesToFieldReport(
+                    event,
+                    number,
+                    (
+                        ReportEntry(
+                            id=0,
+                            created=DateTime.now(tz=UTC),
+                            author=author,
+                            automatic=False,
+                            text="abc",
+                            stricken=False,
+                        ),
+                    ),
+                    author,
+                )
+            )
 
-        # Stage 1: user doesn't have writeFieldReports, so no incident
-        # report can be read.
-        self.failureResultOf(
-            provider.authorizeRequestForFieldReport(
-                request=request,
-                fieldReport=reportByUser,
-            ),
-            NotAuthorizedError,
-        )
-        self.assertEqual(request.authorizations, Authorization.none)
+        # Stage 1: user doesn't have writeFieldReports, so no field report
+        # can be read.
+        for number in (1, 2):
+            self.failureResultOf(
+                provider.authorizeRequestForFieldReportNumber(request, event, number),
+                NotAuthorizedError,
+            )
 
-        # Stage 2: user is a reporter
+        # Stage 2: user is a reporter, so only their own field report can be
+        # read.
         self.successResultOf(
             store.setReporters(
                 event,
@@ -978,22 +1266,16 @@ class AuthProviderTests(TestCase):
             )
         )
         self.successResultOf(
-            provider.authorizeRequestForFieldReport(
-                request=request,
-                fieldReport=reportByUser,
-            ),
-        )
-        self.assertEqual(request.authorizations, Authorization.writeFieldReports)
-        self.failureResultOf(
-            provider.authorizeRequestForFieldReport(
-                request=request,
-                fieldReport=reportNotByUser,
-            ),
-            NotAuthorizedError,
+            provider.authorizeRequestForFieldReportNumber(request, event, 1)
         )
         self.assertEqual(request.authorizations, Authorization.writeFieldReports)
+        for number in (2, 3):
+            self.failureResultOf(
+                provider.authorizeRequestForFieldReportNumber(request, event, number),
+                NotAuthorizedError,
+            )
 
-        # Stage 3: user is a reader
+        # Stage 3: user is a reader, so any field report can be read.
         self.successResultOf(store.setReporters(event, ()))
         self.successResultOf(
             store.setReaders(
@@ -1001,24 +1283,16 @@ class AuthProviderTests(TestCase):
                 (AccessEntry(expression=personUser, validity=AccessValidity.always),),
             )
         )
-        self.successResultOf(
-            provider.authorizeRequestForFieldReport(
-                request=request,
-                fieldReport=reportByUser,
-            ),
-        )
-        self.successResultOf(
-            provider.authorizeRequestForFieldReport(
-                request=request,
-                fieldReport=reportNotByUser,
-            ),
-        )
+        for number in (1, 2):
+            self.successResultOf(
+                provider.authorizeRequestForFieldReportNumber(request, event, number)
+            )
         self.assertEqual(
             request.authorizations,
             Authorization.readPersonnel | Authorization.readIncidents,
         )
 
-        # Stage 4: user is a writer
+        # Stage 4: user is a writer, so any field report can be read.
         self.successResultOf(store.setReaders(event, ()))
         self.successResultOf(
             store.setWriters(
@@ -1026,12 +1300,10 @@ class AuthProviderTests(TestCase):
                 (AccessEntry(expression=personUser, validity=AccessValidity.always),),
             )
         )
-        self.successResultOf(
-            provider.authorizeRequestForFieldReport(
-                request=request,
-                fieldReport=reportNotByUser,
-            ),
-        )
+        for number in (1, 2):
+            self.successResultOf(
+                provider.authorizeRequestForFieldReportNumber(request, event, number)
+            )
         self.assertEqual(
             request.authorizations,
             Authorization.readPersonnel
@@ -34,6 +34,13 @@ from botocore.client import BaseClient  # type: ignore[import-untyped]
 from botocore.config import Config as BotoConfig  # type: ignore[import-untyped]
 from twisted.logger import Logger
 
+from ims.attachments import (
+    AttachmentPreviewer,
+    AttachmentStore,
+    CachingAttachmentStore,
+    LocalAttachmentStore,
+    S3AttachmentStore,
+)
 from ims.auth import AuthProvider, JSONWebKey
 from ims.directory import IMSDirectory
 from ims.directory.clubhouse_db import DMSDirectory, DutyManagementSystem
@@ -181,6 +188,8 @@ class Configuration:
         store: IMSDataStore | None = None
         directory: IMSDirectory | None = None
         authProvider: AuthProvider | None = None
+        attachmentStore: AttachmentStore | None = None
+        attachmentPreviewer: AttachmentPreviewer | None = None
 
     @classmethod
     def fromConfigFile(cls, configFile: Path | None) -> "Configuration":
@@ -244,6 +253,8 @@ class Configuration:
         botoClient: BaseClient | None = None
         s3Bucket: str = ""
         s3BucketSubPath: str = ""
+        s3CacheRoot: Path | None = None
+        s3CacheSize = 0
         match attachmentsStoreType.lower():
             case "none":
                 cls._log.info(
@@ -297,6 +308,21 @@ class Configuration:
                     "S3BucketSubPath: {s3BucketSubPath}",
                     s3BucketSubPath=s3BucketSubPath,
                 )
+                s3CacheSize = int(
+                    parser.valueFromConfig(
+                        "S3_CACHE_SIZE", "AttachmentsStore:S3", "S3CacheSize", "1024"
+                    )
+                )
+                cls._log.info("S3CacheSize: {size} MiB", size=s3CacheSize)
+                if s3CacheSize > 0:
+                    s3CacheRoot = parser.pathFromConfig(
+                        "S3_CACHE_ROOT",
+                        "AttachmentsStore:S3",
+                        "S3CacheRoot",
+                        cachedResourcesRoot,
+                        ("attachments",),
+                    )
+                    cls._log.info("S3CacheRoot: {path}", path=s3CacheRoot)
                 botoClient = BotoClient(
                     "s3",
                     aws_access_key_id=s3AccessKeyId,
@@ -385,6 +411,78 @@ class Configuration:
                 port=storePort,
                 db=storeDatabase,
             )
+            storePoolMin = int(
+                parser.valueFromConfig(
+                    "DB_POOL_MIN_CONNECTIONS", "Store:MySQL", "PoolMinConnections", "3"
+                )
+            )
+            storePoolMax = int(
+                parser.valueFromConfig(
+                    "DB_POOL_MAX_CONNECTIONS", "Store:MySQL", "PoolMaxConnections", "5"
+                )
+            )
+            if not 0 <= storePoolMin <= storePoolMax or storePoolMax < 1:
+                raise ConfigurationError(
+                    f"Invalid database connection pool size: "
+                    f"{storePoolMin}-{storePoolMax}"
+                )
+            cls._log.info(
+                "Database connection pool: {min}-{max} connections",
+                min=storePoolMin,
+                max=storePoolMax,
+            )
+            storeConnectTimeout = int(
+                parser.valueFromConfig(
+                    "DB_CONNECT_TIMEOUT", "Store:MySQL", "ConnectTimeout", "10"
+                )
+            )
+            cls._log.info(
+                "Database connect timeout: {timeout}s", timeout=storeConnectTimeout
+            )
+            storeQueryTimeout: float | None = float(
+                parser.valueFromConfig(
+                    "DB_QUERY_TIMEOUT", "Store:MySQL", "QueryTimeout", "0"
+                )
+            )
+            if not storeQueryTimeout:
+                storeQueryTimeout = None
+            cls._log.info(
+                "Database query timeout: {timeout}s", timeout=storeQueryTimeout
+            )
+            storePingInterval = float(
+                parser.valueFromConfig(
+                    "DB_PING_INTERVAL", "Store:MySQL", "PingInterval", "60"
+                )
+            )
+            cls._log.info(
+                "Database ping interval: {interval}s", interval=storePingInterval
+            )
+
+            storeReplicas: list[tuple[str, int]] = []
+            for replica in parser.valueFromConfig(
+                "DB_REPLICA_HOST_NAMES", "Store:MySQL", "ReplicaHostNames", ""
+            ).split(","):
+                replicaHost, _, replicaPort = replica.strip().partition(":")
+                if not replicaHost:
+                    continue
+                try:
+                    storeReplicas.append(
+                        (replicaHost, int(replicaPort) if replicaPort else storePort)
+                    )
+                except ValueError:
+                    raise ConfigurationError(
+                        f"Invalid database replica: {replica.strip()!r}"
+                    ) from None
+            cls._log.info("Database replicas: {replicas}", replicas=storeReplicas)
+            storeReplicaStickiness = float(
+                parser.valueFromConfig(
+                    "DB_REPLICA_STICKINESS", "Store:MySQL", "ReplicaStickiness", "5"
+                )
+            )
+            cls._log.info(
+                "Database replica stickiness: {stickiness}s",
+                stickiness=storeReplicaStickiness,
+            )
 
             storeFactory = partial(
                 MySQLDataStore,
@@ -393,6 +491,13 @@ class Configuration:
                 database=storeDatabase,
                 username=storeUser,
                 password=storePassword,
+                poolMinConnections=storePoolMin,
+                poolMaxConnections=storePoolMax,
+                connectTimeout=storeConnectTimeout,
+                queryTimeout=storeQueryTimeout,
+                pingInterval=storePingInterval,
+                replicas=tuple(storeReplicas),
+                replicaStickiness=storeReplicaStickiness,
             )
 
         else:
@@ -470,6 +575,13 @@ class Configuration:
             )
         )
 
+        statisticsInterval = float(
+            parser.valueFromConfig(
+                "STATISTICS_INTERVAL", "Core", "StatisticsInterval", str(5 * 60)
+            )
+        )
+        cls._log.info("Statistics interval: {interval}s", interval=statisticsInterval)
+
         #
         # Persist some objects
         #
@@ -490,6 +602,7 @@ class Configuration:
             masterKey=masterKey,
             port=port,
             serverRoot=serverRoot,
+            statisticsInterval=statisticsInterval,
             storeFactory=storeFactory,
             tokenLifetime=tokenLifetime,
             attachmentsStoreType=attachmentsStoreType,
@@ -497,6 +610,8 @@ class Configuration:
             botoClient=botoClient,
             s3Bucket=s3Bucket,
             s3BucketSubPath=s3BucketSubPath,
+            s3CacheRoot=s3CacheRoot,
+            s3CacheSize=s3CacheSize * 1024 * 1024,
         )
 
     cachedResourcesRoot: Path
@@ -514,12 +629,15 @@ class Configuration:
     masterKey: str
     port: int
     serverRoot: Path
+    statisticsInterval: float
     tokenLifetime: TimeDelta
     attachmentsStoreType: str
     localAttachmentsRoot: Path | None
     botoClient: BaseClient | None
     s3Bucket: str
     s3BucketSubPath: str
+    s3CacheRoot: Path | None
+    s3CacheSize: int
 
     _storeFactory: Callable[[], IMSDataStore]
 
@@ -551,6 +669,50 @@ class Configuration:
 
         return self._state.authProvider
 
+    @property
+    def attachmentStore(self) -> AttachmentStore | None:
+        """
+        Attachment store, or :obj:`None` if attachments are not enabled.
+        """
+        if self._state.attachmentStore is None:
+            if self.localAttachmentsRoot is not None:
+                self._state.attachmentStore = LocalAttachmentStore(
+                    root=self.localAttachmentsRoot
+                )
+            elif self.botoClient is not None:
+                s3Store = S3AttachmentStore(
+                    client=self.botoClient,
+                    bucket=self.s3Bucket,
+                    subPath=self.s3BucketSubPath,
+                )
+                if self.s3CacheRoot is None:
+                    self._state.attachmentStore = s3Store
+                else:
+                    self._state.attachmentStore = CachingAttachmentStore(
+                        store=s3Store,
+                        root=self.s3CacheRoot,
+                        maxSize=self.s3CacheSize,
+                    )
+
+        return self._state.attachmentStore
+
+    @property
+    def attachmentPreviewer(self) -> AttachmentPreviewer | None:
+        """
+        Attachment previewer, or :obj:`None` if attachments are not enabled.
+        """
+        if self._state.attachmentPreviewer is None:
+            attachmentStore = self.attachmentStore
+            if attachmentStore is not None:
+                self._state.attachmentPreviewer = AttachmentPreviewer(
+                    store=attachmentStore,
+                    previewStore=LocalAttachmentStore(
+                        root=self.cachedResourcesRoot / "previews"
+                    ),
+                )
+
+        return self._state.attachmentPreviewer
+
     def __str__(self) -> str:
         return (
             f"Configuration file: {self.configFile}\n"
@@ -62,6 +62,8 @@ class URLs:
     incidentAttachmentNumber: ClassVar[URL] = incidentAttachments.child(
         "<attachment_number>"
     )
+    incidentSearch: ClassVar[URL] = event.child("incident_search")
+    incidentBulkEdit: ClassVar[URL] = event.child("incident_bulk_edit")
     fieldReports: ClassVar[URL] = event.child("field_reports").child("")
     fieldReport: ClassVar[URL] = fieldReports.child("<field_report_number>")
     fieldReport_reportEntries: ClassVar[URL] = fieldReport.child("report_entries")
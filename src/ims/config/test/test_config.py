@@ -29,6 +29,11 @@ from typing import cast
 from hypothesis import assume, given
 from hypothesis.strategies import lists, sampled_from, text
 
+from ims.attachments import (
+    CachingAttachmentStore,
+    LocalAttachmentStore,
+    S3AttachmentStore,
+)
 from ims.auth import AuthProvider, JSONWebKey
 from ims.directory import IMSDirectory
 from ims.directory.clubhouse_db import DMSDirectory
@@ -621,6 +626,20 @@ class ConfigurationTests(TestCase):
 
         self.assertIsInstance(config.jsonWebKey, JSONWebKey)
 
+    def test_fromConfigFile_statisticsInterval(self) -> None:
+        """
+        StatisticsInterval defaults to five minutes.
+        """
+        with testingEnvironment({}):
+            config = Configuration.fromConfigFile(None)
+
+        self.assertEqual(config.statisticsInterval, 300)
+
+        with testingEnvironment({"IMS_STATISTICS_INTERVAL": "0"}):
+            config = Configuration.fromConfigFile(None)
+
+        self.assertEqual(config.statisticsInterval, 0)
+
     def test_store(self) -> None:
         with testingEnvironment({}):
             config = Configuration.fromConfigFile(None)
@@ -666,6 +685,74 @@ class ConfigurationTests(TestCase):
         self.assertEqual(store.database, database)
         self.assertEqual(store.username, userName)
         self.assertEqual(store.password, password)
+        self.assertEqual(store.poolMinConnections, 3)
+        self.assertEqual(store.poolMaxConnections, 5)
+        self.assertEqual(store.connectTimeout, 10)
+        self.assertIsNone(store.queryTimeout)
+        self.assertEqual(store.pingInterval, 60)
+        self.assertEqual(store.replicas, ())
+
+    def test_store_mysql_pool(self) -> None:
+        with testingEnvironment(
+            {
+                "IMS_DATA_STORE": "MySQL",
+                "IMS_DB_POOL_MIN_CONNECTIONS": "8",
+                "IMS_DB_POOL_MAX_CONNECTIONS": "20",
+                "IMS_DB_CONNECT_TIMEOUT": "5",
+                "IMS_DB_QUERY_TIMEOUT": "2.5",
+                "IMS_DB_PING_INTERVAL": "30",
+            }
+        ):
+            config = Configuration.fromConfigFile(None)
+
+        store = cast("MySQLDataStore", config.store)
+
+        self.assertEqual(store.poolMinConnections, 8)
+        self.assertEqual(store.poolMaxConnections, 20)
+        self.assertEqual(store.connectTimeout, 5)
+        self.assertEqual(store.queryTimeout, 2.5)
+        self.assertEqual(store.pingInterval, 30)
+
+    def test_store_mysql_replicas(self) -> None:
+        with testingEnvironment(
+            {
+                "IMS_DATA_STORE": "MySQL",
+                "IMS_DB_HOST_PORT": "3307",
+                "IMS_DB_REPLICA_HOST_NAMES": "replica1, replica2:3308,",
+                "IMS_DB_REPLICA_STICKINESS": "10",
+            }
+        ):
+            config = Configuration.fromConfigFile(None)
+
+        store = cast("MySQLDataStore", config.store)
+
+        self.assertEqual(store.replicas, (("replica1", 3307), ("replica2", 3308)))
+        self.assertEqual(store.replicaStickiness, 10)
+
+    def test_store_mysql_replicaInvalid(self) -> None:
+        with testingEnvironment(
+            {"IMS_DATA_STORE": "MySQL", "IMS_DB_REPLICA_HOST_NAMES": "replica1:x"}
+        ):
+            e = self.assertRaises(
+                ConfigurationError, Configuration.fromConfigFile, None
+            )
+        self.assertEqual(str(e), "Invalid database replica: 'replica1:x'")
+
+    def test_store_mysql_poolInvalid(self) -> None:
+        for poolMin, poolMax in (("6", "5"), ("-1", "5"), ("0", "0")):
+            with testingEnvironment(
+                {
+                    "IMS_DATA_STORE": "MySQL",
+                    "IMS_DB_POOL_MIN_CONNECTIONS": poolMin,
+                    "IMS_DB_POOL_MAX_CONNECTIONS": poolMax,
+                }
+            ):
+                e = self.assertRaises(
+                    ConfigurationError, Configuration.fromConfigFile, None
+                )
+            self.assertEqual(
+                str(e), f"Invalid database connection pool size: {poolMin}-{poolMax}"
+            )
 
     def test_store_unknown(self) -> None:
         storeName = "XYZZY"
@@ -675,6 +762,86 @@ class ConfigurationTests(TestCase):
             )
             self.assertEqual(str(e), f"Unknown data store: {storeName!r}")
 
+    def test_attachmentStore_none(self) -> None:
+        with testingEnvironment({"IMS_ATTACHMENTS_STORE": "None"}):
+            config = Configuration.fromConfigFile(None)
+
+        self.assertIsNone(config.attachmentStore)
+
+    def test_attachmentStore_local(self) -> None:
+        path = Path(self.mktemp()).resolve() / "attachments"
+
+        with testingEnvironment(
+            {
+                "IMS_ATTACHMENTS_STORE": "Local",
+                "IMS_LOCAL_ATTACHMENTS_ROOT": str(path),
+            }
+        ):
+            config = Configuration.fromConfigFile(None)
+
+        self.assertIsInstance(config.attachmentStore, LocalAttachmentStore)
+        self.assertEqual(
+            cast("LocalAttachmentStore", config.attachmentStore).root, path
+        )
+        self.assertIs(config.attachmentStore, config.attachmentStore)
+
+    def test_attachmentPreviewer(self) -> None:
+        path = Path(self.mktemp()).resolve() / "attachments"
+
+        with testingEnvironment(
+            {
+                "IMS_ATTACHMENTS_STORE": "Local",
+                "IMS_LOCAL_ATTACHMENTS_ROOT": str(path),
+            }
+        ):
+            config = Configuration.fromConfigFile(None)
+
+        previewer = config.attachmentPreviewer
+        assert previewer is not None
+        self.assertIs(previewer.store, config.attachmentStore)
+        self.assertEqual(
+            previewer.previewStore.root,
+            config.cachedResourcesRoot / "previews",
+        )
+
+    def test_attachmentPreviewer_none(self) -> None:
+        with testingEnvironment({"IMS_ATTACHMENTS_STORE": "None"}):
+            config = Configuration.fromConfigFile(None)
+
+        self.assertIsNone(config.attachmentPreviewer)
+
+    def test_attachmentStore_s3Cache(self) -> None:
+        path = Path(self.mktemp()).resolve() / "cache"
+
+        with testingEnvironment(
+            {
+                "IMS_ATTACHMENTS_STORE": "S3",
+                "IMS_S3_BUCKET": "bucket",
+                "IMS_S3_CACHE_ROOT": str(path),
+                "IMS_S3_CACHE_SIZE": "10",
+            }
+        ):
+            config = Configuration.fromConfigFile(None)
+
+        store = config.attachmentStore
+        self.assertIsInstance(store, CachingAttachmentStore)
+        store = cast("CachingAttachmentStore", store)
+        self.assertIsInstance(store.store, S3AttachmentStore)
+        self.assertEqual(store.root, path)
+        self.assertEqual(store.maxSize, 10 * 1024 * 1024)
+
+    def test_attachmentStore_s3NoCache(self) -> None:
+        with testingEnvironment(
+            {
+                "IMS_ATTACHMENTS_STORE": "S3",
+                "IMS_S3_BUCKET": "bucket",
+                "IMS_S3_CACHE_SIZE": "0",
+            }
+        ):
+            config = Configuration.fromConfigFile(None)
+
+        self.assertIsInstance(config.attachmentStore, S3AttachmentStore)
+
     def test_directory(self) -> None:
         with testingEnvironment({}):
             config = Configuration.fromConfigFile(None)
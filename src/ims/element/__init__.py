@@ -18,4 +18,19 @@
 Incident Management System elements.
 """
 
-__all__ = ()
+from ._static import (
+    StaticAsset,
+    StaticAssetResource,
+    StaticAssets,
+    StaticAssetsResource,
+    staticAssets,
+)
+
+
+__all__ = (
+    "StaticAsset",
+    "StaticAssetResource",
+    "StaticAssets",
+    "StaticAssetsResource",
+    "staticAssets",
+)
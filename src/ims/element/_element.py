@@ -18,6 +18,7 @@
 Element base classes.
 """
 
+from functools import cache
 from typing import cast
 from unittest.mock import sentinel
 
@@ -32,10 +33,26 @@ from twisted.web.template import Tag, XMLFile, renderer
 from ims.config import Configuration
 from ims.ext.json_ext import jsonTextFromObject
 
+from ._static import staticAssets
+
 
 __all__ = ()
 
 
+@cache
+def _templateLoader(moduleName: str) -> ITemplateLoader:
+    """
+    Look up the loader for the template of the element defined in the module
+    with the given name.
+
+    Loaders are shared by all instances of an element, so that each template
+    is parsed once per process rather than once per render.
+    """
+    module = namedModule(moduleName)
+    filePath = FilePath(module.__file__).parent().child("template.xhtml")
+    return XMLFile(filePath)
+
+
 @mutable(kw_only=True)
 class BaseElement(_Element):
     """
@@ -46,9 +63,7 @@ class BaseElement(_Element):
         super().__init__(loader=self._loader())
 
     def _loader(self) -> ITemplateLoader:
-        module = namedModule(self.__class__.__module__)
-        filePath = FilePath(module.__file__).parent().child("template.xhtml")
-        return XMLFile(filePath)
+        return _templateLoader(self.__class__.__module__)
 
 
 @mutable(kw_only=True)
@@ -120,7 +135,7 @@ class Element(BaseElement):
         except AttributeError:
             raise ValueError(f"Unknown URL name: {name}") from None
 
-        text = cast("str", url.asText())
+        text = staticAssets().url(url).asText()
 
         if tag.tagName == "json":
             return jsonTextFromObject(text)
@@ -0,0 +1,365 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+"""
+Incident Management System static resources.
+"""
+
+import re
+from collections.abc import Mapping
+from functools import cache
+from gzip import compress
+from hashlib import sha256
+from mimetypes import guess_type
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, ClassVar
+
+from attrs import field, frozen
+from hyperlink import URL
+from twisted.logger import Logger
+from twisted.web import http
+from twisted.web.iweb import IRequest
+from twisted.web.resource import IResource, NoResource
+from zope.interface import implementer
+
+from ims.config import URLs
+from ims.ext.klein import ContentType, HeaderName, requestHeader
+
+
+__all__ = ()
+
+
+# Relative imports of other modules in JavaScript, eg.:
+#   import * as ims from "./ims.js";
+_moduleImport = re.compile(
+    rb"(?P<prefix>\b(?:from|import)\s*\(?\s*)"
+    rb"(?P<quote>[\"'])\./(?P<name>[\w.-]+\.js)(?P=quote)"
+)
+
+
+def _compressible(contentType: str) -> bool:
+    return contentType.startswith("text/") or contentType in (
+        ContentType.javascript.value,
+        ContentType.json.value,
+        "image/svg+xml",
+    )
+
+
+def _acceptsGzip(request: IRequest) -> bool:
+    """
+    Determine whether the client accepts gzip-encoded content.
+    """
+    acceptEncoding = requestHeader(request, HeaderName.acceptEncoding)
+    if acceptEncoding is None:
+        return False
+
+    for coding in acceptEncoding.split(","):
+        name, _, parameters = coding.partition(";")
+        if name.strip().lower() not in ("gzip", "x-gzip"):
+            continue
+        for parameter in parameters.split(";"):
+            key, _, value = parameter.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+
+    return False
+
+
+@frozen(kw_only=True)
+class StaticAsset:
+    """
+    A static resource, identified by a digest of its content.
+    """
+
+    name: str
+    fingerprintedName: str
+    contentType: str
+    digest: str
+    content: bytes
+
+    # Content compressed with gzip, if that makes it smaller
+    gzipContent: bytes | None
+
+    @classmethod
+    def fromContent(cls, name: str, contentType: str, content: bytes) -> "StaticAsset":
+        """
+        Create an asset with the given content.
+        """
+        digest = sha256(content).hexdigest()
+        path = Path(name)
+
+        gzipContent: bytes | None = None
+        if _compressible(contentType):
+            # A fixed mtime keeps the compressed content reproducible
+            gzipContent = compress(content, compresslevel=9, mtime=0)
+            if len(gzipContent) >= len(content):
+                gzipContent = None
+
+        return cls(
+            name=name,
+            fingerprintedName=f"{path.stem}.{digest[:16]}{path.suffix}",
+            contentType=contentType,
+            digest=digest,
+            content=content,
+            gzipContent=gzipContent,
+        )
+
+
+@frozen(kw_only=True)
+class StaticAssets:
+    """
+    Manifest of static resources.
+
+    Each resource is also available under a fingerprinted name containing a
+    digest of its content, so that clients may cache it indefinitely: any
+    change to the content changes the name.
+    Relative imports between JavaScript modules are rewritten to use the
+    fingerprinted names, so a change to a module also changes the names of
+    the modules which import it.
+
+    Content is read and (where worthwhile) gzip-compressed once, when the
+    manifest is created.
+    """
+
+    _log: ClassVar[Logger] = Logger()
+
+    # URL of the collection of static resources
+    baseURL: URL
+
+    # Assets by name
+    assets: Mapping[str, StaticAsset]
+
+    _fingerprinted: Mapping[str, StaticAsset] = field(init=False, repr=False)
+
+    @_fingerprinted.default
+    def _indexFingerprinted(self) -> Mapping[str, StaticAsset]:
+        return MappingProxyType(
+            {asset.fingerprintedName: asset for asset in self.assets.values()}
+        )
+
+    @classmethod
+    def fromDirectory(cls, root: Path, baseURL: URL) -> "StaticAssets":
+        """
+        Create a manifest of the files in the given directory.
+        """
+        paths = {
+            path.name: path
+            for path in root.iterdir()
+            if path.is_file() and not path.name.startswith(".")
+        }
+        assets: dict[str, StaticAsset] = {}
+        loading: set[str] = set()
+
+        def load(name: str) -> StaticAsset:
+            asset = assets.get(name)
+            if asset is not None:
+                return asset
+
+            if name in loading:
+                raise ValueError(f"Circular import of static resource {name}")
+            loading.add(name)
+
+            content = paths[name].read_bytes()
+            contentType = guess_type(name)[0] or "application/octet-stream"
+
+            if name.endswith(".js"):
+
+                def fingerprintImport(match: re.Match[bytes]) -> bytes:
+                    imported = match.group("name").decode("utf-8")
+                    if imported not in paths:
+                        return match.group(0)
+                    quote = match.group("quote")
+                    fingerprintedName = load(imported).fingerprintedName
+                    return b"".join(
+                        (
+                            match.group("prefix"),
+                            quote,
+                            b"./",
+                            fingerprintedName.encode("utf-8"),
+                            quote,
+                        )
+                    )
+
+                content = _moduleImport.sub(fingerprintImport, content)
+
+            asset = assets[name] = StaticAsset.fromContent(name, contentType, content)
+            loading.remove(name)
+
+            return asset
+
+        for name in sorted(paths):
+            load(name)
+
+        cls._log.info(
+            "Loaded {count} static resources from {root}", count=len(assets), root=root
+        )
+
+        return cls(baseURL=baseURL, assets=MappingProxyType(assets))
+
+    def asset(self, name: str) -> StaticAsset | None:
+        """
+        Look up the asset with the given name or fingerprinted name.
+        """
+        asset = self.assets.get(name)
+        if asset is None:
+            asset = self._fingerprinted.get(name)
+        return asset
+
+    def url(self, url: URL) -> URL:
+        """
+        Look up the fingerprinted URL for a static resource.
+        URLs which are not for a static resource are returned unchanged.
+        """
+        if url.path[:-1] != self.baseURL.path or url.query or url.fragment:
+            return url
+
+        asset = self.assets.get(url.path[-1])
+        if asset is None:
+            return url
+
+        return url.replace(path=(*url.path[:-1], asset.fingerprintedName))
+
+
+@cache
+def staticAssets() -> StaticAssets:
+    """
+    Look up the manifest of the static resources in this package.
+    """
+    return StaticAssets.fromDirectory(
+        Path(__file__).parent / "static", baseURL=URLs.static
+    )
+
+
+@implementer(IResource)
+@frozen(kw_only=True)
+class StaticAssetResource:
+    """
+    Resource which serves a static asset.
+
+    The digest of the content is used as the ETag, so revalidation is cheap.
+    """
+
+    # Cache-Control for assets requested by fingerprinted name, which never
+    # change
+    immutableCacheControl: ClassVar[str] = (
+        f"public, max-age={365 * 24 * 60 * 60}, immutable"
+    )
+
+    # Cache-Control for assets which must be revalidated
+    revalidateCacheControl: ClassVar[str] = "no-cache"
+
+    isLeaf: ClassVar[bool] = True
+
+    asset: StaticAsset
+    cacheControl: str = revalidateCacheControl
+
+    def getChildWithDefault(self, name: bytes, request: IRequest) -> IResource:
+        """
+        See :meth:`IResource.getChildWithDefault`.
+        Static asset resources have no children.
+        """
+        return NoResource()
+
+    def putChild(self, path: bytes, child: IResource) -> None:
+        """
+        See :meth:`IResource.putChild`.
+        Static asset resources have no children, so this does nothing.
+        """
+
+    def render(self, request: IRequest) -> Any:
+        """
+        See :meth:`IResource.render`.
+        """
+        asset = self.asset
+
+        def setHeader(name: HeaderName, value: str) -> None:
+            request.setHeader(name.value, value)
+
+        if asset.gzipContent is not None:
+            setHeader(HeaderName.vary, HeaderName.acceptEncoding.value)
+
+        if asset.gzipContent is not None and _acceptsGzip(request):
+            content = asset.gzipContent
+            etag = f'"{asset.digest}-gzip"'
+            setHeader(HeaderName.contentEncoding, "gzip")
+        else:
+            content = asset.content
+            etag = f'"{asset.digest}"'
+
+        setHeader(HeaderName.etag, etag)
+        setHeader(HeaderName.cacheControl, self.cacheControl)
+        setHeader(HeaderName.contentType, asset.contentType)
+
+        ifNoneMatch = requestHeader(request, HeaderName.ifNoneMatch)
+        if ifNoneMatch is not None and any(
+            tag.strip() == "*" or tag.strip().removeprefix("W/") == etag
+            for tag in ifNoneMatch.split(",")
+        ):
+            request.setResponseCode(http.NOT_MODIFIED)
+            return b""
+
+        setHeader(HeaderName.contentLength, str(len(content)))
+
+        return content
+
+
+@implementer(IResource)
+@frozen(kw_only=True)
+class StaticAssetsResource:
+    """
+    Resource which serves the collection of static assets.
+    """
+
+    isLeaf: ClassVar[bool] = False
+
+    assets: StaticAssets
+
+    def getChildWithDefault(self, name: bytes, request: IRequest) -> IResource:
+        """
+        See :meth:`IResource.getChildWithDefault`.
+        """
+        try:
+            assetName = name.decode("utf-8")
+        except UnicodeDecodeError:
+            return NoResource()
+
+        asset = self.assets.asset(assetName)
+        if asset is None:
+            return NoResource()
+
+        if assetName == asset.fingerprintedName:
+            cacheControl = StaticAssetResource.immutableCacheControl
+        else:
+            cacheControl = StaticAssetResource.revalidateCacheControl
+
+        return StaticAssetResource(asset=asset, cacheControl=cacheControl)
+
+    def putChild(self, path: bytes, child: IResource) -> None:
+        """
+        See :meth:`IResource.putChild`.
+        Static assets are read from a directory, so this does nothing.
+        """
+
+    def render(self, request: IRequest) -> Any:
+        """
+        See :meth:`IResource.render`.
+        """
+        return NoResource().render(request)
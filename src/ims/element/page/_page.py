@@ -30,6 +30,7 @@ from twisted.web.template import Tag, renderer, tags
 from ims.config import Configuration
 
 from .._element import Element
+from .._static import staticAssets
 from .footer import FooterElement
 from .header import HeaderElement
 from .nav import NavElement
@@ -107,6 +108,7 @@ class Page(Element):
         `<head>` element.
         """
         urls = self.config.urls
+        assets = staticAssets()
 
         children = tag.children
         tag.children = []
@@ -115,7 +117,7 @@ class Page(Element):
         for name, url in self.urlsFromImportSpec(
             cast("str", tag.attributes.get("imports", ""))
         ).items():
-            kw = {"src": url.asText()}
+            kw = {"src": assets.url(url).asText()}
             integrity = self.integrityValue(name)
             if integrity is not None:
                 kw["integrity"] = integrity
@@ -128,7 +130,7 @@ class Page(Element):
         # to import any other IMS JS files.
         if "module" in tag.attributes:
             name = cast("str", tag.attributes["module"])
-            kw = {"src": getattr(urls, f"{name}JS").asText()}
+            kw = {"src": assets.url(getattr(urls, f"{name}JS")).asText()}
             integrity = self.integrityValue(name)
             kw["type"] = "module"
             if integrity is not None:
@@ -145,7 +147,7 @@ class Page(Element):
             tags.link(
                 type="image/png",
                 rel="icon",
-                href=urls.logo.asText(),
+                href=assets.url(urls.logo).asText(),
             ),
             tags.link(
                 type="text/css",
@@ -165,7 +167,7 @@ class Page(Element):
             tags.link(
                 type="text/css",
                 rel="stylesheet",
-                href=urls.styleSheet.asText(),
+                href=assets.url(urls.styleSheet).asText(),
             ),
             self.title(request, tags.title.clone()),
             # JavaScript resource imports
@@ -13,6 +13,9 @@
 // limitations under the License.
 import * as ims from "./ims.js";
 let fieldReportsTable = null;
+// The time at which the server wrote the Field Report which caused the latest
+// table reload.
+let _reloadWriteTime = null;
 let _frShowModifiedAfter = null;
 let _frShowDaysBack = null;
 const frDefaultDaysBack = "all";
@@ -100,6 +103,7 @@ function initFieldReportsTable() {
         //  Field Reports for which they're not authorized, and those errors
         //  show up in the browser console. I'd like to find a way to avoid
         //  bringing those errors into the console constantly.
+        _reloadWriteTime = e.data.write_time ?? null;
         fieldReportsTable.ajax.reload();
         ims.clearErrorMessage();
     };
@@ -137,7 +141,7 @@ function frInitDataTables() {
                 // per-user authorization can exclude field reports entirely from
                 // someone who created a field report but then didn't add an
                 // entry to it.
-                ims.urlReplace(url_fieldReports), null);
+                ims.withWriteTime(ims.urlReplace(url_fieldReports), _reloadWriteTime), null);
                 if (err != null || json == null) {
                     ims.setErrorMessage(`Failed to load table: ${err}`);
                     return;
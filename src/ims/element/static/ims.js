@@ -68,6 +68,14 @@ export function urlReplace(url) {
     }
     return url;
 }
+// Add the time of a write reported by the server in an SSE to a URL, so that
+// the server's reply includes that write.
+export function withWriteTime(url, writeTime) {
+    if (writeTime == null) {
+        return url;
+    }
+    return url + (url.includes("?") ? "&" : "?") + "write_time=" + writeTime;
+}
 //
 // Arrays
 //
@@ -746,6 +754,17 @@ function reportEntryElement(entry) {
         const attachmentLink = document.createElement("a");
         attachmentLink.href = url;
         attachmentLink.textContent = "Attached file";
+        // Show a small preview of image attachments. The server can still
+        // respond with an error for images it can't decode.
+        if (entry.attachment_is_image) {
+            const preview = document.createElement("img");
+            preview.src = url + "?preview=small";
+            preview.loading = "lazy";
+            preview.alt = "";
+            preview.classList.add("d-block");
+            preview.addEventListener("error", () => preview.remove());
+            attachmentLink.append(preview);
+        }
         entryContainer.append(attachmentLink);
     }
     // Add a horizontal line after each entry
@@ -977,7 +996,20 @@ function subscribeToUpdates(closed) {
     });
     eventSource.addEventListener("Incident", function (e) {
         localStorage.setItem(lastSseIDKey, e.lastEventId);
-        newIncidentChannel().postMessage(JSON.parse(e.data));
+        const data = JSON.parse(e.data);
+        const channel = newIncidentChannel();
+        if (data.incident_numbers != null) {
+            // Several Incidents were updated together
+            for (const number of data.incident_numbers) {
+                channel.postMessage({
+                    event_id: data.event_id ?? null,
+                    incident_number: number,
+                    write_time: data.write_time ?? null,
+                });
+            }
+            return;
+        }
+        channel.postMessage(data);
     });
     eventSource.addEventListener("FieldReport", function (e) {
         localStorage.setItem(lastSseIDKey, e.lastEventId);
@@ -75,7 +75,7 @@ async function initIncidentPage() {
         if (updateAll || (event === ims.pathIds.eventID && number === ims.pathIds.incidentNumber)) {
             console.log("Got incident update: " + number);
             await loadAndDisplayIncident();
-            await loadAllFieldReports();
+            await loadAllFieldReports(e.data.write_time);
             renderFieldReportData();
         }
     };
@@ -223,11 +223,11 @@ async function loadPersonnel() {
 // Load all field reports
 //
 let allFieldReports = null;
-async function loadAllFieldReports() {
+async function loadAllFieldReports(writeTime = null) {
     if (allFieldReports === undefined) {
         return { err: null };
     }
-    const { resp, json, err } = await ims.fetchJsonNoThrow(ims.urlReplace(url_fieldReports), null);
+    const { resp, json, err } = await ims.fetchJsonNoThrow(ims.withWriteTime(ims.urlReplace(url_fieldReports), writeTime), null);
     if (err != null) {
         if (resp != null && resp.status === 403) {
             // We're not allowed to look these up.
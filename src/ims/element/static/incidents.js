@@ -31,6 +31,14 @@ const _otherPlaceholder = "(other)";
 let _showRows = null;
 const defaultRows = 25;
 let allIncidentTypes = [];
+// Numbers of Incidents reported changed by the server which have yet to be
+// fetched. These are fetched together after a short delay, so that a burst of
+// changes costs one request rather than one per Incident.
+const _refreshDelayMs = 100;
+let _refreshDelayTimer = undefined;
+const _incidentsToRefresh = new Set();
+// The latest time at which the server wrote any of those Incidents.
+let _refreshWriteTime = null;
 //
 // Initialize UI
 //
@@ -146,35 +154,59 @@ function initIncidentsTable() {
         if (event !== ims.pathIds.eventID) {
             return;
         }
-        const { json, err } = await ims.fetchJsonNoThrow(ims.urlReplace(url_incidentNumber).replace("<incident_number>", number.toString()), null);
-        if (err != null) {
-            const message = `Failed to update Incident ${number}: ${err}`;
-            console.error(message);
-            ims.setErrorMessage(message);
-            return;
+        _incidentsToRefresh.add(number);
+        const writeTime = e.data.write_time;
+        if (writeTime != null && (_refreshWriteTime == null || writeTime > _refreshWriteTime)) {
+            _refreshWriteTime = writeTime;
         }
-        // Now update/create the relevant row. This is a change from pre-2025, in that
-        // we no longer reload all incidents here on any single incident update.
-        let done = false;
-        incidentsTable.rows().every(function () {
-            // @ts-expect-error use of "this" for DataTables
-            const existingIncident = this.data();
-            if (existingIncident.number === number) {
-                console.log("Updating Incident " + number);
-                // @ts-expect-error use of "this" for DataTables
-                this.data(json);
-                done = true;
-            }
-        });
-        if (!done) {
-            console.log("Loading new Incident " + number);
-            incidentsTable.row.add(json);
+        if (_refreshDelayTimer === undefined) {
+            _refreshDelayTimer = setTimeout(refreshIncidents, _refreshDelayMs);
         }
-        ims.clearErrorMessage();
-        incidentsTable.processing(false);
-        incidentsTable.draw();
     };
 }
+// Fetch the Incidents reported changed since the last refresh, and
+// update/create the relevant rows. This is a change from pre-2025, in that we
+// no longer reload all incidents here on any Incident update.
+async function refreshIncidents() {
+    _refreshDelayTimer = undefined;
+    const numbers = Array.from(_incidentsToRefresh);
+    _incidentsToRefresh.clear();
+    const writeTime = _refreshWriteTime;
+    _refreshWriteTime = null;
+    if (numbers.length === 0) {
+        return;
+    }
+    const { json, err } = await ims.fetchJsonNoThrow(ims.withWriteTime(ims.urlReplace(url_incidents)
+        + "?exclude_system_entries=true&numbers=" + numbers.join(","), writeTime), null);
+    if (err != null || json == null) {
+        const message = `Failed to update Incidents ${numbers.join(", ")}: ${err}`;
+        console.error(message);
+        ims.setErrorMessage(message);
+        return;
+    }
+    const incidents = new Map();
+    for (const incident of json) {
+        incidents.set(incident.number, incident);
+    }
+    incidentsTable.rows().every(function () {
+        // @ts-expect-error use of "this" for DataTables
+        const existingIncident = this.data();
+        const incident = incidents.get(existingIncident.number);
+        if (incident !== undefined) {
+            console.log("Updating Incident " + incident.number);
+            // @ts-expect-error use of "this" for DataTables
+            this.data(incident);
+            incidents.delete(existingIncident.number);
+        }
+    });
+    for (const incident of incidents.values()) {
+        console.log("Loading new Incident " + incident.number);
+        incidentsTable.row.add(incident);
+    }
+    ims.clearErrorMessage();
+    incidentsTable.processing(false);
+    incidentsTable.draw();
+}
 //
 // Initialize DataTables
 //
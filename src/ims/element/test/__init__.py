@@ -0,0 +1,6 @@
+# -*- test-case-name: ranger-ims-server.element.test -*-
+"""
+Tests for :mod:`ranger-ims-server.element`
+"""
+
+__all__ = ()
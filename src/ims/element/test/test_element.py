@@ -0,0 +1,63 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+"""
+Tests for :mod:`ranger-ims-server.element._element`
+"""
+
+from twisted.web.template import flattenString
+
+from ims.config import Configuration
+from ims.ext.trial import TestCase
+
+from ..page.footer import FooterElement
+from ..page.nav import NavElement
+
+
+__all__ = ()
+
+
+class ElementTests(TestCase):
+    """
+    Tests for :class:`Element`
+    """
+
+    def test_loader_shared(self) -> None:
+        """
+        Instances of an element share a template loader, so the template is
+        parsed once.
+        """
+        config = Configuration.fromConfigFile(None)
+
+        a = FooterElement(config=config)
+        b = FooterElement(config=config)
+        nav = NavElement(config=config)
+
+        assert a.loader is not None
+        self.assertIs(a.loader, b.loader)
+        self.assertIs(a.loader.load(), a.loader.load())
+        self.assertIsNot(a.loader, nav.loader)
+
+    def test_render_repeatable(self) -> None:
+        """
+        Rendering an element doesn't modify its shared template.
+        """
+        config = Configuration.fromConfigFile(None)
+
+        first = self.successResultOf(flattenString(None, NavElement(config=config)))
+        second = self.successResultOf(flattenString(None, NavElement(config=config)))
+
+        self.assertEqual(first, second)
@@ -0,0 +1,370 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+"""
+Tests for :mod:`ranger-ims-server.element._static`
+"""
+
+from gzip import decompress
+from hashlib import sha256
+from pathlib import Path
+
+from hyperlink import URL
+from twisted.web import http
+from twisted.web.server import Request
+from twisted.web.test.requesthelper import DummyChannel
+
+from ims.ext.trial import TestCase
+
+from .._static import (
+    StaticAssetResource,
+    StaticAssets,
+    StaticAssetsResource,
+    staticAssets,
+)
+
+
+__all__ = ()
+
+
+baseURL = URL.fromText("/ims/static")
+
+moduleSource = b'import * as ims from "./ims.js";\n\nims.go();\n'
+styleSource = b"body {\n" + b"  color: black;\n" * 100 + b"}\n"
+
+
+class StaticAssetsTests(TestCase):
+    """
+    Tests for :class:`StaticAssets`
+    """
+
+    def assets(self, **files: bytes) -> StaticAssets:
+        root = Path(self.mktemp())
+        root.mkdir()
+        for name, content in files.items():
+            (root / name.replace("_", ".")).write_bytes(content)
+        return StaticAssets.fromDirectory(root, baseURL=baseURL)
+
+    def test_fingerprintedName(self) -> None:
+        """
+        Fingerprinted names contain a digest of the content.
+        """
+        assets = self.assets(logo_png=b"PNG")
+
+        asset = assets.assets["logo.png"]
+        digest = sha256(b"PNG").hexdigest()
+
+        self.assertEqual(asset.digest, digest)
+        self.assertEqual(asset.fingerprintedName, f"logo.{digest[:16]}.png")
+        self.assertEqual(asset.contentType, "image/png")
+        self.assertEqual(asset.content, b"PNG")
+
+    def test_asset(self) -> None:
+        """
+        :meth:`StaticAssets.asset` looks up assets by name or fingerprinted
+        name.
+        """
+        assets = self.assets(logo_png=b"PNG")
+        asset = assets.assets["logo.png"]
+
+        self.assertIs(assets.asset("logo.png"), asset)
+        self.assertIs(assets.asset(asset.fingerprintedName), asset)
+        self.assertIsNone(assets.asset("other.png"))
+
+    def test_moduleImports(self) -> None:
+        """
+        Relative imports of JavaScript modules are rewritten to use
+        fingerprinted names, so changing a module changes the fingerprinted
+        names of the modules which import it.
+        """
+        assets = self.assets(ims_js=b"export function go() {}\n", root_js=moduleSource)
+        ims = assets.assets["ims.js"]
+        root = assets.assets["root.js"]
+
+        self.assertEqual(
+            root.content,
+            moduleSource.replace(b"./ims.js", f"./{ims.fingerprintedName}".encode()),
+        )
+
+        changed = self.assets(
+            ims_js=b"export function go() { }\n", root_js=moduleSource
+        )
+
+        self.assertNotEqual(
+            changed.assets["root.js"].fingerprintedName, root.fingerprintedName
+        )
+
+    def test_moduleImports_unknown(self) -> None:
+        """
+        Relative imports of JavaScript modules which are not static assets are
+        left alone.
+        """
+        assets = self.assets(root_js=moduleSource)
+
+        self.assertEqual(assets.assets["root.js"].content, moduleSource)
+
+    def test_moduleImports_circular(self) -> None:
+        """
+        Circular imports of JavaScript modules can't be fingerprinted.
+        """
+        self.assertRaises(
+            ValueError,
+            self.assets,
+            a_js=b'import * as b from "./b.js";\n',
+            b_js=b'import * as a from "./a.js";\n',
+        )
+
+    def test_gzip(self) -> None:
+        """
+        Compressible content is precompressed with gzip.
+        """
+        assets = self.assets(style_css=styleSource)
+        asset = assets.assets["style.css"]
+
+        assert asset.gzipContent is not None
+        self.assertLess(len(asset.gzipContent), len(styleSource))
+        self.assertEqual(decompress(asset.gzipContent), styleSource)
+
+    def test_gzip_notCompressible(self) -> None:
+        """
+        Content which is already compressed, or which gzip doesn't make
+        smaller, is not precompressed.
+        """
+        assets = self.assets(logo_png=styleSource, style_css=b"a{}")
+
+        self.assertIsNone(assets.assets["logo.png"].gzipContent)
+        self.assertIsNone(assets.assets["style.css"].gzipContent)
+
+    def test_url(self) -> None:
+        """
+        :meth:`StaticAssets.url` returns fingerprinted URLs for static assets.
+        """
+        assets = self.assets(logo_png=b"PNG")
+        asset = assets.assets["logo.png"]
+
+        self.assertEqual(
+            assets.url(baseURL.child("logo.png")),
+            baseURL.child(asset.fingerprintedName),
+        )
+
+    def test_url_other(self) -> None:
+        """
+        :meth:`StaticAssets.url` returns other URLs unchanged.
+        """
+        assets = self.assets(logo_png=b"PNG")
+
+        for url in (
+            baseURL.child("other.png"),
+            URL.fromText("/ims/logo.png"),
+            baseURL.child("logo.png").add("x", "1"),
+        ):
+            self.assertIs(assets.url(url), url)
+
+    def test_staticAssets(self) -> None:
+        """
+        :func:`staticAssets` has fingerprinted names for this package's
+        static resources, and the IMS modules import each other by
+        fingerprinted name.
+        """
+        assets = staticAssets()
+        ims = assets.assets["ims.js"]
+        root = assets.assets["root.js"]
+
+        self.assertIn(f'"./{ims.fingerprintedName}"'.encode(), root.content)
+        self.assertNotIn(b'"./ims.js"', root.content)
+
+
+class StaticAssetResourceTests(TestCase):
+    """
+    Tests for :class:`StaticAssetResource` and :class:`StaticAssetsResource`
+    """
+
+    def resource(self) -> StaticAssetsResource:
+        root = Path(self.mktemp())
+        root.mkdir()
+        (root / "style.css").write_bytes(styleSource)
+        (root / "logo.png").write_bytes(b"PNG")
+        return StaticAssetsResource(
+            assets=StaticAssets.fromDirectory(root, baseURL=baseURL)
+        )
+
+    def render(
+        self,
+        resource: StaticAssetsResource,
+        name: str,
+        headers: dict[str, str] | None = None,
+        method: bytes = b"GET",
+    ) -> tuple[Request, bytes]:
+        """
+        Render the named child of the given resource and return the request
+        and response body.
+        """
+        channel = DummyChannel()
+        request = Request(channel, False)
+        request.method = method
+        request.clientproto = b"HTTP/1.1"
+        for headerName, value in (headers or {}).items():
+            request.requestHeaders.setRawHeaders(headerName, [value])
+
+        finished = request.notifyFinish()
+        request.render(resource.getChildWithDefault(name.encode("utf-8"), request))
+        self.successResultOf(finished)
+
+        written = channel.transport.written.getvalue()
+        _, _, body = written.partition(b"\r\n\r\n")
+        return request, body
+
+    def header(self, request: Request, name: str) -> str | None:
+        values = request.responseHeaders.getRawHeaders(name)
+        if values is None:
+            return None
+        self.assertEqual(len(values), 1)
+        return values[0]
+
+    def test_fingerprinted(self) -> None:
+        """
+        Assets requested by fingerprinted name may be cached indefinitely.
+        """
+        resource = self.resource()
+        asset = resource.assets.assets["style.css"]
+
+        request, body = self.render(resource, asset.fingerprintedName)
+
+        self.assertResponseCode(request, http.OK)
+        self.assertEqual(body, styleSource)
+        self.assertEqual(self.header(request, "Content-Type"), "text/css")
+        self.assertEqual(self.header(request, "ETag"), f'"{asset.digest}"')
+        self.assertEqual(
+            self.header(request, "Cache-Control"),
+            StaticAssetResource.immutableCacheControl,
+        )
+        self.assertEqual(self.header(request, "Vary"), "Accept-Encoding")
+
+    def test_name(self) -> None:
+        """
+        Assets requested by name must be revalidated.
+        """
+        resource = self.resource()
+
+        request, body = self.render(resource, "style.css")
+
+        self.assertResponseCode(request, http.OK)
+        self.assertEqual(body, styleSource)
+        self.assertEqual(
+            self.header(request, "Cache-Control"),
+            StaticAssetResource.revalidateCacheControl,
+        )
+
+    def test_gzip(self) -> None:
+        """
+        Precompressed content is served to clients which accept gzip.
+        """
+        resource = self.resource()
+        asset = resource.assets.assets["style.css"]
+
+        request, body = self.render(
+            resource, "style.css", {"Accept-Encoding": "br, gzip;q=0.5"}
+        )
+
+        self.assertResponseCode(request, http.OK)
+        self.assertEqual(body, asset.gzipContent)
+        self.assertEqual(self.header(request, "Content-Encoding"), "gzip")
+        self.assertEqual(self.header(request, "ETag"), f'"{asset.digest}-gzip"')
+        self.assertEqual(
+            self.header(request, "Content-Length"), str(len(asset.gzipContent or b""))
+        )
+
+    def test_gzip_notAccepted(self) -> None:
+        """
+        Uncompressed content is served to clients which don't accept gzip.
+        """
+        resource = self.resource()
+
+        for acceptEncoding in ("br", "gzip;q=0", "identity"):
+            request, body = self.render(
+                resource, "style.css", {"Accept-Encoding": acceptEncoding}
+            )
+
+            self.assertEqual(body, styleSource, acceptEncoding)
+            self.assertIsNone(self.header(request, "Content-Encoding"))
+
+    def test_gzip_notCompressible(self) -> None:
+        """
+        Assets which aren't precompressed are served without varying by
+        encoding.
+        """
+        request, body = self.render(
+            self.resource(), "logo.png", {"Accept-Encoding": "gzip"}
+        )
+
+        self.assertEqual(body, b"PNG")
+        self.assertIsNone(self.header(request, "Content-Encoding"))
+        self.assertIsNone(self.header(request, "Vary"))
+
+    def test_head(self) -> None:
+        """
+        HEAD responds with the asset's metadata and no content.
+        """
+        request, body = self.render(self.resource(), "style.css", method=b"HEAD")
+
+        self.assertResponseCode(request, http.OK)
+        self.assertEqual(body, b"")
+        self.assertEqual(self.header(request, "Content-Length"), str(len(styleSource)))
+
+    def test_ifNoneMatch(self) -> None:
+        """
+        A request with a matching If-None-Match condition is not modified.
+        """
+        resource = self.resource()
+        asset = resource.assets.assets["style.css"]
+
+        request, body = self.render(
+            resource, "style.css", {"If-None-Match": f'"other", "{asset.digest}"'}
+        )
+        self.assertResponseCode(request, http.NOT_MODIFIED)
+        self.assertEqual(body, b"")
+
+        request, body = self.render(
+            resource, "style.css", {"If-None-Match": f'"{asset.digest}-gzip"'}
+        )
+        self.assertResponseCode(request, http.OK)
+        self.assertEqual(body, styleSource)
+
+    def test_missing(self) -> None:
+        """
+        Missing assets are not found.
+        """
+        request, _ = self.render(self.resource(), "other.css")
+
+        self.assertResponseCode(request, http.NOT_FOUND)
+
+    def test_child(self) -> None:
+        """
+        Assets have no children.
+        """
+        resource = self.resource()
+        child = resource.getChildWithDefault(
+            b"style.css", Request(DummyChannel(), False)
+        )
+        child.putChild(b"x", child)
+        resource.putChild(b"x", child)
+
+        request = Request(DummyChannel(), False)
+        finished = request.notifyFinish()
+        request.render(child.getChildWithDefault(b"x", request))
+        self.successResultOf(finished)
+
+        self.assertResponseCode(request, http.NOT_FOUND)
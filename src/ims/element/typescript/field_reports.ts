@@ -25,6 +25,9 @@ declare global {
 }
 
 let fieldReportsTable: ims.DataTablesTable|null = null;
+// The time at which the server wrote the Field Report which caused the latest
+// table reload.
+let _reloadWriteTime: number|null = null;
 
 let _frShowModifiedAfter: Date|null = null;
 let _frShowDaysBack: number|string|null = null;
@@ -129,6 +132,7 @@ function initFieldReportsTable() {
         //  Field Reports for which they're not authorized, and those errors
         //  show up in the browser console. I'd like to find a way to avoid
         //  bringing those errors into the console constantly.
+        _reloadWriteTime = e.data.write_time ?? null;
         fieldReportsTable!.ajax.reload();
         ims.clearErrorMessage();
     };
@@ -170,7 +174,7 @@ function frInitDataTables() {
                     // per-user authorization can exclude field reports entirely from
                     // someone who created a field report but then didn't add an
                     // entry to it.
-                    ims.urlReplace(url_fieldReports), null,
+                    ims.withWriteTime(ims.urlReplace(url_fieldReports), _reloadWriteTime), null,
                 );
                 if (err != null || json == null) {
                     ims.setErrorMessage(`Failed to load table: ${err}`);
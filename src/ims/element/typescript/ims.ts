@@ -85,6 +85,15 @@ export function urlReplace(url: string): string {
     return url;
 }
 
+// Add the time of a write reported by the server in an SSE to a URL, so that
+// the server's reply includes that write.
+export function withWriteTime(url: string, writeTime: number|null|undefined): string {
+    if (writeTime == null) {
+        return url;
+    }
+    return url + (url.includes("?") ? "&" : "?") + "write_time=" + writeTime;
+}
+
 
 //
 // Arrays
@@ -880,6 +889,18 @@ function reportEntryElement(entry: ReportEntry): HTMLDivElement {
         attachmentLink.href = url;
         attachmentLink.textContent = "Attached file";
 
+        // Show a small preview of image attachments. The server can still
+        // respond with an error for images it can't decode.
+        if (entry.attachment_is_image) {
+            const preview: HTMLImageElement = document.createElement("img");
+            preview.src = url + "?preview=small";
+            preview.loading = "lazy";
+            preview.alt = "";
+            preview.classList.add("d-block");
+            preview.addEventListener("error", () => preview.remove());
+            attachmentLink.append(preview);
+        }
+
         entryContainer.append(attachmentLink);
 
     }
@@ -1150,7 +1171,20 @@ function subscribeToUpdates(closed: (_value?: undefined)=>void): void {
 
     eventSource.addEventListener("Incident", function(e: MessageEvent<string>) {
         localStorage.setItem(lastSseIDKey, e.lastEventId);
-        newIncidentChannel().postMessage(JSON.parse(e.data) as IncidentBroadcast);
+        const data = JSON.parse(e.data) as IncidentBroadcast;
+        const channel = newIncidentChannel();
+        if (data.incident_numbers != null) {
+            // Several Incidents were updated together
+            for (const number of data.incident_numbers) {
+                channel.postMessage({
+                    event_id: data.event_id ?? null,
+                    incident_number: number,
+                    write_time: data.write_time ?? null,
+                });
+            }
+            return;
+        }
+        channel.postMessage(data);
     });
 
     eventSource.addEventListener("FieldReport", function(e: MessageEvent<string>) {
@@ -1328,6 +1362,7 @@ export interface ReportEntry {
     system_entry?: boolean|null;
     stricken?: boolean|null;
     has_attachment?: boolean|null;
+    attachment_is_image?: boolean|null;
 }
 
 export type UnauthenticatedAuthInfo = {
@@ -1362,6 +1397,8 @@ export type IncidentBroadcast = {
     // fields from SSE
     event_id?: string|null;
     incident_number?: number|null;
+    incident_numbers?: number[]|null;
+    write_time?: number|null;
     // additional fields for use in BroadcastChannel
     update_all?: boolean;
 }
@@ -1370,6 +1407,7 @@ export type FieldReportBroadcast = {
     // fields from SSE
     event_id?: string|null;
     field_report_number?: number|null;
+    write_time?: number|null;
     // additional fields for use in BroadcastChannel
     update_all?: boolean
 }
@@ -120,7 +120,7 @@ async function initIncidentPage(): Promise<void> {
         if (updateAll || (event === ims.pathIds.eventID && number === ims.pathIds.incidentNumber)) {
             console.log("Got incident update: " + number);
             await loadAndDisplayIncident();
-            await loadAllFieldReports();
+            await loadAllFieldReports(e.data.write_time);
             renderFieldReportData();
         }
     };
@@ -295,12 +295,14 @@ async function loadPersonnel(): Promise<{err: string|null}> {
 
 let allFieldReports: ims.FieldReport[]|null|undefined = null;
 
-async function loadAllFieldReports(): Promise<{err: string|null}> {
+async function loadAllFieldReports(writeTime: number|null = null): Promise<{err: string|null}> {
     if (allFieldReports === undefined) {
         return {err: null};
     }
 
-    const {resp, json, err} = await ims.fetchJsonNoThrow<ims.FieldReport[]>(ims.urlReplace(url_fieldReports), null);
+    const {resp, json, err} = await ims.fetchJsonNoThrow<ims.FieldReport[]>(
+        ims.withWriteTime(ims.urlReplace(url_fieldReports), writeTime), null,
+    );
     if (err != null) {
         if (resp != null && resp.status === 403) {
             // We're not allowed to look these up.
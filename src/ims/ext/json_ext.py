@@ -3,16 +3,22 @@
 Extensions to :mod:`json`
 """
 
+from codecs import IncrementalDecoder, getincrementaldecoder
+from collections.abc import Iterator
 from datetime import date as Date
 from datetime import datetime as DateTime
-from json import JSONDecodeError, JSONEncoder, dumps, load, loads
+from json import JSONDecodeError, JSONDecoder, JSONEncoder, dumps, load, loads
+from re import Pattern
+from re import compile as regexCompile
 from typing import Any, BinaryIO, ClassVar
 
 from arrow.parser import DateTimeParser
+from attrs import field, mutable
 from twisted.logger import Logger
 
 
 __all__ = (
+    "JSONStreamReader",
     "dateAsRFC3339Text",
     "dateTimeAsRFC3339Text",
     "jsonTextFromObject",
@@ -95,6 +101,237 @@ def objectFromJSONBytesIO(io: BinaryIO) -> Any:
     return load(io)
 
 
+@mutable
+class _ValueScanner:
+    """
+    Finds the end of a JSON value without decoding it, one piece of text at a
+    time, so that text which has already been scanned need not be scanned
+    again when more text arrives.
+    """
+
+    _stringSpecial: ClassVar[Pattern[str]] = regexCompile(r'["\\]')
+    _structural: ClassVar[Pattern[str]] = regexCompile(r'["\[\]{}]')
+    _scalarEnd: ClassVar[Pattern[str]] = regexCompile(r'[\s,:"\[\]{}]')
+
+    started: bool = False
+    scalar: bool = False
+    depth: int = 0
+    inString: bool = False
+    escape: bool = False
+
+    def scan(self, text: str, position: int) -> int:
+        """
+        Scan the given text from the given position, which must follow the
+        text scanned previously.
+        Returns the position following the end of the value, or -1 if the
+        value continues past the end of the text.
+        """
+        if not self.started:
+            self.started = True
+            first = text[position]
+            if first in "{[":
+                self.depth = 1
+                position += 1
+            elif first == '"':
+                self.inString = True
+                position += 1
+            else:
+                self.scalar = True
+
+        if self.scalar:
+            match = self._scalarEnd.search(text, position)
+            return -1 if match is None else match.start()
+
+        while True:
+            if self.escape:
+                if position >= len(text):
+                    return -1
+                position += 1
+                self.escape = False
+
+            if self.inString:
+                match = self._stringSpecial.search(text, position)
+                if match is None:
+                    return -1
+                position = match.end()
+                if match.group() == "\\":
+                    self.escape = True
+                    continue
+                self.inString = False
+                if self.depth == 0:
+                    return position
+                continue
+
+            match = self._structural.search(text, position)
+            if match is None:
+                return -1
+            position = match.end()
+            character = match.group()
+            if character == '"':
+                self.inString = True
+            elif character in "{[":
+                self.depth += 1
+            else:
+                self.depth -= 1
+                if self.depth == 0:
+                    return position
+
+
+@mutable
+class JSONStreamReader:
+    """
+    Incremental reader for JSON text from a byte stream.
+
+    Rather than parsing an entire document into memory, this allows a caller
+    to walk the objects and arrays in a document, decoding only the values
+    that it asks for, one at a time.
+    """
+
+    _jsonDecoder: ClassVar[JSONDecoder] = JSONDecoder()
+
+    _io: BinaryIO
+    _chunkSize: int = 64 * 1024
+
+    _textDecoder: IncrementalDecoder = field(
+        factory=getincrementaldecoder("utf-8"), init=False
+    )
+    _buffer: str = field(default="", init=False)
+    _position: int = field(default=0, init=False)
+    _eof: bool = field(default=False, init=False)
+
+    def _fill(self, size: int | None = None) -> bool:
+        """
+        Read more text into the buffer, discarding text that has already
+        been consumed.
+        Reads the given number of bytes, or the chunk size if not given.
+        Returns false at the end of the stream.
+        """
+        if self._eof:
+            return False
+
+        data = self._io.read(self._chunkSize if size is None else size)
+        if data:
+            text = self._textDecoder.decode(data)
+        else:
+            self._eof = True
+            text = self._textDecoder.decode(b"", final=True)
+
+        self._buffer = self._buffer[self._position :] + text
+        self._position = 0
+
+        return not self._eof
+
+    def _error(self, message: str) -> JSONDecodeError:
+        return JSONDecodeError(message, self._buffer, self._position)
+
+    def _peek(self) -> str:
+        """
+        Skip whitespace and return the next character without consuming it.
+        Returns an empty string at the end of the stream.
+        """
+        while True:
+            buffer = self._buffer
+            position = self._position
+            while position < len(buffer) and buffer[position] in " \t\n\r":
+                position += 1
+            self._position = position
+
+            if position < len(buffer):
+                return buffer[position]
+            if not self._fill():
+                return ""
+
+    def _expect(self, character: str) -> None:
+        if self._peek() != character:
+            raise self._error(f"Expecting {character!r}")
+        self._position += 1
+
+    def readValue(self) -> Any:
+        """
+        Decode and return the complete JSON value at the current position.
+        """
+        if self._peek():
+            # Read until the buffer holds the complete value, so that it is
+            # decoded only once.
+            # Read sizes double, so that the text of a large value is copied
+            # into the buffer a bounded number of times.
+            scanner = _ValueScanner()
+            size = self._chunkSize
+            end = scanner.scan(self._buffer, self._position)
+            while end < 0:
+                scanned = len(self._buffer) - self._position
+                if not self._fill(size):
+                    break
+                end = scanner.scan(self._buffer, scanned)
+                size *= 2
+
+        value, end = self._jsonDecoder.raw_decode(self._buffer, self._position)
+        self._position = end
+        return value
+
+    def objectKeys(self) -> Iterator[str]:
+        """
+        Iterate over the keys of the JSON object at the current position.
+        After each key is produced, the caller must consume the corresponding
+        value before advancing the iterator.
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self._position += 1
+            return
+
+        while True:
+            if self._peek() != '"':
+                raise self._error("Expecting property name enclosed in double quotes")
+            key = self.readValue()
+            self._expect(":")
+
+            yield key
+
+            delimiter = self._peek()
+            self._position += 1
+            if delimiter == "}":
+                return
+            if delimiter != ",":
+                raise self._error("Expecting ',' delimiter")
+
+    def arrayItems(self) -> Iterator[None]:
+        """
+        Iterate over the items of the JSON array at the current position.
+        After each iteration, the caller must consume the item before
+        advancing the iterator.
+        """
+        self._expect("[")
+        if self._peek() == "]":
+            self._position += 1
+            return
+
+        while True:
+            yield None
+
+            delimiter = self._peek()
+            self._position += 1
+            if delimiter == "]":
+                return
+            if delimiter != ",":
+                raise self._error("Expecting ',' delimiter")
+
+    def arrayValues(self) -> Iterator[Any]:
+        """
+        Iterate over the decoded items of the JSON array at the current
+        position.
+        """
+        for _ in self.arrayItems():
+            yield self.readValue()
+
+    def expectEnd(self) -> None:
+        """
+        Ensure that nothing but whitespace remains in the stream.
+        """
+        if self._peek() != "":
+            raise self._error("Extra data")
+
+
 def dateAsRFC3339Text(date: Date) -> str:
     """
     Convert a :class:`Date` into an RFC 3339 formatted date string.
@@ -18,6 +18,7 @@ __all__ = (
     "ContentType",
     "HeaderName",
     "Method",
+    "requestHeader",
     "static",
 )
 
@@ -72,12 +73,36 @@ class HeaderName(Enum):
     HTTP header names.
     """
 
+    acceptEncoding = "Accept-Encoding"
+    acceptRanges = "Accept-Ranges"
     authorization = "Authorization"
     cacheControl = "Cache-Control"
+    contentEncoding = "Content-Encoding"
+    contentLength = "Content-Length"
+    contentRange = "Content-Range"
     contentType = "Content-Type"
     etag = "ETag"
+    ifModifiedSince = "If-Modified-Since"
+    ifNoneMatch = "If-None-Match"
+    ifRange = "If-Range"
+    lastModified = "Last-Modified"
     location = "Location"
+    range = "Range"
     server = "Server"
+    vary = "Vary"
+
+
+def requestHeader(request: IRequest, name: HeaderName) -> str | None:
+    """
+    Look up the value of the request header with the given name.
+    Returns :obj:`None` if the request has no such header.
+    """
+    value = request.getHeader(name.value)
+    if value is None:
+        return None
+    if isinstance(value, bytes):
+        return value.decode("latin-1")
+    return str(value)
 
 
 staticETagForTest = False
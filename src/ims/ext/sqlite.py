@@ -88,6 +88,20 @@ class Cursor(BaseCursor):
         )
         return super().execute(sql, parameters)
 
+    def executemany(  # type: ignore[override]
+        self, sql: str, parameters: Iterable[Parameters]
+    ) -> "Cursor":
+        """
+        See :meth:`sqlite3.Cursor.executemany`.
+        """
+        parameters = tuple(parameters)
+        self._log.debug(
+            "EXECUTE MANY: {sql} <- {count} parameter sets",
+            sql=sql,
+            count=len(parameters),
+        )
+        return super().executemany(sql, parameters)
+
 
 class Connection(BaseConnection):
     """
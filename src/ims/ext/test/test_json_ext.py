@@ -10,13 +10,14 @@ from datetime import timezone as TimeZone
 from io import BytesIO
 from json import JSONDecodeError
 from textwrap import dedent
-from typing import Any, cast
+from typing import Any, ClassVar, cast
 
 from hypothesis import given
 from hypothesis.strategies import composite, dates, integers
 from hypothesis.strategies import datetimes as _datetimes
 
 from ..json_ext import (
+    JSONStreamReader,
     dateAsRFC3339Text,
     dateTimeAsRFC3339Text,
     jsonTextFromObject,
@@ -167,6 +168,100 @@ class JSONDecodingTests(TestCase):
         )
 
 
+class CountingBytesIO(BytesIO):
+    """
+    Byte stream which counts reads.
+    """
+
+    reads = 0
+
+    def read(self, size: int | None = -1) -> bytes:
+        self.reads += 1
+        return super().read(size)
+
+
+class JSONStreamReaderTests(TestCase):
+    """
+    Tests for :class:`JSONStreamReader`
+    """
+
+    document: ClassVar[dict[str, Any]] = {
+        "x": "Hello ☃",
+        "y": [{"one": 1}, {"two": [2, 2.0]}, {}, []],
+        "z": 12345678901234567890,
+        "w": 'Quote " and \\ backslash, [brackets] and {braces}',
+        "v": {"a": ["]", '}"', "\\", 'x\\"'], "b": [[[]], {"c": None}]},
+        "u": True,
+    }
+
+    def read(self, reader: JSONStreamReader) -> dict[str, Any]:
+        result: dict[str, Any] = {}
+        for key in reader.objectKeys():
+            if key == "y":
+                result[key] = list(reader.arrayValues())
+            else:
+                result[key] = reader.readValue()
+        reader.expectEnd()
+        return result
+
+    def test_read(self) -> None:
+        """
+        :class:`JSONStreamReader` decodes JSON text incrementally, regardless
+        of how the stream is broken up into chunks.
+        """
+        jsonBytes = jsonTextFromObject(self.document, pretty=True).encode("utf-8")
+
+        for chunkSize in (1, 2, 3, 5, 64, 1024):
+            reader = JSONStreamReader(BytesIO(jsonBytes), chunkSize)
+            self.assertEqual(self.read(reader), self.document, chunkSize)
+
+    def test_read_largeValue(self) -> None:
+        """
+        :class:`JSONStreamReader` reads a value which is much larger than the
+        chunk size in a number of reads which grows logarithmically with the
+        size of the value.
+        """
+        value = ["x" * 100 for _ in range(1000)]
+        io = CountingBytesIO(jsonTextFromObject({"x": value}).encode("utf-8"))
+
+        reader = JSONStreamReader(io, 16)
+        self.assertEqual(self.read(reader), {"x": value})
+        self.assertLess(io.reads, 20)
+
+    def test_read_truncated(self) -> None:
+        """
+        :class:`JSONStreamReader` raises :exc:`JSONDecodeError` when the
+        stream ends within a value.
+        """
+        for jsonBytes in (b'{"x": [1, 2', b'{"x": "foo', b'{"x": "\\'):
+            reader = JSONStreamReader(BytesIO(jsonBytes), 2)
+            self.assertRaises(JSONDecodeError, self.read, reader)
+
+    def test_read_badDelimiter(self) -> None:
+        """
+        :class:`JSONStreamReader` raises :exc:`JSONDecodeError` when given
+        an invalid delimiter.
+        """
+        reader = JSONStreamReader(BytesIO(b'{"x": 1; "y": 2}'))
+        self.assertRaises(JSONDecodeError, self.read, reader)
+
+    def test_read_badValue(self) -> None:
+        """
+        :class:`JSONStreamReader` raises :exc:`JSONDecodeError` when given
+        an invalid value.
+        """
+        reader = JSONStreamReader(BytesIO(b'{"x": foo}'))
+        self.assertRaises(JSONDecodeError, self.read, reader)
+
+    def test_read_extraData(self) -> None:
+        """
+        :meth:`JSONStreamReader.expectEnd` raises :exc:`JSONDecodeError` when
+        there is text following the document.
+        """
+        reader = JSONStreamReader(BytesIO(b'{"x": 1} {}'))
+        self.assertRaises(JSONDecodeError, self.read, reader)
+
+
 class DateTimeTests(TestCase):
     """
     Test for encoding and decoding of date/time objects.
@@ -6,7 +6,7 @@ from klein import KleinRenderable
 from klein.test.test_resource import Klein, MockRequest
 from twisted.web.iweb import IRequest
 
-from ..klein import static
+from ..klein import HeaderName, requestHeader, static
 from ..trial import TestCase
 
 
@@ -68,3 +68,27 @@ class StaticDecoratorTests(TestCase):
         self.assertTrue(len(etags) == 1, etags)
         etag = etags[0]
         self.assertTrue(etag)
+
+
+class RequestHeaderTests(TestCase):
+    """
+    Tests for :func:`requestHeader`
+    """
+
+    def test_requestHeader(self) -> None:
+        """
+        :func:`requestHeader` returns the value of the named header as text.
+        """
+        request = MockRequest(b"/")
+        request.requestHeaders.setRawHeaders("If-None-Match", ['"x"'])
+
+        self.assertEqual(requestHeader(request, HeaderName.ifNoneMatch), '"x"')
+
+    def test_requestHeader_missing(self) -> None:
+        """
+        :func:`requestHeader` returns :obj:`None` if the request has no such
+        header.
+        """
+        request = MockRequest(b"/")
+
+        self.assertIsNone(requestHeader(request, HeaderName.ifNoneMatch))
@@ -20,6 +20,7 @@ JSON serialization/deserialization for report entries
 
 from datetime import datetime as DateTime
 from enum import Enum, unique
+from mimetypes import guess_type
 from typing import Any, cast
 
 from .._entry import ReportEntry
@@ -46,8 +47,9 @@ class ReportEntryJSONKey(Enum):
     automatic = "system_entry"
     text = "text"
     stricken = "stricken"
-    # this field is added separately below
+    # these fields are added separately below
     # has_attachment = "has_attachment"
+    # attachment_is_image = "attachment_is_image"
 
 
 class ReportEntryJSONType(Enum):
@@ -62,6 +64,18 @@ class ReportEntryJSONType(Enum):
     text = str
     stricken = bool
     # has_attachment = bool
+    # attachment_is_image = bool
+
+
+def _isImageName(name: str | None) -> bool:
+    """
+    Determine whether an attachment is an image from its name, which has the
+    file extension for its content type.
+    """
+    if not name:
+        return False
+    contentType, _ = guess_type(name, strict=False)
+    return contentType is not None and contentType.startswith("image/")
 
 
 def serializeReportEntry(reportEntry: ReportEntry) -> dict[str, Any]:
@@ -72,6 +86,8 @@ def serializeReportEntry(reportEntry: ReportEntry) -> dict[str, Any]:
     }
     # don't add the name of the file itself, as that's secret
     jsonified["has_attachment"] = bool(reportEntry.attachedFile)
+    # but do say whether it's an image, so clients know to show a preview
+    jsonified["attachment_is_image"] = _isImageName(reportEntry.attachedFile)
     return jsonified
 
 
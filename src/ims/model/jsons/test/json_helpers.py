@@ -18,6 +18,7 @@
 Expected JSON encoding for model data.
 """
 
+from mimetypes import guess_type
 from typing import Any, cast
 
 from ..._address import Address, RodGarettAddress, TextOnlyAddress
@@ -82,6 +83,9 @@ def jsonFromReportEntry(entry: ReportEntry) -> dict[str, Any]:
         "text": jsonSerialize(entry.text),
         "stricken": jsonSerialize(entry.stricken),
         "has_attachment": bool(entry.attachedFile),
+        "attachment_is_image": (
+            guess_type(entry.attachedFile or "", strict=False)[0] or ""
+        ).startswith("image/"),
     }
 
 
@@ -18,6 +18,10 @@
 Tests for :mod:`ranger-ims-server.model.jsons._entry`
 """
 
+from datetime import UTC
+from datetime import datetime as DateTime
+from typing import Any, cast
+
 from hypothesis import given
 
 from ims.ext.trial import TestCase
@@ -43,6 +47,36 @@ class ReportEntrySerializationTests(TestCase):
         """
         self.assertEqual(jsonSerialize(entry), jsonFromReportEntry(entry))
 
+    def test_serialize_attachmentIsImage(self) -> None:
+        """
+        :func:`jsonSerialize` says whether a report entry's attachment is an
+        image, from the extension of its name, without giving the name.
+        """
+        entry = ReportEntry(
+            id=1,
+            created=DateTime(2025, 8, 30, 12, 0, tzinfo=UTC),
+            author="Hubcap",
+            automatic=False,
+            text="Something happened",
+            stricken=False,
+        )
+        digest = "0" * 64
+
+        for attachedFile, hasAttachment, isImage in (
+            (None, False, False),
+            (f"sha256-{digest}.png", True, True),
+            (f"sha256-{digest}.jpg", True, True),
+            (f"sha256-{digest}.pdf", True, False),
+            (f"sha256-{digest}", True, False),
+        ):
+            json = cast(
+                "dict[str, Any]",
+                jsonSerialize(entry.replace(attachedFile=attachedFile)),
+            )
+            self.assertEqual(json["has_attachment"], hasAttachment)
+            self.assertEqual(json["attachment_is_image"], isImage)
+            self.assertNotIn(digest, repr(json))
+
 
 class ReportEntryDeserializationTests(TestCase):
     """
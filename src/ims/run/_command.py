@@ -20,6 +20,8 @@ Run the IMS server.
 
 import sys
 from collections.abc import Sequence
+from datetime import UTC
+from datetime import datetime as DateTime
 from sys import stdout
 from typing import TYPE_CHECKING, ClassVar, cast
 
@@ -27,17 +29,18 @@ from attrs import frozen
 from twisted.application.runner._exit import ExitStatus, exit
 from twisted.application.runner._runner import Runner
 from twisted.internet.defer import Deferred, ensureDeferred
+from twisted.internet.task import LoopingCall
 from twisted.logger import Logger
 from twisted.python.failure import Failure
 from twisted.python.usage import UsageError
 from twisted.web.server import Session, Site
 
 from ims.application import Application
+from ims.attachments import CachingAttachmentStore
 from ims.config import Configuration
 from ims.directory import hashPassword, verifyPassword
-from ims.model.jsons import jsonObjectFromModelObject
 from ims.store import IMSDataStore, StorageError
-from ims.store.export import JSONExporter, JSONImporter
+from ims.store.export import ExportDigest, JSONExporter, JSONStreamImporter
 
 from ._log import patchCombinedLogFormatter
 from ._options import (
@@ -90,6 +93,18 @@ class Command:
     async def initStore(cls, store: IMSDataStore) -> None:
         await store.upgradeSchema()
         await store.validate()
+        await store.prewarm()
+
+    @classmethod
+    def logStatistics(cls, config: Configuration) -> None:
+        """
+        Log statistics on the use of the server's resources.
+        """
+        config.store.logStatistics()
+
+        attachmentStore = config.attachmentStore
+        if isinstance(attachmentStore, CachingAttachmentStore):
+            attachmentStore.logStatistics()
 
     @classmethod
     def runServer(cls, config: Configuration, options: ServerOptions) -> None:  # noqa: ARG003
@@ -116,119 +131,77 @@ class Command:
 
         cast("IReactorTCP", reactor).listenTCP(port, factory, interface=host)
 
+        # Load external resources now, rather than making the first requests
+        # for them wait for downloads.
+        ensureDeferred(application.externalApplication.prewarm())
+
+        if config.statisticsInterval > 0:
+            LoopingCall(cls.logStatistics, config).start(
+                config.statisticsInterval, now=False
+            )
+
     @classmethod
     async def runExport(cls, config: Configuration, options: ExportOptions) -> None:
+        exported = DateTime.now(UTC)
+
         with options["outFile"] as outFile:
-            exporter = JSONExporter(store=config.store)
-            data = await exporter.asBytes()
-            outFile.write(data)
+            exporter = JSONExporter(
+                store=config.store,
+                eventIDs=options.get("eventIDs"),
+                modifiedAfter=options.get("modifiedAfter"),
+            )
+            await exporter.writeJSON(outFile)
+
+        manifestFile = options.get("manifestFile")
+        if manifestFile is not None:
+            with manifestFile:
+                manifest = exporter.manifest(exported)
+                manifestFile.write(manifest.asText().encode("utf-8"))
         cls.stop()
 
     @classmethod
     async def runImport(cls, config: Configuration, options: ImportOptions) -> None:
         with options["inFile"] as inFile:
-            importer = JSONImporter.fromIO(store=config.store, io=inFile)
-            await importer.storeData()
+            importer = JSONStreamImporter(store=config.store, io=inFile)
+            await importer.storeData(
+                bulk=options.get("bulk", False), merge=options.get("merge", False)
+            )
         cls.stop()
 
     @classmethod
-    def runCompare(cls, config: Configuration, options: CompareOptions) -> None:
-        importers: list[JSONImporter] = []
+    def runCompare(cls, config: Configuration, options: CompareOptions) -> None:  # noqa: ARG003
+        first: ExportDigest | None = None
+        firstName = ""
 
         for inFile in options["inFiles"]:
             with inFile:
-                cls.log.info("Reading export file...")
-                importers.append(JSONImporter.fromIO(store=config.store, io=inFile))
-
-        first: JSONImporter | None = None
+                cls.log.info("Reading export file {name}...", name=inFile.name)
+                digest = ExportDigest.fromIO(inFile)
 
-        for importer in importers:
             if first is None:
-                first = importer
-            else:
-                cls.log.info("Comparing export files...")
-
-                imsDataA = first.imsData
-                imsDataB = importer.imsData
-
-                if imsDataA != imsDataB:
-                    if imsDataA.incidentTypes != imsDataB.incidentTypes:
-                        cls.log.error(
-                            "Incident Types do not match: "
-                            "{incidentTypesA} != {incidentTypesB}",
-                            incidentTypesA=imsDataA.incidentTypes,
-                            incidentTypesB=imsDataB.incidentTypes,
-                        )
-
-                    for eventDataA, eventDataB in zip(
-                        sorted(imsDataA.events),
-                        sorted(imsDataB.events),
-                        strict=True,
-                    ):
-                        if eventDataA.event != eventDataB.event:
-                            cls.log.error(
-                                "Events do not match: {eventsA} != {eventsB}",
-                                eventsA=[d.event for d in imsDataA.events],
-                                eventsB=[d.event for d in imsDataB.events],
-                            )
-
-                    for eventDataA, eventDataB in zip(
-                        sorted(imsDataA.events),
-                        sorted(imsDataB.events),
-                        strict=True,
-                    ):
-                        if eventDataA.access != eventDataB.access:
-                            cls.log.error(
-                                "Events ACLs do not match: {aclA} != {aclB}",
-                                aclA=eventDataA.access,
-                                aclB=eventDataB.access,
-                            )
-
-                        if eventDataA.concentricStreets != eventDataB.concentricStreets:
-                            cls.log.error(
-                                "Events concentric streets do not match: "
-                                "{streetsA} != {streetsB}",
-                                streetsA=eventDataA.concentricStreets,
-                                streetsB=eventDataB.concentricStreets,
-                            )
-
-                        if eventDataA.incidents != eventDataB.incidents:
-                            cls.log.error(
-                                "Events incidents do not match: {event}",
-                                event=eventDataA.event,
-                            )
-
-                            numbersA = frozenset(i.number for i in eventDataA.incidents)
-                            numbersB = frozenset(i.number for i in eventDataB.incidents)
-                            if numbersA != numbersB:
-                                cls.log.error(
-                                    "Incident numbers do not match for event {event}",
-                                    event=eventDataA.event,
-                                )
-
-                            for incidentA, incidentB in zip(
-                                sorted(eventDataA.incidents),
-                                sorted(eventDataB.incidents),
-                                strict=True,
-                            ):
-                                if incidentA != incidentB:
-                                    cls.log.error(
-                                        "Incidents do not match for event "
-                                        "{event}: {incidentA} != {incidentB}",
-                                        event=eventDataA.event,
-                                        incidentA=jsonObjectFromModelObject(incidentA),
-                                        incidentB=jsonObjectFromModelObject(incidentB),
-                                    )
-
-                        if eventDataA.fieldReports != eventDataB.fieldReports:
-                            cls.log.error(
-                                "Events field reports do not match: {event}",
-                                event=eventDataA.event,
-                            )
-
-                    cls.log.error("Argh IMS data mismatch")
-
-                    break
+                first = digest
+                firstName = inFile.name
+                continue
+
+            cls.log.info(
+                "Comparing export files {nameA} and {nameB}...",
+                nameA=firstName,
+                nameB=inFile.name,
+            )
+
+            mismatch = False
+            for difference in first.differences(digest):
+                mismatch = True
+                cls.log.error(
+                    "{nameA} != {nameB}: {difference}",
+                    nameA=firstName,
+                    nameB=inFile.name,
+                    difference=difference,
+                )
+
+            if mismatch:
+                cls.log.error("Argh IMS data mismatch")
+                break
 
         cls.stop()
 
@@ -19,6 +19,7 @@ Command line options for the IMS server.
 """
 
 from collections.abc import Mapping, MutableMapping, Sequence
+from datetime import UTC
 from pathlib import Path
 from sys import stderr, stdin, stdout
 from textwrap import dedent
@@ -38,6 +39,8 @@ from twisted.python.usage import UsageError
 
 from ims import __version__ as version
 from ims.config import Configuration, LogFormat
+from ims.ext.json_ext import rfc3339TextAsDateTime
+from ims.store.export import ExportManifest
 
 
 __all__ = ()
@@ -101,6 +104,43 @@ class ExportOptions(Options):
         """
         self["outFile"] = openFile(fileName, "wb")
 
+    def opt_event(self, eventID: str) -> None:
+        """
+        Export the given event. (may be repeated; default: all events)
+        """
+        self.setdefault("eventIDs", set()).add(eventID)
+
+    def opt_since(self, dateTime: str) -> None:
+        """
+        Export only incidents and field reports modified after the given
+        RFC 3339 date-time.
+        """
+        try:
+            modifiedAfter = rfc3339TextAsDateTime(dateTime)
+        except ValueError as e:
+            raise UsageError(f"Invalid date-time: {dateTime}") from e
+        if modifiedAfter.tzinfo is None:
+            modifiedAfter = modifiedAfter.replace(tzinfo=UTC)
+        self["modifiedAfter"] = modifiedAfter
+
+    def opt_since_manifest(self, fileName: str) -> None:
+        """
+        Export only incidents and field reports modified after the export
+        described by the given manifest file.
+        """
+        with openFile(fileName, "rb") as manifestFile:
+            try:
+                manifest = ExportManifest.fromText(manifestFile.read().decode("utf-8"))
+            except (ValueError, KeyError) as e:
+                raise UsageError(f"Invalid export manifest: {fileName}") from e
+        self["modifiedAfter"] = manifest.exported
+
+    def opt_manifest(self, fileName: str) -> None:
+        """
+        Write a manifest describing the export to the given file.
+        """
+        self["manifestFile"] = openFile(fileName, "wb")
+
 
 class ImportOptions(Options):
     """
@@ -113,6 +153,19 @@ class ImportOptions(Options):
         """
         self["inFile"] = openFile(fileName, "rb")
 
+    def opt_bulk(self) -> None:
+        """
+        Import incidents and field reports in large batched transactions.
+        """
+        self["bulk"] = True
+
+    def opt_merge(self) -> None:
+        """
+        Merge incidents and field reports into existing ones with the same
+        numbers, as when importing the output of an incremental export.
+        """
+        self["merge"] = True
+
 
 class CompareOptions(Options):
     """
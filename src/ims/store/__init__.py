@@ -24,10 +24,12 @@ from ._exceptions import (
     NoSuchIncidentError,
     StorageError,
 )
+from ._search import IncidentSearchResult
 
 
 __all__ = (
     "IMSDataStore",
+    "IncidentSearchResult",
     "NoSuchFieldReportError",
     "NoSuchIncidentError",
     "StorageError",
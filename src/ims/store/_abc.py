@@ -19,11 +19,12 @@ Incident Management System data store abstract base classes.
 """
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Mapping, Sequence
 
 from ims.model import (
     AccessEntry,
     Event,
+    EventAccess,
     FieldReport,
     Incident,
     IncidentPriority,
@@ -31,6 +32,8 @@ from ims.model import (
     ReportEntry,
 )
 
+from ._search import IncidentSearchResult
+
 
 __all__ = ()
 
@@ -57,6 +60,29 @@ class IMSDataStore(ABC):
         there are any problems detected.
         """
 
+    @abstractmethod
+    async def prewarm(self) -> None:
+        """
+        Open connections to the underlying storage ahead of their first use.
+        """
+
+    @abstractmethod
+    def logStatistics(self) -> None:
+        """
+        Log statistics on the use of connections to the underlying storage.
+        """
+
+    def readingAfter(self, writeTime: float | None) -> "IMSDataStore":
+        """
+        Look up a view of this store whose reads see data written at or before
+        the given time (as returned by :func:`time.time`), if not :obj:`None`.
+        Stores which read from replicas may otherwise read data which doesn't
+        yet include recent writes.
+        This implementation returns this store, which always reads the latest
+        data.
+        """
+        return self
+
     ###
     # Incident Types
     ###
@@ -139,6 +165,13 @@ class IMSDataStore(ABC):
         Set the allowed reporters for the given event.
         """
 
+    @abstractmethod
+    async def eventAccesses(self) -> Mapping[str, EventAccess]:
+        """
+        Look up the allowed readers, writers and reporters for all events.
+        Returns a mapping from event ID to event access.
+        """
+
     ###
     # Concentric Streets
     ###
@@ -150,22 +183,59 @@ class IMSDataStore(ABC):
         Returns a mapping from street ID to street name.
         """
 
+    @abstractmethod
+    async def concentricStreetsByEvent(self) -> Mapping[str, Mapping[str, str]]:
+        """
+        Look up the concentric streets associated with all events.
+        Returns a mapping from event ID to a mapping from street ID to street
+        name.
+        """
+
     @abstractmethod
     async def createConcentricStreet(self, eventID: str, id: str, name: str) -> None:
         """
         Create a new concentric street and associated it with the given event.
         """
 
+    @abstractmethod
+    async def createConcentricStreets(
+        self, eventID: str, streets: Mapping[str, str]
+    ) -> None:
+        """
+        Create the given concentric streets, keyed by ID, in the given event,
+        in a single transaction.
+        Streets with IDs that already exist in the event are left unchanged.
+        """
+
     ###
     # Incidents
     ###
 
     @abstractmethod
     async def incidents(
-        self, eventID: str, *, excludeSystemEntries: bool = False
+        self,
+        eventID: str,
+        *,
+        excludeSystemEntries: bool = False,
+        excludeReportEntries: bool = False,
+        numbers: Iterable[int] | None = None,
     ) -> Iterable[Incident]:
         """
         Look up all incidents for the given event.
+
+        If ``excludeReportEntries`` is true, the returned incidents will have
+        no report entries, which avoids reading report entry text from the
+        store.
+
+        If ``numbers`` is given, only the incidents with those numbers are
+        looked up.
+        Numbers for which there is no incident are ignored.
+        """
+
+    @abstractmethod
+    async def incidentNumbers(self, eventID: str) -> Iterable[int]:
+        """
+        Look up the numbers of all incidents in the given event.
         """
 
     @abstractmethod
@@ -174,6 +244,26 @@ class IMSDataStore(ABC):
         Look up the incident with the given number in the given event.
         """
 
+    @abstractmethod
+    async def incidentAttachedFile(
+        self, eventID: str, incidentNumber: int, reportEntryID: int
+    ) -> str | None:
+        """
+        Look up the name of the file attached to the report entry with the
+        given ID on the incident with the given number in the given event.
+        Returns :obj:`None` if there is no such report entry on the incident,
+        or if the report entry has no attached file.
+        """
+
+    @abstractmethod
+    async def incidentAttachments(
+        self, eventID: str, incidentNumber: int
+    ) -> Iterable[ReportEntry]:
+        """
+        Look up the report entries with attached files on the incident with
+        the given number in the given event.
+        """
+
     @abstractmethod
     async def createIncident(self, incident: Incident, author: str) -> Incident:
         """
@@ -198,6 +288,26 @@ class IMSDataStore(ABC):
         it.
         """
 
+    @abstractmethod
+    async def importIncidents(self, incidents: Iterable[Incident]) -> None:
+        """
+        Import the given incidents, as with
+        :meth:`IMSDataStore.importIncident`, in a single transaction.
+        """
+
+    @abstractmethod
+    async def mergeIncident(self, incident: Incident) -> None:
+        """
+        Merge an imported incident into the existing incident with the same
+        number in the same event.
+
+        The incident's attributes, Rangers and incident types replace those of
+        the existing incident, report entries that the existing incident does
+        not already have are added to it, and the stricken values of report
+        entries that it does have are updated.
+        No automatic entries are added.
+        """
+
     @abstractmethod
     async def setIncident_priority(
         self,
@@ -317,6 +427,27 @@ class IMSDataStore(ABC):
         given event.
         """
 
+    @abstractmethod
+    async def editIncidents(
+        self,
+        eventID: str,
+        incidentNumbers: Iterable[int],
+        author: str,
+        *,
+        priority: IncidentPriority | None = None,
+        state: IncidentState | None = None,
+        reportEntries: Iterable[ReportEntry] = (),
+    ) -> None:
+        """
+        Apply the same changes to the incidents with the given numbers in the
+        given event, in a single transaction.
+
+        The given priority and state, if any, are set on each incident, and
+        the given report entries are added to each incident.
+        Raises :exc:`NoSuchIncidentError` (and changes nothing) if any of the
+        incidents don't exist.
+        """
+
     @abstractmethod
     async def setIncidentReportEntry_stricken(
         self,
@@ -330,16 +461,44 @@ class IMSDataStore(ABC):
         Set the stricken value for the given report entry ID on an incident.
         """
 
+    @abstractmethod
+    async def searchIncidents(
+        self, eventID: str, text: str, *, limit: int = 100
+    ) -> Sequence[IncidentSearchResult]:
+        """
+        Search the summaries, locations and (user-written, unstricken) report
+        entries of the incidents in the given event for the given text.
+        Results are ordered from best to worst match.
+        """
+
     ###
     # Field Reports
     ###
 
     @abstractmethod
     async def fieldReports(
-        self, eventID: str, *, excludeSystemEntries: bool = False
+        self,
+        eventID: str,
+        *,
+        excludeSystemEntries: bool = False,
+        excludeReportEntries: bool = False,
+        author: str | None = None,
     ) -> Iterable[FieldReport]:
         """
         Look up all field reports in the given event.
+
+        If ``excludeReportEntries`` is true, the returned field reports will
+        have no report entries.
+
+        If ``author`` is not :obj:`None`, only field reports with a report
+        entry (other than an excluded system entry) by that author are
+        returned.
+        """
+
+    @abstractmethod
+    async def fieldReportNumbers(self, eventID: str) -> Iterable[int]:
+        """
+        Look up the numbers of all field reports in the given event.
         """
 
     @abstractmethod
@@ -348,6 +507,15 @@ class IMSDataStore(ABC):
         Look up the field report with the given number.
         """
 
+    @abstractmethod
+    async def fieldReportHasAuthor(
+        self, eventID: str, number: int, author: str
+    ) -> bool:
+        """
+        Determine whether the field report with the given number has a report
+        entry by the given author.
+        """
+
     @abstractmethod
     async def createFieldReport(
         self, fieldReport: FieldReport, author: str
@@ -374,6 +542,26 @@ class IMSDataStore(ABC):
         are added to it.
         """
 
+    @abstractmethod
+    async def importFieldReports(self, fieldReports: Iterable[FieldReport]) -> None:
+        """
+        Import the given field reports, as with
+        :meth:`IMSDataStore.importFieldReport`, in a single transaction.
+        """
+
+    @abstractmethod
+    async def mergeFieldReport(self, fieldReport: FieldReport) -> None:
+        """
+        Merge an imported field report into the existing field report with
+        the same number in the same event.
+
+        The field report's summary and incident number replace those of the
+        existing field report, report entries that the existing field report
+        does not already have are added to it, and the stricken values of
+        report entries that it does have are updated.
+        No automatic entries are added.
+        """
+
     @abstractmethod
     async def setFieldReport_summary(
         self,
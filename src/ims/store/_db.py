@@ -20,9 +20,10 @@ Incident Management System database tooling.
 
 from abc import abstractmethod
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Iterator, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from datetime import UTC
 from datetime import datetime as DateTime
+from datetime import timedelta as TimeDelta
 from json import loads
 from pathlib import Path
 from re import search as reSearch
@@ -37,6 +38,7 @@ from ims.model import (
     AccessEntry,
     AccessValidity,
     Event,
+    EventAccess,
     FieldReport,
     Incident,
     IncidentPriority,
@@ -52,6 +54,11 @@ from ._exceptions import (
     NoSuchIncidentError,
     StorageError,
 )
+from ._search import (
+    IncidentSearchResult,
+    searchSnippet,
+    searchTerms,
+)
 
 
 __all__ = ()
@@ -70,6 +77,45 @@ def now() -> DateTime:
     return DateTime.now(UTC)
 
 
+# Report entries being merged into those of an existing incident or field
+# report are considered to be the same as an existing entry if their creation
+# times differ by no more than this, to allow for data store time resolution.
+mergeTimeTolerance = TimeDelta(seconds=1)
+
+
+def mergeReportEntries(
+    existingEntries: Iterable[ReportEntry], reportEntries: Iterable[ReportEntry]
+) -> tuple[Sequence[ReportEntry], Sequence[tuple[int, bool]]]:
+    """
+    Compare report entries to be merged with existing report entries.
+
+    Returns the report entries that do not already exist, and the IDs of
+    existing report entries whose stricken value differs from that of the
+    corresponding given report entry, along with the new stricken value.
+    """
+    unmatchedEntries = list(existingEntries)
+    newEntries: list[ReportEntry] = []
+    strickenChanges: list[tuple[int, bool]] = []
+
+    for reportEntry in reportEntries:
+        for existingEntry in unmatchedEntries:
+            if (
+                existingEntry.author == reportEntry.author
+                and existingEntry.text == reportEntry.text
+                and existingEntry.automatic == reportEntry.automatic
+                and abs(existingEntry.created - reportEntry.created)
+                <= mergeTimeTolerance
+            ):
+                unmatchedEntries.remove(existingEntry)
+                if existingEntry.stricken != reportEntry.stricken:
+                    strickenChanges.append((existingEntry.id, reportEntry.stricken))
+                break
+        else:
+            newEntries.append(reportEntry)
+
+    return newEntries, strickenChanges
+
+
 @frozen
 class Query:
     description: str
@@ -82,7 +128,9 @@ class Queries:
     events: Query
     createEvent: Query
     createEventOrIgnore: Query
+    createEventCounter: Query
     eventAccess: Query
+    eventAccesses: Query
     clearEventAccessForMode: Query
     clearEventAccessForExpression: Query
     addEventAccess: Query
@@ -92,6 +140,7 @@ class Queries:
     createIncidentTypeOrIgnore: Query
     hideShowIncidentType: Query
     concentricStreets: Query
+    concentricStreetsByEvent: Query
     createConcentricStreet: Query
     createConcentricStreetOrIgnore: Query
     detachedReportEntries: Query
@@ -99,10 +148,18 @@ class Queries:
     incident_rangers: Query
     incident_incidentTypes: Query
     incident_reportEntries: Query
+    incident_reportEntryAttachedFile: Query
+    incident_attachments: Query
     incidentNumbers: Query
-    maxIncidentNumber: Query
+    nextIncidentNumber: Query
+    bumpIncidentNumber: Query
+    lastIncidentNumber: Query
     incidents: Query
     incidents_reportEntries: Query
+    incidents_lastModified: Query
+    incidentsWithNumbers: Query
+    incidentsWithNumbers_reportEntries: Query
+    incidentsWithNumbers_lastModified: Query
     attachRangerHandleToIncident: Query
     detachRangerHandleFromIncident: Query
     attachIncidentTypeToIncident: Query
@@ -123,9 +180,14 @@ class Queries:
     fieldReport: Query
     fieldReport_reportEntries: Query
     fieldReportNumbers: Query
-    maxFieldReportNumber: Query
+    nextFieldReportNumber: Query
+    bumpFieldReportNumber: Query
+    lastFieldReportNumber: Query
     fieldReports: Query
     fieldReports_reportEntries: Query
+    fieldReportsByAuthor: Query
+    fieldReportsByAuthor_reportEntries: Query
+    fieldReportHasAuthor: Query
     createFieldReport: Query
     attachReportEntryToFieldReport: Query
     setFieldReport_summary: Query
@@ -134,6 +196,15 @@ class Queries:
     attachedFieldReportNumbers: Query
     setIncidentReportEntry_stricken: Query
     setFieldReportReportEntry_stricken: Query
+    clearIncidentSearchText: Query
+    indexIncidentSearchText: Query
+    indexReportEntrySearchText: Query
+    searchIncidents: Query
+    searchIncidents_indexedTerm: Query
+
+    # Only needed by stores whose full-text index can't match some terms; see
+    # DatabaseStore.asSearchExpression
+    searchIncidents_unindexedTerm: Query | None = None
 
 
 @frozen(kw_only=True)
@@ -146,6 +217,12 @@ class Transaction:
         Executes an SQL statement.
         """
 
+    @abstractmethod
+    def executemany(self, sql: str, parameters: Iterable[Parameters]) -> None:
+        """
+        Executes an SQL statement once for each of the given parameter sets.
+        """
+
     @abstractmethod
     def executescript(self, sql_script: str) -> None:
         """
@@ -263,6 +340,50 @@ class DatabaseStore(IMSDataStore):
 
         return DateTime.fromtimestamp(value, tz=UTC)
 
+    @staticmethod
+    @abstractmethod
+    def parameterPlaceholder(name: str) -> str:
+        """
+        Return the placeholder for the query parameter with the given name,
+        for use in query text generated at run time.
+        """
+
+    def expandParameterList(
+        self,
+        query: Query,
+        name: str,
+        values: Sequence[ParameterValue],
+        parameters: dict[str, ParameterValue],
+    ) -> Query:
+        """
+        Replace the placeholder for the list parameter with the given name in
+        the given query's text with one placeholder per value, and add the
+        values to the given parameters.
+        An empty list is replaced with ``null``, which is in no list.
+        """
+        placeholders: list[str] = []
+        for index, value in enumerate(values):
+            valueName = f"{name}{index}"
+            parameters[valueName] = value
+            placeholders.append(self.parameterPlaceholder(valueName))
+
+        return Query(
+            query.description,
+            query.text.format_map({name: ", ".join(placeholders) or "null"}),
+        )
+
+    @staticmethod
+    @abstractmethod
+    def asSearchExpression(term: str) -> str | None:
+        """
+        Convert a search term to a full-text search expression for the
+        database.
+        The expression should match text containing the given term as a word
+        prefix.
+        Returns :obj:`None` if the full-text index cannot match the term, in
+        which case the term is matched by scanning the indexed text instead.
+        """
+
     @classmethod
     def loadSchema(cls, version: int | str | None = None) -> str:
         """
@@ -314,6 +435,36 @@ class DatabaseStore(IMSDataStore):
         transaction as the sole argument.
         """
 
+    async def runReadQuery(
+        self, query: Query, parameters: Parameters | None = None
+    ) -> Rows:
+        """
+        Execute the given read-only query with the given parameters, returning
+        the resulting rows.
+
+        Stores with read replicas may run the query on a replica, which need
+        not have seen recent writes; see :meth:`IMSDataStore.readingAfter`.
+        This implementation calls :meth:`runQuery`.
+        """
+        return await self.runQuery(query, parameters)
+
+    async def runReadInteraction(
+        self,
+        interaction: Callable[..., T],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Create a transaction and call the given read-only interaction with the
+        transaction as the sole argument.
+
+        Stores with read replicas may run the interaction on a replica, which
+        need not have seen recent writes; see
+        :meth:`IMSDataStore.readingAfter`.
+        This implementation calls :meth:`runInteraction`.
+        """
+        return await self.runInteraction(interaction, *args, **kwargs)
+
     @abstractmethod
     async def dbSchemaVersion(self) -> int:
         """
@@ -333,6 +484,18 @@ class DatabaseStore(IMSDataStore):
         if await self.dbManager.upgradeSchema(targetVersion):
             await self.disconnect()
 
+    async def prewarm(self) -> None:
+        """
+        See :meth:`IMSDataStore.prewarm`.
+        This implementation does nothing.
+        """
+
+    def logStatistics(self) -> None:
+        """
+        See :meth:`IMSDataStore.logStatistics`.
+        This implementation does nothing.
+        """
+
     async def validate(self) -> None:
         """
         See :meth:`IMSDataStore.validate`.
@@ -377,7 +540,12 @@ class DatabaseStore(IMSDataStore):
                 f"wanted EventID to match '{eventIdPattern}', got '{event.id}'"
             )
 
-        await self.runOperation(self.query.createEvent, {"eventID": event.id})
+        def createEvent(txn: Transaction) -> None:
+            parameters = {"eventID": event.id}
+            txn.execute(self.query.createEvent.text, parameters)
+            txn.execute(self.query.createEventCounter.text, parameters)
+
+        await self.runInteraction(createEvent)
 
         self._log.info(
             "Created event: {event}",
@@ -391,36 +559,80 @@ class DatabaseStore(IMSDataStore):
                 expression=cast("str", row["EXPRESSION"]),
                 validity=self.fromAccessValidityValue(row["VALIDITY"]),
             )
-            for row in await self.runQuery(
+            for row in await self.runReadQuery(
                 self.query.eventAccess, {"eventID": eventID, "mode": mode}
             )
         )
 
+    async def eventAccesses(self) -> Mapping[str, EventAccess]:
+        """
+        See :meth:`IMSDataStore.eventAccesses`.
+        """
+        entries: dict[str, dict[str, list[AccessEntry]]] = {}
+
+        for row in await self.runReadQuery(self.query.eventAccesses):
+            eventEntries = entries.setdefault(
+                cast("str", row["EVENT_NAME"]),
+                {"read": [], "write": [], "report": []},
+            )
+            if row["MODE"] is None:
+                # Event with no access entries
+                continue
+            eventEntries[cast("str", row["MODE"])].append(
+                AccessEntry(
+                    expression=cast("str", row["EXPRESSION"]),
+                    validity=self.fromAccessValidityValue(row["VALIDITY"]),
+                )
+            )
+
+        return MappingProxyType(
+            {
+                eventID: EventAccess(
+                    readers=eventEntries["read"],
+                    writers=eventEntries["write"],
+                    reporters=eventEntries["report"],
+                )
+                for eventID, eventEntries in entries.items()
+            }
+        )
+
     async def _setEventAccess(
         self,
         eventID: str,
         mode: str,
         accessEntries: Iterable[AccessEntry],
     ) -> None:
+        accessEntries = tuple(accessEntries)
+
+        # An expression has at most one entry per event, so later entries for
+        # an expression replace earlier ones.
+        entries = {entry.expression: entry for entry in accessEntries}
+
         def setEventAccess(txn: Transaction) -> None:
             txn.execute(
                 self.query.clearEventAccessForMode.text,
                 {"eventID": eventID, "mode": mode},
             )
-            for entry in accessEntries:
-                txn.execute(
-                    self.query.clearEventAccessForExpression.text,
-                    {"eventID": eventID, "expression": entry.expression},
-                )
-                txn.execute(
-                    self.query.addEventAccess.text,
+            # Remove the expressions from any other mode
+            txn.executemany(
+                self.query.clearEventAccessForExpression.text,
+                [
+                    {"eventID": eventID, "expression": expression}
+                    for expression in entries
+                ],
+            )
+            txn.executemany(
+                self.query.addEventAccess.text,
+                [
                     {
                         "eventID": eventID,
                         "expression": entry.expression,
                         "mode": mode,
                         "validity": self.asAccessValidityValue(entry.validity),
-                    },
-                )
+                    }
+                    for entry in entries.values()
+                ],
+            )
 
         try:
             await self.runInteraction(setEventAccess)
@@ -517,11 +729,13 @@ class DatabaseStore(IMSDataStore):
         incidentTypes = tuple(incidentTypes)
 
         def hideShowIncidentTypes(txn: Transaction) -> None:
-            for incidentType in incidentTypes:
-                txn.execute(
-                    self.query.hideShowIncidentType.text,
-                    {"incidentType": incidentType, "hidden": hidden},
-                )
+            txn.executemany(
+                self.query.hideShowIncidentType.text,
+                [
+                    {"incidentType": incidentType, "hidden": hidden}
+                    for incidentType in incidentTypes
+                ],
+            )
 
         try:
             await self.runInteraction(hideShowIncidentTypes)
@@ -568,6 +782,24 @@ class DatabaseStore(IMSDataStore):
             }
         )
 
+    async def concentricStreetsByEvent(self) -> Mapping[str, Mapping[str, str]]:
+        """
+        See :meth:`IMSDataStore.concentricStreetsByEvent`.
+        """
+        streets: dict[str, dict[str, str]] = {}
+
+        for row in await self.runQuery(self.query.concentricStreetsByEvent):
+            eventStreets = streets.setdefault(cast("str", row["EVENT_NAME"]), {})
+            if row["ID"] is not None:
+                eventStreets[cast("str", row["ID"])] = cast("str", row["NAME"])
+
+        return MappingProxyType(
+            {
+                eventID: MappingProxyType(eventStreets)
+                for eventID, eventStreets in streets.items()
+            }
+        )
+
     async def createConcentricStreet(self, eventID: str, id: str, name: str) -> None:
         """
         See :meth:`IMSDataStore.createConcentricStreet`.
@@ -584,6 +816,50 @@ class DatabaseStore(IMSDataStore):
             concentricStreetName=name,
         )
 
+    async def createConcentricStreets(
+        self, eventID: str, streets: Mapping[str, str]
+    ) -> None:
+        """
+        See :meth:`IMSDataStore.createConcentricStreets`.
+        """
+
+        def createConcentricStreets(txn: Transaction) -> Mapping[str, str]:
+            txn.execute(self.query.concentricStreets.text, {"eventID": eventID})
+            existing = frozenset(cast("str", row["ID"]) for row in txn.fetchall())
+
+            created = {
+                streetID: streetName
+                for streetID, streetName in streets.items()
+                if streetID not in existing
+            }
+            txn.executemany(
+                self.query.createConcentricStreet.text,
+                [
+                    {"eventID": eventID, "streetID": streetID, "streetName": streetName}
+                    for streetID, streetName in created.items()
+                ],
+            )
+
+            return created
+
+        try:
+            created = await self.runInteraction(createConcentricStreets)
+        except StorageError as e:
+            self._log.critical(
+                "Unable to create concentric streets in {eventID}: {error}",
+                eventID=eventID,
+                error=e,
+            )
+            raise
+
+        self._log.info(
+            "Created {count} concentric streets in {eventID}: {streetNames}",
+            storeWriteClass=Event,
+            eventID=eventID,
+            count=len(created),
+            streetNames=tuple(created.values()),
+        )
+
     ##
     # Report Entries
     ##
@@ -625,32 +901,72 @@ class DatabaseStore(IMSDataStore):
     ###
 
     def _fetchIncidents(
-        self, txn: Transaction, eventID: str, *, excludeSystemEntries: bool = False
+        self,
+        txn: Transaction,
+        eventID: str,
+        *,
+        excludeSystemEntries: bool = False,
+        excludeReportEntries: bool = False,
+        numbers: Iterable[int] | None = None,
     ) -> Iterable[Incident]:
-        parameters: Parameters = {
+        parameters: dict[str, ParameterValue] = {
             "eventID": eventID,
             # generated value less than or equal to
             "generatedLTE": 0 if excludeSystemEntries else 1,
         }
 
+        if numbers is None:
+            incidentsQuery = self.query.incidents
+            reportEntriesQuery = self.query.incidents_reportEntries
+            lastModifiedQuery = self.query.incidents_lastModified
+        else:
+            # Each number is a separate parameter, so that the database can
+            # look up each of the incidents by index
+            numberList = [int(number) for number in numbers]
+            incidentsQuery, reportEntriesQuery, lastModifiedQuery = (
+                self.expandParameterList(query, "numbers", numberList, parameters)
+                for query in (
+                    self.query.incidentsWithNumbers,
+                    self.query.incidentsWithNumbers_reportEntries,
+                    self.query.incidentsWithNumbers_lastModified,
+                )
+            )
+
         reportEntries = defaultdict[int, list[ReportEntry]](list)
-        txn.execute(self.query.incidents_reportEntries.text, parameters)
-        for row in txn.fetchall():
-            if row["TEXT"]:
-                incidentNumber = cast("int", row["INCIDENT_NUMBER"])
-                reportEntries[incidentNumber].append(
-                    ReportEntry(
-                        id=cast("int", row["ID"]),
-                        created=self.fromDateTimeValue(row["CREATED"]),
-                        author=cast("str", row["AUTHOR"]),
-                        automatic=bool(row["GENERATED"]),
-                        text=cast("str", row["TEXT"]),
-                        stricken=bool(row["STRICKEN"]),
-                        attachedFile=cast("str", row["ATTACHED_FILE"]),
+        # incident number -> most recent report entry creation time
+        entriesLastModified: dict[int, DateTime] = {}
+
+        if excludeReportEntries:
+            # Fetch only the entry timestamps, not the entries themselves
+            txn.execute(lastModifiedQuery.text, parameters)
+            for row in txn.fetchall():
+                if row["LAST_MODIFIED"] is not None:
+                    incidentNumber = cast("int", row["INCIDENT_NUMBER"])
+                    entriesLastModified[incidentNumber] = self.fromDateTimeValue(
+                        row["LAST_MODIFIED"]
+                    )
+        else:
+            txn.execute(reportEntriesQuery.text, parameters)
+            for row in txn.fetchall():
+                if row["TEXT"]:
+                    incidentNumber = cast("int", row["INCIDENT_NUMBER"])
+                    reportEntries[incidentNumber].append(
+                        ReportEntry(
+                            id=cast("int", row["ID"]),
+                            created=self.fromDateTimeValue(row["CREATED"]),
+                            author=cast("str", row["AUTHOR"]),
+                            automatic=bool(row["GENERATED"]),
+                            text=cast("str", row["TEXT"]),
+                            stricken=bool(row["STRICKEN"]),
+                            attachedFile=cast("str", row["ATTACHED_FILE"]),
+                        )
                     )
+            for incidentNumber, entries in reportEntries.items():
+                entriesLastModified[incidentNumber] = max(
+                    entry.created for entry in entries
                 )
 
-        txn.execute(self.query.incidents.text, parameters)
+        txn.execute(incidentsQuery.text, parameters)
         results = []
         for row in txn.fetchall():
             # FIXME: This is because schema thinks concentric is an int
@@ -672,9 +988,9 @@ class DatabaseStore(IMSDataStore):
                 ]
             incidentNumber = cast("int", row["NUMBER"])
 
-            lastModified = self.fromDateTimeValue(row["CREATED"])
-            if reportEntries[incidentNumber]:
-                lastModified = max(re.created for re in reportEntries[incidentNumber])
+            lastModified = entriesLastModified.get(
+                incidentNumber, self.fromDateTimeValue(row["CREATED"])
+            )
 
             results.append(
                 Incident(
@@ -792,7 +1108,12 @@ class DatabaseStore(IMSDataStore):
         return (cast("int", row["NUMBER"]) for row in txn.fetchall())
 
     async def incidents(
-        self, eventID: str, *, excludeSystemEntries: bool = False
+        self,
+        eventID: str,
+        *,
+        excludeSystemEntries: bool = False,
+        excludeReportEntries: bool = False,
+        numbers: Iterable[int] | None = None,
     ) -> Iterable[Incident]:
         """
         See :meth:`IMSDataStore.incidents`.
@@ -800,11 +1121,15 @@ class DatabaseStore(IMSDataStore):
 
         def incidents(txn: Transaction) -> Iterable[Incident]:
             return self._fetchIncidents(
-                txn, eventID, excludeSystemEntries=excludeSystemEntries
+                txn,
+                eventID,
+                excludeSystemEntries=excludeSystemEntries,
+                excludeReportEntries=excludeReportEntries,
+                numbers=numbers,
             )
 
         try:
-            return await self.runInteraction(incidents)
+            return await self.runReadInteraction(incidents)
         except NoSuchIncidentError:
             raise
         except StorageError as e:
@@ -815,6 +1140,24 @@ class DatabaseStore(IMSDataStore):
             )
             raise
 
+    async def incidentNumbers(self, eventID: str) -> Iterable[int]:
+        """
+        See :meth:`IMSDataStore.incidentNumbers`.
+        """
+
+        def incidentNumbers(txn: Transaction) -> Iterable[int]:
+            return tuple(self._fetchIncidentNumbers(txn, eventID))
+
+        try:
+            return await self.runInteraction(incidentNumbers)
+        except StorageError as e:
+            self._log.critical(
+                "Unable to look up incident numbers in {eventID}: {error}",
+                eventID=eventID,
+                error=e,
+            )
+            raise
+
     async def incidentWithNumber(self, eventID: str, number: int) -> Incident:
         """
         See :meth:`IMSDataStore.incidentWithNumber`.
@@ -834,17 +1177,93 @@ class DatabaseStore(IMSDataStore):
             )
             raise
 
-    def _nextIncidentNumber(self, eventID: str, txn: Transaction) -> int:
+    async def incidentAttachedFile(
+        self, eventID: str, incidentNumber: int, reportEntryID: int
+    ) -> str | None:
         """
-        Look up the next available incident number.
+        See :meth:`IMSDataStore.incidentAttachedFile`.
         """
-        txn.execute(self.query.maxIncidentNumber.text, {"eventID": eventID})
-        row = txn.fetchone()
-        assert row is not None
-        number = cast("int | None", row["max(NUMBER)"])
-        if number is None:
-            return 1
-        return number + 1
+        try:
+            rows = await self.runQuery(
+                self.query.incident_reportEntryAttachedFile,
+                {
+                    "eventID": eventID,
+                    "incidentNumber": incidentNumber,
+                    "reportEntryID": reportEntryID,
+                },
+            )
+        except OverflowError:
+            # Too large to be the number or ID of anything in the store
+            return None
+
+        for row in rows:
+            return cast("str | None", row["ATTACHED_FILE"]) or None
+
+        return None
+
+    async def incidentAttachments(
+        self, eventID: str, incidentNumber: int
+    ) -> Iterable[ReportEntry]:
+        """
+        See :meth:`IMSDataStore.incidentAttachments`.
+        """
+        try:
+            rows = await self.runQuery(
+                self.query.incident_attachments,
+                {"eventID": eventID, "incidentNumber": incidentNumber},
+            )
+        except OverflowError:
+            return ()
+
+        return tuple(
+            ReportEntry(
+                id=cast("int", row["ID"]),
+                created=self.fromDateTimeValue(row["CREATED"]),
+                author=cast("str", row["AUTHOR"]),
+                automatic=bool(row["GENERATED"]),
+                text=cast("str", row["TEXT"]),
+                stricken=bool(row["STRICKEN"]),
+                attachedFile=cast("str", row["ATTACHED_FILE"]),
+            )
+            for row in rows
+        )
+
+    async def _allocateNumber(
+        self, eventID: str, nextNumber: Query, lastNumber: Query, column: str
+    ) -> int:
+        """
+        Allocate the next number from the given event's counter.
+
+        The counter is incremented in a transaction of its own, so that
+        concurrent writers only contend for the counter's row briefly, rather
+        than for the duration of the transaction which uses the number, and
+        two writers are never given the same number.
+        A number allocated for an object which then fails to be created is not
+        reused.
+        Objects imported with a given number advance the counter past that
+        number, so the counter never falls behind the largest number in use.
+        """
+
+        def allocate(txn: Transaction) -> int:
+            txn.execute(nextNumber.text, {"eventID": eventID})
+            txn.execute(lastNumber.text, {"eventID": eventID})
+            row = txn.fetchone()
+            if row is None:
+                raise StorageError(f"No such event: {eventID}")
+            return cast("int", row[column])
+
+        return await self.runInteraction(allocate)
+
+    async def _allocateIncidentNumber(self, eventID: str) -> int:
+        """
+        Allocate the next incident number for the given event.
+        """
+        return await self._allocateNumber(
+            eventID,
+            self.query.nextIncidentNumber,
+            self.query.lastIncidentNumber,
+            "LAST_INCIDENT_NUMBER",
+        )
 
     def _attachRangerHandlesToIncident(
         self,
@@ -952,17 +1371,24 @@ class DatabaseStore(IMSDataStore):
             incidentTypes=incidentTypes,
         )
 
+    def _reportEntryParameters(self, reportEntry: ReportEntry) -> Parameters:
+        """
+        Parameters for the query that writes the row for the given report
+        entry.
+        """
+        return {
+            "created": self.asDateTimeValue(reportEntry.created),
+            "generated": reportEntry.automatic,
+            "author": reportEntry.author,
+            "text": reportEntry.text,
+            "stricken": reportEntry.stricken,
+            "attachedFile": reportEntry.attachedFile,
+        }
+
     def _createReportEntry(self, reportEntry: ReportEntry, txn: Transaction) -> None:
         txn.execute(
             self.query.createReportEntry.text,
-            {
-                "created": self.asDateTimeValue(reportEntry.created),
-                "generated": reportEntry.automatic,
-                "author": reportEntry.author,
-                "text": reportEntry.text,
-                "stricken": reportEntry.stricken,
-                "attachedFile": reportEntry.attachedFile,
-            },
+            self._reportEntryParameters(reportEntry),
         )
 
         self._log.info(
@@ -984,6 +1410,20 @@ class DatabaseStore(IMSDataStore):
             incidentNumber=incidentNumber,
         )
 
+    def _notifyIncidentsUpdate(
+        self,
+        eventID: str,
+        incidentNumbers: Iterable[int],
+    ) -> None:
+        # This will trigger the DataStoreEventSourceLogObserver, which sends
+        # a single event for all of the incidents
+        self._log.info(
+            "Firing incident update event for {eventID}#{incidentNumbers}",
+            storeWriteClass=Incident,
+            eventID=eventID,
+            incidentNumbers=tuple(incidentNumbers),
+        )
+
     def _notifyFieldReportUpdate(
         self,
         eventID: str,
@@ -1008,6 +1448,7 @@ class DatabaseStore(IMSDataStore):
 
         for reportEntry in reportEntries:
             self._createReportEntry(reportEntry, txn)
+            reportEntryID = txn.lastrowid
 
             # Join to incident
             txn.execute(
@@ -1015,10 +1456,22 @@ class DatabaseStore(IMSDataStore):
                 {
                     "eventID": eventID,
                     "incidentNumber": incidentNumber,
-                    "reportEntryID": txn.lastrowid,
+                    "reportEntryID": reportEntryID,
                 },
             )
 
+            # Automatic entries are not searchable
+            if not reportEntry.automatic:
+                txn.execute(
+                    self.query.indexReportEntrySearchText.text,
+                    {
+                        "eventID": eventID,
+                        "incidentNumber": incidentNumber,
+                        "reportEntryID": reportEntryID,
+                        "text": reportEntry.text,
+                    },
+                )
+
         self._log.info(
             "Attached report entries to incident {eventID}#{incidentNumber}: "
             "{reportEntries}",
@@ -1027,6 +1480,17 @@ class DatabaseStore(IMSDataStore):
             reportEntries=reportEntries,
         )
 
+    def _indexIncidentSearchText(
+        self, eventID: str, incidentNumber: int, txn: Transaction
+    ) -> None:
+        """
+        Update the full-text search index with the summary and location of
+        the given incident.
+        """
+        parameters: Parameters = {"eventID": eventID, "incidentNumber": incidentNumber}
+        txn.execute(self.query.clearIncidentSearchText.text, parameters)
+        txn.execute(self.query.indexIncidentSearchText.text, parameters)
+
     def _automaticReportEntry(
         self, author: str, created: DateTime, attribute: str, value: Any
     ) -> ReportEntry:
@@ -1086,6 +1550,41 @@ class DatabaseStore(IMSDataStore):
 
         return tuple(reportEntries)
 
+    def _incidentParameters(self, incident: Incident) -> Parameters:
+        """
+        Parameters for the query that writes the row for the given incident.
+        """
+        # Get normalized-to-Rod-Garett address fields
+        location = incident.location
+        address = location.address
+
+        assert address is not None
+
+        locationDescription = address.description
+
+        if isinstance(address, RodGarettAddress):
+            locationConcentric = address.concentric
+            locationRadialHour = address.radialHour
+            locationRadialMinute = address.radialMinute
+        else:
+            locationConcentric = None
+            locationRadialHour = None
+            locationRadialMinute = None
+
+        return {
+            "eventID": incident.eventID,
+            "incidentNumber": incident.number,
+            "incidentCreated": self.asDateTimeValue(incident.created),
+            "incidentPriority": self.asPriorityValue(incident.priority),
+            "incidentState": self.asIncidentStateValue(incident.state),
+            "incidentSummary": incident.summary,
+            "locationName": location.name,
+            "locationConcentric": locationConcentric,
+            "locationRadialHour": locationRadialHour,
+            "locationRadialMinute": locationRadialMinute,
+            "locationDescription": locationDescription,
+        }
+
     async def _createIncident(
         self,
         incident: Incident,
@@ -1113,47 +1612,21 @@ class DatabaseStore(IMSDataStore):
                 reportEntries=(reportEntries + tuple(incident.reportEntries))
             )
 
-        # Get normalized-to-Rod-Garett address fields
-        location = incident.location
-        address = location.address
-
-        assert address is not None
-
-        locationDescription = address.description
-
-        if isinstance(address, RodGarettAddress):
-            locationConcentric = address.concentric
-            locationRadialHour = address.radialHour
-            locationRadialMinute = address.radialMinute
-        else:
-            locationConcentric = None
-            locationRadialHour = None
-            locationRadialMinute = None
-
-        def createIncident(txn: Transaction, incident: Incident = incident) -> Incident:
-            if not directImport:
-                # Assign the incident number a number
-                number = self._nextIncidentNumber(incident.eventID, txn)
-                incident = incident.replace(number=number)
-
+        def createIncident(txn: Transaction, incident: Incident) -> Incident:
             # Write incident row
             txn.execute(
-                self.query.createIncident.text,
-                {
-                    "eventID": incident.eventID,
-                    "incidentNumber": incident.number,
-                    "incidentCreated": self.asDateTimeValue(incident.created),
-                    "incidentPriority": self.asPriorityValue(incident.priority),
-                    "incidentState": self.asIncidentStateValue(incident.state),
-                    "incidentSummary": incident.summary,
-                    "locationName": location.name,
-                    "locationConcentric": locationConcentric,
-                    "locationRadialHour": locationRadialHour,
-                    "locationRadialMinute": locationRadialMinute,
-                    "locationDescription": locationDescription,
-                },
+                self.query.createIncident.text, self._incidentParameters(incident)
             )
 
+            self._indexIncidentSearchText(incident.eventID, incident.number, txn)
+
+            if directImport:
+                # Skip the imported number when allocating numbers
+                txn.execute(
+                    self.query.bumpIncidentNumber.text,
+                    {"eventID": incident.eventID, "incidentNumber": incident.number},
+                )
+
             # Join with Ranger handles
             self._attachRangerHandlesToIncident(
                 incident.eventID,
@@ -1181,7 +1654,12 @@ class DatabaseStore(IMSDataStore):
             return incident
 
         try:
-            incident = await self.runInteraction(createIncident)
+            if not directImport:
+                # Assign the incident a number
+                number = await self._allocateIncidentNumber(incident.eventID)
+                incident = incident.replace(number=number)
+
+            incident = await self.runInteraction(createIncident, incident=incident)
         except StorageError as e:
             self._log.critical(
                 "Unable to create incident {incident}: {error}",
@@ -1212,6 +1690,194 @@ class DatabaseStore(IMSDataStore):
         """
         await self._createIncident(incident, author=None, directImport=True)
 
+    async def importIncidents(self, incidents: Iterable[Incident]) -> None:
+        """
+        See :meth:`IMSDataStore.importIncidents`.
+        """
+        incidents = tuple(incidents)
+
+        for incident in incidents:
+            if incident.number <= 0:
+                raise ValueError("Incident number must be greater than zero.")
+
+        def importIncidents(txn: Transaction) -> None:
+            # Write incident rows
+            txn.executemany(
+                self.query.createIncident.text,
+                [self._incidentParameters(incident) for incident in incidents],
+            )
+            txn.executemany(
+                self.query.indexIncidentSearchText.text,
+                [
+                    {"eventID": incident.eventID, "incidentNumber": incident.number}
+                    for incident in incidents
+                ],
+            )
+
+            # Skip the imported numbers when allocating numbers
+            txn.executemany(
+                self.query.bumpIncidentNumber.text,
+                [
+                    {"eventID": incident.eventID, "incidentNumber": incident.number}
+                    for incident in incidents
+                ],
+            )
+
+            # Join with Ranger handles
+            txn.executemany(
+                self.query.attachRangerHandleToIncident.text,
+                [
+                    {
+                        "eventID": incident.eventID,
+                        "incidentNumber": incident.number,
+                        "rangerHandle": rangerHandle,
+                    }
+                    for incident in incidents
+                    for rangerHandle in incident.rangerHandles
+                ],
+            )
+
+            # Attach incident types
+            txn.executemany(
+                self.query.attachIncidentTypeToIncident.text,
+                [
+                    {
+                        "eventID": incident.eventID,
+                        "incidentNumber": incident.number,
+                        "incidentType": incidentType,
+                    }
+                    for incident in incidents
+                    for incidentType in incident.incidentTypes
+                ],
+            )
+
+            # Add report entries
+            attachments: list[Parameters] = []
+            searchTexts: list[Parameters] = []
+            for incident in incidents:
+                for reportEntry in incident.reportEntries:
+                    # Report entries are written one at a time, as we need
+                    # the ID assigned to each in order to join it.
+                    self._createReportEntry(reportEntry, txn)
+                    attachment: Parameters = {
+                        "eventID": incident.eventID,
+                        "incidentNumber": incident.number,
+                        "reportEntryID": txn.lastrowid,
+                    }
+                    attachments.append(attachment)
+
+                    # Automatic entries are not searchable
+                    if not reportEntry.automatic:
+                        searchTexts.append({**attachment, "text": reportEntry.text})
+
+            txn.executemany(self.query.attachReportEntryToIncident.text, attachments)
+            txn.executemany(self.query.indexReportEntrySearchText.text, searchTexts)
+
+        try:
+            await self.runInteraction(importIncidents)
+        except StorageError as e:
+            self._log.critical(
+                "Unable to import {count} incidents: {error}",
+                count=len(incidents),
+                error=e,
+            )
+            raise
+
+        self._log.info("Imported {count} incidents", count=len(incidents))
+
+        for incident in incidents:
+            self._notifyIncidentUpdate(incident.eventID, incident.number)
+
+    async def mergeIncident(self, incident: Incident) -> None:
+        """
+        See :meth:`IMSDataStore.mergeIncident`.
+        """
+        eventID = incident.eventID
+        incidentNumber = incident.number
+        incidentParameters = self._incidentParameters(incident)
+
+        def mergeIncident(txn: Transaction) -> None:
+            existing = self._fetchIncident(txn, eventID, incidentNumber)
+
+            # Update incident row
+            for query, key in (
+                (self.query.setIncident_priority, "incidentPriority"),
+                (self.query.setIncident_state, "incidentState"),
+                (self.query.setIncident_summary, "incidentSummary"),
+                (self.query.setIncident_locationName, "locationName"),
+                (
+                    self.query.setIncident_locationConcentricStreet,
+                    "locationConcentric",
+                ),
+                (self.query.setIncident_locationRadialHour, "locationRadialHour"),
+                (
+                    self.query.setIncident_locationRadialMinute,
+                    "locationRadialMinute",
+                ),
+                (
+                    self.query.setIncident_locationDescription,
+                    "locationDescription",
+                ),
+            ):
+                txn.execute(
+                    query.text,
+                    {
+                        "eventID": eventID,
+                        "incidentNumber": incidentNumber,
+                        "value": incidentParameters[key],
+                    },
+                )
+
+            self._indexIncidentSearchText(eventID, incidentNumber, txn)
+
+            # Replace Ranger handles and incident types
+            parameters: Parameters = {
+                "eventID": eventID,
+                "incidentNumber": incidentNumber,
+            }
+            txn.execute(self.query.clearIncidentRangers.text, parameters)
+            self._attachRangerHandlesToIncident(
+                eventID, incidentNumber, incident.rangerHandles, txn
+            )
+            txn.execute(self.query.clearIncidentIncidentTypes.text, parameters)
+            self._attachIncidentTypesToIncident(
+                eventID, incidentNumber, incident.incidentTypes, txn
+            )
+
+            # Add new report entries and update stricken values
+            newEntries, strickenChanges = mergeReportEntries(
+                existing.reportEntries, incident.reportEntries
+            )
+            self._createAndAttachReportEntriesToIncident(
+                eventID, incidentNumber, newEntries, txn
+            )
+            for reportEntryID, stricken in strickenChanges:
+                txn.execute(
+                    self.query.setIncidentReportEntry_stricken.text,
+                    {
+                        "eventID": eventID,
+                        "incidentNumber": incidentNumber,
+                        "reportEntryID": reportEntryID,
+                        "stricken": stricken,
+                    },
+                )
+
+        try:
+            await self.runInteraction(mergeIncident)
+        except NoSuchIncidentError:
+            raise
+        except StorageError as e:
+            self._log.critical(
+                "Unable to merge incident {incident}: {error}",
+                incident=incident,
+                error=e,
+            )
+            raise
+
+        self._log.info("Merged incident {incident}", incident=incident)
+
+        self._notifyIncidentUpdate(eventID, incidentNumber)
+
     async def _setIncidentAttribute(
         self,
         query: str,
@@ -1220,6 +1886,8 @@ class DatabaseStore(IMSDataStore):
         attribute: str,
         value: ParameterValue,
         author: str,
+        *,
+        searchable: bool = True,
     ) -> None:
         autoEntry = self._automaticReportEntry(author, now(), attribute, value)
 
@@ -1233,6 +1901,9 @@ class DatabaseStore(IMSDataStore):
                 },
             )
 
+            if searchable:
+                self._indexIncidentSearchText(eventID, incidentNumber, txn)
+
             # Add automatic report entry
             self._createAndAttachReportEntriesToIncident(
                 eventID,
@@ -1286,6 +1957,7 @@ class DatabaseStore(IMSDataStore):
             "priority",
             self.asPriorityValue(priority),
             author,
+            searchable=False,
         )
 
     async def setIncident_state(
@@ -1305,6 +1977,7 @@ class DatabaseStore(IMSDataStore):
             "state",
             self.asIncidentStateValue(state),
             author,
+            searchable=False,
         )
 
     async def setIncident_summary(
@@ -1574,6 +2247,127 @@ class DatabaseStore(IMSDataStore):
 
         self._notifyIncidentUpdate(eventID, incidentNumber)
 
+    async def editIncidents(
+        self,
+        eventID: str,
+        incidentNumbers: Iterable[int],
+        author: str,
+        *,
+        priority: IncidentPriority | None = None,
+        state: IncidentState | None = None,
+        reportEntries: Iterable[ReportEntry] = (),
+    ) -> None:
+        """
+        See :meth:`IMSDataStore.editIncidents`.
+        """
+        incidentNumbers = tuple(sorted(frozenset(incidentNumbers)))
+        reportEntries = tuple(reportEntries)
+
+        for reportEntry in reportEntries:
+            if reportEntry.automatic:
+                raise ValueError(
+                    f"Automatic report entry {reportEntry} may not be created "
+                    f"by user {author}"
+                )
+
+            if reportEntry.author != author:
+                raise ValueError(f"Report entry {reportEntry} has author != {author}")
+
+        updates: list[tuple[Query, str, ParameterValue]] = []
+        if priority is not None:
+            updates.append(
+                (
+                    self.query.setIncident_priority,
+                    "priority",
+                    self.asPriorityValue(priority),
+                )
+            )
+        if state is not None:
+            updates.append(
+                (
+                    self.query.setIncident_state,
+                    "state",
+                    self.asIncidentStateValue(state),
+                )
+            )
+
+        created = now()
+        entries = (
+            *(
+                self._automaticReportEntry(author, created, attribute, value)
+                for _, attribute, value in updates
+            ),
+            *reportEntries,
+        )
+
+        def editIncidents(txn: Transaction) -> None:
+            existing = frozenset(self._fetchIncidentNumbers(txn, eventID))
+            missing = [number for number in incidentNumbers if number not in existing]
+            if missing:
+                raise NoSuchIncidentError(f"No incidents {missing} in event {eventID}")
+
+            for query, _, value in updates:
+                txn.executemany(
+                    query.text,
+                    [
+                        {
+                            "eventID": eventID,
+                            "incidentNumber": incidentNumber,
+                            "value": value,
+                        }
+                        for incidentNumber in incidentNumbers
+                    ],
+                )
+
+            attachments: list[Parameters] = []
+            searchTexts: list[Parameters] = []
+            for incidentNumber in incidentNumbers:
+                for reportEntry in entries:
+                    # Report entries are written one at a time, as we need
+                    # the ID assigned to each in order to join it.
+                    self._createReportEntry(reportEntry, txn)
+                    attachment: Parameters = {
+                        "eventID": eventID,
+                        "incidentNumber": incidentNumber,
+                        "reportEntryID": txn.lastrowid,
+                    }
+                    attachments.append(attachment)
+
+                    # Automatic entries are not searchable
+                    if not reportEntry.automatic:
+                        searchTexts.append({**attachment, "text": reportEntry.text})
+
+            txn.executemany(self.query.attachReportEntryToIncident.text, attachments)
+            txn.executemany(self.query.indexReportEntrySearchText.text, searchTexts)
+
+        try:
+            await self.runInteraction(editIncidents)
+        except NoSuchIncidentError:
+            raise
+        except StorageError as e:
+            self._log.critical(
+                "Author {author} unable to update incidents "
+                "{eventID}#{incidentNumbers}: {error}",
+                eventID=eventID,
+                incidentNumbers=incidentNumbers,
+                author=author,
+                error=e,
+            )
+            raise
+
+        self._log.info(
+            "{author} updated incidents {eventID}#{incidentNumbers}: "
+            "{updates} {reportEntries}",
+            eventID=eventID,
+            incidentNumbers=incidentNumbers,
+            updates={attribute: value for _, attribute, value in updates},
+            reportEntries=reportEntries,
+            author=author,
+        )
+
+        if incidentNumbers:
+            self._notifyIncidentsUpdate(eventID, incidentNumbers)
+
     async def setIncidentReportEntry_stricken(
         self,
         eventID: str,
@@ -1629,38 +2423,126 @@ class DatabaseStore(IMSDataStore):
             raise
         self._notifyIncidentUpdate(eventID, incidentNumber)
 
+    async def searchIncidents(
+        self, eventID: str, text: str, *, limit: int = 100
+    ) -> Sequence[IncidentSearchResult]:
+        """
+        See :meth:`IMSDataStore.searchIncidents`.
+        """
+        terms = searchTerms(text)
+        if not terms:
+            return ()
+
+        # Each term is matched separately, one summary, location or report
+        # entry at a time; an incident is a result if all of the terms occur
+        # somewhere in its indexed text.
+        parameters: dict[str, ParameterValue] = {
+            "eventID": eventID,
+            "termCount": len(terms),
+            "limit": limit,
+        }
+        termQueries: list[str] = []
+        for index, term in enumerate(terms):
+            name = f"term{index}"
+            expression = self.asSearchExpression(term)
+            if expression is None:
+                unindexedTermQuery = self.query.searchIncidents_unindexedTerm
+                assert unindexedTermQuery is not None, term
+                termQuery = unindexedTermQuery
+                parameters[name] = term
+            else:
+                termQuery = self.query.searchIncidents_indexedTerm
+                parameters[name] = expression
+            termQueries.append(
+                termQuery.text.format(
+                    term=self.parameterPlaceholder(name), termIndex=index
+                )
+            )
+        query = Query(
+            self.query.searchIncidents.description,
+            self.query.searchIncidents.text.format(
+                termMatches="union all\n".join(termQueries)
+            ),
+        )
+
+        try:
+            rows = await self.runQuery(query, parameters)
+        except StorageError as e:
+            self._log.critical(
+                "Unable to search incidents in {eventID} for {text!r}: {error}",
+                eventID=eventID,
+                text=text,
+                error=e,
+            )
+            raise
+
+        # Rows are ordered by incident rank, then by rank within the incident
+        ranks: dict[int, float] = {}
+        texts = defaultdict[int, list[str]](list)
+        for row in rows:
+            incidentNumber = cast("int", row["INCIDENT_NUMBER"])
+            ranks[incidentNumber] = float(cast("float", row["INCIDENT_RANK"]))
+            texts[incidentNumber].append(cast("str", row["TEXT"]))
+
+        return tuple(
+            IncidentSearchResult(
+                eventID=eventID,
+                number=incidentNumber,
+                rank=rank,
+                snippets=(
+                    searchSnippet(rowText, terms)
+                    for rowText in texts[incidentNumber][:3]
+                ),
+            )
+            for incidentNumber, rank in ranks.items()
+        )
+
     ###
     # Field Reports
     ###
 
     def _fetchFieldReports(
-        self, txn: Transaction, eventID: str, excludeSystemEntries: bool
+        self,
+        txn: Transaction,
+        eventID: str,
+        excludeSystemEntries: bool,
+        excludeReportEntries: bool = False,
+        author: str | None = None,
     ) -> Iterable[FieldReport]:
-        parameters: Parameters = {
+        parameters: dict[str, ParameterValue] = {
             "eventID": eventID,
             # generated value less than or equal to
             "generatedLTE": 0 if excludeSystemEntries else 1,
         }
 
-        txn.execute(self.query.fieldReports_reportEntries.text, parameters)
+        if author is None:
+            fieldReportsQuery = self.query.fieldReports
+            reportEntriesQuery = self.query.fieldReports_reportEntries
+        else:
+            parameters["author"] = author
+            fieldReportsQuery = self.query.fieldReportsByAuthor
+            reportEntriesQuery = self.query.fieldReportsByAuthor_reportEntries
 
         # field report number -> report entry
         reports = defaultdict[int, list[ReportEntry]](list)
-        for row in txn.fetchall():
-            fieldReportNumber = cast("int", row["FIELD_REPORT_NUMBER"])
-            reports[fieldReportNumber].append(
-                ReportEntry(
-                    id=cast("int", row["ID"]),
-                    created=self.fromDateTimeValue(row["CREATED"]),
-                    author=cast("str", row["AUTHOR"]),
-                    automatic=bool(row["GENERATED"]),
-                    text=cast("str", row["TEXT"]),
-                    stricken=bool(row["STRICKEN"]),
-                ),
-            )
+
+        if not excludeReportEntries:
+            txn.execute(reportEntriesQuery.text, parameters)
+            for row in txn.fetchall():
+                fieldReportNumber = cast("int", row["FIELD_REPORT_NUMBER"])
+                reports[fieldReportNumber].append(
+                    ReportEntry(
+                        id=cast("int", row["ID"]),
+                        created=self.fromDateTimeValue(row["CREATED"]),
+                        author=cast("str", row["AUTHOR"]),
+                        automatic=bool(row["GENERATED"]),
+                        text=cast("str", row["TEXT"]),
+                        stricken=bool(row["STRICKEN"]),
+                    ),
+                )
 
         results = list[FieldReport]()
-        txn.execute(self.query.fieldReports.text, parameters)
+        txn.execute(fieldReportsQuery.text, parameters)
         for row in txn.fetchall():
             fieldReportNumber = cast("int", row["NUMBER"])
             results.append(
@@ -1726,7 +2608,11 @@ class DatabaseStore(IMSDataStore):
         return (cast("int", row["NUMBER"]) for row in txn.fetchall())
 
     async def fieldReports(
-        self, eventID: str, excludeSystemEntries: bool = False
+        self,
+        eventID: str,
+        excludeSystemEntries: bool = False,
+        excludeReportEntries: bool = False,
+        author: str | None = None,
     ) -> Iterable[FieldReport]:
         """
         See :meth:`IMSDataStore.fieldReports`.
@@ -1734,11 +2620,15 @@ class DatabaseStore(IMSDataStore):
 
         def fieldReports(txn: Transaction) -> Iterable[FieldReport]:
             return self._fetchFieldReports(
-                txn, eventID, excludeSystemEntries=excludeSystemEntries
+                txn,
+                eventID,
+                excludeSystemEntries=excludeSystemEntries,
+                excludeReportEntries=excludeReportEntries,
+                author=author,
             )
 
         try:
-            return await self.runInteraction(fieldReports)
+            return await self.runReadInteraction(fieldReports)
         except NoSuchFieldReportError:
             raise
         except StorageError as e:
@@ -1748,6 +2638,24 @@ class DatabaseStore(IMSDataStore):
             )
             raise
 
+    async def fieldReportNumbers(self, eventID: str) -> Iterable[int]:
+        """
+        See :meth:`IMSDataStore.fieldReportNumbers`.
+        """
+
+        def fieldReportNumbers(txn: Transaction) -> Iterable[int]:
+            return tuple(self._fetchFieldReportNumbers(txn, eventID))
+
+        try:
+            return await self.runInteraction(fieldReportNumbers)
+        except StorageError as e:
+            self._log.critical(
+                "Unable to look up field report numbers in {eventID}: {error}",
+                eventID=eventID,
+                error=e,
+            )
+            raise
+
     async def fieldReportWithNumber(self, eventID: str, number: int) -> FieldReport:
         """
         See :meth:`IMSDataStore.fieldReportWithNumber`.
@@ -1766,17 +2674,33 @@ class DatabaseStore(IMSDataStore):
             )
             raise
 
-    def _nextFieldReportNumber(self, eventID: str, txn: Transaction) -> int:
+    async def fieldReportHasAuthor(
+        self, eventID: str, number: int, author: str
+    ) -> bool:
         """
-        Look up the next available field report number.
+        See :meth:`IMSDataStore.fieldReportHasAuthor`.
         """
-        txn.execute(self.query.maxFieldReportNumber.text, {"eventID": eventID})
-        row = txn.fetchone()
-        assert row is not None
-        number = cast("int | None", row["max(NUMBER)"])
-        if number is None:
-            return 1
-        return number + 1
+        try:
+            rows = await self.runQuery(
+                self.query.fieldReportHasAuthor,
+                {"eventID": eventID, "fieldReportNumber": number, "author": author},
+            )
+        except OverflowError:
+            # Too large to be the number of anything in the store
+            return False
+
+        return any(True for _ in rows)
+
+    async def _allocateFieldReportNumber(self, eventID: str) -> int:
+        """
+        Allocate the next field report number for the given event.
+        """
+        return await self._allocateNumber(
+            eventID,
+            self.query.nextFieldReportNumber,
+            self.query.lastFieldReportNumber,
+            "LAST_FIELD_REPORT_NUMBER",
+        )
 
     def _createAndAttachReportEntriesToFieldReport(
         self,
@@ -1835,14 +2759,9 @@ class DatabaseStore(IMSDataStore):
             )
 
         def createFieldReport(
-            txn: Transaction, fieldReport: FieldReport = fieldReport
+            txn: Transaction, fieldReport: FieldReport
         ) -> FieldReport:
-            if not directImport:
-                # Assign the incident number a number
-                number = self._nextFieldReportNumber(fieldReport.eventID, txn)
-                fieldReport = fieldReport.replace(number=number)
-
-            # Write incident row
+            # Write field report row
             created = self.asDateTimeValue(fieldReport.created)
             txn.execute(
                 self.query.createFieldReport.text,
@@ -1855,6 +2774,16 @@ class DatabaseStore(IMSDataStore):
                 },
             )
 
+            if directImport:
+                # Skip the imported number when allocating numbers
+                txn.execute(
+                    self.query.bumpFieldReportNumber.text,
+                    {
+                        "eventID": fieldReport.eventID,
+                        "fieldReportNumber": fieldReport.number,
+                    },
+                )
+
             # Add report entries
             self._createAndAttachReportEntriesToFieldReport(
                 fieldReport.eventID,
@@ -1866,7 +2795,14 @@ class DatabaseStore(IMSDataStore):
             return fieldReport
 
         try:
-            fieldReport = await self.runInteraction(createFieldReport)
+            if not directImport:
+                # Assign the field report a number
+                number = await self._allocateFieldReportNumber(fieldReport.eventID)
+                fieldReport = fieldReport.replace(number=number)
+
+            fieldReport = await self.runInteraction(
+                createFieldReport, fieldReport=fieldReport
+            )
         except StorageError as e:
             self._log.critical(
                 "Unable to create field report {fieldReport}: {error}",
@@ -1903,6 +2839,138 @@ class DatabaseStore(IMSDataStore):
         """
         await self._createFieldReport(fieldReport, author=None, directImport=True)
 
+    async def importFieldReports(self, fieldReports: Iterable[FieldReport]) -> None:
+        """
+        See :meth:`IMSDataStore.importFieldReports`.
+        """
+        fieldReports = tuple(fieldReports)
+
+        for fieldReport in fieldReports:
+            if fieldReport.number <= 0:
+                raise ValueError("Field report number must be greater than zero.")
+
+        def importFieldReports(txn: Transaction) -> None:
+            # Write field report rows
+            txn.executemany(
+                self.query.createFieldReport.text,
+                [
+                    {
+                        "eventID": fieldReport.eventID,
+                        "fieldReportNumber": fieldReport.number,
+                        "fieldReportCreated": self.asDateTimeValue(fieldReport.created),
+                        "fieldReportSummary": fieldReport.summary,
+                        "incidentNumber": fieldReport.incidentNumber,
+                    }
+                    for fieldReport in fieldReports
+                ],
+            )
+
+            # Skip the imported numbers when allocating numbers
+            txn.executemany(
+                self.query.bumpFieldReportNumber.text,
+                [
+                    {
+                        "eventID": fieldReport.eventID,
+                        "fieldReportNumber": fieldReport.number,
+                    }
+                    for fieldReport in fieldReports
+                ],
+            )
+
+            # Add report entries
+            attachments: list[Parameters] = []
+            for fieldReport in fieldReports:
+                for reportEntry in fieldReport.reportEntries:
+                    # Report entries are written one at a time, as we need
+                    # the ID assigned to each in order to join it.
+                    self._createReportEntry(reportEntry, txn)
+                    attachments.append(
+                        {
+                            "eventID": fieldReport.eventID,
+                            "fieldReportNumber": fieldReport.number,
+                            "reportEntryID": txn.lastrowid,
+                        }
+                    )
+
+            txn.executemany(self.query.attachReportEntryToFieldReport.text, attachments)
+
+        try:
+            await self.runInteraction(importFieldReports)
+        except StorageError as e:
+            self._log.critical(
+                "Unable to import {count} field reports: {error}",
+                count=len(fieldReports),
+                error=e,
+            )
+            raise
+
+        self._log.info("Imported {count} field reports", count=len(fieldReports))
+
+        for fieldReport in fieldReports:
+            self._notifyFieldReportUpdate(
+                eventID=fieldReport.eventID, fieldReportNumber=fieldReport.number
+            )
+
+    async def mergeFieldReport(self, fieldReport: FieldReport) -> None:
+        """
+        See :meth:`IMSDataStore.mergeFieldReport`.
+        """
+        eventID = fieldReport.eventID
+        fieldReportNumber = fieldReport.number
+
+        def mergeFieldReport(txn: Transaction) -> None:
+            existing = self._fetchFieldReport(txn, eventID, fieldReportNumber)
+
+            # Update field report row
+            for query, value in (
+                (self.query.setFieldReport_summary, fieldReport.summary),
+                (self.query.attachFieldReportToIncident, fieldReport.incidentNumber),
+            ):
+                txn.execute(
+                    query.text,
+                    {
+                        "eventID": eventID,
+                        "fieldReportNumber": fieldReportNumber,
+                        "value": value,
+                    },
+                )
+
+            # Add new report entries and update stricken values
+            newEntries, strickenChanges = mergeReportEntries(
+                existing.reportEntries, fieldReport.reportEntries
+            )
+            self._createAndAttachReportEntriesToFieldReport(
+                eventID, fieldReportNumber, newEntries, txn
+            )
+            for reportEntryID, stricken in strickenChanges:
+                txn.execute(
+                    self.query.setFieldReportReportEntry_stricken.text,
+                    {
+                        "eventID": eventID,
+                        "fieldReportNumber": fieldReportNumber,
+                        "reportEntryID": reportEntryID,
+                        "stricken": stricken,
+                    },
+                )
+
+        try:
+            await self.runInteraction(mergeFieldReport)
+        except NoSuchFieldReportError:
+            raise
+        except StorageError as e:
+            self._log.critical(
+                "Unable to merge field report {fieldReport}: {error}",
+                fieldReport=fieldReport,
+                error=e,
+            )
+            raise
+
+        self._log.info("Merged field report {fieldReport}", fieldReport=fieldReport)
+
+        self._notifyFieldReportUpdate(
+            eventID=eventID, fieldReportNumber=fieldReportNumber
+        )
+
     async def _setFieldReportAttribute(
         self,
         query: str,
@@ -0,0 +1,119 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+"""
+Incident full-text search support.
+"""
+
+from collections.abc import Iterable, Sequence
+from html import escape
+from re import IGNORECASE
+from re import compile as regexCompile
+from re import escape as regexEscape
+from unicodedata import combining, normalize
+
+from attrs import field, frozen
+
+
+__all__ = ()
+
+
+_termPattern = regexCompile(r"\w+")
+
+
+def freezeSnippets(snippets: Iterable[str]) -> Sequence[str]:
+    return tuple(snippets)
+
+
+@frozen(kw_only=True)
+class IncidentSearchResult:
+    """
+    An incident matching a full-text search.
+    """
+
+    eventID: str
+    number: int
+
+    # Higher is a better match
+    rank: float
+
+    # HTML text fragments, with matching terms wrapped in <mark> elements
+    snippets: Sequence[str] = field(converter=freezeSnippets)
+
+
+def _fold(text: str) -> str:
+    """
+    Case-fold the given text and remove diacritics, as the search indexes do.
+    """
+    return "".join(c for c in normalize("NFKD", text.casefold()) if not combining(c))
+
+
+def searchTerms(text: str) -> Sequence[str]:
+    """
+    Split search text into distinct, folded terms.
+    Punctuation is discarded, so that user input can't be interpreted as
+    search engine syntax.
+    """
+    terms: list[str] = []
+    for term in _termPattern.findall(_fold(text)):
+        if term not in terms:
+            terms.append(term)
+    return tuple(terms)
+
+
+def searchSnippet(text: str, terms: Sequence[str], *, width: int = 120) -> str:
+    """
+    Extract a fragment of the given text around the first occurrence of any
+    of the given search terms, as HTML with matching terms highlighted.
+    Terms match as word prefixes, as they do in the search indexes.
+    """
+    if not terms:
+        return escape(text[:width])
+
+    pattern = regexCompile(
+        r"\b(?:" + "|".join(regexEscape(term) for term in terms) + r")\w*",
+        IGNORECASE,
+    )
+
+    match = pattern.search(text)
+    if match is None:
+        start = 0
+    else:
+        # Provide a little leading context
+        start = max(0, match.start() - width // 4)
+        if start > 0:
+            space = text.rfind(" ", 0, start)
+            start = space + 1 if space >= 0 else start
+    end = min(len(text), start + width)
+    if end < len(text):
+        space = text.rfind(" ", start, end)
+        end = space if space > start else end
+
+    fragment = text[start:end]
+
+    html: list[str] = []
+    if start > 0:
+        html.append("…")
+    last = 0
+    for termMatch in pattern.finditer(fragment):
+        html.append(escape(fragment[last : termMatch.start()]))
+        html.append(f"<mark>{escape(termMatch.group())}</mark>")
+        last = termMatch.end()
+    html.append(escape(fragment[last:]))
+    if end < len(text):
+        html.append("…")
+
+    return "".join(html)
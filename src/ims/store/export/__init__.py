@@ -18,10 +18,14 @@
 Incident Management System data store.
 """
 
-from ._json import JSONExporter, JSONImporter
+from ._compare import ExportDigest
+from ._json import ExportManifest, JSONExporter, JSONImporter, JSONStreamImporter
 
 
 __all__ = (
+    "ExportDigest",
+    "ExportManifest",
     "JSONExporter",
     "JSONImporter",
+    "JSONStreamImporter",
 )
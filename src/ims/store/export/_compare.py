@@ -0,0 +1,399 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+"""
+Incident Management System data store export comparison.
+"""
+
+from collections import Counter
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from datetime import UTC
+from datetime import datetime as DateTime
+from enum import Enum
+from hashlib import blake2b
+from typing import Any, BinaryIO, ClassVar
+
+from attrs import fields, frozen, has
+from twisted.logger import Logger
+
+from ims.ext.json_ext import JSONStreamReader
+from ims.model import Event, EventAccess, FieldReport, Incident, IncidentType
+from ims.model._cmp import ComparisonMixIn
+from ims.model.jsons import (
+    EventDataJSONKey,
+    IMSDataJSONKey,
+    modelObjectFromJSONObject,
+)
+
+
+__all__ = ()
+
+
+_digestSize = 16
+
+
+def _hash(tag: bytes, *parts: bytes) -> bytes:
+    """
+    Hash the given parts, which are distinguished from other kinds of values
+    by the given tag.
+    """
+    hasher = blake2b(tag, digest_size=_digestSize)
+    hasher.update(len(parts).to_bytes(8))
+    for part in parts:
+        hasher.update(len(part).to_bytes(8))
+        hasher.update(part)
+    return hasher.digest()
+
+
+def modelDigest(value: Any) -> bytes:
+    """
+    Compute a digest of a model object.
+
+    Two model objects which are equal have the same digest, regardless of
+    the iteration order of any sets or mappings that they contain.
+    """
+    if isinstance(value, ComparisonMixIn):
+        # Equality is defined by the comparison value, which may omit some
+        # attributes (eg. report entry IDs, which differ between stores).
+        return _hash(b"cmp", modelDigest(value._cmpValue()))
+
+    if has(type(value)):
+        return _hash(
+            type(value).__name__.encode("utf-8"),
+            *(
+                modelDigest(getattr(value, attribute.name))
+                for attribute in fields(type(value))
+                if attribute.eq
+            ),
+        )
+
+    if isinstance(value, Enum):
+        return _hash(b"enum", f"{type(value).__name__}.{value.name}".encode())
+
+    if isinstance(value, Mapping):
+        return _hash(
+            b"map",
+            *sorted(modelDigest(key) + modelDigest(v) for key, v in value.items()),
+        )
+
+    if isinstance(value, set | frozenset):
+        return _hash(b"set", *sorted(modelDigest(item) for item in value))
+
+    if isinstance(value, list | tuple):
+        return _hash(b"seq", *(modelDigest(item) for item in value))
+
+    if isinstance(value, DateTime):
+        if value.tzinfo is not None:
+            value = value.astimezone(UTC)
+        return _hash(b"datetime", value.isoformat().encode("utf-8"))
+
+    if value is None or isinstance(value, bool | int | float | str):
+        return _hash(type(value).__name__.encode("utf-8"), repr(value).encode())
+
+    raise TypeError(f"Unable to compute digest for {value!r}")
+
+
+def _splitDigests(digests: bytes) -> Sequence[bytes]:
+    """
+    Split concatenated digests.
+    """
+    return [
+        digests[start : start + _digestSize]
+        for start in range(0, len(digests), _digestSize)
+    ]
+
+
+@frozen(kw_only=True)
+class RecordDigest:
+    """
+    Digest of an incident or field report.
+
+    Digests of each attribute and of each report entry are retained (packed
+    into bytes, to keep memory use small), so that differing records can be
+    described in detail.
+    """
+
+    number: int
+    digest: bytes
+    attributeNames: Sequence[str]
+    attributeDigests: bytes
+    entryDigests: bytes
+
+    @classmethod
+    def fromRecord(cls, record: Incident | FieldReport) -> "RecordDigest":
+        """
+        Compute the digest of an incident or field report.
+        """
+        attributes = tuple(
+            attribute
+            for attribute in fields(type(record))
+            if attribute.eq and attribute.name != "reportEntries"
+        )
+        attributeDigests = b"".join(
+            modelDigest(getattr(record, attribute.name)) for attribute in attributes
+        )
+        entryDigests = b"".join(modelDigest(entry) for entry in record.reportEntries)
+
+        return cls(
+            number=record.number,
+            digest=_hash(b"record", attributeDigests, entryDigests),
+            attributeNames=tuple(attribute.name for attribute in attributes),
+            attributeDigests=attributeDigests,
+            entryDigests=entryDigests,
+        )
+
+    def differences(self, other: "RecordDigest") -> Iterator[str]:
+        """
+        Describe the differences between this record and another.
+        """
+        if self.digest == other.digest:
+            return
+
+        for name, digest, otherDigest in zip(
+            self.attributeNames,
+            _splitDigests(self.attributeDigests),
+            _splitDigests(other.attributeDigests),
+            strict=True,
+        ):
+            if digest != otherDigest:
+                yield f"{name} does not match"
+
+        if self.entryDigests != other.entryDigests:
+            entries = Counter(_splitDigests(self.entryDigests))
+            otherEntries = Counter(_splitDigests(other.entryDigests))
+            onlyHere = (entries - otherEntries).total()
+            onlyThere = (otherEntries - entries).total()
+            if onlyHere:
+                yield f"{onlyHere} report entries only in first export"
+            if onlyThere:
+                yield f"{onlyThere} report entries only in second export"
+
+
+def _recordsDigest(records: Mapping[int, RecordDigest]) -> bytes:
+    return _hash(
+        b"records",
+        *(
+            number.to_bytes(8, signed=True) + records[number].digest
+            for number in sorted(records)
+        ),
+    )
+
+
+def _recordDifferences(
+    description: str,
+    records: Mapping[int, RecordDigest],
+    otherRecords: Mapping[int, RecordDigest],
+) -> Iterator[str]:
+    for number in sorted(records.keys() | otherRecords.keys()):
+        record = records.get(number)
+        otherRecord = otherRecords.get(number)
+        if otherRecord is None:
+            yield f"{description} #{number} only in first export"
+        elif record is None:
+            yield f"{description} #{number} only in second export"
+        else:
+            for difference in record.differences(otherRecord):
+                yield f"{description} #{number}: {difference}"
+
+
+@frozen(kw_only=True)
+class EventDigest:
+    """
+    Digest of the data for an event.
+    """
+
+    event: Event
+    digest: bytes
+    accessDigest: bytes
+    concentricStreetsDigest: bytes
+    incidents: Mapping[int, RecordDigest]
+    fieldReports: Mapping[int, RecordDigest]
+
+    @classmethod
+    def fromRecords(
+        cls,
+        *,
+        event: Event,
+        accessDigest: bytes,
+        concentricStreetsDigest: bytes,
+        incidents: Mapping[int, RecordDigest],
+        fieldReports: Mapping[int, RecordDigest],
+    ) -> "EventDigest":
+        """
+        Compute the digest of an event from the digests of its parts.
+        """
+        return cls(
+            event=event,
+            digest=_hash(
+                b"event",
+                modelDigest(event),
+                accessDigest,
+                concentricStreetsDigest,
+                _recordsDigest(incidents),
+                _recordsDigest(fieldReports),
+            ),
+            accessDigest=accessDigest,
+            concentricStreetsDigest=concentricStreetsDigest,
+            incidents=incidents,
+            fieldReports=fieldReports,
+        )
+
+    def differences(self, other: "EventDigest") -> Iterator[str]:
+        """
+        Describe the differences between this event's data and another's.
+        """
+        if self.digest == other.digest:
+            return
+
+        if self.event != other.event:
+            yield f"event does not match: {self.event!r} != {other.event!r}"
+        if self.accessDigest != other.accessDigest:
+            yield "access does not match"
+        if self.concentricStreetsDigest != other.concentricStreetsDigest:
+            yield "concentric streets do not match"
+
+        yield from _recordDifferences("incident", self.incidents, other.incidents)
+        yield from _recordDifferences(
+            "field report", self.fieldReports, other.fieldReports
+        )
+
+
+@frozen(kw_only=True)
+class ExportDigest:
+    """
+    Digest of an export file, computed by reading the file incrementally.
+
+    Comparing the digests of two export files is equivalent to comparing the
+    data in them, but only differing events and records need to be examined,
+    and the data itself needn't be held in memory.
+    """
+
+    _log: ClassVar[Logger] = Logger()
+
+    digest: bytes
+    incidentTypes: frozenset[IncidentType]
+    events: Mapping[str, EventDigest]
+
+    @classmethod
+    def fromIO(cls, io: BinaryIO) -> "ExportDigest":
+        """
+        Compute the digest of an export file read from the given byte stream.
+        """
+        reader = JSONStreamReader(io)
+
+        incidentTypes: frozenset[IncidentType] = frozenset()
+        events: dict[str, EventDigest] = {}
+
+        for key in reader.objectKeys():
+            match key:
+                case IMSDataJSONKey.incidentTypes.value:
+                    incidentTypes = frozenset(
+                        modelObjectFromJSONObject(json, IncidentType)
+                        for json in reader.readValue()
+                    )
+                case IMSDataJSONKey.events.value:
+                    for _ in reader.arrayItems():
+                        eventDigest = cls._eventDigest(reader)
+                        events[eventDigest.event.id] = eventDigest
+                case _:
+                    cls._log.warn("Ignoring unknown key: {key}", key=key)
+                    reader.readValue()
+
+        reader.expectEnd()
+
+        return cls(
+            digest=_hash(
+                b"export",
+                modelDigest(incidentTypes),
+                *(events[eventID].digest for eventID in sorted(events)),
+            ),
+            incidentTypes=incidentTypes,
+            events=events,
+        )
+
+    @classmethod
+    def _eventDigest(cls, reader: JSONStreamReader) -> EventDigest:
+        event: Event | None = None
+        accessDigest = modelDigest(None)
+        concentricStreetsDigest = modelDigest({})
+        incidents: dict[int, RecordDigest] = {}
+        fieldReports: dict[int, RecordDigest] = {}
+
+        def recordDigests(
+            modelClass: type[Incident | FieldReport],
+        ) -> Iterable[RecordDigest]:
+            for json in reader.arrayValues():
+                yield RecordDigest.fromRecord(
+                    modelObjectFromJSONObject(json, modelClass)
+                )
+
+        for key in reader.objectKeys():
+            match key:
+                case EventDataJSONKey.event.value:
+                    event = modelObjectFromJSONObject(reader.readValue(), Event)
+                case EventDataJSONKey.access.value:
+                    accessDigest = modelDigest(
+                        modelObjectFromJSONObject(reader.readValue(), EventAccess)
+                    )
+                case EventDataJSONKey.concentricStreets.value:
+                    concentricStreetsDigest = modelDigest(reader.readValue())
+                case EventDataJSONKey.incidents.value:
+                    for digest in recordDigests(Incident):
+                        incidents[digest.number] = digest
+                case EventDataJSONKey.fieldReports.value:
+                    for digest in recordDigests(FieldReport):
+                        fieldReports[digest.number] = digest
+                case _:
+                    cls._log.warn("Ignoring unknown event data key: {key}", key=key)
+                    reader.readValue()
+
+        if event is None:
+            raise ValueError("Event data has no event")
+
+        return EventDigest.fromRecords(
+            event=event,
+            accessDigest=accessDigest,
+            concentricStreetsDigest=concentricStreetsDigest,
+            incidents=incidents,
+            fieldReports=fieldReports,
+        )
+
+    def differences(self, other: "ExportDigest") -> Iterator[str]:
+        """
+        Describe the differences between this export and another.
+        """
+        if self.digest == other.digest:
+            return
+
+        if self.incidentTypes != other.incidentTypes:
+            onlyHere = sorted(self.incidentTypes - other.incidentTypes)
+            onlyThere = sorted(other.incidentTypes - self.incidentTypes)
+            yield (
+                "Incident types do not match: "
+                f"{onlyHere} only in first export, "
+                f"{onlyThere} only in second export"
+            )
+
+        for eventID in sorted(self.events.keys() | other.events.keys()):
+            eventDigest = self.events.get(eventID)
+            otherEventDigest = other.events.get(eventID)
+            if otherEventDigest is None:
+                yield f"Event {eventID} only in first export"
+            elif eventDigest is None:
+                yield f"Event {eventID} only in second export"
+            else:
+                for difference in eventDigest.differences(otherEventDigest):
+                    yield f"Event {eventID}: {difference}"
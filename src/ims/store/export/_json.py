@@ -18,19 +18,43 @@
 Incident Management System data store export.
 """
 
-from collections.abc import Iterable, Mapping
+from collections.abc import (
+    Awaitable,
+    Callable,
+    Collection,
+    Iterable,
+    Mapping,
+    Sequence,
+)
+from datetime import datetime as DateTime
 from typing import Any, BinaryIO, ClassVar, cast
 
-from attrs import frozen
+from attrs import field, frozen, mutable
 from twisted.logger import Logger
 
 from ims.ext.json_ext import (
+    JSONStreamReader,
+    dateTimeAsRFC3339Text,
     jsonTextFromObject,
     objectFromJSONBytesIO,
     objectFromJSONText,
+    rfc3339TextAsDateTime,
+)
+from ims.model import (
+    Event,
+    EventAccess,
+    EventData,
+    FieldReport,
+    IMSData,
+    Incident,
+    IncidentType,
+)
+from ims.model.jsons import (
+    EventDataJSONKey,
+    IMSDataJSONKey,
+    jsonObjectFromModelObject,
+    modelObjectFromJSONObject,
 )
-from ims.model import Event, EventAccess, EventData, IMSData, IncidentType
-from ims.model.jsons import jsonObjectFromModelObject, modelObjectFromJSONObject
 
 from .._abc import IMSDataStore
 
@@ -38,15 +62,83 @@ from .._abc import IMSDataStore
 __all__ = ()
 
 
+@frozen(kw_only=True)
+class ExportManifest:
+    """
+    Description of an export, which can be used to select the data for a
+    subsequent incremental export.
+    """
+
+    # When the export started
+    exported: DateTime
+
+    # Events that were exported, or None for all events
+    eventIDs: Collection[str] | None = None
+
+    # Only data modified after this time was exported, or None for all data
+    modifiedAfter: DateTime | None = None
+
+    def asText(self) -> str:
+        """
+        Encode as JSON text.
+        """
+        return jsonTextFromObject(
+            {
+                "exported": dateTimeAsRFC3339Text(self.exported),
+                "event_ids": (None if self.eventIDs is None else sorted(self.eventIDs)),
+                "modified_after": (
+                    None
+                    if self.modifiedAfter is None
+                    else dateTimeAsRFC3339Text(self.modifiedAfter)
+                ),
+            },
+            pretty=True,
+        )
+
+    @classmethod
+    def fromText(cls, text: str) -> "ExportManifest":
+        """
+        Decode from JSON text.
+        """
+        json = objectFromJSONText(text)
+        eventIDs = json.get("event_ids")
+        modifiedAfter = json.get("modified_after")
+        return cls(
+            exported=rfc3339TextAsDateTime(json["exported"]),
+            eventIDs=None if eventIDs is None else frozenset(eventIDs),
+            modifiedAfter=(
+                None if modifiedAfter is None else rfc3339TextAsDateTime(modifiedAfter)
+            ),
+        )
+
+
 @frozen(kw_only=True)
 class JSONExporter:
     """
     Incident Management System data store JSON exporter.
+
+    If ``eventIDs`` is given, only those events are exported.
+    If ``modifiedAfter`` is given, only incidents and field reports which
+    were created or have report entries added after that time are exported.
+    Incident types, event access and concentric streets are always exported
+    in full.
     """
 
     _log: ClassVar[Logger] = Logger()
 
     store: IMSDataStore
+    eventIDs: Collection[str] | None = None
+    modifiedAfter: DateTime | None = None
+
+    def manifest(self, exported: DateTime) -> ExportManifest:
+        """
+        Describe an export started at the given time.
+        """
+        return ExportManifest(
+            exported=exported,
+            eventIDs=self.eventIDs,
+            modifiedAfter=self.modifiedAfter,
+        )
 
     async def asBytes(self) -> bytes:
         """
@@ -73,15 +165,123 @@ class JSONExporter:
             "Mapping[str, Any]", jsonObjectFromModelObject(await self.imsData())
         )
 
+    async def writeJSON(self, out: BinaryIO) -> None:
+        """
+        Export data store as JSON text to the given byte stream.
+
+        Unlike :meth:`asBytes`, data is written out one event at a time, and
+        one incident or field report at a time within each event, so that the
+        entire data store isn't held in memory at once.
+        """
+
+        def write(text: str) -> None:
+            out.write(text.encode("utf-8"))
+
+        def writeObject(modelObject: Any) -> None:
+            write(jsonTextFromObject(jsonObjectFromModelObject(modelObject)))
+
+        def writeKey(key: IMSDataJSONKey | EventDataJSONKey) -> None:
+            write(f"{jsonTextFromObject(key.value)}:")
+
+        def writeArray(modelObjects: Iterable[Any]) -> None:
+            write("[")
+            for index, modelObject in enumerate(modelObjects):
+                if index:
+                    write(",")
+                writeObject(modelObject)
+            write("]")
+
+        self._log.info("Exporting data store as JSON stream...")
+
+        # Incident types are written first, so that they can be stored before
+        # the incidents that refer to them when the stream is read back.
+        write("{")
+        writeKey(IMSDataJSONKey.incidentTypes)
+        writeArray(await self._incidentTypes())
+        write(",")
+        writeKey(IMSDataJSONKey.events)
+        write("[")
+        for index, event in enumerate(await self._events()):
+            self._log.info("Exporting event {event}...", event=event)
+
+            if index:
+                write(",")
+            write("{")
+            writeKey(EventDataJSONKey.event)
+            writeObject(event)
+            write(",")
+            writeKey(EventDataJSONKey.access)
+            writeObject(await self._eventAccess(event))
+            write(",")
+            writeKey(EventDataJSONKey.concentricStreets)
+            writeObject(await self.store.concentricStreets(event.id))
+            write(",")
+            writeKey(EventDataJSONKey.incidents)
+            writeArray(await self._incidents(event))
+            write(",")
+            writeKey(EventDataJSONKey.fieldReports)
+            writeArray(await self._fieldReports(event))
+            write("}")
+        write("]}")
+
     async def imsData(self) -> IMSData:
         """
         Export IMS Data.
         """
         return IMSData(
             incidentTypes=(await self._incidentTypes()),
-            events=[
-                await self._eventData(event) for event in await self.store.events()
-            ],
+            events=[await self._eventData(event) for event in await self._events()],
+        )
+
+    async def _events(self) -> Iterable[Event]:
+        """
+        Look up the events to export.
+        """
+        events = await self.store.events()
+
+        if self.eventIDs is None:
+            return events
+
+        return tuple(event for event in events if event.id in self.eventIDs)
+
+    async def _incidents(self, event: Event) -> Iterable[Incident]:
+        """
+        Look up the incidents to export for an event.
+        """
+        modifiedAfter = self.modifiedAfter
+
+        if modifiedAfter is None:
+            return await self.store.incidents(event.id)
+
+        # Look up incidents without their report entries to find those that
+        # have been modified, then look up each of those in full.
+        incidents = await self.store.incidents(event.id, excludeReportEntries=True)
+        return [
+            await self.store.incidentWithNumber(event.id, incident.number)
+            for incident in incidents
+            if incident.lastModified > modifiedAfter
+        ]
+
+    async def _fieldReports(self, event: Event) -> Iterable[FieldReport]:
+        """
+        Look up the field reports to export for an event.
+        """
+        fieldReports = await self.store.fieldReports(event.id)
+        modifiedAfter = self.modifiedAfter
+
+        if modifiedAfter is None:
+            return fieldReports
+
+        return tuple(
+            fieldReport
+            for fieldReport in fieldReports
+            if max(
+                (
+                    fieldReport.created,
+                    *(entry.created for entry in fieldReport.reportEntries),
+                )
+            )
+            > modifiedAfter
         )
 
     async def _incidentTypes(self) -> Iterable[IncidentType]:
@@ -91,26 +291,31 @@ class JSONExporter:
         allTypes = frozenset(await self.store.incidentTypes(includeHidden=True))
         visibleTypes = frozenset(await self.store.incidentTypes(includeHidden=False))
 
-        return (
+        return tuple(
             IncidentType(name=name, hidden=(name not in visibleTypes))
             for name in allTypes
         )
 
-    async def _eventData(self, event: Event) -> EventData:
+    async def _eventAccess(self, event: Event) -> EventAccess:
         """
-        Export an event.
+        Export access for an event.
         """
-        self._log.info("Exporting event {event}...", event=event)
-
-        eventAccess = EventAccess(
+        return EventAccess(
             readers=(await self.store.readers(event.id)),
             writers=(await self.store.writers(event.id)),
             reporters=(await self.store.reporters(event.id)),
         )
 
+    async def _eventData(self, event: Event) -> EventData:
+        """
+        Export an event.
+        """
+        self._log.info("Exporting event {event}...", event=event)
+
+        eventAccess = await self._eventAccess(event)
         concentricStreets = await self.store.concentricStreets(event.id)
-        incidents = await self.store.incidents(event.id)
-        fieldReports = await self.store.fieldReports(event.id)
+        incidents = await self._incidents(event)
+        fieldReports = await self._fieldReports(event)
 
         return EventData(
             event=event,
@@ -122,48 +327,25 @@ class JSONExporter:
 
 
 @frozen(kw_only=True)
-class JSONImporter:
+class _Importer:
     """
-    Incident Management System data store JSON importer.
+    Superclass for data store importers.
     """
 
     _log: ClassVar[Logger] = Logger()
 
-    store: IMSDataStore | None
-    imsData: IMSData
-
-    @classmethod
-    def fromIO(cls, store: IMSDataStore, io: BinaryIO) -> "JSONImporter":
-        cls._log.info("Reading from JSON I/O...")
-        return cls.fromJSON(store, objectFromJSONBytesIO(io))
-
-    @classmethod
-    def fromBytes(cls, store: IMSDataStore, jsonBytes: bytes) -> "JSONImporter":
-        cls._log.info("Reading from JSON bytes...")
-        return cls.fromText(store, jsonBytes.decode("utf-8"))
+    bulkBatchSize: ClassVar[int] = 1000
 
-    @classmethod
-    def fromText(cls, store: IMSDataStore, jsonText: str) -> "JSONImporter":
-        cls._log.info("Reading from JSON text...")
-        return cls.fromJSON(store, objectFromJSONText(jsonText))
-
-    @classmethod
-    def fromJSON(cls, store: IMSDataStore, json: Mapping[str, Any]) -> "JSONImporter":
-        """
-        Import JSON.
-        """
-        cls._log.info("Reading from JSON objects...")
-        imsData = modelObjectFromJSONObject(json, IMSData)
-        return cls(store=store, imsData=imsData)
+    store: IMSDataStore | None
 
-    async def _storeIncidentTypes(self) -> None:
+    async def _storeIncidentTypes(self, incidentTypes: Iterable[IncidentType]) -> None:
         store = self.store
 
         assert store is not None
 
         existingIncidentTypes = frozenset(await store.incidentTypes(includeHidden=True))
 
-        for incidentType in self.imsData.incidentTypes:
+        for incidentType in incidentTypes:
             if incidentType.name in existingIncidentTypes:
                 self._log.info(
                     "Not importing existing incident type: {incidentType}",
@@ -174,10 +356,21 @@ class JSONImporter:
                     incidentType.name, hidden=incidentType.hidden
                 )
 
-    async def _storeEventAccess(self, eventData: EventData) -> None:
+    async def _storeEvent(self, event: Event, existingEvents: frozenset[Event]) -> None:
+        store = self.store
+
+        assert store is not None
+
+        if event in existingEvents:
+            self._log.info(
+                "Not creating existing event: {event}",
+                event=event,
+            )
+        else:
+            await store.createEvent(event)
+
+    async def _storeEventAccess(self, event: Event, eventAccess: EventAccess) -> None:
         store = self.store
-        event = eventData.event
-        eventAccess = eventData.access
 
         assert store is not None
 
@@ -185,64 +378,196 @@ class JSONImporter:
         await store.setWriters(event.id, eventAccess.writers)
         await store.setReporters(event.id, eventAccess.reporters)
 
-    async def _storeConcentricStreets(self, eventData: EventData) -> None:
+    async def _storeConcentricStreets(
+        self, event: Event, concentricStreets: Mapping[str, str]
+    ) -> None:
         store = self.store
-        event = eventData.event
 
         assert store is not None
 
         existingStreetIDs = frozenset((await store.concentricStreets(event.id)).keys())
 
-        for streetID, streetName in eventData.concentricStreets.items():
+        for streetID, streetName in concentricStreets.items():
             if streetID in existingStreetIDs:
                 self._log.info(
                     "Not importing existing street {streetID} into event {event}",
-                    event=eventData.event,
+                    event=event,
                     streetID=streetID,
                 )
             else:
                 await store.createConcentricStreet(event.id, streetID, streetName)
 
-    async def _storeIncidents(self, eventData: EventData) -> None:
+    async def _prepareIncidents(self, incidents: Sequence[Incident]) -> None:
+        """
+        Called before the given incidents are stored.
+        """
+
+    async def _storeIncidents(
+        self,
+        event: Event,
+        incidents: Iterable[Incident],
+        *,
+        bulk: bool,
+        merge: bool,
+    ) -> None:
         store = self.store
 
         assert store is not None
 
-        existingIncidentNumbers = frozenset(
-            incident.number for incident in await store.incidents(eventData.event.id)
-        )
-
-        for incident in eventData.incidents:
-            if incident.number in existingIncidentNumbers:
-                self._log.info(
-                    "Not importing existing incident #{number} into event {event}",
-                    event=eventData.event,
-                    number=incident.number,
-                )
+        existingIncidentNumbers = frozenset(await store.incidentNumbers(event.id))
+
+        async def importIncidents(incidents: Sequence[Incident]) -> None:
+            await self._prepareIncidents(incidents)
+
+            newIncidents = []
+            for incident in incidents:
+                if incident.number not in existingIncidentNumbers:
+                    newIncidents.append(incident)
+                elif merge:
+                    await store.mergeIncident(incident)
+                else:
+                    self._log.info(
+                        "Not importing existing incident #{number} into event {event}",
+                        event=event,
+                        number=incident.number,
+                    )
+
+            if bulk:
+                if newIncidents:
+                    await store.importIncidents(newIncidents)
             else:
-                await store.importIncident(incident)
+                for incident in newIncidents:
+                    await store.importIncident(incident)
+
+        await self._importInBatches(
+            event, "incidents", incidents, importIncidents, bulk=bulk
+        )
 
-    async def _storeFieldReports(self, eventData: EventData) -> None:
+    async def _storeFieldReports(
+        self,
+        event: Event,
+        fieldReports: Iterable[FieldReport],
+        *,
+        bulk: bool,
+        merge: bool,
+    ) -> None:
         store = self.store
 
         assert store is not None
 
-        existingFieldReportNumbers = frozenset(
-            fieldReport.number
-            for fieldReport in await store.fieldReports(eventData.event.id)
+        existingFieldReportNumbers = frozenset(await store.fieldReportNumbers(event.id))
+
+        async def importFieldReports(fieldReports: Sequence[FieldReport]) -> None:
+            newFieldReports = []
+            for fieldReport in fieldReports:
+                if fieldReport.number not in existingFieldReportNumbers:
+                    newFieldReports.append(fieldReport)
+                elif merge:
+                    await store.mergeFieldReport(fieldReport)
+                else:
+                    self._log.info(
+                        "Not importing existing field report #{number} into "
+                        "event {event}",
+                        event=event,
+                        number=fieldReport.number,
+                    )
+
+            if bulk:
+                if newFieldReports:
+                    await store.importFieldReports(newFieldReports)
+            else:
+                for fieldReport in newFieldReports:
+                    await store.importFieldReport(fieldReport)
+
+        await self._importInBatches(
+            event, "field reports", fieldReports, importFieldReports, bulk=bulk
         )
 
-        for fieldReport in eventData.fieldReports:
-            if fieldReport.number in existingFieldReportNumbers:
+    async def _importInBatches[T](
+        self,
+        event: Event,
+        description: str,
+        items: Iterable[T],
+        importBatch: Callable[[Sequence[T]], Awaitable[None]],
+        *,
+        bulk: bool,
+    ) -> None:
+        """
+        Import the given items, in batches of :attr:`bulkBatchSize` when
+        ``bulk`` is true, or one at a time otherwise.
+        """
+        batchSize = self.bulkBatchSize if bulk else 1
+        batch: list[T] = []
+        count = 0
+
+        async def flush() -> None:
+            nonlocal count
+            await importBatch(batch)
+            count += len(batch)
+            batch.clear()
+            if bulk:
                 self._log.info(
-                    "Not importing existing field report #{number} into event {event}",
-                    event=eventData.event,
-                    number=fieldReport.number,
+                    "Imported {count} {description} into event {event}",
+                    event=event,
+                    description=description,
+                    count=count,
                 )
-            else:
-                await store.importFieldReport(fieldReport)
 
-    async def storeData(self) -> None:
+        for item in items:
+            batch.append(item)
+            if len(batch) >= batchSize:
+                await flush()
+
+        if batch:
+            await flush()
+
+
+@frozen(kw_only=True)
+class JSONImporter(_Importer):
+    """
+    Incident Management System data store JSON importer.
+    """
+
+    imsData: IMSData
+
+    @classmethod
+    def fromIO(cls, store: IMSDataStore, io: BinaryIO) -> "JSONImporter":
+        cls._log.info("Reading from JSON I/O...")
+        return cls.fromJSON(store, objectFromJSONBytesIO(io))
+
+    @classmethod
+    def fromBytes(cls, store: IMSDataStore, jsonBytes: bytes) -> "JSONImporter":
+        cls._log.info("Reading from JSON bytes...")
+        return cls.fromText(store, jsonBytes.decode("utf-8"))
+
+    @classmethod
+    def fromText(cls, store: IMSDataStore, jsonText: str) -> "JSONImporter":
+        cls._log.info("Reading from JSON text...")
+        return cls.fromJSON(store, objectFromJSONText(jsonText))
+
+    @classmethod
+    def fromJSON(cls, store: IMSDataStore, json: Mapping[str, Any]) -> "JSONImporter":
+        """
+        Import JSON.
+        """
+        cls._log.info("Reading from JSON objects...")
+        imsData = modelObjectFromJSONObject(json, IMSData)
+        return cls(store=store, imsData=imsData)
+
+    async def storeData(self, *, bulk: bool = False, merge: bool = False) -> None:
+        """
+        Store the imported data in the data store.
+
+        If ``bulk`` is true, incidents and field reports are written in
+        batches of :attr:`bulkBatchSize`, each in a single transaction.
+        This is much faster for large data sets, but a failure to store an
+        incident or field report fails the whole batch containing it.
+
+        Incidents and field reports which already exist in the data store are
+        not imported, unless ``merge`` is true, in which case they are merged
+        into the existing ones.
+        This allows the output of incremental exports to be imported.
+        """
         store = self.store
 
         if store is None:
@@ -250,22 +575,243 @@ class JSONImporter:
 
         imsData = self.imsData
 
-        await self._storeIncidentTypes()
+        await self._storeIncidentTypes(imsData.incidentTypes)
 
         existingEvents = frozenset(await store.events())
 
         for eventData in imsData.events:
             event = eventData.event
 
-            if event in existingEvents:
-                self._log.info(
-                    "Not creating existing event: {event}",
+            await self._storeEvent(event, existingEvents)
+            await self._storeEventAccess(event, eventData.access)
+            await self._storeConcentricStreets(event, eventData.concentricStreets)
+            await self._storeIncidents(
+                event, eventData.incidents, bulk=bulk, merge=merge
+            )
+            await self._storeFieldReports(
+                event, eventData.fieldReports, bulk=bulk, merge=merge
+            )
+
+
+@frozen(kw_only=True)
+class JSONStreamImporter(_Importer):
+    """
+    Incident Management System data store incremental JSON importer.
+
+    Unlike :class:`JSONImporter`, this reads JSON text from a byte stream
+    and stores each incident and field report as it is read, so that the
+    entire archive isn't held in memory at once.
+
+    Archives written by :meth:`JSONExporter.writeJSON` are read with memory
+    use bounded by the size of the largest incident or field report.
+    Other archives are also accepted, but data that can't be stored until
+    data that follows it has been read is held in memory until then.
+    """
+
+    @mutable(kw_only=True, eq=False)
+    class _State:
+        """
+        Internal mutable state for :class:`JSONStreamImporter`.
+        """
+
+        incidentTypesStored: bool = False
+        knownIncidentTypes: set[str] | None = None
+        createdIncidentTypes: set[str] = field(factory=set)
+
+    io: BinaryIO
+
+    _state: _State = field(factory=_State, init=False, repr=False)
+
+    async def _prepareIncidents(self, incidents: Sequence[Incident]) -> None:
+        """
+        See :meth:`_Importer._prepareIncidents`.
+
+        If incident types haven't been read yet, create any that are referred
+        to by the given incidents, so that they can be stored.
+        """
+        state = self._state
+
+        if state.incidentTypesStored:
+            return
+
+        store = self.store
+
+        assert store is not None
+
+        if state.knownIncidentTypes is None:
+            state.knownIncidentTypes = set(
+                await store.incidentTypes(includeHidden=True)
+            )
+
+        for incident in incidents:
+            for incidentType in incident.incidentTypes:
+                if incidentType not in state.knownIncidentTypes:
+                    await store.createIncidentType(incidentType)
+                    state.knownIncidentTypes.add(incidentType)
+                    state.createdIncidentTypes.add(incidentType)
+
+    async def _storeIncidentTypesFromJSON(self, json: Iterable[Any]) -> None:
+        store = self.store
+
+        assert store is not None
+
+        incidentTypes = tuple(
+            modelObjectFromJSONObject(obj, IncidentType) for obj in json
+        )
+
+        await self._storeIncidentTypes(incidentTypes)
+
+        # Incident types created ahead of time are created visible
+        hidden = [
+            incidentType.name
+            for incidentType in incidentTypes
+            if incidentType.hidden
+            and incidentType.name in self._state.createdIncidentTypes
+        ]
+        if hidden:
+            await store.hideIncidentTypes(hidden)
+
+        self._state.incidentTypesStored = True
+
+    async def _storeEventValue(
+        self, event: Event, key: str, json: Any, *, bulk: bool, merge: bool
+    ) -> None:
+        """
+        Store the event data with the given JSON key.
+        """
+        match key:
+            case EventDataJSONKey.access.value:
+                await self._storeEventAccess(
+                    event, modelObjectFromJSONObject(json, EventAccess)
+                )
+            case EventDataJSONKey.concentricStreets.value:
+                await self._storeConcentricStreets(event, json)
+            case EventDataJSONKey.incidents.value:
+                await self._storeIncidents(
+                    event,
+                    (modelObjectFromJSONObject(obj, Incident) for obj in json),
+                    bulk=bulk,
+                    merge=merge,
+                )
+            case EventDataJSONKey.fieldReports.value:
+                await self._storeFieldReports(
+                    event,
+                    (modelObjectFromJSONObject(obj, FieldReport) for obj in json),
+                    bulk=bulk,
+                    merge=merge,
+                )
+            case _:
+                self._log.warn(
+                    "Ignoring unknown event data key {key} in event {event}",
                     event=event,
+                    key=key,
+                )
+
+    async def _storeEventData(
+        self,
+        reader: JSONStreamReader,
+        existingEvents: frozenset[Event],
+        *,
+        bulk: bool,
+        merge: bool,
+    ) -> None:
+        event: Event | None = None
+
+        # Values which were read before they could be stored
+        pending: list[tuple[str, Any]] = []
+
+        # Field reports refer to incidents, so they can't be stored until
+        # the incidents are.
+        incidentsStored = False
+
+        for key in reader.objectKeys():
+            if key == EventDataJSONKey.event.value:
+                event = cast(
+                    "Event", modelObjectFromJSONObject(reader.readValue(), Event)
+                )
+                await self._storeEvent(event, existingEvents)
+            elif event is None or (
+                key == EventDataJSONKey.fieldReports.value and not incidentsStored
+            ):
+                pending.append((key, reader.readValue()))
+                continue
+            elif key == EventDataJSONKey.incidents.value:
+                await self._storeIncidents(
+                    event,
+                    (
+                        modelObjectFromJSONObject(obj, Incident)
+                        for obj in reader.arrayValues()
+                    ),
+                    bulk=bulk,
+                    merge=merge,
+                )
+            elif key == EventDataJSONKey.fieldReports.value:
+                await self._storeFieldReports(
+                    event,
+                    (
+                        modelObjectFromJSONObject(obj, FieldReport)
+                        for obj in reader.arrayValues()
+                    ),
+                    bulk=bulk,
+                    merge=merge,
                 )
             else:
-                await store.createEvent(event)
+                await self._storeEventValue(
+                    event, key, reader.readValue(), bulk=bulk, merge=merge
+                )
+
+            if key == EventDataJSONKey.incidents.value:
+                incidentsStored = True
+
+            # Store any pending values that can now be stored
+            stillPending: list[tuple[str, Any]] = []
+            for pendingKey, json in pending:
+                if pendingKey == EventDataJSONKey.fieldReports.value and not (
+                    incidentsStored
+                ):
+                    stillPending.append((pendingKey, json))
+                    continue
+                await self._storeEventValue(
+                    event, pendingKey, json, bulk=bulk, merge=merge
+                )
+                if pendingKey == EventDataJSONKey.incidents.value:
+                    incidentsStored = True
+            pending = stillPending
+
+        if event is None:
+            raise ValueError("Event data has no event")
+
+        for pendingKey, json in pending:
+            await self._storeEventValue(event, pendingKey, json, bulk=bulk, merge=merge)
+
+    async def storeData(self, *, bulk: bool = False, merge: bool = False) -> None:
+        """
+        Read data from the stream and store it in the data store.
+
+        See :meth:`JSONImporter.storeData` regarding ``bulk`` and ``merge``.
+        """
+        store = self.store
+
+        if store is None:
+            raise RuntimeError("No data store")
+
+        self._log.info("Reading from JSON stream...")
+
+        existingEvents = frozenset(await store.events())
 
-            await self._storeEventAccess(eventData)
-            await self._storeConcentricStreets(eventData)
-            await self._storeIncidents(eventData)
-            await self._storeFieldReports(eventData)
+        reader = JSONStreamReader(self.io)
+
+        for key in reader.objectKeys():
+            match key:
+                case IMSDataJSONKey.incidentTypes.value:
+                    await self._storeIncidentTypesFromJSON(reader.readValue())
+                case IMSDataJSONKey.events.value:
+                    for _ in reader.arrayItems():
+                        await self._storeEventData(
+                            reader, existingEvents, bulk=bulk, merge=merge
+                        )
+                case _:
+                    self._log.warn("Ignoring unknown key: {key}", key=key)
+                    reader.readValue()
+
+        reader.expectEnd()
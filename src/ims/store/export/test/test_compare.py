@@ -0,0 +1,192 @@
+##
+# See the file COPYRIGHT for copyright information.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+"""
+Tests for :mod:`ranger-ims-server.store.export._compare`
+"""
+
+from collections.abc import Callable
+from datetime import UTC
+from datetime import datetime as DateTime
+from io import BytesIO
+
+from hypothesis import assume, given, settings
+
+from ims.ext.json_ext import jsonTextFromObject
+from ims.ext.trial import TestCase
+from ims.model import EventData, IMSData, Incident, ReportEntry
+from ims.model.jsons import jsonObjectFromModelObject
+from ims.model.strategies import imsDatas
+
+from .._compare import ExportDigest, modelDigest
+
+
+__all__ = ()
+
+
+def exportDigest(imsData: IMSData, *, pretty: bool = False) -> ExportDigest:
+    json = jsonObjectFromModelObject(imsData)
+    text = jsonTextFromObject(json, pretty=pretty)
+    return ExportDigest.fromIO(BytesIO(text.encode("utf-8")))
+
+
+def replaceFirstIncident(
+    imsData: IMSData, replace: Callable[[Incident], Incident]
+) -> tuple[EventData, Incident, IMSData]:
+    """
+    Replace the first incident in the first event that has incidents.
+    """
+    eventData = min(d for d in imsData.events if d.incidents)
+    incident = min(eventData.incidents)
+
+    newEventData = EventData(
+        event=eventData.event,
+        access=eventData.access,
+        concentricStreets=eventData.concentricStreets,
+        incidents=(
+            replace(i) if i.number == incident.number else i
+            for i in eventData.incidents
+        ),
+        fieldReports=eventData.fieldReports,
+    )
+
+    return (
+        eventData,
+        incident,
+        imsData.replace(
+            events=(
+                newEventData if d.event == eventData.event else d
+                for d in imsData.events
+            )
+        ),
+    )
+
+
+class ModelDigestTests(TestCase):
+    """
+    Tests for :func:`modelDigest`
+    """
+
+    def test_sets(self) -> None:
+        """
+        Sets with the same items have the same digest.
+        """
+        self.assertEqual(
+            modelDigest(frozenset(("a", "b", "c"))),
+            modelDigest({"c", "b", "a"}),
+        )
+        self.assertNotEqual(
+            modelDigest(frozenset(("a", "b", "c"))),
+            modelDigest(frozenset(("a", "b"))),
+        )
+
+    def test_reportEntry(self) -> None:
+        """
+        Equal report entries have the same digest, even if their IDs differ.
+        """
+        entry = ReportEntry(
+            id=1,
+            created=DateTime(2025, 8, 30, 12, 0, tzinfo=UTC),
+            author="Hubcap",
+            automatic=False,
+            text="Something happened",
+            stricken=False,
+        )
+
+        self.assertEqual(modelDigest(entry), modelDigest(entry.replace(id=2)))
+        self.assertNotEqual(
+            modelDigest(entry), modelDigest(entry.replace(text="Nothing happened"))
+        )
+
+
+class ExportDigestTests(TestCase):
+    """
+    Tests for :class:`ExportDigest`
+    """
+
+    @settings(max_examples=10)
+    @given(imsDatas())
+    def test_differences_none(self, imsData: IMSData) -> None:
+        """
+        Exports of the same data have no differences, regardless of how the
+        JSON text is formatted.
+        """
+        digestA = exportDigest(imsData)
+        digestB = exportDigest(imsData, pretty=True)
+
+        self.assertEqual(digestA.digest, digestB.digest)
+        self.assertEqual(list(digestA.differences(digestB)), [])
+
+    @settings(max_examples=10)
+    @given(imsDatas())
+    def test_differences_event(self, imsData: IMSData) -> None:
+        """
+        Events missing from an export are reported.
+        """
+        assume(imsData.events)
+
+        eventData = min(imsData.events)
+        imsDataB = imsData.replace(events=(d for d in imsData.events if d != eventData))
+
+        self.assertEqual(
+            list(exportDigest(imsData).differences(exportDigest(imsDataB))),
+            [f"Event {eventData.event.id} only in first export"],
+        )
+
+    @settings(max_examples=10)
+    @given(imsDatas())
+    def test_differences_incidentSummary(self, imsData: IMSData) -> None:
+        """
+        Differing incident attributes are reported.
+        """
+        assume(any(d.incidents for d in imsData.events))
+
+        eventData, incident, imsDataB = replaceFirstIncident(
+            imsData, lambda i: i.replace(summary=f"{i.summary} (changed)")
+        )
+
+        prefix = f"Event {eventData.event.id}: incident #{incident.number}"
+        self.assertEqual(
+            list(exportDigest(imsData).differences(exportDigest(imsDataB))),
+            [f"{prefix}: summary does not match"],
+        )
+
+    @settings(max_examples=10)
+    @given(imsDatas())
+    def test_differences_incidentReportEntry(self, imsData: IMSData) -> None:
+        """
+        Report entries missing from an incident are reported.
+        """
+        assume(any(d.incidents for d in imsData.events))
+
+        entry = ReportEntry(
+            id=0,
+            created=DateTime(2025, 8, 30, 12, 0, tzinfo=UTC),
+            author="Hubcap",
+            automatic=False,
+            text="Something else happened",
+            stricken=False,
+        )
+        eventData, incident, imsDataB = replaceFirstIncident(
+            imsData,
+            lambda i: i.replace(reportEntries=(*i.reportEntries, entry)),
+        )
+
+        prefix = f"Event {eventData.event.id}: incident #{incident.number}"
+        self.assertEqual(
+            list(exportDigest(imsData).differences(exportDigest(imsDataB))),
+            [f"{prefix}: 1 report entries only in second export"],
+        )
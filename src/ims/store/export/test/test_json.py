@@ -18,6 +18,9 @@
 Tests for :mod:`ranger-ims-server.store.export._json`
 """
 
+from datetime import UTC
+from datetime import datetime as DateTime
+from datetime import timedelta as TimeDelta
 from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
@@ -39,7 +42,12 @@ from ims.model.strategies import imsDatas
 from ims.store import IMSDataStore
 from ims.store.sqlite import DataStore as SQLiteDataStore
 
-from .._json import JSONExporter, JSONImporter
+from .._json import (
+    ExportManifest,
+    JSONExporter,
+    JSONImporter,
+    JSONStreamImporter,
+)
 
 
 if TYPE_CHECKING:
@@ -102,6 +110,80 @@ class JSONExporterTests(TestCase):
         # Compare result to input data
         self.assertIMSDataEqual(imsDataOut, imsDataIn)
 
+    @given(imsDatas())
+    def test_writeJSON(self, imsDataIn: IMSData) -> None:
+        imsDataIn = addKnownIncidentTypes(imsDataIn)
+
+        # Create a new data store and import imsDataIn into it
+        store = self.store(imsData=imsDataIn)
+
+        # Export the data from that store
+        exporter = JSONExporter(store=store)
+        out = BytesIO()
+        self.successResultOf(exporter.writeJSON(out))
+        json = objectFromJSONText(out.getvalue().decode("utf-8"))
+        imsDataOut = modelObjectFromJSONObject(json, IMSData)
+
+        # Compare result to input data
+        self.assertIMSDataEqual(imsDataOut, imsDataIn)
+
+    @settings(max_examples=10)
+    @given(imsDatas())
+    def test_writeJSON_eventIDs(self, imsDataIn: IMSData) -> None:
+        imsDataIn = addKnownIncidentTypes(imsDataIn)
+        eventDatas = sorted(imsDataIn.events)[:1]
+
+        # Create a new data store and import imsDataIn into it
+        store = self.store(imsData=imsDataIn)
+
+        # Export the first event from that store
+        exporter = JSONExporter(
+            store=store, eventIDs=frozenset(d.event.id for d in eventDatas)
+        )
+        out = BytesIO()
+        self.successResultOf(exporter.writeJSON(out))
+        json = objectFromJSONText(out.getvalue().decode("utf-8"))
+        imsDataOut = modelObjectFromJSONObject(json, IMSData)
+
+        # Compare result to input data for that event
+        self.assertIMSDataEqual(imsDataOut, imsDataIn.replace(events=eventDatas))
+
+    @settings(max_examples=10)
+    @given(imsDatas())
+    def test_writeJSON_modifiedAfter(self, imsDataIn: IMSData) -> None:
+        imsDataIn = addKnownIncidentTypes(imsDataIn)
+
+        # Create a new data store and import imsDataIn into it
+        store = self.store(imsData=imsDataIn)
+
+        for modifiedAfter, expected in (
+            (DateTime.min.replace(tzinfo=UTC), imsDataIn),
+            (
+                DateTime.max.replace(tzinfo=UTC),
+                imsDataIn.replace(
+                    events=(
+                        EventData(
+                            event=eventData.event,
+                            access=eventData.access,
+                            concentricStreets=eventData.concentricStreets,
+                            incidents=(),
+                            fieldReports=(),
+                        )
+                        for eventData in imsDataIn.events
+                    )
+                ),
+            ),
+        ):
+            # Export data modified after the given time from that store
+            exporter = JSONExporter(store=store, modifiedAfter=modifiedAfter)
+            out = BytesIO()
+            self.successResultOf(exporter.writeJSON(out))
+            json = objectFromJSONText(out.getvalue().decode("utf-8"))
+            imsDataOut = modelObjectFromJSONObject(json, IMSData)
+
+            # Compare result to expected data
+            self.assertIMSDataEqual(imsDataOut, expected)
+
     @settings(max_examples=4)
     @given(imsDatas())
     def test_asText(self, imsDataIn: IMSData) -> None:
@@ -197,38 +279,160 @@ class JSONImporterTests(TestCase):
 
     @given(imsDatas())
     def test_storeData(self, imsDataIn: IMSData) -> None:
+        self.assertStoreData(imsDataIn, bulk=False)
+
+    @given(imsDatas())
+    def test_storeData_bulk(self, imsDataIn: IMSData) -> None:
+        self.assertStoreData(imsDataIn, bulk=True)
+
+    def assertStoreData(self, imsDataIn: IMSData, *, bulk: bool) -> None:
         imsDataIn = addKnownIncidentTypes(imsDataIn)
 
-        resultOf = self.successResultOf
+        # Create a new data store and import imsDataIn into it
+        store = self.store()
+        importer = JSONImporter(store=store, imsData=imsDataIn)
+        self.successResultOf(importer.storeData(bulk=bulk))
+
+        # Compare imported result to input data
+        self.assertIMSDataEqual(imsDataFromStore(self, store), imsDataIn)
+
+
+class JSONStreamImporterTests(TestCase):
+    """
+    Tests for :class:`JSONStreamImporter`
+    """
+
+    def store(self) -> IMSDataStore:
+        store = SQLiteDataStore(dbPath=Path(self.mktemp()))
+        self.successResultOf(store.upgradeSchema())
+        return store
+
+    @given(imsDatas())
+    def test_storeData(self, imsDataIn: IMSData) -> None:
+        """
+        :meth:`JSONStreamImporter.storeData` stores data written by
+        :meth:`JSONExporter.writeJSON`.
+        """
+        imsDataIn = addKnownIncidentTypes(imsDataIn)
 
         # Create a new data store and import imsDataIn into it
         store = self.store()
         importer = JSONImporter(store=store, imsData=imsDataIn)
-        resultOf(importer.storeData())
-
-        # Create a new IMSData with the imported data in it
-        allTypesOut = frozenset(resultOf(store.incidentTypes(includeHidden=True)))
-        visibleTypesOut = frozenset(resultOf(store.incidentTypes(includeHidden=False)))
-        imsDataOut = IMSData(
-            events=(
-                EventData(
-                    event=event,
-                    access=EventAccess(
-                        readers=resultOf(store.readers(event.id)),
-                        writers=resultOf(store.writers(event.id)),
-                        reporters=resultOf(store.reporters(event.id)),
-                    ),
-                    concentricStreets=resultOf(store.concentricStreets(event.id)),
-                    incidents=resultOf(store.incidents(event.id)),
-                    fieldReports=resultOf(store.fieldReports(event.id)),
-                )
-                for event in resultOf(store.events())
-            ),
-            incidentTypes=(
-                IncidentType(name=t, hidden=(t not in visibleTypesOut))
-                for t in allTypesOut
-            ),
+        self.successResultOf(importer.storeData())
+
+        # Export the data from that store as a stream
+        exporter = JSONExporter(store=store)
+        out = BytesIO()
+        self.successResultOf(exporter.writeJSON(out))
+
+        self.assertStoreData(out.getvalue(), imsDataIn, bulk=False)
+
+    @given(imsDatas())
+    def test_storeData_bulk(self, imsDataIn: IMSData) -> None:
+        """
+        :meth:`JSONStreamImporter.storeData` stores data in bulk.
+        """
+        imsDataIn = addKnownIncidentTypes(imsDataIn)
+        jsonBytes = jsonTextFromObject(jsonObjectFromModelObject(imsDataIn)).encode(
+            "utf-8"
+        )
+
+        self.assertStoreData(jsonBytes, imsDataIn, bulk=True)
+
+    @settings(max_examples=10)
+    @given(imsDatas())
+    def test_storeData_merge(self, imsDataIn: IMSData) -> None:
+        """
+        :meth:`JSONStreamImporter.storeData` merges data into existing
+        incidents and field reports without duplicating report entries.
+        """
+        imsDataIn = addKnownIncidentTypes(imsDataIn)
+        jsonBytes = jsonTextFromObject(jsonObjectFromModelObject(imsDataIn)).encode(
+            "utf-8"
         )
 
+        store = self.store()
+        for merge in (False, True):
+            importer = JSONStreamImporter(store=store, io=BytesIO(jsonBytes))
+            self.successResultOf(importer.storeData(merge=merge))
+
         # Compare imported result to input data
-        self.assertIMSDataEqual(imsDataOut, imsDataIn)
+        self.assertIMSDataEqual(imsDataFromStore(self, store), imsDataIn)
+
+    @settings(max_examples=10)
+    @given(imsDatas())
+    def test_storeData_sortedKeys(self, imsDataIn: IMSData) -> None:
+        """
+        :meth:`JSONStreamImporter.storeData` stores data with keys in an
+        order that requires some data to be held until data which follows it
+        has been stored.
+        """
+        imsDataIn = addKnownIncidentTypes(imsDataIn)
+        json = jsonObjectFromModelObject(imsDataIn)
+        jsonBytes = jsonTextFromObject(json, pretty=True).encode("utf-8")
+
+        self.assertStoreData(jsonBytes, imsDataIn, bulk=False)
+
+    def assertStoreData(
+        self, jsonBytes: bytes, imsDataIn: IMSData, *, bulk: bool
+    ) -> None:
+        # Create a new data store and import the JSON into it
+        store = self.store()
+        importer = JSONStreamImporter(store=store, io=BytesIO(jsonBytes))
+        self.successResultOf(importer.storeData(bulk=bulk))
+
+        # Compare imported result to input data
+        self.assertIMSDataEqual(imsDataFromStore(self, store), imsDataIn)
+
+
+class ExportManifestTests(TestCase):
+    """
+    Tests for :class:`ExportManifest`
+    """
+
+    def test_text(self) -> None:
+        """
+        :meth:`ExportManifest.fromText` decodes the output of
+        :meth:`ExportManifest.asText`.
+        """
+        exported = DateTime(2025, 8, 30, 12, 0, tzinfo=UTC)
+
+        for manifest in (
+            ExportManifest(exported=exported),
+            ExportManifest(
+                exported=exported,
+                eventIDs=frozenset(("2024", "2025")),
+                modifiedAfter=exported - TimeDelta(hours=1),
+            ),
+        ):
+            self.assertEqual(ExportManifest.fromText(manifest.asText()), manifest)
+
+
+def imsDataFromStore(testCase: TestCase, store: IMSDataStore) -> IMSData:
+    """
+    Read all of the data in a data store.
+    """
+    resultOf = testCase.successResultOf
+
+    allTypesOut = frozenset(resultOf(store.incidentTypes(includeHidden=True)))
+    visibleTypesOut = frozenset(resultOf(store.incidentTypes(includeHidden=False)))
+
+    return IMSData(
+        events=(
+            EventData(
+                event=event,
+                access=EventAccess(
+                    readers=resultOf(store.readers(event.id)),
+                    writers=resultOf(store.writers(event.id)),
+                    reporters=resultOf(store.reporters(event.id)),
+                ),
+                concentricStreets=resultOf(store.concentricStreets(event.id)),
+                incidents=resultOf(store.incidents(event.id)),
+                fieldReports=resultOf(store.fieldReports(event.id)),
+            )
+            for event in resultOf(store.events())
+        ),
+        incidentTypes=(
+            IncidentType(name=t, hidden=(t not in visibleTypesOut)) for t in allTypesOut
+        ),
+    )
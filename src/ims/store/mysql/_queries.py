@@ -62,6 +62,12 @@ queries = Queries(
         on duplicate key update NAME=NAME
         """,
     ),
+    createEventCounter=Query(
+        "create number counters for event, if none already exist",
+        f"""
+        insert ignore into EVENT_COUNTER (EVENT) {query_eventID}
+        """,
+    ),
     eventAccess=Query(
         "look up access for event",
         f"""
@@ -69,6 +75,14 @@ queries = Queries(
         where EVENT = ({query_eventID}) and MODE = %(mode)s
         """,
     ),
+    eventAccesses=Query(
+        "look up access for all events",
+        """
+        select e.NAME as EVENT_NAME, ea.MODE, ea.EXPRESSION, ea.VALIDITY
+        from EVENT e
+        left join EVENT_ACCESS ea on ea.EVENT = e.ID
+        """,
+    ),
     clearEventAccessForMode=Query(
         "clear event access for mode",
         f"""
@@ -131,6 +145,14 @@ queries = Queries(
         where EVENT = ({query_eventID})
         """,
     ),
+    concentricStreetsByEvent=Query(
+        "look up concentric streets for all events",
+        """
+        select e.NAME as EVENT_NAME, cs.ID, cs.NAME
+        from EVENT e
+        left join CONCENTRIC_STREET cs on cs.EVENT = e.ID
+        """,
+    ),
     createConcentricStreet=Query(
         "create concentric street",
         f"""
@@ -201,16 +223,72 @@ queries = Queries(
         )
         """,
     ),
+    incident_reportEntryAttachedFile=Query(
+        "look up attached file for incident report entry",
+        f"""
+        select re.ATTACHED_FILE
+        from
+            INCIDENT__REPORT_ENTRY ire
+            join REPORT_ENTRY re
+                on re.ID = ire.REPORT_ENTRY
+        where
+            ire.EVENT = ({query_eventID})
+            and ire.INCIDENT_NUMBER = %(incidentNumber)s
+            and ire.REPORT_ENTRY = %(reportEntryID)s
+        """,
+    ),
+    incident_attachments=Query(
+        "look up report entries with attached files for incident",
+        f"""
+        select
+            re.ID,
+            re.AUTHOR,
+            re.TEXT,
+            re.CREATED,
+            re.GENERATED,
+            re.STRICKEN,
+            re.ATTACHED_FILE
+        from
+            INCIDENT__REPORT_ENTRY ire
+            join REPORT_ENTRY re
+                on re.ID = ire.REPORT_ENTRY
+        where
+            ire.EVENT = ({query_eventID})
+            and ire.INCIDENT_NUMBER = %(incidentNumber)s
+            and re.ATTACHED_FILE is not null
+            and re.ATTACHED_FILE <> ''
+        order by re.CREATED
+        """,
+    ),
     incidentNumbers=Query(
         "look up incident numbers for event",
         f"""
         select NUMBER from INCIDENT where EVENT = ({query_eventID})
         """,
     ),
-    maxIncidentNumber=Query(
-        "look up maximum incident number for event",
+    nextIncidentNumber=Query(
+        "allocate next incident number for event",
         f"""
-        select max(NUMBER) from INCIDENT where EVENT = ({query_eventID})
+        update EVENT_COUNTER
+        set LAST_INCIDENT_NUMBER = LAST_INCIDENT_NUMBER + 1
+        where EVENT = ({query_eventID})
+        """,
+    ),
+    bumpIncidentNumber=Query(
+        "advance last allocated incident number for event to a given number",
+        f"""
+        update EVENT_COUNTER
+        set LAST_INCIDENT_NUMBER = greatest(
+            LAST_INCIDENT_NUMBER, %(incidentNumber)s
+        )
+        where EVENT = ({query_eventID})
+        """,
+    ),
+    lastIncidentNumber=Query(
+        "look up last allocated incident number for event",
+        f"""
+        select LAST_INCIDENT_NUMBER from EVENT_COUNTER
+        where EVENT = ({query_eventID})
         """,
     ),
     incidents=Query(
@@ -278,6 +356,111 @@ queries = Queries(
         ;
         """,
     ),
+    incidents_lastModified=Query(
+        "look up last report entry time for all incidents in an event",
+        f"""
+        select
+            ire.INCIDENT_NUMBER,
+            max(re.CREATED) as LAST_MODIFIED
+        from
+            INCIDENT__REPORT_ENTRY ire
+            join REPORT_ENTRY re
+                on re.ID = ire.REPORT_ENTRY
+        where
+            ire.EVENT = ({query_eventID})
+            and re.GENERATED <= %(generatedLTE)s
+            and re.TEXT <> ''
+        group by
+            ire.INCIDENT_NUMBER
+        """,
+    ),
+    incidentsWithNumbers=Query(
+        "look up incidents with the given numbers for event",
+        f"""
+        select
+            i.NUMBER,
+            i.CREATED,
+            i.PRIORITY,
+            i.STATE,
+            i.SUMMARY,
+            i.LOCATION_NAME,
+            i.LOCATION_CONCENTRIC,
+            i.LOCATION_RADIAL_HOUR,
+            i.LOCATION_RADIAL_MINUTE,
+            i.LOCATION_DESCRIPTION,
+            i.EVENT,
+            (
+                select json_arrayagg(it.NAME)
+                from INCIDENT__INCIDENT_TYPE iit
+                join INCIDENT_TYPE it
+                    on i.EVENT = iit.EVENT
+                    and i.NUMBER = iit.INCIDENT_NUMBER
+                    and iit.INCIDENT_TYPE = it.ID
+            ) as INCIDENT_TYPES,
+            (
+                select json_arrayagg(irep.NUMBER)
+                from FIELD_REPORT irep
+                where i.EVENT = irep.EVENT
+                    and i.NUMBER = irep.INCIDENT_NUMBER
+            ) as FIELD_REPORT_NUMBERS,
+            (
+                select json_arrayagg(ir.RANGER_HANDLE)
+                from INCIDENT__RANGER ir
+                where i.EVENT = ir.EVENT
+                    and i.NUMBER = ir.INCIDENT_NUMBER
+            ) as RANGER_HANDLES
+        from
+            INCIDENT i
+        where
+            i.EVENT = ({query_eventID})
+            and i.NUMBER in ({{numbers}})
+        group by
+            i.NUMBER
+        """,
+    ),
+    incidentsWithNumbers_reportEntries=Query(
+        "look up report entries for incidents with the given numbers in an event",
+        f"""
+        select
+            re.ID,
+            ire.INCIDENT_NUMBER,
+            re.AUTHOR,
+            re.TEXT,
+            re.CREATED,
+            re.GENERATED,
+            re.STRICKEN,
+            re.ATTACHED_FILE
+        from
+            INCIDENT__REPORT_ENTRY ire
+            join REPORT_ENTRY re
+                on re.ID = ire.REPORT_ENTRY
+        where
+            ire.EVENT = ({query_eventID})
+            and ire.INCIDENT_NUMBER in ({{numbers}})
+            and re.GENERATED <= %(generatedLTE)s
+        ;
+        """,
+    ),
+    incidentsWithNumbers_lastModified=Query(
+        "look up last report entry time for incidents with the given numbers in "
+        "an event",
+        f"""
+        select
+            ire.INCIDENT_NUMBER,
+            max(re.CREATED) as LAST_MODIFIED
+        from
+            INCIDENT__REPORT_ENTRY ire
+            join REPORT_ENTRY re
+                on re.ID = ire.REPORT_ENTRY
+        where
+            ire.EVENT = ({query_eventID})
+            and ire.INCIDENT_NUMBER in ({{numbers}})
+            and re.GENERATED <= %(generatedLTE)s
+            and re.TEXT <> ''
+        group by
+            ire.INCIDENT_NUMBER
+        """,
+    ),
     attachRangerHandleToIncident=Query(
         "add Ranger to incident",
         f"""
@@ -446,10 +629,28 @@ queries = Queries(
         where EVENT = ({query_eventID})
         """,
     ),
-    maxFieldReportNumber=Query(
-        "look up maximum field report number",
+    nextFieldReportNumber=Query(
+        "allocate next field report number for event",
+        f"""
+        update EVENT_COUNTER
+        set LAST_FIELD_REPORT_NUMBER = LAST_FIELD_REPORT_NUMBER + 1
+        where EVENT = ({query_eventID})
+        """,
+    ),
+    bumpFieldReportNumber=Query(
+        "advance last allocated field report number for event to a given number",
         f"""
-        select max(NUMBER) from FIELD_REPORT
+        update EVENT_COUNTER
+        set LAST_FIELD_REPORT_NUMBER = greatest(
+            LAST_FIELD_REPORT_NUMBER, %(fieldReportNumber)s
+        )
+        where EVENT = ({query_eventID})
+        """,
+    ),
+    lastFieldReportNumber=Query(
+        "look up last allocated field report number for event",
+        f"""
+        select LAST_FIELD_REPORT_NUMBER from EVENT_COUNTER
         where EVENT = ({query_eventID})
         """,
     ),
@@ -487,6 +688,78 @@ queries = Queries(
             and re.GENERATED <= %(generatedLTE)s
         """,
     ),
+    fieldReportsByAuthor=Query(
+        "look up field reports with report entries by an author for an event",
+        f"""
+        select
+            NUMBER,
+            CREATED,
+            SUMMARY,
+            INCIDENT_NUMBER
+        from
+            FIELD_REPORT
+        where
+            EVENT = ({query_eventID})
+            and NUMBER in (
+                select frre.FIELD_REPORT_NUMBER
+                from
+                    FIELD_REPORT__REPORT_ENTRY frre
+                    join REPORT_ENTRY re
+                        on frre.REPORT_ENTRY = re.ID
+                where
+                    frre.EVENT = ({query_eventID})
+                    and re.AUTHOR = %(author)s
+                    and re.GENERATED <= %(generatedLTE)s
+            )
+        """,
+    ),
+    fieldReportsByAuthor_reportEntries=Query(
+        "look up report entries for field reports with report entries by an "
+        "author for an event",
+        f"""
+        select
+            re.ID,
+            irre.FIELD_REPORT_NUMBER,
+            re.AUTHOR,
+            re.CREATED,
+            re.GENERATED,
+            re.TEXT,
+            re.STRICKEN
+        from
+            FIELD_REPORT__REPORT_ENTRY irre
+            join REPORT_ENTRY re
+                on irre.REPORT_ENTRY = re.ID
+        where
+            irre.EVENT = ({query_eventID})
+            and re.GENERATED <= %(generatedLTE)s
+            and irre.FIELD_REPORT_NUMBER in (
+                select frre.FIELD_REPORT_NUMBER
+                from
+                    FIELD_REPORT__REPORT_ENTRY frre
+                    join REPORT_ENTRY re
+                        on frre.REPORT_ENTRY = re.ID
+                where
+                    frre.EVENT = ({query_eventID})
+                    and re.AUTHOR = %(author)s
+                    and re.GENERATED <= %(generatedLTE)s
+            )
+        """,
+    ),
+    fieldReportHasAuthor=Query(
+        "look up whether a field report has a report entry by an author",
+        f"""
+        select 1
+        from
+            FIELD_REPORT__REPORT_ENTRY frre
+            join REPORT_ENTRY re
+                on frre.REPORT_ENTRY = re.ID
+        where
+            frre.EVENT = ({query_eventID})
+            and frre.FIELD_REPORT_NUMBER = %(fieldReportNumber)s
+            and re.AUTHOR = %(author)s
+        limit 1
+        """,
+    ),
     createFieldReport=Query(
         "create field report",
         f"""
@@ -573,4 +846,120 @@ queries = Queries(
         )
         """,
     ),
+    clearIncidentSearchText=Query(
+        "clear incident summary and location search text",
+        f"""
+        delete from INCIDENT_SEARCH
+        where
+            EVENT = ({query_eventID})
+            and INCIDENT_NUMBER = %(incidentNumber)s
+            and REPORT_ENTRY is null
+        """,
+    ),
+    indexIncidentSearchText=Query(
+        "index incident summary and location search text",
+        f"""
+        insert into INCIDENT_SEARCH (EVENT, INCIDENT_NUMBER, REPORT_ENTRY, TEXT)
+        select
+            i.EVENT,
+            i.NUMBER,
+            null,
+            concat_ws(
+                ' ',
+                i.SUMMARY,
+                i.LOCATION_NAME,
+                concat(
+                    i.LOCATION_RADIAL_HOUR,
+                    ':',
+                    lpad(coalesce(i.LOCATION_RADIAL_MINUTE, 0), 2, '0')
+                ),
+                cs.NAME,
+                i.LOCATION_DESCRIPTION
+            )
+        from INCIDENT i
+        left join CONCENTRIC_STREET cs
+            on cs.EVENT = i.EVENT and cs.ID = i.LOCATION_CONCENTRIC
+        where
+            i.EVENT = ({query_eventID})
+            and i.NUMBER = %(incidentNumber)s
+        """,
+    ),
+    indexReportEntrySearchText=Query(
+        "index incident report entry search text",
+        f"""
+        insert into INCIDENT_SEARCH (EVENT, INCIDENT_NUMBER, REPORT_ENTRY, TEXT)
+        values (
+            ({query_eventID}),
+            %(incidentNumber)s,
+            %(reportEntryID)s,
+            %(text)s
+        )
+        """,
+    ),
+    searchIncidents=Query(
+        "search incident text",
+        """
+        with
+            TERM_MATCHES as (
+                {termMatches}
+            ),
+            MATCHES as (
+                select m.*
+                from TERM_MATCHES m
+                left join REPORT_ENTRY re
+                    on re.ID = m.REPORT_ENTRY
+                where coalesce(re.STRICKEN, 0) = 0
+            ),
+            INCIDENTS as (
+                select INCIDENT_NUMBER, sum(RANK) as RANK
+                from MATCHES
+                group by INCIDENT_NUMBER
+                having count(distinct TERM) = %(termCount)s
+                order by RANK desc, INCIDENT_NUMBER desc
+                limit %(limit)s
+            )
+        select
+            m.INCIDENT_NUMBER,
+            i.RANK as INCIDENT_RANK,
+            m.TEXT,
+            max(m.RANK) as RANK
+        from MATCHES m
+        join INCIDENTS i
+            on i.INCIDENT_NUMBER = m.INCIDENT_NUMBER
+        group by m.ID, m.INCIDENT_NUMBER, m.TEXT, i.RANK
+        order by i.RANK desc, m.INCIDENT_NUMBER desc, max(m.RANK) desc
+        """,
+    ),
+    searchIncidents_indexedTerm=Query(
+        "search incident text for a term using the full-text index",
+        f"""
+        select
+            s.ID,
+            s.INCIDENT_NUMBER,
+            s.REPORT_ENTRY,
+            s.TEXT,
+            {{termIndex}} as TERM,
+            match (s.TEXT) against ({{term}} in boolean mode) as RANK
+        from INCIDENT_SEARCH s
+        where
+            match (s.TEXT) against ({{term}} in boolean mode)
+            and s.EVENT = ({query_eventID})
+        """,
+    ),
+    searchIncidents_unindexedTerm=Query(
+        "search incident text for a term without using the full-text index",
+        f"""
+        select
+            s.ID,
+            s.INCIDENT_NUMBER,
+            s.REPORT_ENTRY,
+            s.TEXT,
+            {{termIndex}} as TERM,
+            0.0 as RANK
+        from INCIDENT_SEARCH s
+        where
+            s.TEXT regexp concat('\\\\b', {{term}})
+            and s.EVENT = ({query_eventID})
+        """,
+    ),
 )
@@ -18,15 +18,20 @@
 Incident Management System SQL data store.
 """
 
-from collections.abc import Callable
+import contextlib
+from collections.abc import Callable, Sequence
 from pathlib import Path
 from sys import stdout
-from typing import Any, ClassVar, TextIO, TypeVar, cast
+from threading import Barrier, BrokenBarrierError, Lock
+from time import monotonic, time
+from typing import TYPE_CHECKING, Any, ClassVar, Self, TextIO, TypeVar, cast
 
-from attrs import field, frozen, mutable
+from attrs import evolve, field, frozen, mutable
 from pymysql.cursors import DictCursor
 from pymysql.err import MySQLError
 from twisted.enterprise.adbapi import Connection, ConnectionPool
+from twisted.internet.defer import Deferred, ensureDeferred, gatherResults
+from twisted.internet.task import LoopingCall
 from twisted.logger import Logger
 
 from .._db import DatabaseStore, Parameters, Queries, Query, Rows, Transaction
@@ -34,22 +39,181 @@ from .._exceptions import StorageError
 from ._queries import queries
 
 
+if TYPE_CHECKING:
+    from pymysql.connections import Connection as MySQLConnection
+
+
 __all__ = ()
 
 
 T = TypeVar("T")
 
 
+# InnoDB full-text indexes omit tokens shorter than innodb_ft_min_token_size
+# and those in the default stopword list, so searches for them can't use the
+# index.
+innoDBMinimumTokenSize = 3
+innoDBStopwords = frozenset(
+    (
+        "a",
+        "about",
+        "an",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "com",
+        "de",
+        "en",
+        "for",
+        "from",
+        "how",
+        "i",
+        "in",
+        "is",
+        "it",
+        "la",
+        "of",
+        "on",
+        "or",
+        "that",
+        "the",
+        "this",
+        "to",
+        "was",
+        "what",
+        "when",
+        "where",
+        "who",
+        "will",
+        "with",
+        "und",
+        "www",
+    )
+)
+
+
+@mutable(kw_only=True)
+class ConnectionPoolStatistics:
+    """
+    MySQL connection pool statistics.
+    """
+
+    # Open connections
+    connections: int = 0
+
+    # Interactions waiting for a connection
+    waiting: int = 0
+
+    # Interactions using a connection
+    active: int = 0
+
+    # Interactions completed, successfully or not
+    interactions: int = 0
+
+    # Total and longest time interactions waited for a connection, in seconds
+    waitTime: float = 0.0
+    maxWaitTime: float = 0.0
+
+    # Total and longest time interactions used a connection, in seconds
+    interactionTime: float = 0.0
+    maxInteractionTime: float = 0.0
+
+    @property
+    def idle(self) -> int:
+        """
+        Open connections not in use.
+        """
+        return max(self.connections - self.active, 0)
+
+
 class ReconnectingConnectionPool(ConnectionPool):
     """
-    Subclass of ConnectionPool that reconnects to MySQL.
+    Subclass of ConnectionPool that reconnects to MySQL, and keeps statistics
+    on the use of its connections.
     """
 
+    _log: ClassVar[Logger] = Logger()
+
+    # Waiting longer than this for a connection, or using one for longer than
+    # this, is logged as a warning, in seconds
+    slowTime: ClassVar[float] = 1.0
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.statistics = ConnectionPoolStatistics()
+        self._statisticsLock = Lock()
+
     def connect(self) -> Connection:
         connection = ConnectionPool.connect(self)
         connection.ping(reconnect=True)
         return cast("Connection", connection)
 
+    def runInteraction(
+        self, interaction: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> Deferred[T]:
+        """
+        See :meth:`ConnectionPool.runInteraction`.
+        """
+        statistics = self.statistics
+        lock = self._statisticsLock
+        times: dict[str, float] = {}
+
+        # Called in a pool thread
+        def timedInteraction(*args: Any, **kwargs: Any) -> T:
+            times["started"] = monotonic()
+            waitTime = times["started"] - times["submitted"]
+            with lock:
+                statistics.connections = len(self.connections)
+                statistics.waiting -= 1
+                statistics.active += 1
+                statistics.waitTime += waitTime
+                statistics.maxWaitTime = max(statistics.maxWaitTime, waitTime)
+            try:
+                return interaction(*args, **kwargs)
+            finally:
+                interactionTime = monotonic() - times["started"]
+                with lock:
+                    statistics.active -= 1
+                    statistics.interactions += 1
+                    statistics.interactionTime += interactionTime
+                    statistics.maxInteractionTime = max(
+                        statistics.maxInteractionTime, interactionTime
+                    )
+
+        def done(result: object) -> object:
+            started = times.get("started")
+            if started is None:
+                # The interaction never ran
+                with lock:
+                    statistics.waiting -= 1
+                return result
+
+            waitTime = started - times["submitted"]
+            interactionTime = monotonic() - started
+            if waitTime > self.slowTime or interactionTime > self.slowTime:
+                self._log.warn(
+                    "Slow database interaction {interaction}: "
+                    "waited {waitTime:.3f}s for a connection, "
+                    "used it for {interactionTime:.3f}s; {statistics}",
+                    interaction=interaction,
+                    waitTime=waitTime,
+                    interactionTime=interactionTime,
+                    statistics=statistics,
+                )
+            return result
+
+        with lock:
+            statistics.waiting += 1
+        times["submitted"] = monotonic()
+
+        d = cast(
+            "Deferred[T]", super().runInteraction(timedInteraction, *args, **kwargs)
+        )
+        d.addBoth(done)
+        return d
+
 
 class Cursor(DictCursor):
     """
@@ -100,12 +264,31 @@ class DataStore(DatabaseStore):
 
     _log: ClassVar[Logger] = Logger()
 
-    schemaVersion: ClassVar[int] = 13
+    schemaVersion: ClassVar[int] = 16
     schemaBasePath: ClassVar[Path] = Path(__file__).parent / "schema"
     sqlFileExtension: ClassVar[str] = "mysql"
 
     query: ClassVar[Queries] = queries
 
+    @staticmethod
+    def parameterPlaceholder(name: str) -> str:
+        """
+        See :meth:`DatabaseStore.parameterPlaceholder`.
+        """
+        return f"%({name})s"
+
+    @staticmethod
+    def asSearchExpression(term: str) -> str | None:
+        """
+        See :meth:`DatabaseStore.asSearchExpression`.
+        This implementation returns a boolean mode full-text query with a
+        prefix term, or :obj:`None` for terms which InnoDB does not index:
+        those shorter than the minimum token size and stopwords.
+        """
+        if len(term) < innoDBMinimumTokenSize or term in innoDBStopwords:
+            return None
+        return f"{term}*"
+
     @mutable(kw_only=True, eq=False)
     class _State:
         """
@@ -113,6 +296,13 @@ class DataStore(DatabaseStore):
         """
 
         db: ConnectionPool | None = field(default=None, init=False)
+        replicaDBs: tuple[ConnectionPool, ...] | None = field(default=None, init=False)
+
+        # Index of the replica to use for the next read
+        nextReplica: int = field(default=0, init=False)
+
+        # Periodic ping of connections which are not in use
+        pinger: LoopingCall | None = field(default=None, init=False)
 
     hostName: str
     hostPort: int
@@ -120,33 +310,211 @@ class DataStore(DatabaseStore):
     username: str
     password: str = field(repr=lambda _: "*")
 
+    # Number of connections to keep open, and the most to open at once
+    poolMinConnections: int = 3
+    poolMaxConnections: int = 5
+
+    # Time to wait for a connection to the server to be established, in
+    # seconds
+    connectTimeout: int = 10
+
+    # Time after which the server aborts a statement, in seconds, or None for
+    # no limit.
+    # MariaDB applies this to all statements (max_statement_time); MySQL only
+    # to read-only select statements (max_execution_time).
+    queryTimeout: float | None = None
+
+    # Time between pings of connections which are not in use, in seconds, or
+    # 0 for no pings.
+    # Pings keep connections from being closed for being idle by the server
+    # (see wait_timeout) or by a firewall between us and it, and reopen any
+    # which have been closed anyway, so that requests don't wait for that.
+    pingInterval: float = 60.0
+
+    # Read replicas of the database, as (host name, port) pairs.
+    # Reads which may be run on a replica are spread across the replicas;
+    # all other queries use the primary database.
+    replicas: Sequence[tuple[str, int]] = ()
+
+    # Time after data is written during which reads which must see it (see
+    # readingAfter) use the primary database, as the replicas may not have it
+    # yet, in seconds
+    replicaStickiness: float = 5.0
+
+    # Time (as returned by time.time()) at or before which data written must
+    # be seen by reads, or None; see readingAfter
+    readAfter: float | None = None
+
     _state: _State = field(factory=_State, init=False, repr=False)
 
+    def _connectionPool(
+        self, hostName: str, hostPort: int
+    ) -> ReconnectingConnectionPool:
+        return ReconnectingConnectionPool(
+            "pymysql",
+            host=hostName,
+            port=hostPort,
+            database=self.database,
+            user=self.username,
+            password=self.password,
+            cursorclass=Cursor,
+            connect_timeout=self.connectTimeout,
+            cp_min=self.poolMinConnections,
+            cp_max=self.poolMaxConnections,
+            cp_reconnect=True,
+            cp_openfun=self._connectionOpened,
+        )
+
+    def _connectionOpened(self, connection: "MySQLConnection[Cursor]") -> None:
+        """
+        Configure a newly opened connection.
+        Called in a pool thread.
+        """
+        if self.queryTimeout is None:
+            return
+
+        if "mariadb" in connection.get_server_info().lower():
+            command = f"set session max_statement_time = {float(self.queryTimeout)}"
+        else:
+            # In milliseconds
+            command = (
+                f"set session max_execution_time = {round(self.queryTimeout * 1000)}"
+            )
+
+        # Reconnecting (see ReconnectingConnectionPool.connect) runs the init
+        # command again
+        connection.init_command = command
+        with connection.cursor() as cursor:
+            cursor.execute(command)
+
     @property
     def _db(self) -> ConnectionPool:
         if self._state.db is None:
-            db = ReconnectingConnectionPool(
-                "pymysql",
-                host=self.hostName,
-                port=self.hostPort,
-                database=self.database,
-                user=self.username,
-                password=self.password,
-                cursorclass=Cursor,
-                cp_reconnect=True,
+            self._state.db = self._connectionPool(self.hostName, self.hostPort)
+
+        return self._state.db
+
+    @property
+    def _replicaDBs(self) -> tuple[ConnectionPool, ...]:
+        if self._state.replicaDBs is None:
+            self._state.replicaDBs = tuple(
+                self._connectionPool(hostName, hostPort)
+                for hostName, hostPort in self.replicas
             )
 
-            self._state.db = db
+        return self._state.replicaDBs
 
-        return self._state.db
+    @property
+    def statistics(self) -> ConnectionPoolStatistics:
+        """
+        Connection pool statistics for the primary database.
+        """
+        db = self._db
+        assert isinstance(db, ReconnectingConnectionPool)
+        return db.statistics
+
+    @property
+    def replicaStatistics(self) -> Sequence[ConnectionPoolStatistics]:
+        """
+        Connection pool statistics for each replica, in the order of
+        :attr:`replicas`.
+        """
+        return tuple(
+            cast("ReconnectingConnectionPool", db).statistics for db in self._replicaDBs
+        )
+
+    async def prewarm(self) -> None:
+        """
+        See :meth:`IMSDataStore.prewarm`.
+        This implementation opens :attr:`poolMinConnections` connections to
+        the primary database and to each replica, and then pings connections
+        which are not in use every :attr:`pingInterval` seconds until
+        disconnected.
+        """
+        for db in (self._db, *self._replicaDBs):
+            await self._runOnConnections(db, self.poolMinConnections)
+
+        self._log.info(
+            "Opened database connections: {statistics}, replicas: {replicaStatistics}",
+            statistics=self.statistics,
+            replicaStatistics=self.replicaStatistics,
+        )
+
+        state = self._state
+        if self.pingInterval > 0 and state.pinger is None:
+            state.pinger = LoopingCall(lambda: ensureDeferred(self.pingIdle()))
+            state.pinger.start(self.pingInterval, now=False)
+
+    async def pingIdle(self) -> None:
+        """
+        Ping the open connections to the primary database and to each replica,
+        reopening any which have been closed, unless some of the connections
+        to that database are in use.
+        """
+        for db in (self._db, *self._replicaDBs):
+            statistics = cast("ReconnectingConnectionPool", db).statistics
+            if statistics.active or statistics.waiting:
+                # Connections in use have no need of a ping, and the pings
+                # would have to wait for them.
+                continue
+
+            try:
+                await self._runOnConnections(db, len(db.connections))
+            except StorageError as e:
+                self._log.warn("Unable to ping database: {error}", error=e)
+
+    def logStatistics(self) -> None:
+        """
+        See :meth:`IMSDataStore.logStatistics`.
+        """
+        statistics = self.statistics
+        self._log.info(
+            "Database connections: {active}/{maxConnections} in use, "
+            "{waiting} interactions waiting; {statistics}, "
+            "replicas: {replicaStatistics}",
+            active=statistics.active,
+            maxConnections=self.poolMaxConnections,
+            waiting=statistics.waiting,
+            statistics=statistics,
+            replicaStatistics=self.replicaStatistics,
+        )
+
+    async def _runOnConnections(self, db: ConnectionPool, count: int) -> None:
+        """
+        Run an interaction on the given number of connections in the given
+        pool at once, opening connections as needed.
+        The pool pings each connection as the interaction starts.
+        """
+        if count < 1:
+            return
+
+        # Each interaction holds its pool thread (and so that thread's
+        # connection) until all of them have started, so each runs on a
+        # different thread's connection.
+        barrier = Barrier(count, timeout=self.connectTimeout)
+
+        def connected(txn: Transaction) -> None:  # noqa: ARG001
+            with contextlib.suppress(BrokenBarrierError):
+                barrier.wait()
+
+        await gatherResults(
+            [ensureDeferred(self._runInteraction(db, connected)) for _ in range(count)]
+        )
 
     async def disconnect(self) -> None:
         """
         See :meth:`DatabaseStore.disconnect`.
         """
+        if self._state.pinger is not None:
+            self._state.pinger.stop()
+            self._state.pinger = None
         if self._state.db is not None:
             self._state.db.close()
             self._state.db = None
+        if self._state.replicaDBs is not None:
+            for db in self._state.replicaDBs:
+                db.close()
+            self._state.replicaDBs = None
 
     async def runQuery(
         self, query: Query, parameters: Parameters | None = None
@@ -189,11 +557,18 @@ class DataStore(DatabaseStore):
         interaction: Callable[..., T],
         *args: Any,
         **kwargs: Any,
+    ) -> T:
+        return await self._runInteraction(self._db, interaction, *args, **kwargs)
+
+    async def _runInteraction(
+        self,
+        db: ConnectionPool,
+        interaction: Callable[..., T],
+        *args: Any,
+        **kwargs: Any,
     ) -> T:
         try:
-            return cast(
-                "T", await self._db.runInteraction(interaction, *args, **kwargs)
-            )
+            return cast("T", await db.runInteraction(interaction, *args, **kwargs))
         except MySQLError as e:
             self._log.critical(
                 "Interaction {interaction} failed: {error}",
@@ -202,6 +577,88 @@ class DataStore(DatabaseStore):
             )
             raise StorageError(str(e)) from e
 
+    def readingAfter(self, writeTime: float | None) -> Self:
+        """
+        See :meth:`IMSDataStore.readingAfter`.
+        This implementation returns a view of this store, sharing its
+        connections, which reads from the primary database until
+        :attr:`replicaStickiness` seconds after the given time.
+        """
+        if writeTime is None or not self.replicas:
+            return self
+
+        if self.readAfter is not None:
+            writeTime = max(writeTime, self.readAfter)
+
+        # Share connections (and all other state) with the view; as it is
+        # frozen, set its state the way attrs does
+        view = evolve(self, readAfter=writeTime)
+        object.__setattr__(view, "_state", self._state)
+        return view
+
+    def _replicaDB(self) -> ConnectionPool | None:
+        """
+        Choose a replica to read data from.
+        Returns :obj:`None` if the read should use the primary database,
+        because there are no replicas, or because the read must see data
+        written too recently for the replicas to be relied on to have it.
+        """
+        replicaDBs = self._replicaDBs
+        if not replicaDBs:
+            return None
+
+        readAfter = self.readAfter
+        if readAfter is not None and time() - readAfter < self.replicaStickiness:
+            return None
+
+        state = self._state
+        db = replicaDBs[state.nextReplica % len(replicaDBs)]
+        state.nextReplica += 1
+        return db
+
+    async def runReadQuery(
+        self, query: Query, parameters: Parameters | None = None
+    ) -> Rows:
+        """
+        See :meth:`DatabaseStore.runReadQuery`.
+        This implementation runs the query on a replica, if there are any and
+        the read needn't see recently written data, falling back to the
+        primary database if the replica fails.
+        """
+        db = self._replicaDB()
+        if db is not None:
+            try:
+                return iter(await db.runQuery(query.text, parameters or {}))
+            except MySQLError as e:
+                self._log.warn(
+                    "Unable to read from replica; using primary: {error}", error=e
+                )
+
+        return await self.runQuery(query, parameters)
+
+    async def runReadInteraction(
+        self,
+        interaction: Callable[..., T],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """
+        See :meth:`DatabaseStore.runReadInteraction`.
+        This implementation runs the interaction on a replica, if there are
+        any and the read needn't see recently written data, falling back to
+        the primary database if the replica fails.
+        """
+        db = self._replicaDB()
+        if db is not None:
+            try:
+                return cast("T", await db.runInteraction(interaction, *args, **kwargs))
+            except MySQLError as e:
+                self._log.warn(
+                    "Unable to read from replica; using primary: {error}", error=e
+                )
+
+        return await self.runInteraction(interaction, *args, **kwargs)
+
     async def dbSchemaVersion(self) -> int:
         """
         See `meth:DatabaseStore.dbSchemaVersion`.
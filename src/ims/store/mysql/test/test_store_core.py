@@ -21,13 +21,15 @@ Tests for :mod:`ranger-ims-server.store.mysql._store`
 from io import StringIO
 from os import environ
 from textwrap import dedent
-from typing import ClassVar, cast
+from time import time
+from typing import TYPE_CHECKING, Any, ClassVar, Self, cast
 from unittest.mock import patch
 
 from twisted.internet.defer import Deferred, ensureDeferred
 from twisted.logger import Logger
 
-from ims.ext.trial import AsynchronousTestCase, asyncAsDeferred
+from ims.ext.trial import AsynchronousTestCase, TestCase, asyncAsDeferred
+from ims.model import Event
 
 from ..._exceptions import StorageError
 from .._store import DataStore, ReconnectingConnectionPool
@@ -35,6 +37,11 @@ from .base import TestDataStore
 from .service import DatabaseExistsError, MySQLService, randomDatabaseName
 
 
+if TYPE_CHECKING:
+    from pymysql.connections import Connection as MySQLConnection
+    from twisted.enterprise.adbapi import ConnectionPool
+
+
 __all__ = ()
 
 
@@ -88,7 +95,7 @@ class DataStoreCoreTests(AsynchronousTestCase):
         # setUp can't return a coroutine, so convert it to a Deferred
         return ensureDeferred(tearDown())
 
-    async def store(self) -> TestDataStore:
+    async def store(self, **kwargs: Any) -> TestDataStore:
         service = self.mysqlService
 
         assert service.host is not None
@@ -112,6 +119,7 @@ class DataStoreCoreTests(AsynchronousTestCase):
             database=databaseName,
             username=service.user,
             password=service.password,
+            **kwargs,
         )
 
         self.stores.append(store)
@@ -144,7 +152,7 @@ class DataStoreCoreTests(AsynchronousTestCase):
         self.assertEqual(
             dedent(
                 """
-                Version: 13
+                Version: 16
                 CONCENTRIC_STREET:
                   1: EVENT(int) not null
                   2: ID(varchar(16)) not null
@@ -158,6 +166,10 @@ class DataStoreCoreTests(AsynchronousTestCase):
                   3: EXPRESSION(varchar(128)) not null
                   4: MODE(enum(6)) not null
                   5: VALIDITY(enum(6)) not null := 'always'
+                EVENT_COUNTER:
+                  1: EVENT(int) not null
+                  2: LAST_INCIDENT_NUMBER(int) not null := 0
+                  3: LAST_FIELD_REPORT_NUMBER(int) not null := 0
                 FIELD_REPORT:
                   1: EVENT(int) not null
                   2: NUMBER(int) not null
@@ -180,6 +192,12 @@ class DataStoreCoreTests(AsynchronousTestCase):
                   9: LOCATION_RADIAL_HOUR(tinyint) := NULL
                   10: LOCATION_RADIAL_MINUTE(tinyint) := NULL
                   11: LOCATION_DESCRIPTION(varchar(1024)) := NULL
+                INCIDENT_SEARCH:
+                  1: ID(int) not null
+                  2: EVENT(int) not null
+                  3: INCIDENT_NUMBER(int) not null
+                  4: REPORT_ENTRY(int) := NULL
+                  5: TEXT(text(65535)) not null
                 INCIDENT_TYPE:
                   1: ID(int) not null
                   2: NAME(varchar(128)) not null
@@ -242,6 +260,140 @@ class DataStoreCoreTests(AsynchronousTestCase):
 
         self.assertIsInstance(store._db, ReconnectingConnectionPool)
 
+    @asyncAsDeferred
+    async def test_statistics(self) -> None:
+        """
+        :attr:`DataStore.statistics` counts interactions and their use of the
+        connection pool.
+        """
+        store = await self.store()
+        await store.upgradeSchema()
+
+        before = store.statistics.interactions
+        await store.dbSchemaVersion()
+        statistics = store.statistics
+
+        self.assertEqual(statistics.interactions, before + 1)
+        self.assertEqual(statistics.waiting, 0)
+        self.assertEqual(statistics.active, 0)
+        self.assertGreaterEqual(statistics.connections, 1)
+        self.assertEqual(statistics.idle, statistics.connections)
+        self.assertGreaterEqual(statistics.interactionTime, 0)
+
+    @asyncAsDeferred
+    async def test_prewarm(self) -> None:
+        """
+        :meth:`DataStore.prewarm` opens the minimum number of connections in
+        the pool.
+        """
+        store = await self.store()
+        await store.upgradeSchema()
+        await store.prewarm()
+
+        self.assertEqual(store.statistics.connections, store.poolMinConnections)
+
+    @asyncAsDeferred
+    async def test_prewarm_pinger(self) -> None:
+        """
+        :meth:`DataStore.prewarm` starts pinging idle connections, until the
+        store is disconnected.
+        """
+        store = await self.store()
+        await store.upgradeSchema()
+        await store.prewarm()
+
+        pinger = store._state.pinger
+        assert pinger is not None
+        self.assertTrue(pinger.running)
+
+        await store.disconnect()
+        self.assertFalse(pinger.running)
+        self.assertIsNone(store._state.pinger)
+
+    @asyncAsDeferred
+    async def test_pingIdle(self) -> None:
+        """
+        :meth:`DataStore.pingIdle` runs an interaction on each open connection.
+        """
+        store = await self.store(pingInterval=0)
+        await store.upgradeSchema()
+        await store.prewarm()
+
+        interactions = store.statistics.interactions
+        await store.pingIdle()
+
+        self.assertEqual(
+            store.statistics.interactions, interactions + store.poolMinConnections
+        )
+        self.assertEqual(store.statistics.connections, store.poolMinConnections)
+
+    @asyncAsDeferred
+    async def test_queryTimeout(self) -> None:
+        """
+        Connections are configured to abort statements which take longer than
+        :attr:`DataStore.queryTimeout`.
+        """
+        store = await self.store(queryTimeout=0.5)
+
+        rows = await store._db.runQuery(
+            "show session variables where Variable_name in "
+            "('max_statement_time', 'max_execution_time')"
+        )
+        values = {row["Variable_name"]: float(row["Value"]) for row in rows}
+
+        if "max_statement_time" in values:
+            # MariaDB
+            self.assertEqual(values["max_statement_time"], 0.5)
+        else:
+            self.assertEqual(values["max_execution_time"], 500)
+
+    @asyncAsDeferred
+    async def test_readReplica(self) -> None:
+        """
+        Reads of incidents are run on a replica.
+        """
+        service = self.mysqlService
+        assert service.host is not None
+        assert service.port is not None
+
+        # The test service stands in for its own replica
+        store = await self.store(
+            replicas=((service.host, service.port),), replicaStickiness=0
+        )
+        await store.upgradeSchema()
+        await store.createEvent(Event(id="foo"))
+
+        interactions = store.statistics.interactions
+        await store.incidents("foo")
+
+        self.assertEqual(store.statistics.interactions, interactions)
+        self.assertEqual(store.replicaStatistics[0].interactions, 1)
+
+    @asyncAsDeferred
+    async def test_readReplica_afterWrite(self) -> None:
+        """
+        Reads by a view of the store which must see data written recently are
+        run on the primary database; other reads are still run on a replica.
+        """
+        service = self.mysqlService
+        assert service.host is not None
+        assert service.port is not None
+
+        store = await self.store(replicas=((service.host, service.port),))
+        await store.upgradeSchema()
+        await store.createEvent(Event(id="foo"))
+
+        interactions = store.statistics.interactions
+        await store.readingAfter(time()).incidents("foo")
+
+        self.assertEqual(store.statistics.interactions, interactions + 1)
+        self.assertEqual(store.replicaStatistics[0].interactions, 0)
+
+        await store.incidents("foo")
+
+        self.assertEqual(store.statistics.interactions, interactions + 1)
+        self.assertEqual(store.replicaStatistics[0].interactions, 1)
+
     @asyncAsDeferred
     async def test_upgradeSchema(self) -> None:
         """
@@ -374,3 +526,148 @@ class DataStoreCoreTests(AsynchronousTestCase):
             )
         else:
             self.fail("StorageError not raised.")
+
+
+class FakeCursor:
+    def __init__(self, connection: "FakeConnection") -> None:
+        self.connection = connection
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        pass
+
+    def execute(self, sql: str) -> None:
+        self.connection.executed.append(sql)
+
+
+class FakeConnection:
+    def __init__(self, serverInfo: str) -> None:
+        self.serverInfo = serverInfo
+        self.init_command: str | None = None
+        self.executed: list[str] = []
+
+    def get_server_info(self) -> str:
+        return self.serverInfo
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self)
+
+
+class DataStoreConnectionTests(TestCase):
+    """
+    Tests for :class:`DataStore` connection configuration.
+    """
+
+    def connectionOpened(
+        self, serverInfo: str, queryTimeout: float | None
+    ) -> FakeConnection:
+        store = DataStore(
+            hostName="localhost",
+            hostPort=3306,
+            database="ims",
+            username="ims",
+            password="",
+            queryTimeout=queryTimeout,
+        )
+        connection = FakeConnection(serverInfo)
+        store._connectionOpened(cast("MySQLConnection[Any]", connection))
+        return connection
+
+    def test_queryTimeout_none(self) -> None:
+        """
+        Connections are not given a statement timeout when there is no query
+        timeout.
+        """
+        connection = self.connectionOpened("10.5.27-MariaDB-ubu2004", None)
+
+        self.assertIsNone(connection.init_command)
+        self.assertEqual(connection.executed, [])
+
+    def test_queryTimeout_mariadb(self) -> None:
+        """
+        Connections to MariaDB are given a statement timeout, in seconds.
+        """
+        command = "set session max_statement_time = 2.5"
+        connection = self.connectionOpened("10.5.27-MariaDB-ubu2004", 2.5)
+
+        self.assertEqual(connection.init_command, command)
+        self.assertEqual(connection.executed, [command])
+
+    def test_queryTimeout_mysql(self) -> None:
+        """
+        Connections to MySQL are given an execution timeout, in milliseconds.
+        """
+        command = "set session max_execution_time = 2500"
+        connection = self.connectionOpened("8.0.36", 2.5)
+
+        self.assertEqual(connection.init_command, command)
+        self.assertEqual(connection.executed, [command])
+
+
+class DataStoreReplicaTests(TestCase):
+    """
+    Tests for :class:`DataStore` choice of read replicas.
+    """
+
+    def store(self) -> DataStore:
+        store = DataStore(
+            hostName="localhost",
+            hostPort=3306,
+            database="ims",
+            username="ims",
+            password="",
+            replicas=(("replica1", 3306), ("replica2", 3306)),
+            replicaStickiness=5,
+        )
+        store._state.replicaDBs = cast(
+            "tuple[ConnectionPool, ...]", (object(), object())
+        )
+        return store
+
+    def test_replicaDB(self) -> None:
+        """
+        Readers which haven't written data recently, or at all, take turns
+        reading from the replicas.
+        """
+        store = self.store()
+        replicaDBs = store._replicaDBs
+
+        self.assertEqual(
+            [store._replicaDB(), store.readingAfter(time() - 60)._replicaDB()],
+            list(replicaDBs),
+        )
+        self.assertIs(store._replicaDB(), replicaDBs[0])
+
+    def test_replicaDB_afterWrite(self) -> None:
+        """
+        Views of the store which must see data written recently read from the
+        primary database.
+        """
+        store = self.store()
+
+        self.assertIsNone(store.readingAfter(time())._replicaDB())
+        self.assertIsNotNone(store._replicaDB())
+
+    def test_readingAfter_none(self) -> None:
+        """
+        :meth:`DataStore.readingAfter` returns the store itself when given no
+        write time.
+        """
+        store = self.store()
+
+        self.assertIs(store.readingAfter(None), store)
+
+    def test_readingAfter_view(self) -> None:
+        """
+        :meth:`DataStore.readingAfter` returns a view of the store which shares
+        its state, and reads after the latest write time it was given.
+        """
+        store = self.store()
+        now = time()
+        view = store.readingAfter(now).readingAfter(now - 60)
+
+        self.assertIs(view._state, store._state)
+        self.assertEqual(view.readAfter, now)
+        self.assertIsNone(store.readAfter)
@@ -56,12 +56,28 @@ class DataStore(DatabaseStore):
 
     _log: ClassVar[Logger] = Logger()
 
-    schemaVersion: ClassVar[int] = 7
+    schemaVersion: ClassVar[int] = 10
     schemaBasePath: ClassVar[Path] = Path(__file__).parent / "schema"
     sqlFileExtension: ClassVar[str] = "sqlite"
 
     query: ClassVar[Queries] = queries
 
+    @staticmethod
+    def parameterPlaceholder(name: str) -> str:
+        """
+        See :meth:`DatabaseStore.parameterPlaceholder`.
+        """
+        return f":{name}"
+
+    @staticmethod
+    def asSearchExpression(term: str) -> str:
+        """
+        See :meth:`DatabaseStore.asSearchExpression`.
+        This implementation returns a FTS5 prefix query, which the index can
+        match for any term.
+        """
+        return f'"{term}"*'
+
     @mutable(kw_only=True, eq=False)
     class _State:
         """
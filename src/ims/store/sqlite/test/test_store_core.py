@@ -25,10 +25,12 @@ from io import StringIO
 from pathlib import Path
 from sqlite3 import IntegrityError
 from textwrap import dedent
+from threading import Barrier, Thread
 from unittest.mock import patch
 
 from hypothesis import given, settings
 from hypothesis.strategies import integers
+from twisted.internet.defer import ensureDeferred
 
 from ims.ext.sqlite import (
     SQLITE_MAX_INT,
@@ -41,6 +43,8 @@ from ims.ext.sqlite import (
 from ims.ext.trial import AsynchronousTestCase, TestCase
 
 from ..._exceptions import StorageError
+from ...test.incident import anEvent, aNewIncident
+from ...test.report import aNewFieldReport
 from .. import _store
 from .._store import DataStore
 from .base import TestDataStore
@@ -76,7 +80,7 @@ class DataStoreCoreTests(AsynchronousTestCase):
             schemaInfo.lower(),
             dedent(
                 """
-                Version: 7
+                Version: 10
                 ACCESS_MODE:
                   0: ID(text) not null *1
                 ACCESS_VALIDITY:
@@ -93,6 +97,10 @@ class DataStoreCoreTests(AsynchronousTestCase):
                   1: EXPRESSION(text) not null *2
                   2: MODE(text) not null
                   3: VALIDITY(text) not null ['always']
+                EVENT_COUNTER:
+                  0: EVENT(integer) not null *1
+                  1: LAST_INCIDENT_NUMBER(integer) not null [0]
+                  2: LAST_FIELD_REPORT_NUMBER(integer) not null [0]
                 FIELD_REPORT:
                   0: EVENT(integer) not null *1
                   1: NUMBER(integer) not null *2
@@ -115,6 +123,30 @@ class DataStoreCoreTests(AsynchronousTestCase):
                   8: LOCATION_RADIAL_HOUR(integer)
                   9: LOCATION_RADIAL_MINUTE(integer)
                   10: LOCATION_DESCRIPTION(text)
+                INCIDENT_SEARCH:
+                  0: EVENT()
+                  1: INCIDENT_NUMBER()
+                  2: REPORT_ENTRY()
+                  3: TEXT()
+                INCIDENT_SEARCH_config:
+                  0: k() not null *1
+                  1: v()
+                INCIDENT_SEARCH_content:
+                  0: id(INTEGER) *1
+                  1: c0()
+                  2: c1()
+                  3: c2()
+                  4: c3()
+                INCIDENT_SEARCH_data:
+                  0: id(INTEGER) *1
+                  1: block(BLOB)
+                INCIDENT_SEARCH_docsize:
+                  0: id(INTEGER) *1
+                  1: sz(BLOB)
+                INCIDENT_SEARCH_idx:
+                  0: segid() not null *1
+                  1: term() not null *2
+                  2: pgno()
                 INCIDENT_STATE:
                   0: ID(text) not null *1
                 INCIDENT_TYPE:
@@ -371,6 +403,61 @@ class DataStoreCoreTests(AsynchronousTestCase):
             f = self.failureResultOf(store.validate(), StorageError)
             self.assertEqual(f.getErrorMessage(), "Data store validation failed")
 
+    def test_allocateNumbers_threads(self) -> None:
+        """
+        Incidents and field reports created concurrently by stores in separate
+        threads, each with its own connection to the same database, are
+        assigned distinct, sequential numbers.
+        """
+        dbPath = Path(self.mktemp())
+        store = TestDataStore(dbPath=dbPath)
+        self.successResultOf(store.upgradeSchema())
+        self.successResultOf(store.createEvent(anEvent))
+
+        threadCount = 8
+        createCount = 10
+        incidentNumbers: list[int] = []
+        fieldReportNumbers: list[int] = []
+        errors: list[AssertionError] = []
+        barrier = Barrier(threadCount)
+
+        def create() -> None:
+            threadStore = TestDataStore(dbPath=dbPath)
+            try:
+                barrier.wait()
+                for _ in range(createCount):
+                    incident = self.successResultOf(
+                        ensureDeferred(
+                            threadStore.createIncident(aNewIncident, "Hubcap")
+                        )
+                    )
+                    incidentNumbers.append(incident.number)
+                    fieldReport = self.successResultOf(
+                        ensureDeferred(
+                            threadStore.createFieldReport(aNewFieldReport, "Hubcap")
+                        )
+                    )
+                    fieldReportNumbers.append(fieldReport.number)
+            except self.failureException as e:
+                errors.append(e)
+            finally:
+                self.successResultOf(ensureDeferred(threadStore.disconnect()))
+
+        threads = [Thread(target=create) for _ in range(threadCount)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+        expected = list(range(1, threadCount * createCount + 1))
+        self.assertEqual(sorted(incidentNumbers), expected)
+        self.assertEqual(sorted(fieldReportNumbers), expected)
+
+        incidents = self.successResultOf(ensureDeferred(store.incidents(anEvent.id)))
+        self.assertEqual(sorted(i.number for i in incidents), expected)
+
 
 class DataStoreHelperTests(TestCase):
     """
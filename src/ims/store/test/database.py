@@ -54,8 +54,13 @@ class TestDatabaseStoreMixIn(TestDataStoreMixIn):
         """
         store = cast("DatabaseStore", self)
 
+        def storeEvent(txn: Transaction) -> None:
+            parameters = {"eventID": event.id}
+            txn.execute(store.query.createEvent.text, parameters)
+            txn.execute(store.query.createEventCounter.text, parameters)
+
         try:
-            await store.runOperation(store.query.createEvent, {"eventID": event.id})
+            await store.runInteraction(storeEvent)
         except StorageError as e:
             self._log.critical(
                 "Unable to store event {event}: {error}", event=event, error=e
@@ -76,6 +81,10 @@ class TestDatabaseStoreMixIn(TestDataStoreMixIn):
             store.query.createEventOrIgnore.text,
             {"eventID": incident.eventID},
         )
+        txn.execute(
+            store.query.createEventCounter.text,
+            {"eventID": incident.eventID},
+        )
 
         if address is None:
             locationConcentric = None
@@ -113,6 +122,10 @@ class TestDatabaseStoreMixIn(TestDataStoreMixIn):
                 "locationDescription": locationDescription,
             },
         )
+        txn.execute(
+            store.query.bumpIncidentNumber.text,
+            {"eventID": incident.eventID, "incidentNumber": incident.number},
+        )
 
         for rangerHandle in incident.rangerHandles:
             txn.execute(
@@ -182,6 +195,10 @@ class TestDatabaseStoreMixIn(TestDataStoreMixIn):
             store.query.createEventOrIgnore.text,
             {"eventID": fieldReport.eventID},
         )
+        txn.execute(
+            store.query.createEventCounter.text,
+            {"eventID": fieldReport.eventID},
+        )
 
         txn.execute(
             store.query.createFieldReport.text,
@@ -193,6 +210,10 @@ class TestDatabaseStoreMixIn(TestDataStoreMixIn):
                 "incidentNumber": fieldReport.incidentNumber,
             },
         )
+        txn.execute(
+            store.query.bumpFieldReportNumber.text,
+            {"eventID": fieldReport.eventID, "fieldReportNumber": fieldReport.number},
+        )
 
         for reportEntry in fieldReport.reportEntries:
             txn.execute(
@@ -19,7 +19,7 @@ Event tests for :mod:`ranger-ims-server.store`
 """
 
 from ims.ext.trial import asyncAsDeferred
-from ims.model import AccessEntry, AccessValidity, Event
+from ims.model import AccessEntry, AccessValidity, Event, EventAccess
 
 from .._exceptions import StorageError
 from .base import DataStoreTests
@@ -132,6 +132,28 @@ class DataStoreEventTests(DataStoreTests):
             result = tuple(await store.readers(event.id))
             self.assertEqual(result, readers)
 
+    @asyncAsDeferred
+    async def test_setReaders_otherMode(self) -> None:
+        """
+        :meth:`IMSDataStore.setReaders` moves expressions with another kind of
+        access to the read ACL, and uses the last entry given for an
+        expression.
+        """
+        event = Event(id="Foo")
+        a = AccessEntry(expression="a", validity=AccessValidity.always)
+        b = AccessEntry(expression="b", validity=AccessValidity.always)
+
+        store = await self.store()
+        await store.createEvent(event)
+        await store.setWriters(event.id, (a, b))
+        await store.setReaders(
+            event.id,
+            (AccessEntry(expression="a", validity=AccessValidity.onsite), a),
+        )
+
+        self.assertEqual(tuple(await store.readers(event.id)), (a,))
+        self.assertEqual(tuple(await store.writers(event.id)), (b,))
+
     @asyncAsDeferred
     async def test_setReaders_error(self) -> None:
         """
@@ -190,3 +212,28 @@ class DataStoreEventTests(DataStoreTests):
             pass
         else:
             self.fail("StorageError not raised")
+
+    @asyncAsDeferred
+    async def test_eventAccesses(self) -> None:
+        """
+        :meth:`IMSDataStore.eventAccesses` returns the access for all events.
+        """
+        a = AccessEntry(expression="a", validity=AccessValidity.always)
+        b = AccessEntry(expression="b", validity=AccessValidity.onsite)
+        c = AccessEntry(expression="c", validity=AccessValidity.always)
+
+        store = await self.store()
+        for eventID in ("Foo", "Bar", "Baz"):
+            await store.createEvent(Event(id=eventID))
+        await store.setReaders("Foo", (a, b))
+        await store.setWriters("Foo", (c,))
+        await store.setReporters("Bar", (a,))
+
+        self.assertEqual(
+            dict(await store.eventAccesses()),
+            {
+                "Foo": EventAccess(readers=(a, b), writers=(c,), reporters=()),
+                "Bar": EventAccess(readers=(), writers=(), reporters=(a,)),
+                "Baz": EventAccess(readers=(), writers=(), reporters=()),
+            },
+        )
@@ -24,7 +24,9 @@ from datetime import datetime as DateTime
 from datetime import timedelta as TimeDelta
 from typing import TYPE_CHECKING, Any, cast
 
+from attrs import evolve
 from attrs import fields as attrsFields
+from twisted.internet.defer import ensureDeferred, gatherResults
 
 from ims.ext.trial import asyncAsDeferred
 from ims.model import (
@@ -191,6 +193,79 @@ class DataStoreIncidentTests(DataStoreTests):
             for r, i in zip(sorted(retrieved), sorted(incidents), strict=True):
                 self.assertIncidentsEqual(store, r, i)
 
+    @asyncAsDeferred
+    async def test_incidents_excludeReportEntries(self) -> None:
+        """
+        :meth:`IMSDataStore.incidents` returns incidents without report
+        entries when ``excludeReportEntries`` is true, with the same last
+        modified time as when report entries are included.
+        """
+        incident = anIncident1
+
+        store = await self.store()
+        await store.storeIncident(incident)
+        await store.addReportEntriesToIncident(
+            incident.eventID,
+            incident.number,
+            (aReportEntry1, aReportEntry2),
+            aReportEntry1.author,
+        )
+
+        (full,) = await store.incidents(incident.eventID)
+        (retrieved,) = await store.incidents(
+            incident.eventID, excludeReportEntries=True
+        )
+
+        self.assertEqual(len(full.reportEntries), 2)
+        self.assertEqual(retrieved.reportEntries, ())
+        self.assertEqual(retrieved.lastModified, full.lastModified)
+        self.assertIncidentsEqual(store, retrieved, incident)
+
+    @asyncAsDeferred
+    async def test_incidents_numbers(self) -> None:
+        """
+        :meth:`IMSDataStore.incidents` returns only the incidents with the
+        given numbers when ``numbers`` is given.
+        """
+        incident1 = anIncident1
+        incident2 = anIncident2.replace(eventID=incident1.eventID)
+        assert incident1.number != incident2.number
+
+        store = await self.store()
+        for incident in (incident1, incident2):
+            await store.storeIncident(incident)
+        await store.addReportEntriesToIncident(
+            incident2.eventID,
+            incident2.number,
+            (aReportEntry1,),
+            aReportEntry1.author,
+        )
+
+        for numbers, expected in (
+            ((), ()),
+            ((incident2.number,), (incident2,)),
+            ((incident2.number, 9999), (incident2,)),
+            ((incident1.number, incident2.number), (incident1, incident2)),
+        ):
+            retrieved = await store.incidents(incident1.eventID, numbers=numbers)
+
+            self.assertEqual(
+                sorted(incident.number for incident in retrieved),
+                sorted(incident.number for incident in expected),
+                numbers,
+            )
+            for incident in retrieved:
+                if incident.number == incident2.number:
+                    self.assertEqual(
+                        [entry.text for entry in incident.reportEntries],
+                        [aReportEntry1.text],
+                    )
+
+        (retrievedIncident,) = await store.incidents(
+            incident1.eventID, numbers=(incident1.number,), excludeReportEntries=True
+        )
+        self.assertIncidentsEqual(store, retrievedIncident, incident1)
+
     @asyncAsDeferred
     async def test_incidents_error(self) -> None:
         """
@@ -274,6 +349,82 @@ class DataStoreIncidentTests(DataStoreTests):
         else:
             self.fail("StorageError not raised")
 
+    async def _storeAttachments(self) -> tuple[TestDataStoreABC, Incident]:
+        store = await self.store()
+        await store.createEvent(anEvent)
+        await store.storeIncident(anIncident1)
+        await store.addReportEntriesToIncident(
+            anEvent.id,
+            anIncident1.number,
+            (
+                evolve(aReportEntry, author="Bucket"),
+                evolve(aReportEntry1, attachedFile="sha256-abc.png"),
+                evolve(aReportEntry2, attachedFile="sha256-def.pdf"),
+            ),
+            "Bucket",
+        )
+        incident = await store.incidentWithNumber(anEvent.id, anIncident1.number)
+        return store, incident
+
+    @asyncAsDeferred
+    async def test_incidentAttachedFile(self) -> None:
+        """
+        :meth:`IMSDataStore.incidentAttachedFile` returns the name of the file
+        attached to the given report entry, if any.
+        """
+        store, incident = await self._storeAttachments()
+
+        attachedFiles = {
+            entry.id: await store.incidentAttachedFile(
+                anEvent.id, incident.number, entry.id
+            )
+            for entry in incident.reportEntries
+        }
+
+        self.assertEqual(
+            attachedFiles,
+            {entry.id: entry.attachedFile for entry in incident.reportEntries},
+        )
+        self.assertEqual(
+            sorted(name for name in attachedFiles.values() if name is not None),
+            ["sha256-abc.png", "sha256-def.pdf"],
+        )
+
+    @asyncAsDeferred
+    async def test_incidentAttachedFile_notFound(self) -> None:
+        """
+        :meth:`IMSDataStore.incidentAttachedFile` returns :obj:`None` for
+        report entries which are not attached to the given incident.
+        """
+        store, incident = await self._storeAttachments()
+        await store.storeIncident(evolve(anIncident1, number=2))
+
+        for entry in incident.reportEntries:
+            self.assertIsNone(await store.incidentAttachedFile(anEvent.id, 2, entry.id))
+        self.assertIsNone(
+            await store.incidentAttachedFile(
+                anEvent.id, incident.number, store.maxIncidentNumber + 1
+            )
+        )
+
+    @asyncAsDeferred
+    async def test_incidentAttachments(self) -> None:
+        """
+        :meth:`IMSDataStore.incidentAttachments` returns the report entries
+        with attached files on the given incident.
+        """
+        store, incident = await self._storeAttachments()
+
+        attachments = await store.incidentAttachments(anEvent.id, incident.number)
+
+        self.assertEqual(
+            sorted(attachments),
+            sorted(entry for entry in incident.reportEntries if entry.attachedFile),
+        )
+        self.assertEqual(
+            await store.incidentAttachments(anEvent.id, incident.number + 1), ()
+        )
+
     @asyncAsDeferred
     async def test_createIncident(self) -> None:
         """
@@ -377,6 +528,186 @@ class DataStoreIncidentTests(DataStoreTests):
         else:
             self.fail("StorageError not raised")
 
+    @asyncAsDeferred
+    async def test_createIncident_concurrent(self) -> None:
+        """
+        :meth:`IMSDataStore.createIncident` assigns distinct, sequential
+        numbers to incidents created concurrently.
+        """
+        store = await self.store()
+        await store.createEvent(anEvent)
+        await store.createEvent(anEvent2)
+
+        incidents = await gatherResults(
+            [
+                ensureDeferred(
+                    store.createIncident(
+                        aNewIncident.replace(eventID=event.id, summary=str(i)),
+                        "Hubcap",
+                    )
+                )
+                for i in range(20)
+                for event in (anEvent, anEvent2)
+            ]
+        )
+
+        for event in (anEvent, anEvent2):
+            numbers = sorted(
+                incident.number
+                for incident in incidents
+                if incident.eventID == event.id
+            )
+            self.assertEqual(numbers, list(range(1, 21)))
+
+            stored = await store.incidents(event.id)
+            self.assertEqual(sorted(incident.number for incident in stored), numbers)
+
+    @asyncAsDeferred
+    async def test_createIncident_afterImport(self) -> None:
+        """
+        :meth:`IMSDataStore.createIncident` doesn't assign numbers already
+        taken by imported incidents.
+        """
+        store = await self.store()
+        await store.createEvent(anEvent)
+
+        created = await store.createIncident(aNewIncident, "Hubcap")
+        self.assertEqual(created.number, 1)
+
+        await store.importIncident(anIncident1.replace(number=5))
+
+        created = await store.createIncident(aNewIncident, "Hubcap")
+        self.assertEqual(created.number, 6)
+
+    @asyncAsDeferred
+    async def test_importIncidents(self) -> None:
+        """
+        :meth:`IMSDataStore.importIncidents` stores the given incidents as is.
+        """
+        incidents = (
+            anIncident1.replace(
+                rangerHandles=("Hubcap",),
+                reportEntries=(aReportEntry,),
+            ),
+            anIncident2.replace(
+                eventID=anEvent.id,
+                rangerHandles=("Bucket", "Hubcap"),
+                incidentTypes=("Medical",),
+                reportEntries=(aReportEntry1, aReportEntry2),
+            ),
+        )
+
+        store = await self.store()
+        await store.createEvent(anEvent)
+        await store.createIncidentType("Medical")
+
+        await store.importIncidents(incidents)
+
+        for incident in incidents:
+            retrieved = await store.incidentWithNumber(
+                incident.eventID, incident.number
+            )
+            self.assertIncidentsEqual(store, retrieved, incident)
+
+    @asyncAsDeferred
+    async def test_importIncidents_invalidNumber(self) -> None:
+        """
+        :meth:`IMSDataStore.importIncidents` raises :exc:`ValueError` when
+        given an incident without a number.
+        """
+        store = await self.store()
+        await store.createEvent(anEvent)
+
+        try:
+            await store.importIncidents((anIncident1, aNewIncident))
+        except ValueError:
+            pass
+        else:
+            self.fail("ValueError not raised")
+
+        self.assertEqual(tuple(await store.incidentNumbers(anEvent.id)), ())
+
+    @asyncAsDeferred
+    async def test_importIncidents_error(self) -> None:
+        """
+        :meth:`IMSDataStore.importIncidents` raises :exc:`StorageError` when
+        the store raises an exception.
+        """
+        store = await self.store()
+        await store.createEvent(anEvent)
+        store.bringThePain()
+
+        try:
+            await store.importIncidents((anIncident1,))
+        except StorageError as e:
+            self.assertEqual(str(e), store.exceptionMessage)
+        else:
+            self.fail("StorageError not raised")
+
+    @asyncAsDeferred
+    async def test_mergeIncident(self) -> None:
+        """
+        :meth:`IMSDataStore.mergeIncident` replaces the attributes of an
+        existing incident and adds new report entries to it.
+        """
+        store = await self.store()
+        await store.createEvent(anEvent)
+        await store.createIncidentType("Medical")
+        await store.importIncident(
+            anIncident1.replace(
+                rangerHandles=("Hubcap",),
+                reportEntries=(aReportEntry, aReportEntry1),
+            )
+        )
+
+        merged = anIncident1.replace(
+            priority=IncidentPriority.high,
+            summary="Another thing happened",
+            rangerHandles=("Bucket",),
+            incidentTypes=("Medical",),
+            reportEntries=(
+                aReportEntry,
+                aReportEntry1.replace(stricken=True),
+                aReportEntry2,
+            ),
+        )
+        await store.mergeIncident(merged)
+
+        retrieved = await store.incidentWithNumber(anEvent.id, merged.number)
+        self.assertIncidentsEqual(store, retrieved, merged)
+
+    @asyncAsDeferred
+    async def test_mergeIncident_notFound(self) -> None:
+        """
+        :meth:`IMSDataStore.mergeIncident` raises
+        :exc:`NoSuchIncidentError` when the incident does not exist.
+        """
+        store = await self.store()
+        await store.createEvent(anEvent)
+
+        try:
+            await store.mergeIncident(anIncident1)
+        except NoSuchIncidentError:
+            pass
+        else:
+            self.fail("NoSuchIncidentError not raised")
+
+    @asyncAsDeferred
+    async def test_incidentNumbers(self) -> None:
+        """
+        :meth:`IMSDataStore.incidentNumbers` returns the numbers of all
+        incidents in the given event.
+        """
+        store = await self.store()
+        await store.storeIncident(anIncident1)
+        await store.storeIncident(anIncident2.replace(eventID=anIncident1.eventID))
+        await store.storeIncident(anIncident2)
+
+        self.assertEqual(
+            sorted(await store.incidentNumbers(anIncident1.eventID)),
+            [anIncident1.number, anIncident2.number],
+        )
+
     @asyncAsDeferred
     async def test_setIncident_priority_error(self) -> None:
         """
@@ -775,6 +1106,106 @@ class DataStoreIncidentTests(DataStoreTests):
         else:
             self.fail("StorageError not raised")
 
+    @asyncAsDeferred
+    async def test_editIncidents(self) -> None:
+        """
+        :meth:`IMSDataStore.editIncidents` applies the given changes to the
+        incidents with the given numbers, and only to those, with automatic
+        report entries recording the changes.
+        """
+        eventID = anIncident1.eventID
+        edited = (anIncident1, anIncident2.replace(eventID=eventID))
+        other = anIncident2.replace(eventID=eventID, number=2)
+
+        store = await self.store()
+        for incident in (*edited, other):
+            await store.storeIncident(incident)
+
+        await store.editIncidents(
+            eventID,
+            [incident.number for incident in edited],
+            aReportEntry1.author,
+            priority=IncidentPriority.high,
+            state=IncidentState.closed,
+            reportEntries=(aReportEntry1,),
+        )
+
+        for incident in edited:
+            retrieved = await store.incidentWithNumber(eventID, incident.number)
+
+            self.assertEqual(retrieved.priority, IncidentPriority.high)
+            self.assertEqual(retrieved.state, IncidentState.closed)
+            self.assertEqual(
+                sorted(
+                    entry.text.partition(":")[0]
+                    for entry in retrieved.reportEntries
+                    if entry.automatic
+                ),
+                ["Changed priority to", "Changed state to"],
+            )
+            self.assertEqual(
+                [
+                    entry.text
+                    for entry in retrieved.reportEntries
+                    if not entry.automatic
+                ],
+                [aReportEntry1.text],
+            )
+
+        self.assertIncidentsEqual(
+            store, await store.incidentWithNumber(eventID, other.number), other
+        )
+
+    @asyncAsDeferred
+    async def test_editIncidents_notFound(self) -> None:
+        """
+        :meth:`IMSDataStore.editIncidents` raises :exc:`NoSuchIncidentError`
+        and changes nothing if any of the incidents don't exist.
+        """
+        store = await self.store()
+        await store.storeIncident(anIncident1)
+
+        try:
+            await store.editIncidents(
+                anIncident1.eventID,
+                (anIncident1.number, 9999),
+                "Hubcap",
+                state=IncidentState.closed,
+            )
+        except NoSuchIncidentError:
+            pass
+        else:
+            self.fail("NoSuchIncidentError not raised")
+
+        self.assertIncidentsEqual(
+            store,
+            await store.incidentWithNumber(anIncident1.eventID, anIncident1.number),
+            anIncident1,
+        )
+
+    @asyncAsDeferred
+    async def test_editIncidents_automatic(self) -> None:
+        """
+        :meth:`IMSDataStore.editIncidents` raises :exc:`ValueError` when given
+        automatic report entries.
+        """
+        store = await self.store()
+        await store.storeIncident(anIncident1)
+
+        reportEntry = aReportEntry.replace(automatic=True)
+
+        try:
+            await store.editIncidents(
+                anIncident1.eventID,
+                (anIncident1.number,),
+                reportEntry.author,
+                reportEntries=(reportEntry,),
+            )
+        except ValueError as e:
+            self.assertIn(" may not be created by user ", str(e))
+        else:
+            self.fail("ValueError not raised")
+
     @asyncAsDeferred
     async def test_setIncidentReportEntry_stricken(self) -> None:
         incident = anIncident1
@@ -871,6 +1302,153 @@ class DataStoreIncidentTests(DataStoreTests):
         else:
             self.fail("StorageError not raised")
 
+    async def _storeSearchableIncidents(self) -> TestDataStoreABC:
+        """
+        Create a store with two incidents created via the store API, which
+        maintains the search index.
+        """
+        store = await self.store()
+        await store.createEvent(anEvent)
+
+        for summary in ("Lost camera", "Found bicycle"):
+            await store.createIncident(
+                anIncident1.replace(number=0, summary=summary), "Hubcap"
+            )
+
+        await store.addReportEntriesToIncident(
+            anEvent.id,
+            1,
+            (aReportEntry.replace(text="It was a black Nikon"),),
+            aReportEntry.author,
+        )
+
+        return store
+
+    @asyncAsDeferred
+    async def test_searchIncidents(self) -> None:
+        """
+        :meth:`IMSDataStore.searchIncidents` returns incidents with all of the
+        search terms in their summary, location or report entries, with
+        highlighted snippets.
+        """
+        store = await self._storeSearchableIncidents()
+
+        results = await store.searchIncidents(anEvent.id, "nikon & lost CAM")
+        self.assertEqual([result.number for result in results], [1])
+        self.assertTrue(
+            any("<mark>Nikon</mark>" in snippet for snippet in results[0].snippets),
+            results[0].snippets,
+        )
+
+        results = await store.searchIncidents(anEvent.id, "bicycle")
+        self.assertEqual([result.number for result in results], [2])
+
+        results = await store.searchIncidents(anEvent.id, "bicycle nikon")
+        self.assertEqual(results, ())
+
+    @asyncAsDeferred
+    async def test_searchIncidents_shortTerms(self) -> None:
+        """
+        :meth:`IMSDataStore.searchIncidents` matches terms which are too short
+        for, or ignored by, some full-text indexes.
+        """
+        store = await self._storeSearchableIncidents()
+
+        await store.addReportEntriesToIncident(
+            anEvent.id,
+            2,
+            (aReportEntry.replace(text="Left at 7:30 & E"),),
+            aReportEntry.author,
+        )
+
+        for text in ("7", "30", "E", "at 7", "bicycle 7:30 e"):
+            results = await store.searchIncidents(anEvent.id, text)
+            self.assertEqual([result.number for result in results], [2], text)
+
+        self.assertEqual(await store.searchIncidents(anEvent.id, "camera 7"), ())
+        self.assertEqual(await store.searchIncidents(anEvent.id, "8"), ())
+
+    @asyncAsDeferred
+    async def test_searchIncidents_limit(self) -> None:
+        """
+        :meth:`IMSDataStore.searchIncidents` returns no more than the given
+        number of results.
+        """
+        store = await self._storeSearchableIncidents()
+
+        for incidentNumber in (1, 2):
+            await store.addReportEntriesToIncident(
+                anEvent.id,
+                incidentNumber,
+                (aReportEntry.replace(text="Camera bag"),),
+                aReportEntry.author,
+            )
+
+        results = await store.searchIncidents(anEvent.id, "camera")
+        self.assertEqual(len(results), 2)
+
+        results = await store.searchIncidents(anEvent.id, "camera", limit=1)
+        self.assertEqual([result.number for result in results], [1])
+
+    @asyncAsDeferred
+    async def test_searchIncidents_noTerms(self) -> None:
+        """
+        :meth:`IMSDataStore.searchIncidents` returns no results when the
+        search text has no words in it.
+        """
+        store = await self._storeSearchableIncidents()
+
+        self.assertEqual(await store.searchIncidents(anEvent.id, " & "), ())
+
+    @asyncAsDeferred
+    async def test_searchIncidents_summaryChanged(self) -> None:
+        """
+        :meth:`IMSDataStore.searchIncidents` matches an incident's current
+        summary after it is changed.
+        """
+        store = await self._storeSearchableIncidents()
+
+        await store.setIncident_summary(anEvent.id, 2, "Found tent", "Hubcap")
+
+        results = await store.searchIncidents(anEvent.id, "bicycle")
+        self.assertEqual(results, ())
+
+        results = await store.searchIncidents(anEvent.id, "tent")
+        self.assertEqual([result.number for result in results], [2])
+
+    @asyncAsDeferred
+    async def test_searchIncidents_stricken(self) -> None:
+        """
+        :meth:`IMSDataStore.searchIncidents` does not match stricken report
+        entries.
+        """
+        store = await self._storeSearchableIncidents()
+
+        incident = await store.incidentWithNumber(anEvent.id, 1)
+        (entry,) = (entry for entry in incident.reportEntries if "Nikon" in entry.text)
+        await store.setIncidentReportEntry_stricken(
+            anEvent.id, 1, entry.id, True, "Hubcap"
+        )
+
+        self.assertEqual(await store.searchIncidents(anEvent.id, "nikon"), ())
+
+    @asyncAsDeferred
+    async def test_searchIncidents_error(self) -> None:
+        """
+        :meth:`IMSDataStore.searchIncidents` raises :exc:`StorageError` when
+        the store raises an exception.
+        """
+        store = await self.store()
+        await store.createEvent(anEvent)
+        store.bringThePain()
+
+        try:
+            await store.searchIncidents(anEvent.id, "camera")
+        except StorageError as e:
+            self.assertEqual(str(e), store.exceptionMessage)
+        else:
+            self.fail("StorageError not raised")
+
     def assertIncidentsEqual(
         self,
         store: TestDataStoreABC,
@@ -25,6 +25,7 @@ from datetime import timedelta as TimeDelta
 from typing import Any, cast
 
 from attrs import fields as attrsFields
+from twisted.internet.defer import ensureDeferred, gatherResults
 
 from ims.ext.trial import asyncAsDeferred
 from ims.model import Event, FieldReport, ReportEntry
@@ -134,6 +135,84 @@ class DataStoreFieldReportTests(DataStoreTests):
 
             self.assertEqual(found, {r.number for r in fieldReports})
 
+    @asyncAsDeferred
+    async def test_fieldReports_excludeReportEntries(self) -> None:
+        """
+        :meth:`DataStore.fieldReports` returns field reports without report
+        entries when ``excludeReportEntries`` is true.
+        """
+        fieldReport = aFieldReport1
+
+        store = await self.store()
+        await store.storeFieldReport(fieldReport)
+        await store.addReportEntriesToFieldReport(
+            fieldReport.eventID,
+            fieldReport.number,
+            (aReportEntry1,),
+            aReportEntry1.author,
+        )
+
+        (full,) = await store.fieldReports(fieldReport.eventID)
+        (retrieved,) = await store.fieldReports(
+            fieldReport.eventID, excludeReportEntries=True
+        )
+
+        self.assertEqual(len(full.reportEntries), 1)
+        self.assertFieldReportsEqual(store, retrieved, fieldReport)
+
+    async def _storeFieldReportsByAuthor(self) -> TestDataStoreABC:
+        """
+        Store a field report with an entry by aReportEntry1's author and
+        another with an entry by aReportEntry2's author.
+        """
+        store = await self.store()
+        for fieldReport, reportEntry in (
+            (aFieldReport1, aReportEntry1),
+            (aFieldReport2, aReportEntry2),
+        ):
+            await store.storeFieldReport(fieldReport)
+            await store.addReportEntriesToFieldReport(
+                fieldReport.eventID,
+                fieldReport.number,
+                (reportEntry,),
+                reportEntry.author,
+            )
+        return store
+
+    @asyncAsDeferred
+    async def test_fieldReports_author(self) -> None:
+        """
+        :meth:`DataStore.fieldReports` returns only field reports with a
+        report entry by the given author, when one is given.
+        """
+        store = await self._storeFieldReportsByAuthor()
+
+        (retrieved,) = await store.fieldReports(anEvent.id, author=aReportEntry1.author)
+
+        self.assertEqual(retrieved.number, aFieldReport1.number)
+        self.assertEqual(
+            [entry.author for entry in retrieved.reportEntries],
+            [aReportEntry1.author],
+        )
+
+        self.assertEqual(tuple(await store.fieldReports(anEvent.id, author="X")), ())
+
+    @asyncAsDeferred
+    async def test_fieldReports_author_excludeReportEntries(self) -> None:
+        """
+        :meth:`DataStore.fieldReports` returns only field reports with a
+        report entry by the given author, when one is given, even if report
+        entries are excluded.
+        """
+        store = await self._storeFieldReportsByAuthor()
+
+        (retrieved,) = await store.fieldReports(
+            anEvent.id, author=aReportEntry2.author, excludeReportEntries=True
+        )
+
+        self.assertEqual(retrieved.number, aFieldReport2.number)
+        self.assertEqual(tuple(retrieved.reportEntries), ())
+
     @asyncAsDeferred
     async def test_fieldReports_error(self) -> None:
         """
@@ -198,6 +277,27 @@ class DataStoreFieldReportTests(DataStoreTests):
         else:
             self.fail("NoSuchFieldReportError not raised")
 
+    @asyncAsDeferred
+    async def test_fieldReportHasAuthor(self) -> None:
+        """
+        :meth:`DataStore.fieldReportHasAuthor` determines whether a field
+        report has a report entry by the given author.
+        """
+        store = await self._storeFieldReportsByAuthor()
+
+        for number, author, expected in (
+            (aFieldReport1.number, aReportEntry1.author, True),
+            (aFieldReport1.number, aReportEntry2.author, False),
+            (aFieldReport2.number, aReportEntry2.author, True),
+            (3, aReportEntry1.author, False),
+            (store.maxIncidentNumber + 1, aReportEntry1.author, False),
+        ):
+            self.assertEqual(
+                await store.fieldReportHasAuthor(anEvent.id, number, author),
+                expected,
+                (number, author),
+            )
+
     @asyncAsDeferred
     async def test_fieldReportWithNumber_error(self) -> None:
         """
@@ -279,6 +379,128 @@ class DataStoreFieldReportTests(DataStoreTests):
         else:
             self.fail("StorageError not raised")
 
+    @asyncAsDeferred
+    async def test_createFieldReport_concurrent(self) -> None:
+        """
+        :meth:`DataStore.createFieldReport` assigns distinct, sequential
+        numbers to field reports created concurrently.
+        """
+        store = await self.store()
+        await store.createEvent(anEvent)
+
+        fieldReports = await gatherResults(
+            [
+                ensureDeferred(
+                    store.createFieldReport(
+                        aNewFieldReport.replace(summary=str(i)), "Hubcap"
+                    )
+                )
+                for i in range(20)
+            ]
+        )
+
+        numbers = sorted(fieldReport.number for fieldReport in fieldReports)
+        self.assertEqual(numbers, list(range(1, 21)))
+
+        stored = await store.fieldReports(anEvent.id)
+        self.assertEqual(sorted(fieldReport.number for fieldReport in stored), numbers)
+
+    @asyncAsDeferred
+    async def test_createFieldReport_afterImport(self) -> None:
+        """
+        :meth:`DataStore.createFieldReport` doesn't assign numbers already
+        taken by imported field reports.
+        """
+        store = await self.store()
+        await store.createEvent(anEvent)
+
+        created = await store.createFieldReport(aNewFieldReport, "Hubcap")
+        self.assertEqual(created.number, 1)
+
+        await store.importFieldReport(aFieldReport1.replace(number=5))
+
+        created = await store.createFieldReport(aNewFieldReport, "Hubcap")
+        self.assertEqual(created.number, 6)
+
+    @asyncAsDeferred
+    async def test_importFieldReports(self) -> None:
+        """
+        :meth:`DataStore.importFieldReports` stores the given field reports
+        as is.
+        """
+        fieldReports = (
+            aFieldReport1.replace(reportEntries=(aReportEntry1,)),
+            aFieldReport2.replace(
+                incidentNumber=anIncident1.number,
+                reportEntries=(aReportEntry1, aReportEntry2),
+            ),
+        )
+
+        store = await self.store()
+        await store.storeIncident(anIncident1)
+
+        await store.importFieldReports(fieldReports)
+
+        for fieldReport in fieldReports:
+            retrieved = await store.fieldReportWithNumber(
+                fieldReport.eventID, fieldReport.number
+            )
+            self.assertFieldReportsEqual(store, retrieved, fieldReport)
+
+    @asyncAsDeferred
+    async def test_importFieldReports_error(self) -> None:
+        """
+        :meth:`DataStore.importFieldReports` raises :exc:`StorageError` when
+        the database raises an exception.
+        """
+        store = await self.store()
+        await store.createEvent(anEvent)
+        store.bringThePain()
+
+        try:
+            await store.importFieldReports((aFieldReport1,))
+        except StorageError as e:
+            self.assertEqual(str(e), store.exceptionMessage)
+        else:
+            self.fail("StorageError not raised")
+
+    @asyncAsDeferred
+    async def test_mergeFieldReport(self) -> None:
+        """
+        :meth:`DataStore.mergeFieldReport` replaces the attributes of an
+        existing field report and adds new report entries to it.
+        """
+        store = await self.store()
+        await store.storeIncident(anIncident1)
+        await store.importFieldReport(
+            aFieldReport1.replace(reportEntries=(aReportEntry1,))
+        )
+
+        merged = aFieldReport1.replace(
+            summary="A happy thing happened",
+            incidentNumber=anIncident1.number,
+            reportEntries=(aReportEntry1.replace(stricken=True), aReportEntry2),
+        )
+        await store.mergeFieldReport(merged)
+
+        retrieved = await store.fieldReportWithNumber(anEvent.id, merged.number)
+        self.assertFieldReportsEqual(store, retrieved, merged)
+
+    @asyncAsDeferred
+    async def test_fieldReportNumbers(self) -> None:
+        """
+        :meth:`DataStore.fieldReportNumbers` returns the numbers of all field
+        reports in the given event.
+        """
+        store = await self.store()
+        await store.storeFieldReport(aFieldReport1)
+        await store.storeFieldReport(aFieldReport2)
+
+        self.assertEqual(
+            sorted(await store.fieldReportNumbers(anEvent.id)),
+            [aFieldReport1.number, aFieldReport2.number],
+        )
+
     @asyncAsDeferred
     async def test_setFieldReport_summary_error(self) -> None:
         """
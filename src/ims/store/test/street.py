@@ -53,6 +53,31 @@ class DataStoreConcentricStreetTests(DataStoreTests):
             self.assertEqual(len(concentricStreets), 1)
             self.assertEqual(concentricStreets.get(streetID), streetName)
 
+    @asyncAsDeferred
+    async def test_concentricStreetsByEvent(self) -> None:
+        """
+        :meth:`IMSDataStore.concentricStreetsByEvent` returns the concentric
+        streets for all events.
+        """
+        store = await self.store()
+
+        for eventID in ("Foo", "Bar", "Baz"):
+            await store.createEvent(Event(id=eventID))
+        await store.storeConcentricStreet("Foo", "A", "Alpha")
+        await store.storeConcentricStreet("Foo", "B", "Bravo")
+        await store.storeConcentricStreet("Bar", "A", "Ash")
+
+        concentricStreets = await store.concentricStreetsByEvent()
+
+        self.assertEqual(
+            {eventID: dict(streets) for eventID, streets in concentricStreets.items()},
+            {
+                "Foo": {"A": "Alpha", "B": "Bravo"},
+                "Bar": {"A": "Ash"},
+                "Baz": {},
+            },
+        )
+
     @asyncAsDeferred
     async def test_createConcentricStreet(self) -> None:
         """
@@ -75,3 +100,25 @@ class DataStoreConcentricStreetTests(DataStoreTests):
 
             self.assertEqual(len(stored), 1)
             self.assertEqual(stored.get(streetID), streetName)
+
+    @asyncAsDeferred
+    async def test_createConcentricStreets(self) -> None:
+        """
+        :meth:`IMSDataStore.createConcentricStreets` creates the given
+        concentric streets for the given event, leaving existing streets
+        unchanged.
+        """
+        event = Event(id="Foo")
+
+        store = await self.store()
+        await store.createEvent(event)
+        await store.createConcentricStreet(eventID=event.id, id="A", name="Alpha")
+
+        await store.createConcentricStreets(
+            event.id, {"A": "Ash", "B": "Bravo", "C": "Charlie"}
+        )
+
+        self.assertEqual(
+            dict(await store.concentricStreets(event.id)),
+            {"A": "Alpha", "B": "Bravo", "C": "Charlie"},
+        )